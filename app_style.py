@@ -0,0 +1,108 @@
+"""
+Application Style
+The stylesheet shared by every widget of the launcher. It is set once on the
+QApplication, so Qt parses it a single time and widgets only need an object name
+to pick up their rules, instead of each card parsing its own copy.
+"""
+
+# Game card colors, shared by the stylesheet and GameCard.paintEvent
+CARD_BACKGROUND = "#033860"
+CARD_BACKGROUND_HOVER = "#044a7a"
+CARD_BORDER = "#044a7a"
+CARD_BORDER_HOVER = "#055a9a"
+CARD_IMAGE_BACKGROUND = "#022d4a"
+CARD_PLACEHOLDER_TEXT = "#7C8483"
+CARD_CHIP_BACKGROUND = "#80022d4a"  # #AARRGGBB
+
+APP_STYLESHEET = """
+    QMainWindow {
+        background-color: #1e1e1e;
+    }
+    QMainWindow QLabel {
+        color: white;
+    }
+    QMainWindow QPushButton {
+        background-color: #5865f2;
+        color: white;
+        border: none;
+        padding: 8px 16px;
+        border-radius: 6px;
+        font-weight: bold;
+    }
+    QMainWindow QPushButton:hover {
+        background-color: #4752c4;
+    }
+    QMainWindow QPushButton:pressed {
+        background-color: #3b45b5;
+    }
+    QMainWindow QLineEdit {
+        background-color: #40444b;
+        color: white;
+        border: none;
+        border-radius: 6px;
+        padding: 8px 12px;
+        selection-background-color: #5865f2;
+    }
+    QMainWindow QLineEdit:focus {
+        border: 1px solid #5865f2;
+    }
+
+    QScrollArea#libraryScrollArea {
+        border: none;
+        background-color: #1e1e1e;
+    }
+    QScrollArea#libraryScrollArea QScrollBar:vertical {
+        border: none;
+        background: #2d2d2d;
+        width: 10px;
+        margin: 0px;
+    }
+    QScrollArea#libraryScrollArea QScrollBar::handle:vertical {
+        background: #4f545c;
+        min-height: 20px;
+        border-radius: 5px;
+    }
+    QScrollArea#libraryScrollArea QScrollBar::handle:vertical:hover {
+        background: #5865f2;
+    }
+    QScrollArea#libraryScrollArea QScrollBar::add-line:vertical,
+    QScrollArea#libraryScrollArea QScrollBar::sub-line:vertical {
+        height: 0px;
+    }
+    QScrollArea#libraryScrollArea QScrollBar::add-page:vertical,
+    QScrollArea#libraryScrollArea QScrollBar::sub-page:vertical {
+        background: none;
+    }
+    QWidget#libraryGrid {
+        background-color: #1e1e1e;
+    }
+
+    QPushButton#cardPlayButton, QPushButton#cardDetailsButton,
+    QPushButton#cardEditButton, QPushButton#cardRemoveButton {
+        color: white;
+        border: none;
+        padding: 8px 15px;
+        border-radius: 8px;
+        font-weight: bold;
+        font-size: 13px;
+        min-width: 100px;
+        min-height: 20px;
+        max-height: 20px;
+    }
+    QPushButton#cardPlayButton { background-color: #723D46; }
+    QPushButton#cardPlayButton:hover { background-color: #8B4B55; }
+    QPushButton#cardPlayButton:pressed { background-color: #5E323A; }
+    QPushButton#cardDetailsButton { background-color: #022d4a; }
+    QPushButton#cardDetailsButton:hover { background-color: #033860; }
+    QPushButton#cardDetailsButton:pressed { background-color: #022d4a; }
+    QPushButton#cardEditButton { background-color: #3182ce; }
+    QPushButton#cardEditButton:hover { background-color: #4299e1; }
+    QPushButton#cardEditButton:pressed { background-color: #2b6cb0; }
+    QPushButton#cardRemoveButton { background-color: #dc2626; }
+    QPushButton#cardRemoveButton:hover { background-color: #ef4444; }
+    QPushButton#cardRemoveButton:pressed { background-color: #b91c1c; }
+"""
+
+def apply_app_style(app):
+    """Install the shared stylesheet on the application (once, at startup)."""
+    app.setStyleSheet(APP_STYLESHEET)
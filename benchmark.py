@@ -0,0 +1,716 @@
+#!/usr/bin/env python
+"""
+Benchmark Script
+Measures the launcher's hot paths on synthetic data so changes can be compared.
+Run with the name of a benchmark, e.g. `python benchmark.py game-memory`.
+"""
+
+import io
+import sys
+import json
+import asyncio
+import argparse
+import contextlib
+import threading
+import tracemalloc
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+from dataclasses import dataclass
+from typing import List, Optional
+from models import Game
+
+GENRES = ["Action", "Adventure", "Action, Adventure", "RPG", "Strategy", "Indie", "Simulation", "Uncategorized"]
+DEVELOPERS = ["Valve", "CD PROJEKT RED", "Ubisoft Montreal", "Bethesda Game Studios", "Larian Studios"]
+DESCRIPTION = ("An open world adventure with a branching story, dozens of hours of quests "
+               "and a large cast of characters. ") * 6  # about 600 characters, typical for Steam
+
+@dataclass
+class LegacyGame:
+    """The previous plain dataclass layout of models.Game, kept for comparison."""
+    id: Optional[int] = None
+    name: str = ""
+    type: str = ""
+    app_id: Optional[str] = None
+    install_path: Optional[str] = None
+    launch_command: Optional[str] = None
+    genre: Optional[str] = None
+    is_installed: bool = False
+    playtime: int = 0
+    metadata_fetched: bool = False
+    poster_url: Optional[str] = None
+    poster_path: Optional[str] = None
+    background_url: Optional[str] = None
+    release_date: Optional[str] = None
+    description: Optional[str] = None
+    rating: float = 0.0
+    platforms: List[str] = None
+    developers: List[str] = None
+    publishers: List[str] = None
+    metacritic: int = 0
+    esrb_rating: str = "Not Rated"
+    epic_app_id: Optional[str] = None
+    epic_launch_command: Optional[str] = None
+    last_launched: Optional[object] = None
+
+def synthetic_rows(count: int):
+    """Yield game field dicts the way they come out of the database (fresh strings per row)."""
+    for i in range(count):
+        app_id = str(100000 + i)
+        yield {
+            'id': i + 1,
+            'name': f"Game {i}",
+            'type': "".join(["st", "eam"]),  # a new string object per row, like sqlite returns
+            'app_id': app_id,
+            'launch_command': f"steam://rungameid/{app_id}",
+            'genre': "".join(GENRES[i % len(GENRES)]),
+            'is_installed': i % 3 == 0,
+            'playtime': i * 7,
+            'metadata_fetched': True,
+            'poster_url': f"https://cdn.akamai.steamstatic.com/steam/apps/{app_id}/header.jpg",
+            'release_date': "12 Nov, 2019",
+            'description': DESCRIPTION[:-1] + str(i % 10),
+            'rating': 4.2,
+            'platforms': "windows,mac".split(','),
+            'developers': "".join(DEVELOPERS[i % len(DEVELOPERS)]).split(','),
+            'publishers': "".join(DEVELOPERS[(i + 1) % len(DEVELOPERS)]).split(','),
+            'metacritic': 84,
+            'esrb_rating': "".join(["Not ", "Rated"]),
+        }
+
+def measure(build) -> int:
+    """Bytes allocated by build() that are still alive afterwards."""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return after - before
+
+def benchmark_game_memory(args):
+    """Per-game memory of the legacy dataclass versus the slotted Game."""
+    from models import NOT_LOADED
+    count = args.count
+
+    legacy = measure(lambda: [LegacyGame(**row) for row in synthetic_rows(count)])
+
+    def build_slotted():
+        games = []
+        for row in synthetic_rows(count):
+            row['description'] = NOT_LOADED  # read on demand, like DatabaseManager.get_all_games
+            games.append(Game(check_install=False, **row))
+        return games
+    slotted = measure(build_slotted)
+
+    # The row dicts and strings are built inside both measurements, only what the games keep counts
+    print(f"Games: {count}")
+    print(f"Legacy dataclass: {legacy / count:8.0f} bytes/game  ({legacy / (1024 * 1024):.1f} MB)")
+    print(f"Slotted Game:     {slotted / count:8.0f} bytes/game  ({slotted / (1024 * 1024):.1f} MB)")
+    print(f"Reduction:        {legacy / max(slotted, 1):8.1f}x")
+
+def synthetic_appdetails(appid: str) -> dict:
+    """A full appdetails payload shaped (and sized) like a typical Steam store response."""
+    i = int(appid)
+    paragraph = ("<p class=\"bb_paragraph\">Explore a hand-crafted world, uncover its secrets and "
+                 "shape the story with every choice you make.</p><br>")
+    media = f"https://shared.akamai.steamstatic.com/store_item_assets/steam/apps/{appid}"
+    requirements = ("<strong>Minimum:</strong><br><ul class=\"bb_ul\"><li><strong>OS:</strong> Windows 10 "
+                    "64-bit<br></li><li><strong>Processor:</strong> Intel Core i5-4460<br></li><li><strong>"
+                    "Memory:</strong> 8 GB RAM<br></li><li><strong>Graphics:</strong> GTX 960<br></li></ul>")
+    return {
+        'type': 'game',
+        'name': f"Game {i}",
+        'steam_appid': i,
+        'required_age': 0,
+        'is_free': False,
+        'detailed_description': paragraph * 60,
+        'about_the_game': paragraph * 55,
+        'short_description': DESCRIPTION[:300],
+        'supported_languages': "English<strong>*</strong>, French, German, Spanish - Spain, Japanese" * 3,
+        'header_image': f"{media}/header.jpg?t=1700000000",
+        'capsule_image': f"{media}/capsule_231x87.jpg?t=1700000000",
+        'website': "https://example.com",
+        'pc_requirements': {'minimum': requirements, 'recommended': requirements},
+        'mac_requirements': {'minimum': requirements},
+        'linux_requirements': {'minimum': requirements},
+        'legal_notice': "© Example Studio. All rights reserved. " * 8,
+        'developers': [DEVELOPERS[i % len(DEVELOPERS)]],
+        'publishers': [DEVELOPERS[(i + 1) % len(DEVELOPERS)]],
+        'price_overview': {'currency': 'USD', 'initial': 2999, 'final': 1499, 'discount_percent': 50,
+                           'initial_formatted': "$29.99", 'final_formatted': "$14.99"},
+        'packages': [i * 10],
+        'platforms': {'windows': True, 'mac': i % 2 == 0, 'linux': False},
+        'metacritic': {'score': 60 + i % 40, 'url': f"https://www.metacritic.com/game/pc/game-{i}"},
+        'categories': [{'id': c, 'description': f"Category {c}"} for c in range(8)],
+        'genres': [{'id': str(g), 'description': g_name} for g, g_name in enumerate(GENRES[i % 4].split(', '))],
+        'screenshots': [{'id': n, 'path_thumbnail': f"{media}/ss_{n:040x}.600x338.jpg",
+                         'path_full': f"{media}/ss_{n:040x}.1920x1080.jpg"} for n in range(16)],
+        'movies': [{'id': n, 'name': f"Trailer {n}", 'thumbnail': f"{media}/movie_{n}.jpg",
+                    'webm': {'480': f"{media}/movie480_{n}.webm", 'max': f"{media}/movie_max_{n}.webm"},
+                    'mp4': {'480': f"{media}/movie480_{n}.mp4", 'max': f"{media}/movie_max_{n}.mp4"},
+                    'highlight': True} for n in range(4)],
+        'recommendations': {'total': 1000 + i},
+        'achievements': {'total': 50, 'highlighted': [{'name': f"Achievement {n}", 'path': f"{media}/ach_{n}.jpg"}
+                                                      for n in range(10)]},
+        'release_date': {'coming_soon': False, 'date': "12 Nov, 2019"},
+        'support_info': {'url': "https://example.com/support", 'email': "support@example.com"},
+        'background': f"{media}/page_bg_generated_v6b.jpg?t=1700000000",
+        'content_descriptors': {'ids': [], 'notes': None},
+    }
+
+class StubStoreServer:
+    """Local stand-in for the appdetails endpoint that replays recorded (or synthetic) payloads.
+
+    It applies `filters` the way the store does and, like the store, rejects
+    several appids in one request unless only price_overview is asked for.
+    """
+
+    def __init__(self, fixtures: Optional[dict] = None):
+        self.fixtures = fixtures or {}
+        self.requests = 0
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                stub.requests += 1
+                query = parse_qs(urlparse(self.path).query)
+                appids = query.get('appids', [''])[0].split(',')
+                filters = [f for f in query.get('filters', [''])[0].split(',') if f]
+                if len(appids) > 1 and filters != ['price_overview']:
+                    body = b"null"
+                    self.send_response(400)
+                else:
+                    body = json.dumps(stub.respond(appids, filters)).encode()
+                    self.send_response(200)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}/api/appdetails"
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    def respond(self, appids: List[str], filters: List[str]) -> dict:
+        payload = {}
+        for appid in appids:
+            data = self.fixtures.get(appid) or synthetic_appdetails(appid)
+            if filters:
+                data = {key: value for key, value in data.items() if key in filters} or []
+            payload[appid] = {'success': True, 'data': data}
+        return payload
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.server.shutdown()
+        self.server.server_close()
+
+def load_fixtures(path: Optional[str]) -> dict:
+    if not path:
+        return {}
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+def benchmark_store_fetch(args):
+    """Bytes and requests per game for appdetails fetching, against a local stub store."""
+    from metadata_fetcher import MetadataFetcher
+    fixtures = load_fixtures(args.fixtures)
+    appids = list(fixtures) or [str(100000 + i) for i in range(args.count)]
+
+    async def run(url, filters):
+        fetcher = MetadataFetcher(store_api_url=url)
+        fetcher.REQUEST_DELAY = 0  # the stub has no rate limit
+        try:
+            return fetcher, await fetcher.fetch_appdetails(appids, filters)
+        finally:
+            await fetcher.close()
+
+    def metadata(fetcher, data) -> dict:
+        game = Game(name="", type='steam', check_install=False)
+        fetcher.apply_store_metadata(game, data)
+        return game.to_dict()
+
+    with StubStoreServer(fixtures) as stub:
+        full_fetcher, full = asyncio.run(run(stub.url, ()))
+        filtered_fetcher, filtered = asyncio.run(run(stub.url, None))
+        price_fetcher, _ = asyncio.run(run(stub.url, ('price_overview',)))
+
+    # Filtering must not change what ends up on the Game
+    identical = sum(1 for appid in appids
+                    if metadata(full_fetcher, full.get(appid)) == metadata(filtered_fetcher, filtered.get(appid)))
+
+    print(f"Games: {len(appids)} ({'recorded' if fixtures else 'synthetic'} payloads)")
+    for label, fetcher in (("Full payload", full_fetcher),
+                           ("Metadata filters", filtered_fetcher),
+                           ("price_overview batch", price_fetcher)):
+        stats = fetcher.stats
+        print(f"{label:22} {stats.requests / len(appids):5.2f} requests/game  "
+              f"{stats.bytes / len(appids) / 1024:7.1f} KB/game")
+    print(f"Bytes saved by filters: {1 - filtered_fetcher.stats.bytes / max(full_fetcher.stats.bytes, 1):.0%}")
+    print(f"Identical game metadata: {identical}/{len(appids)}")
+
+def benchmark_store_record(args):
+    """Record full appdetails payloads from the real store as fixtures for store-fetch."""
+    import time
+    import requests
+    if not args.fixtures or not args.appids:
+        raise ValueError("store-record needs --fixtures FILE and --appids 10,20,...")
+    fixtures = {}
+    for appid in args.appids.split(','):
+        response = requests.get("https://store.steampowered.com/api/appdetails",
+                                params={'appids': appid}, timeout=10)
+        entry = response.json().get(appid) if response.status_code == 200 else None
+        if entry and entry.get('success'):
+            fixtures[appid] = entry['data']
+        print(f"{appid}: {'recorded' if appid in fixtures else 'no data'}")
+        time.sleep(1.5)  # stay under the store's rate limit
+    with open(args.fixtures, 'w', encoding='utf-8') as f:
+        json.dump(fixtures, f)
+
+class NullDatabase:
+    """Accepts the fetcher's writes without touching disk."""
+
+    def update_game(self, game_id, update_data):
+        return True
+
+def benchmark_metadata_priority(args):
+    """Time until the games on screen have metadata, in queue order versus on-screen first.
+
+    The user starts scrolled to the bottom of the library and scrolls to the
+    middle once the first on-screen games have arrived. Store requests take
+    LATENCY seconds each. Try --count 1000.
+    """
+    from metadata_fetcher import MetadataFetcher
+    latency = 0.02
+    per_screen = 24
+
+    class TimedFetcher(MetadataFetcher):
+        async def _fetch_steam_store_metadata(self, appid):
+            await asyncio.sleep(latency)
+            return synthetic_appdetails(appid)
+
+    async def run(prioritize: bool):
+        games = [Game(id=i + 1, name=f"Game {i}", type='steam', app_id=str(100000 + i), check_install=False)
+                 for i in range(args.count)]
+        screens = [games[-per_screen:], games[len(games) // 2:len(games) // 2 + per_screen]]
+        fetcher = TimedFetcher()
+        fetcher.REQUEST_DELAY = 0
+        fetcher.db_manager = NullDatabase()
+        times = []
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        screen = set()
+
+        def show(index):
+            nonlocal screen
+            screen = {game.id for game in screens[index] if not game.metadata_fetched}
+            if prioritize:
+                fetcher.set_visible_games(screens[index])
+            check()
+
+        def check():
+            if not screen and len(times) < len(screens):
+                times.append(loop.time() - start)
+                if len(times) < len(screens):
+                    show(len(times))  # the user scrolls on once the screen is complete
+
+        def on_updated(game):
+            screen.discard(game.id)
+            check()
+
+        fetcher.game_updated.connect(on_updated)
+        show(0)
+        task = asyncio.create_task(fetcher.fetch_metadata_for_games(games))
+        while len(times) < len(screens) and not task.done():
+            await asyncio.sleep(0.01)
+        task.cancel()
+        return times
+
+    with contextlib.redirect_stdout(io.StringIO()):  # the fetcher logs every field it sets
+        fifo = asyncio.run(run(False))
+        prioritized = asyncio.run(run(True))
+    print(f"Games: {args.count}, {per_screen} cards per screen, {latency * 1000:.0f} ms per request")
+    for label, times in (("Queue order", fifo), ("On-screen first", prioritized)):
+        print(f"{label:16} bottom screen {times[0]:6.2f} s   then middle screen {times[1]:6.2f} s")
+
+# The stylesheets the per-widget game cards parsed before app_style, kept for comparison
+LEGACY_WINDOW_STYLE = """
+    QMainWindow { background-color: #1e1e1e; }
+    QLabel { color: white; }
+    QPushButton { background-color: #5865f2; color: white; border: none; padding: 8px 16px;
+                  border-radius: 6px; font-weight: bold; }
+    QPushButton:hover { background-color: #4752c4; }
+    QPushButton:pressed { background-color: #3b45b5; }
+"""
+LEGACY_CARD_STYLE = """
+    QWidget#game-card { background-color: #033860; border-radius: 15px; padding: 0px; margin: 8px;
+                        border: 3px solid #044a7a; }
+    QWidget#game-card:hover { background-color: #044a7a; border: 3px solid #055a9a; }
+    QLabel { color: white; }
+    QPushButton { background-color: #7C8483; color: white; border: none; padding: 8px 15px;
+                  border-radius: 8px; font-weight: bold; font-size: 13px; }
+    QPushButton:hover { background-color: #8a9291; }
+    QPushButton:pressed { background-color: #6e7675; }
+"""
+LEGACY_IMAGE_STYLE = ("background-color: #022d4a; border-top-left-radius: 12px; "
+                      "border-top-right-radius: 12px;")
+LEGACY_CHIP_STYLE = "QWidget { background: rgba(2, 45, 74, 0.5); border-radius: 8px; padding: 4px; }"
+LEGACY_BUTTON_STYLE = """
+    QPushButton {{ background-color: {0}; color: white; border: none; padding: 8px 15px;
+                  border-radius: 8px; font-weight: bold; font-size: 13px; }}
+    QPushButton:hover {{ background-color: {1}; }}
+    QPushButton:pressed {{ background-color: {2}; }}
+"""
+
+def legacy_game_card(game: Game, image):
+    """The game card as MainWindow.create_game_card built it before the painter-drawn GameCard."""
+    from PySide6.QtCore import Qt
+    from PySide6.QtGui import QColor, QPixmap
+    from PySide6.QtWidgets import (QFrame, QGraphicsDropShadowEffect, QHBoxLayout, QLabel,
+                                   QPushButton, QVBoxLayout, QWidget)
+    card = QWidget()
+    card.setObjectName("game-card")
+    card.setFixedWidth(300)
+    card.setMinimumHeight(360)
+    card.setStyleSheet(LEGACY_CARD_STYLE)
+    layout = QVBoxLayout()
+    layout.setSpacing(10)
+    layout.setContentsMargins(0, 0, 0, 15)
+
+    image_container = QWidget()
+    image_container.setFixedSize(300, 170)
+    image_container.setStyleSheet(LEGACY_IMAGE_STYLE)
+    image_layout = QVBoxLayout(image_container)
+    image_layout.setContentsMargins(0, 0, 0, 0)
+    poster = QLabel() if image is not None else QLabel("[No Image Available]")
+    poster.setFixedSize(300, 170)
+    if image is not None:
+        poster.setScaledContents(True)
+        poster.setPixmap(QPixmap.fromImage(image))
+        poster.setStyleSheet("border-top-left-radius: 12px; border-top-right-radius: 12px;")
+    else:
+        poster.setStyleSheet(LEGACY_IMAGE_STYLE + " color: #7C8483; font-style: italic;")
+    poster.setAlignment(Qt.AlignCenter)
+    image_layout.addWidget(poster)
+    layout.addWidget(image_container)
+
+    info_container = QWidget()
+    info_container.setStyleSheet("QWidget { background: transparent; border-left: 2px solid #044a7a; "
+                                 "margin-left: 15px; }")
+    info_layout = QVBoxLayout(info_container)
+    info_layout.setContentsMargins(15, 0, 15, 0)
+    info_layout.setSpacing(12)
+    title_container = QWidget()
+    title_container.setStyleSheet("QWidget { background: transparent; border: none; }")
+    title_layout = QVBoxLayout(title_container)
+    title_layout.setContentsMargins(0, 0, 0, 8)
+    title_layout.setSpacing(0)
+    title_label = QLabel(game.name)
+    title_label.setStyleSheet("font-weight: bold; font-size: 18px; color: #ffffff; padding-bottom: 4px;")
+    title_label.setWordWrap(True)
+    title_label.setFixedHeight(50)
+    title_layout.addWidget(title_label)
+    separator = QFrame()
+    separator.setFrameShape(QFrame.HLine)
+    separator.setStyleSheet("background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 #044a7a, "
+                            "stop:1 transparent); border: none; height: 2px; margin: 0;")
+    title_layout.addWidget(separator)
+    info_layout.addWidget(title_container)
+
+    details_layout = QVBoxLayout()
+    details_layout.setSpacing(12)
+    chips = [("🖥️", game.type.capitalize()), ("💾", "Installed") if game.is_installed else ("❌", "Not Installed")]
+    if game.genre:
+        chips.append(("🏷️", game.genre))
+    for icon, text in chips:
+        row = QHBoxLayout()
+        row.setSpacing(10)
+        chip = QWidget()
+        chip.setStyleSheet(LEGACY_CHIP_STYLE)
+        chip_layout = QHBoxLayout(chip)
+        chip_layout.setContentsMargins(8, 4, 12, 4)
+        chip_layout.setSpacing(8)
+        icon_label = QLabel(icon)
+        icon_label.setStyleSheet("color: #00b0f4; font-size: 14px;")
+        chip_layout.addWidget(icon_label)
+        text_label = QLabel(text)
+        text_label.setStyleSheet("color: #ffffff; font-size: 14px; font-weight: bold;")
+        chip_layout.addWidget(text_label)
+        row.addWidget(chip)
+        row.addStretch()
+        details_layout.addLayout(row)
+    info_layout.addLayout(details_layout)
+    layout.addWidget(info_container)
+
+    button_container = QWidget()
+    button_container.setStyleSheet("QWidget { background: transparent; }")
+    button_layout = QVBoxLayout(button_container)
+    button_layout.setSpacing(8)
+    button_layout.setContentsMargins(0, 0, 0, 0)
+    rows = [[("PLAY", "#723D46", "#8B4B55", "#5E323A"), ("DETAILS", "#022d4a", "#033860", "#022d4a")]]
+    if game.type == 'manual':
+        rows.append([("EDIT", "#3182ce", "#4299e1", "#2b6cb0"), ("REMOVE", "#dc2626", "#ef4444", "#b91c1c")])
+    for row in rows:
+        row_layout = QHBoxLayout()
+        row_layout.setSpacing(8)
+        for text, *colors in row:
+            button = QPushButton(text)
+            button.setFixedHeight(36)
+            button.setMinimumWidth(100)
+            button.setStyleSheet(LEGACY_BUTTON_STYLE.format(*colors))
+            row_layout.addWidget(button)
+        button_layout.addLayout(row_layout)
+    layout.addWidget(button_container)
+    card.setLayout(layout)
+
+    shadow = QGraphicsDropShadowEffect()
+    shadow.setColor(QColor(0, 0, 0, 150))
+    shadow.setBlurRadius(20)
+    shadow.setOffset(0, 5)
+    card.setGraphicsEffect(shadow)
+    return card
+
+def benchmark_card_paint(args):
+    """Build, style-polish and paint cost of per-widget-stylesheet cards versus painter-drawn GameCards.
+
+    Cards are created inside a main window carrying the matching stylesheet, polished
+    and laid out, then each is painted into an image (offscreen, so no GPU or display
+    is involved). Try --count 1000.
+    """
+    import os
+    import time
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    from PySide6.QtCore import Qt
+    from PySide6.QtGui import QColor, QImage
+    from PySide6.QtWidgets import QApplication, QMainWindow, QWidget
+    from app_style import APP_STYLESHEET
+    from game_card import GameCard
+
+    app = QApplication.instance() or QApplication([])
+    poster = QImage(460, 215, QImage.Format_RGB32)
+    poster.fill(QColor("#335577"))
+    games = [Game(id=row['id'], name=row['name'], type=row['type'] or 'steam', genre=row['genre'],
+                  is_installed=row['is_installed'], poster_url=f"https://example.com/{row['id']}.jpg",
+                  check_install=False)
+             for row in synthetic_rows(args.count)]
+
+    def run(build, window_style: str, app_style: str):
+        app.setStyleSheet(app_style)
+        window = QMainWindow()
+        window.setStyleSheet(window_style)
+        container = QWidget()
+        window.setCentralWidget(container)
+        timings = {}
+
+        start = time.perf_counter()
+        cards = []
+        for game in games:
+            card = build(game)
+            card.setParent(container)
+            cards.append(card)
+        timings['build'] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for card in cards:
+            for widget in [card] + card.findChildren(QWidget):
+                widget.ensurePolished()
+            card.layout().activate()
+            card.adjustSize()
+        timings['polish'] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for card in cards:
+            target = QImage(card.size(), QImage.Format_ARGB32_Premultiplied)
+            target.fill(Qt.transparent)
+            card.render(target)
+        timings['paint'] = time.perf_counter() - start
+
+        window.deleteLater()
+        app.processEvents()
+        return timings
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        legacy = run(lambda game: legacy_game_card(game, poster), LEGACY_WINDOW_STYLE, "")
+        painted = run(lambda game: GameCard(game, None, poster), "", APP_STYLESHEET)
+
+    print(f"Cards: {args.count}")
+    print(f"{'':22} {'build':>9} {'polish':>9} {'paint':>9} {'total':>9}")
+    for label, timings in (("Per-widget stylesheets", legacy), ("Painter-drawn cards", painted)):
+        total = sum(timings.values())
+        print(f"{label:22} " + " ".join(f"{timings[phase] * 1000:7.0f}ms" for phase in ('build', 'polish', 'paint'))
+              + f" {total * 1000:7.0f}ms")
+    print(f"Speedup: {sum(legacy.values()) / max(sum(painted.values()), 1e-9):.1f}x")
+
+def benchmark_card_hover(args):
+    """A fast mouse sweep across a grid of GameCards: repaints, layout passes and clock load.
+
+    The pointer crosses one card every SWEEP_MS milliseconds (offscreen). Every
+    card should only be repainted by the shared HoverClock while it fades, with
+    no geometry changes or layout requests anywhere in the grid. Try --count 200.
+    """
+    import os
+    import time
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    from PySide6.QtCore import QEvent, QEventLoop, QObject, QPointF, QTimer
+    from PySide6.QtGui import QEnterEvent
+    from PySide6.QtWidgets import QApplication, QGridLayout, QMainWindow, QWidget
+    from app_style import apply_app_style
+    from game_card import GameCard, HoverClock
+    sweep_ms = 5
+    columns = 6
+
+    app = QApplication.instance() or QApplication([])
+    apply_app_style(app)
+    window = QMainWindow()
+    grid = QWidget()
+    layout = QGridLayout(grid)
+    window.setCentralWidget(grid)
+    games = [Game(id=row['id'], name=row['name'], type='steam', genre=row['genre'],
+                  is_installed=row['is_installed'], check_install=False)
+             for row in synthetic_rows(args.count)]
+    cards = [GameCard(game) for game in games]
+    for index, card in enumerate(cards):
+        layout.addWidget(card, index // columns, index % columns)
+    window.show()
+
+    def wait(ms):
+        loop = QEventLoop()
+        QTimer.singleShot(ms, loop.quit)
+        loop.exec()
+    wait(100)  # let the initial polish and layout settle before counting
+
+    class Counter(QObject):
+        counts = {QEvent.Paint: 0, QEvent.LayoutRequest: 0, QEvent.Move: 0, QEvent.Resize: 0}
+
+        def eventFilter(self, watched, event):
+            if event.type() in self.counts:
+                self.counts[event.type()] += 1
+            return False
+
+    counter = Counter()
+    for widget in [grid] + cards:
+        widget.installEventFilter(counter)
+
+    clock = HoverClock.instance()
+    busiest = 0
+    handler_time = 0.0
+    start = time.perf_counter()
+    previous = None
+    for card in cards:
+        began = time.perf_counter()
+        if previous is not None:
+            app.sendEvent(previous, QEvent(QEvent.Leave))
+        app.sendEvent(card, QEnterEvent(QPointF(10, 10), QPointF(10, 10), QPointF(10, 10)))
+        handler_time += time.perf_counter() - began
+        busiest = max(busiest, len(clock.cards))
+        previous = card
+        wait(sweep_ms)
+    app.sendEvent(previous, QEvent(QEvent.Leave))
+    while clock.cards:
+        wait(clock.INTERVAL)
+    elapsed = time.perf_counter() - start
+
+    counts = counter.counts
+    print(f"Cards swept: {len(cards)} at {sweep_ms} ms per card ({elapsed:.2f} s)")
+    print(f"Enter/leave handling: {handler_time / (2 * len(cards)) * 1e6:.0f} us per event")
+    print(f"Most cards fading at once: {busiest}")
+    print(f"Card repaints: {counts[QEvent.Paint]} ({counts[QEvent.Paint] / len(cards):.1f} per card)")
+    print(f"Layout requests: {counts[QEvent.LayoutRequest]}, moves: {counts[QEvent.Move]}, "
+          f"resizes: {counts[QEvent.Resize]}")
+    window.deleteLater()
+
+# Executables of a synthetic games folder: (path, size in KiB, whether it is the game)
+CRAWL_FILES = [
+    ("Hollow Knight/hollow_knight.exe", 650, True),
+    ("Hollow Knight/UnityPlayer.dll", 1, False),
+    ("Hollow Knight/UnityCrashHandler64.exe", 2048, False),
+    ("Observer/Binaries/Win64/Observer-Win64-Shipping.exe", 80 * 1024, True),
+    ("Observer/Engine/Binaries/Win64/CrashReportClient.exe", 20 * 1024, False),
+    ("Dispatch/Dispatch.exe", 40 * 1024, True),
+    ("Crash Bandicoot/CrashBandicootNSaneTrilogy.exe", 60 * 1024, True),
+    ("Crash Bandicoot/_CommonRedist/vcredist/VC_redist.x64.exe", 14 * 1024, False),
+    ("Old Game/game.exe", 4096, True),
+    ("Old Game/setup.exe", 5120, False),
+    ("Old Game/unins000.exe", 2048, False),
+    ("Old Game/Game-Server.exe", 4096, False),
+    ("Old Game/crash_reporter.exe", 2048, False),
+]
+
+def benchmark_crawl(args):
+    """Crawl a synthetic games folder and check which executables are taken for games.
+
+    Real games whose names contain helper words ("Observer", "Dispatch",
+    "CrashBandicoot") must be found and the installers and crash reporters next
+    to them left out; --count sets the number of asset folders to walk through.
+    """
+    import os
+    import time
+    import shutil
+    import tempfile
+    from game_crawler import GameCrawler
+    root = tempfile.mkdtemp(prefix="crawl-")
+    try:
+        for path, size, _ in CRAWL_FILES:
+            path = os.path.join(root, path)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, 'wb') as f:
+                f.truncate(size * 1024)
+        os.makedirs(os.path.join(root, "Hollow Knight", "hollow_knight_Data"))
+        for i in range(args.count // 10):
+            folder = os.path.join(root, "Big Game", "assets", str(i % 100), str(i))
+            os.makedirs(folder)
+            open(os.path.join(folder, "chunk.bin"), 'wb').close()
+
+        crawler = GameCrawler([root], state_path=os.path.join(root, "crawl_state.json"))
+        start = time.perf_counter()
+        crawler.run()
+        elapsed = time.perf_counter() - start
+        found = {os.path.relpath(game['path'], root).replace(os.sep, '/') for game in crawler.games()}
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+    games = {path for path, _, is_game in CRAWL_FILES if is_game}
+    print(f"Folders: {crawler.stats['directories']}, files: {crawler.stats['files']}, {elapsed:.2f} s")
+    print(f"Games found: {len(found & games)}/{len(games)}")
+    missed = sorted(games - found)
+    extra = sorted(found - games)
+    for path in missed:
+        print(f"Missed game: {path}")
+    for path in extra:
+        print(f"Not a game: {path}")
+    if missed or extra:
+        sys.exit(1)
+
+BENCHMARKS = {
+    'game-memory': benchmark_game_memory,
+    'store-fetch': benchmark_store_fetch,
+    'store-record': benchmark_store_record,
+    'metadata-priority': benchmark_metadata_priority,
+    'card-paint': benchmark_card_paint,
+    'card-hover': benchmark_card_hover,
+    'crawl': benchmark_crawl,
+}
+
+def main():
+    parser = argparse.ArgumentParser(description="Clockwork benchmarks")
+    parser.add_argument('benchmark', choices=sorted(BENCHMARKS))
+    parser.add_argument('--count', type=int, default=10000, help="number of synthetic games")
+    parser.add_argument('--fixtures', help="JSON file of recorded appdetails payloads (store-fetch, store-record)")
+    parser.add_argument('--appids', help="comma-separated app ids to record (store-record)")
+    args = parser.parse_args()
+    BENCHMARKS[args.benchmark](args)
+
+if __name__ == "__main__":
+    try:
+        main()
+    except Exception as e:
+        print(f"Error: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
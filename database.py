@@ -1,18 +1,36 @@
 import os
 import sqlite3
-from datetime import datetime
-from typing import List, Dict, Optional
-from models import Game
+import threading
+from datetime import datetime, timedelta
+from typing import List, Dict, Optional, Set, Tuple
+from models import Game, NOT_LOADED
+from release_dates import normalize_release_date
 
 class DatabaseManager:
-    def __init__(self, db_path='games.db'):
-        """Initialize database connection and create tables if they don't exist."""
+    # Columns that identify a game across machines, and the store metadata kept for it
+    IDENTITY_COLUMNS = ('name', 'type', 'app_id', 'launch_command', 'epic_app_id', 'epic_launch_command')
+    INSERT_COLUMNS = IDENTITY_COLUMNS + ('install_path',)  # bundles leave the path empty
+    METADATA_COLUMNS = ('genre', 'poster_url', 'background_url', 'description', 'release_date',
+                        'rating', 'metacritic', 'esrb_rating', 'platforms', 'developers', 'publishers')
+
+    def __init__(self, db_path='games.db', initialize=True):
+        """Initialize database connection and create tables if they don't exist.
+
+        Pass initialize=False for extra read connections (e.g. on a worker thread)
+        to an already prepared database.
+        """
         self.db_path = db_path
         self.conn = sqlite3.connect(db_path)
         self.cursor = self.conn.cursor()
-        self.init_database()
-        self.update_database_schema()  # Add this line to update schema on initialization
-        self.remove_duplicates()
+        self.thread_id = threading.get_ident()  # sqlite connections only work on their own thread
+        self.thread_connections = threading.local()
+        if initialize:
+            self.init_database()
+            self.update_database_schema()  # Add this line to update schema on initialization
+            self.remove_duplicates()
+            self.close_stale_sessions()
+            # Library games read their descriptions through this connection on demand
+            Game.description_loader = self.load_game_description
         
     def connect(self):
         """Establish database connection"""
@@ -48,6 +66,9 @@ class DatabaseManager:
                     epic_launch_command TEXT,
                     description TEXT,
                     release_date TEXT,
+                    release_date_iso TEXT,
+                    release_date_epoch INTEGER,
+                    release_date_precision TEXT,
                     rating REAL,
                     metacritic INTEGER,
                     esrb_rating TEXT,
@@ -90,6 +111,80 @@ class DatabaseManager:
                 )
             ''')
             
+            # Create sessions table (one row per play session, kept open by heartbeats)
+            self.cursor.execute('''
+                CREATE TABLE IF NOT EXISTS sessions (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    game_id INTEGER NOT NULL,
+                    started_at DATETIME NOT NULL,
+                    ended_at DATETIME,
+                    duration INTEGER DEFAULT 0,
+                    exit_code INTEGER,
+                    closed BOOLEAN DEFAULT 0,
+                    FOREIGN KEY (game_id) REFERENCES games(id) ON DELETE CASCADE
+                )
+            ''')
+            self.cursor.execute(
+                "CREATE INDEX IF NOT EXISTS idx_sessions_open ON sessions(closed) WHERE closed = 0"
+            )
+            
+            # Create playtime rollup tables, maintained incrementally when a session closes
+            self.cursor.execute('''
+                CREATE TABLE IF NOT EXISTS playtime_daily (
+                    game_id INTEGER NOT NULL,
+                    day TEXT NOT NULL,
+                    seconds INTEGER DEFAULT 0,
+                    sessions INTEGER DEFAULT 0,
+                    PRIMARY KEY (game_id, day),
+                    FOREIGN KEY (game_id) REFERENCES games(id) ON DELETE CASCADE
+                )
+            ''')
+            self.cursor.execute('''
+                CREATE TABLE IF NOT EXISTS playtime_weekly (
+                    game_id INTEGER NOT NULL,
+                    week TEXT NOT NULL,
+                    seconds INTEGER DEFAULT 0,
+                    sessions INTEGER DEFAULT 0,
+                    PRIMARY KEY (game_id, week),
+                    FOREIGN KEY (game_id) REFERENCES games(id) ON DELETE CASCADE
+                )
+            ''')
+            
+            # Create metadata refresh job tables (per-game state so a refresh survives restarts)
+            self.cursor.execute('''
+                CREATE TABLE IF NOT EXISTS refresh_jobs (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    status TEXT NOT NULL DEFAULT 'active',
+                    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+                    finished_at DATETIME
+                )
+            ''')
+            self.cursor.execute('''
+                CREATE TABLE IF NOT EXISTS refresh_job_items (
+                    job_id INTEGER NOT NULL,
+                    game_id INTEGER NOT NULL,
+                    state TEXT NOT NULL DEFAULT 'pending',
+                    attempts INTEGER DEFAULT 0,
+                    next_attempt_at DATETIME,
+                    last_error TEXT,
+                    PRIMARY KEY (job_id, game_id),
+                    FOREIGN KEY (job_id) REFERENCES refresh_jobs(id) ON DELETE CASCADE,
+                    FOREIGN KEY (game_id) REFERENCES games(id) ON DELETE CASCADE
+                )
+            ''')
+            self.cursor.execute(
+                "CREATE INDEX IF NOT EXISTS idx_refresh_items_state ON refresh_job_items(job_id, state)"
+            )
+            
+            # Create key/value table for sync watermarks
+            self.cursor.execute('''
+                CREATE TABLE IF NOT EXISTS sync_state (
+                    key TEXT PRIMARY KEY,
+                    value TEXT,
+                    updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
+                )
+            ''')
+            
             self.conn.commit()
             print("Database initialized successfully")
         except Exception as e:
@@ -139,6 +234,9 @@ class DatabaseManager:
                     poster_url = NULL,
                     description = NULL,
                     release_date = NULL,
+                    release_date_iso = NULL,
+                    release_date_epoch = NULL,
+                    release_date_precision = NULL,
                     rating = NULL,
                     metacritic = NULL,
                     esrb_rating = NULL,
@@ -178,14 +276,16 @@ class DatabaseManager:
                     name, type, app_id, epic_app_id, epic_launch_command,
                     install_path, launch_command, genre, is_installed,
                     playtime, metadata_fetched, poster_url, poster_path, background_url,
-                    release_date, description, rating, platforms,
+                    release_date, release_date_iso, release_date_epoch, release_date_precision,
+                    description, rating, platforms,
                     developers, publishers, metacritic, esrb_rating
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
             """, (
                 game.name, game.type, game.app_id, game.epic_app_id,
                 game.epic_launch_command, game.install_path, game.launch_command,
                 game.genre, game.is_installed, game.playtime, game.metadata_fetched,
                 game.poster_url, game.poster_path, game.background_url, game.release_date,
+                *normalize_release_date(game.release_date),
                 game.description, game.rating,
                 ','.join(str(p) for p in (game.platforms or [])),
                 ','.join(str(d) for d in (game.developers or [])),
@@ -203,21 +303,7 @@ class DatabaseManager:
     def update_game(self, game_id: int, update_data: Dict) -> bool:
         """Update an existing game in the database with the provided data."""
         try:
-            # Build the SQL update statement dynamically based on the provided data
-            update_fields = []
-            values = []
-            for key, value in update_data.items():
-                if key in ['platforms', 'developers', 'publishers'] and isinstance(value, list):
-                    value = ','.join(str(v) for v in value)
-                update_fields.append(f"{key} = ?")
-                values.append(value)
-            
-            # Add the game_id to the values list
-            values.append(game_id)
-            
-            # Construct and execute the SQL statement
-            sql = f"UPDATE games SET {', '.join(update_fields)} WHERE id = ?"
-            self.cursor.execute(sql, values)
+            self._update_game(self.cursor, game_id, update_data)
             self.conn.commit()
             
             return True
@@ -227,15 +313,79 @@ class DatabaseManager:
             traceback.print_exc()
             return False
 
+    @staticmethod
+    def _update_game(cursor, game_id: int, update_data: Dict):
+        """Run the UPDATE for update_game (no commit)."""
+        # Build the SQL update statement dynamically based on the provided data
+        update_fields = []
+        values = []
+        if 'release_date' in update_data:
+            # Parse the display date once here so sorting and range filters never have to
+            update_data = dict(update_data)
+            release = normalize_release_date(update_data['release_date'])
+            update_data['release_date_iso'] = release.iso
+            update_data['release_date_epoch'] = release.epoch
+            update_data['release_date_precision'] = release.precision
+        for key, value in update_data.items():
+            if key in ['platforms', 'developers', 'publishers'] and isinstance(value, (list, tuple)):
+                value = ','.join(str(v) for v in value)
+            update_fields.append(f"{key} = ?")
+            values.append(value)
+        
+        # Add the game_id to the values list
+        values.append(game_id)
+        
+        # Construct and execute the SQL statement
+        sql = f"UPDATE games SET {', '.join(update_fields)} WHERE id = ?"
+        cursor.execute(sql, values)
+
+    def merge_games(self, primary_id: int, duplicate_ids: List[int], update_data: Dict) -> bool:
+        """Fold duplicate games into one, in one transaction.
+
+        The primary game gets update_data; sessions and playtime rollups of the
+        duplicates move to it before the duplicates are deleted.
+        """
+        if not duplicate_ids:
+            return True
+        placeholders = ', '.join('?' * len(duplicate_ids))
+        try:
+            cursor = self.conn.cursor()
+            if update_data:
+                self._update_game(cursor, primary_id, update_data)
+            cursor.execute(f"UPDATE sessions SET game_id = ? WHERE game_id IN ({placeholders})",
+                           [primary_id] + duplicate_ids)
+            for table, period in (('playtime_daily', 'day'), ('playtime_weekly', 'week')):
+                cursor.execute(f"""
+                    INSERT INTO {table} (game_id, {period}, seconds, sessions)
+                    SELECT ?, {period}, seconds, sessions FROM {table} WHERE game_id IN ({placeholders})
+                    ON CONFLICT(game_id, {period}) DO UPDATE SET
+                        seconds = seconds + excluded.seconds,
+                        sessions = sessions + excluded.sessions
+                """, [primary_id] + duplicate_ids)
+            for table in ('playtime_daily', 'playtime_weekly', 'refresh_job_items',
+                          'platforms', 'developers', 'publishers', 'games'):
+                column = 'id' if table == 'games' else 'game_id'
+                cursor.execute(f"DELETE FROM {table} WHERE {column} IN ({placeholders})", duplicate_ids)
+            self.conn.commit()
+            return True
+        except Exception as e:
+            print(f"Error merging games into {primary_id}: {e}")
+            self.conn.rollback()
+            return False
+
     def get_all_games(self) -> List[Game]:
         """Get all games from the database."""
         try:
-            self.cursor.execute("""
+            # Descriptions are the largest text per game, so leave them in the database until needed
+            lazy_description = Game.description_loader is not None
+            description_column = "NULL" if lazy_description else "description"
+            self.cursor.execute(f"""
                 SELECT id, name, type, app_id, install_path, launch_command,
                        genre, is_installed, playtime, metadata_fetched,
-                       poster_url, poster_path, background_url, release_date, description,
+                       poster_url, poster_path, background_url, release_date, {description_column},
                        rating, platforms, developers, publishers,
-                       metacritic, esrb_rating, epic_app_id, epic_launch_command
+                       metacritic, esrb_rating, epic_app_id, epic_launch_command,
+                       last_played, created_at, release_date_epoch, release_date_precision
                 FROM games
             """)
             rows = self.cursor.fetchall()
@@ -257,7 +407,7 @@ class DatabaseManager:
                     poster_path=row[11],
                     background_url=row[12],
                     release_date=row[13],
-                    description=row[14],
+                    description=NOT_LOADED if lazy_description else row[14],
                     rating=row[15],
                     platforms=row[16].split(',') if row[16] else [],
                     developers=row[17].split(',') if row[17] else [],
@@ -265,7 +415,11 @@ class DatabaseManager:
                     metacritic=row[19],
                     esrb_rating=row[20],
                     epic_app_id=row[21],
-                    epic_launch_command=row[22]
+                    epic_launch_command=row[22],
+                    last_launched=self._parse_datetime(row[23]),
+                    created_at=self._parse_datetime(row[24]),
+                    # Rows not normalized yet (no precision) parse the date on first use
+                    release_epoch=row[25] if row[26] is not None else NOT_LOADED
                 )
                 games.append(game)
             
@@ -276,6 +430,28 @@ class DatabaseManager:
             traceback.print_exc()
             return []
 
+    def get_game_description(self, game_id: int) -> Optional[str]:
+        """Get a single game's description."""
+        try:
+            return self.load_game_description(game_id)
+        except Exception as e:
+            print(f"Error getting game description: {e}")
+            return None
+
+    def load_game_description(self, game_id: int) -> Optional[str]:
+        """Read a game's description on any thread; raises on database errors.
+
+        Other threads than the one owning self.conn read through their own connection.
+        """
+        if threading.get_ident() == self.thread_id:
+            conn = self.conn
+        else:
+            conn = getattr(self.thread_connections, 'conn', None)
+            if conn is None:
+                conn = self.thread_connections.conn = sqlite3.connect(self.db_path)
+        row = conn.execute("SELECT description FROM games WHERE id = ?", (game_id,)).fetchone()
+        return row[0] if row else None
+
     def get_game_by_id(self, game_id: int) -> Optional[Game]:
         """Get a game by its ID."""
         try:
@@ -318,6 +494,20 @@ class DatabaseManager:
             print(f"Error getting game by ID from database: {e}")
             return None
 
+    def get_app_ids(self, game_ids: List[int]) -> Dict[int, str]:
+        """Map game ids to their Steam app ids (games without one are left out)."""
+        try:
+            cursor = self.conn.cursor()
+            placeholders = ','.join('?' * len(game_ids))
+            cursor.execute(
+                f"SELECT id, app_id FROM games WHERE id IN ({placeholders}) AND app_id IS NOT NULL",
+                list(game_ids)
+            )
+            return dict(cursor.fetchall())
+        except Exception as e:
+            print(f"Error getting app ids: {e}")
+            return {}
+
     def get_game_by_app_id(self, app_id: str) -> Optional[Game]:
         """Get a game by its Steam app ID."""
         try:
@@ -386,6 +576,253 @@ class DatabaseManager:
             print(f"Error getting game playtime: {e}")
             return None
 
+    def get_steam_playtimes(self) -> Dict[str, Tuple[int, int, float]]:
+        """Get a mapping of Steam app_id to (game id, stored playtime, epoch the row was added) without building Game objects."""
+        try:
+            cursor = self.conn.cursor()
+            cursor.execute("""
+                SELECT app_id, id, playtime, CAST(strftime('%s', created_at) AS REAL) FROM games
+                WHERE type = 'steam' AND app_id IS NOT NULL
+            """)
+            return {str(app_id): (game_id, playtime or 0, added or 0.0)
+                    for app_id, game_id, playtime, added in cursor.fetchall()}
+        except Exception as e:
+            print(f"Error getting Steam playtimes: {e}")
+            return {}
+
+    def update_playtimes(self, changes: List[Tuple[int, int]]) -> Optional[int]:
+        """Write (game id, playtime) pairs in a single transaction and return the row count, or None on error."""
+        if not changes:
+            return 0
+        try:
+            cursor = self.conn.cursor()
+            cursor.executemany(
+                "UPDATE games SET playtime = ?, updated_at = CURRENT_TIMESTAMP WHERE id = ?",
+                [(playtime, game_id) for game_id, playtime in changes]
+            )
+            self.conn.commit()
+            return len(changes)
+        except Exception as e:
+            print(f"Error updating playtimes: {e}")
+            self.conn.rollback()
+            return None
+
+    def get_sync_state(self, key: str) -> Optional[str]:
+        """Get a stored sync watermark value."""
+        try:
+            cursor = self.conn.cursor()
+            cursor.execute("SELECT value FROM sync_state WHERE key = ?", (key,))
+            row = cursor.fetchone()
+            return row[0] if row else None
+        except Exception as e:
+            print(f"Error getting sync state {key}: {e}")
+            return None
+
+    def set_sync_state(self, key: str, value: str) -> bool:
+        """Store a sync watermark value."""
+        try:
+            self.cursor.execute("""
+                INSERT INTO sync_state (key, value, updated_at) VALUES (?, ?, CURRENT_TIMESTAMP)
+                ON CONFLICT(key) DO UPDATE SET value = excluded.value, updated_at = CURRENT_TIMESTAMP
+            """, (key, value))
+            self.conn.commit()
+            return True
+        except Exception as e:
+            print(f"Error setting sync state {key}: {e}")
+            self.conn.rollback()
+            return False
+
+    @staticmethod
+    def _format_datetime(value: datetime) -> str:
+        """Format a datetime the same way SQLite's CURRENT_TIMESTAMP does."""
+        return value.strftime('%Y-%m-%d %H:%M:%S')
+
+    @staticmethod
+    def _parse_datetime(value) -> Optional[datetime]:
+        """Parse a stored DATETIME column, returning None for empty or invalid values."""
+        if not value:
+            return None
+        try:
+            return datetime.fromisoformat(str(value))
+        except ValueError:
+            return None
+
+    def start_session(self, game_id: int, started_at: Optional[datetime] = None) -> Optional[int]:
+        """Open a play session for a game and record it as the last played time."""
+        try:
+            started_at = started_at or datetime.now()
+            timestamp = self._format_datetime(started_at)
+            cursor = self.conn.cursor()
+            cursor.execute(
+                "INSERT INTO sessions (game_id, started_at, ended_at, duration) VALUES (?, ?, ?, 0)",
+                (game_id, timestamp, timestamp)
+            )
+            session_id = cursor.lastrowid
+            cursor.execute("UPDATE games SET last_played = ? WHERE id = ?", (timestamp, game_id))
+            self.conn.commit()
+            return session_id
+        except Exception as e:
+            print(f"Error starting session: {e}")
+            self.conn.rollback()
+            return None
+
+    def heartbeat_session(self, session_id: int, now: Optional[datetime] = None) -> bool:
+        """Extend an open session up to now so a crash loses at most one heartbeat."""
+        try:
+            now = now or datetime.now()
+            cursor = self.conn.cursor()
+            cursor.execute("""
+                UPDATE sessions
+                SET ended_at = ?,
+                    duration = CAST(strftime('%s', ?) - strftime('%s', started_at) AS INTEGER)
+                WHERE id = ? AND closed = 0
+            """, (self._format_datetime(now), self._format_datetime(now), session_id))
+            self.conn.commit()
+            return True
+        except Exception as e:
+            print(f"Error updating session heartbeat: {e}")
+            return False
+
+    def end_session(self, session_id: int, ended_at: Optional[datetime] = None,
+                    exit_code: Optional[int] = None) -> Optional[int]:
+        """Close a session, fold it into the rollups and return its duration in seconds."""
+        try:
+            cursor = self.conn.cursor()
+            cursor.execute(
+                "SELECT game_id, started_at FROM sessions WHERE id = ? AND closed = 0",
+                (session_id,)
+            )
+            row = cursor.fetchone()
+            if not row:
+                return None
+
+            game_id, started_at = row[0], self._parse_datetime(row[1])
+            ended_at = ended_at or datetime.now()
+            duration = self._close_session(cursor, session_id, game_id, started_at, ended_at, exit_code)
+            self.conn.commit()
+            return duration
+        except Exception as e:
+            print(f"Error ending session: {e}")
+            self.conn.rollback()
+            return None
+
+    def discard_session(self, session_id: int) -> bool:
+        """Delete an open session that never attached to a running game."""
+        try:
+            self.cursor.execute("DELETE FROM sessions WHERE id = ? AND closed = 0", (session_id,))
+            self.conn.commit()
+            return True
+        except Exception as e:
+            print(f"Error discarding session: {e}")
+            return False
+
+    def close_stale_sessions(self) -> int:
+        """Close sessions left open by a previous run at their last heartbeat."""
+        try:
+            cursor = self.conn.cursor()
+            cursor.execute("SELECT id, game_id, started_at, ended_at FROM sessions WHERE closed = 0")
+            rows = cursor.fetchall()
+            for session_id, game_id, started_at, ended_at in rows:
+                started_at = self._parse_datetime(started_at)
+                ended_at = self._parse_datetime(ended_at) or started_at
+                self._close_session(cursor, session_id, game_id, started_at, ended_at, None)
+            self.conn.commit()
+            if rows:
+                print(f"Recovered {len(rows)} unfinished play sessions")
+            return len(rows)
+        except Exception as e:
+            print(f"Error closing stale sessions: {e}")
+            self.conn.rollback()
+            return 0
+
+    def _close_session(self, cursor, session_id: int, game_id: int, started_at: datetime,
+                       ended_at: datetime, exit_code: Optional[int]) -> int:
+        """Mark a session closed and add it to the daily/weekly rollups (no commit)."""
+        ended_at = max(ended_at, started_at)
+        duration = int((ended_at - started_at).total_seconds())
+        cursor.execute("""
+            UPDATE sessions SET ended_at = ?, duration = ?, exit_code = ?, closed = 1
+            WHERE id = ?
+        """, (self._format_datetime(ended_at), duration, exit_code, session_id))
+
+        # Split the session at local midnight so each day gets its own share
+        first = True
+        for day_start, seconds in self._split_by_day(started_at, ended_at):
+            day = day_start.strftime('%Y-%m-%d')
+            iso_year, iso_week, _ = day_start.isocalendar()
+            week = f"{iso_year}-W{iso_week:02d}"
+            counted = 1 if first else 0
+            cursor.execute("""
+                INSERT INTO playtime_daily (game_id, day, seconds, sessions) VALUES (?, ?, ?, ?)
+                ON CONFLICT(game_id, day) DO UPDATE SET
+                    seconds = seconds + excluded.seconds,
+                    sessions = sessions + excluded.sessions
+            """, (game_id, day, seconds, counted))
+            cursor.execute("""
+                INSERT INTO playtime_weekly (game_id, week, seconds, sessions) VALUES (?, ?, ?, ?)
+                ON CONFLICT(game_id, week) DO UPDATE SET
+                    seconds = seconds + excluded.seconds,
+                    sessions = sessions + excluded.sessions
+            """, (game_id, week, seconds, counted))
+            first = False
+
+        # Steam playtime comes from the Steam API; every other store accrues it locally
+        cursor.execute("""
+            UPDATE games SET playtime = COALESCE(playtime, 0) + ?
+            WHERE id = ? AND type != 'steam'
+        """, (round(duration / 60), game_id))
+        return duration
+
+    @staticmethod
+    def _split_by_day(started_at: datetime, ended_at: datetime) -> List[Tuple[datetime, int]]:
+        """Split a time range into (day start, seconds) pieces at midnight boundaries."""
+        pieces = []
+        current = started_at
+        while True:
+            next_midnight = datetime.combine(current.date() + timedelta(days=1), datetime.min.time())
+            piece_end = min(ended_at, next_midnight)
+            pieces.append((current, int((piece_end - current).total_seconds())))
+            if piece_end >= ended_at:
+                break
+            current = piece_end
+        return pieces
+
+    def get_daily_playtime(self, game_id: Optional[int] = None, since: Optional[str] = None) -> List[Tuple]:
+        """Get (game_id, day, seconds, sessions) rollup rows, optionally filtered."""
+        try:
+            sql = "SELECT game_id, day, seconds, sessions FROM playtime_daily WHERE 1 = 1"
+            params = []
+            if game_id is not None:
+                sql += " AND game_id = ?"
+                params.append(game_id)
+            if since:
+                sql += " AND day >= ?"
+                params.append(since)
+            cursor = self.conn.cursor()
+            cursor.execute(sql + " ORDER BY day", params)
+            return cursor.fetchall()
+        except Exception as e:
+            print(f"Error getting daily playtime: {e}")
+            return []
+
+    def get_weekly_playtime(self, game_id: Optional[int] = None, since: Optional[str] = None) -> List[Tuple]:
+        """Get (game_id, week, seconds, sessions) rollup rows, optionally filtered."""
+        try:
+            sql = "SELECT game_id, week, seconds, sessions FROM playtime_weekly WHERE 1 = 1"
+            params = []
+            if game_id is not None:
+                sql += " AND game_id = ?"
+                params.append(game_id)
+            if since:
+                sql += " AND week >= ?"
+                params.append(since)
+            cursor = self.conn.cursor()
+            cursor.execute(sql + " ORDER BY week", params)
+            return cursor.fetchall()
+        except Exception as e:
+            print(f"Error getting weekly playtime: {e}")
+            return []
+
     def update_database_schema(self):
         """Update the database schema with new fields."""
         try:
@@ -397,10 +834,274 @@ class DatabaseManager:
             if 'poster_path' not in columns:
                 self.cursor.execute("ALTER TABLE games ADD COLUMN poster_path TEXT")
                 self.conn.commit()
+
+            # Normalized release dates, parsed once from the display string
+            for column, column_type in (('release_date_iso', 'TEXT'),
+                                        ('release_date_epoch', 'INTEGER'),
+                                        ('release_date_precision', 'TEXT')):
+                if column not in columns:
+                    self.cursor.execute(f"ALTER TABLE games ADD COLUMN {column} {column_type}")
+            self.cursor.execute(
+                "CREATE INDEX IF NOT EXISTS idx_games_release_epoch ON games(release_date_epoch)"
+            )
+            self.conn.commit()
+            self.backfill_release_dates()
                 
         except Exception as e:
             print(f"Error updating database schema: {e}")
 
+    def iter_fetched_metadata(self, chunk_size: int = 500):
+        """Yield identity and metadata columns of every game with fetched metadata, as dicts.
+
+        Rows are read in chunks on a separate cursor, so the whole library is never in memory.
+        """
+        columns = self.IDENTITY_COLUMNS + self.METADATA_COLUMNS
+        cursor = self.conn.cursor()
+        cursor.execute(f"SELECT {', '.join(columns)} FROM games WHERE metadata_fetched = 1 ORDER BY id")
+        while True:
+            rows = cursor.fetchmany(chunk_size)
+            if not rows:
+                break
+            for row in rows:
+                yield dict(zip(columns, row))
+
+    @staticmethod
+    def metadata_key(game_type: str, app_id: Optional[str], name: Optional[str]) -> Tuple:
+        """Key matching the same game between libraries: the app id, or the name for manual games."""
+        if app_id:
+            return (game_type, str(app_id))
+        return (game_type, (name or '').casefold())
+
+    def get_metadata_index(self) -> Dict[Tuple, Tuple[int, bool]]:
+        """Map metadata_key of every game to its id and whether it has metadata."""
+        try:
+            cursor = self.conn.cursor()
+            cursor.execute("SELECT id, type, app_id, name, metadata_fetched FROM games")
+            return {self.metadata_key(game_type, app_id, name): (game_id, bool(fetched))
+                    for game_id, game_type, app_id, name, fetched in cursor.fetchall()}
+        except Exception as e:
+            print(f"Error indexing games: {e}")
+            return {}
+
+    def get_install_paths(self) -> Set[str]:
+        """Normalized install paths of every game that has one."""
+        try:
+            cursor = self.conn.cursor()
+            cursor.execute("SELECT install_path FROM games WHERE install_path IS NOT NULL AND install_path != ''")
+            return {os.path.normcase(os.path.normpath(path)) for (path,) in cursor.fetchall()}
+        except Exception as e:
+            print(f"Error reading install paths: {e}")
+            return set()
+
+    def bulk_write_metadata(self, updates: List[Tuple[int, Dict]], inserts: List[Dict]) -> bool:
+        """Write imported metadata to existing games and add new games, in one transaction.
+
+        Every record holds the METADATA_COLUMNS (new games also the INSERT_COLUMNS);
+        list values are stored comma separated and release dates are normalized.
+        """
+        def values(record: Dict) -> List:
+            result = []
+            for column in self.METADATA_COLUMNS:
+                value = record.get(column)
+                if column in ('platforms', 'developers', 'publishers') and isinstance(value, (list, tuple)):
+                    value = ','.join(str(v) for v in value)
+                result.append(value)
+            return result + list(normalize_release_date(record.get('release_date')))
+
+        metadata_columns = list(self.METADATA_COLUMNS) + [
+            'release_date_iso', 'release_date_epoch', 'release_date_precision'
+        ]
+        try:
+            cursor = self.conn.cursor()
+            if updates:
+                assignments = ', '.join(f"{column} = ?" for column in metadata_columns)
+                cursor.executemany(
+                    f"UPDATE games SET {assignments}, metadata_fetched = 1 WHERE id = ?",
+                    [values(record) + [game_id] for game_id, record in updates]
+                )
+            if inserts:
+                columns = list(self.INSERT_COLUMNS) + metadata_columns + ['metadata_fetched']
+                cursor.executemany(
+                    f"INSERT INTO games ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})",
+                    [[record.get(column) for column in self.INSERT_COLUMNS] + values(record) + [1]
+                     for record in inserts]
+                )
+            self.conn.commit()
+            return True
+        except Exception as e:
+            print(f"Error writing imported metadata: {e}")
+            self.conn.rollback()
+            return False
+
+    def create_refresh_job(self, game_ids: List[int]) -> Optional[int]:
+        """Start a metadata refresh job with every game pending, or return the active job.
+
+        Only one refresh runs at a time; asking again while one is unfinished resumes it.
+        """
+        try:
+            active = self.get_active_refresh_job()
+            if active is not None:
+                return active
+            self.cursor.execute("INSERT INTO refresh_jobs (status) VALUES ('active')")
+            job_id = self.cursor.lastrowid
+            self.cursor.executemany(
+                "INSERT OR IGNORE INTO refresh_job_items (job_id, game_id) VALUES (?, ?)",
+                [(job_id, game_id) for game_id in game_ids]
+            )
+            self.conn.commit()
+            return job_id
+        except Exception as e:
+            print(f"Error creating refresh job: {e}")
+            self.conn.rollback()
+            return None
+
+    def get_active_refresh_job(self) -> Optional[int]:
+        """Id of the unfinished refresh job, if any."""
+        try:
+            self.cursor.execute(
+                "SELECT id FROM refresh_jobs WHERE status = 'active' ORDER BY id DESC LIMIT 1"
+            )
+            row = self.cursor.fetchone()
+            return row[0] if row else None
+        except Exception as e:
+            print(f"Error getting active refresh job: {e}")
+            return None
+
+    def requeue_in_flight_items(self, job_id: int) -> int:
+        """Put items left in flight by a previous run back to pending."""
+        try:
+            self.cursor.execute(
+                "UPDATE refresh_job_items SET state = 'pending' WHERE job_id = ? AND state = 'in_flight'",
+                (job_id,)
+            )
+            self.conn.commit()
+            return self.cursor.rowcount
+        except Exception as e:
+            print(f"Error requeueing refresh items: {e}")
+            self.conn.rollback()
+            return 0
+
+    def claim_refresh_items(self, job_id: int, now: datetime, limit: int) -> Dict[int, int]:
+        """Mark up to `limit` due pending items in flight; returns game id -> attempts so far."""
+        try:
+            self.cursor.execute("""
+                SELECT game_id, attempts FROM refresh_job_items
+                WHERE job_id = ? AND state = 'pending'
+                  AND (next_attempt_at IS NULL OR next_attempt_at <= ?)
+                ORDER BY attempts, game_id
+                LIMIT ?
+            """, (job_id, self._format_datetime(now), limit))
+            items = dict(self.cursor.fetchall())
+            self.cursor.executemany(
+                "UPDATE refresh_job_items SET state = 'in_flight' WHERE job_id = ? AND game_id = ?",
+                [(job_id, game_id) for game_id in items]
+            )
+            self.conn.commit()
+            return items
+        except Exception as e:
+            print(f"Error claiming refresh items: {e}")
+            self.conn.rollback()
+            return {}
+
+    def complete_refresh_item(self, job_id: int, game_id: int, update_data: Dict) -> bool:
+        """Write a game's replacement metadata and mark its item done in one transaction."""
+        try:
+            # update_game commits, so write the item first and let that commit cover both
+            self.cursor.execute("""
+                UPDATE refresh_job_items SET state = 'done', attempts = attempts + 1, last_error = NULL
+                WHERE job_id = ? AND game_id = ?
+            """, (job_id, game_id))
+            if not self.update_game(game_id, update_data):
+                self.conn.rollback()
+                return False
+            return True
+        except Exception as e:
+            print(f"Error completing refresh item: {e}")
+            self.conn.rollback()
+            return False
+
+    def fail_refresh_item(self, job_id: int, game_id: int, error: str,
+                          retry_at: Optional[datetime]) -> bool:
+        """Record a failed attempt; the item is retried at `retry_at`, or given up when None."""
+        try:
+            self.cursor.execute("""
+                UPDATE refresh_job_items
+                SET state = ?, attempts = attempts + 1, next_attempt_at = ?, last_error = ?
+                WHERE job_id = ? AND game_id = ?
+            """, ('pending' if retry_at else 'failed',
+                  self._format_datetime(retry_at) if retry_at else None,
+                  error, job_id, game_id))
+            self.conn.commit()
+            return True
+        except Exception as e:
+            print(f"Error recording refresh failure: {e}")
+            self.conn.rollback()
+            return False
+
+    def get_refresh_job_progress(self, job_id: int) -> Dict[str, int]:
+        """Item counts per state for a job."""
+        try:
+            self.cursor.execute(
+                "SELECT state, COUNT(*) FROM refresh_job_items WHERE job_id = ? GROUP BY state",
+                (job_id,)
+            )
+            progress = {'pending': 0, 'in_flight': 0, 'done': 0, 'failed': 0}
+            progress.update(dict(self.cursor.fetchall()))
+            return progress
+        except Exception as e:
+            print(f"Error getting refresh job progress: {e}")
+            return {}
+
+    def get_next_refresh_attempt(self, job_id: int) -> Optional[datetime]:
+        """Earliest retry time among the job's pending items."""
+        try:
+            self.cursor.execute("""
+                SELECT MIN(COALESCE(next_attempt_at, '')) FROM refresh_job_items
+                WHERE job_id = ? AND state = 'pending'
+            """, (job_id,))
+            row = self.cursor.fetchone()
+            if not row or row[0] is None:
+                return None
+            return self._parse_datetime(row[0]) or datetime.now()
+        except Exception as e:
+            print(f"Error getting next refresh attempt: {e}")
+            return None
+
+    def finish_refresh_job(self, job_id: int, status: str = 'done') -> bool:
+        """Close a refresh job ('done' or 'cancelled')."""
+        try:
+            self.cursor.execute(
+                "UPDATE refresh_jobs SET status = ?, finished_at = ? WHERE id = ?",
+                (status, self._format_datetime(datetime.now()), job_id)
+            )
+            self.conn.commit()
+            return True
+        except Exception as e:
+            print(f"Error finishing refresh job: {e}")
+            self.conn.rollback()
+            return False
+
+    def backfill_release_dates(self) -> int:
+        """Normalize release dates of rows written before the normalized columns existed."""
+        try:
+            self.cursor.execute(
+                "SELECT id, release_date FROM games WHERE release_date_precision IS NULL"
+            )
+            rows = self.cursor.fetchall()
+            if not rows:
+                return 0
+            self.cursor.executemany("""
+                UPDATE games SET release_date_iso = ?, release_date_epoch = ?, release_date_precision = ?
+                WHERE id = ?
+            """, [(*normalize_release_date(release_date), game_id) for game_id, release_date in rows])
+            self.conn.commit()
+            print(f"[DEBUG] Normalized release dates of {len(rows)} games")
+            return len(rows)
+        except Exception as e:
+            print(f"Error backfilling release dates: {e}")
+            self.conn.rollback()
+            return 0
+
     def remove_game(self, game_id: int) -> bool:
         """Remove a game from the database."""
         try:
@@ -0,0 +1,75 @@
+from typing import List
+from PySide6.QtWidgets import QDialog, QVBoxLayout, QHBoxLayout, QLabel, QListWidget, QListWidgetItem, QPushButton
+from PySide6.QtCore import Qt
+from models import Game
+
+class DuplicatesDialog(QDialog):
+    """Lists the sets of library entries that look like the same game; only the checked sets get merged."""
+
+    def __init__(self, clusters: List[List[Game]], parent=None):
+        super().__init__(parent)
+        self.clusters = clusters
+        self.setWindowTitle("Merge Duplicate Games")
+        self.setMinimumSize(620, 420)
+        self.setStyleSheet("""
+            QDialog {
+                background-color: #121416;
+                color: white;
+            }
+            QLabel {
+                color: #f2f3f5;
+                font-size: 13px;
+            }
+            QListWidget {
+                background-color: #1a1c1e;
+                color: #f2f3f5;
+                border: 1px solid #2a2c2e;
+                border-radius: 6px;
+            }
+            QListWidget::item {
+                padding: 6px;
+            }
+            QPushButton {
+                background-color: #033860;
+                color: white;
+                border: none;
+                padding: 10px 20px;
+                border-radius: 6px;
+                font-weight: bold;
+            }
+            QPushButton:hover {
+                background-color: #044a7a;
+            }
+        """)
+
+        layout = QVBoxLayout(self)
+        label = QLabel(
+            "These games look like they are in your library more than once.\n"
+            "Checked entries are merged into the first one, which keeps every store's launch options."
+        )
+        label.setWordWrap(True)
+        layout.addWidget(label)
+
+        self.list = QListWidget()
+        for cluster in clusters:
+            item = QListWidgetItem("  =  ".join(f"{game.name} ({game.type})" for game in cluster))
+            item.setFlags(item.flags() | Qt.ItemIsUserCheckable)
+            item.setCheckState(Qt.Checked)
+            self.list.addItem(item)
+        layout.addWidget(self.list)
+
+        buttons = QHBoxLayout()
+        buttons.addStretch()
+        skip_button = QPushButton("Not Now")
+        skip_button.clicked.connect(self.reject)
+        merge_button = QPushButton("Merge Checked")
+        merge_button.clicked.connect(self.accept)
+        merge_button.setDefault(True)
+        buttons.addWidget(skip_button)
+        buttons.addWidget(merge_button)
+        layout.addLayout(buttons)
+
+    def selected_clusters(self) -> List[List[Game]]:
+        """The clusters whose item is still checked."""
+        return [cluster for index, cluster in enumerate(self.clusters)
+                if self.list.item(index).checkState() == Qt.Checked]
@@ -1,9 +1,12 @@
+from typing import Dict, List, Optional, Set
 from PySide6.QtWidgets import (
-    QDialog, QVBoxLayout, QHBoxLayout, QLabel,
-    QPushButton, QWidget, QCheckBox, QScrollArea, QFrame, QStyleOptionButton
+    QDialog, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit,
+    QPushButton, QWidget, QCheckBox, QScrollArea, QFrame, QStyleOptionButton, QSpinBox
 )
 from PySide6.QtCore import Signal, Qt
 from PySide6.QtGui import QColor, QPalette, QFont, QPainter, QPen, QBrush
+from datetime import date
+from library_store import empty_filters
 
 class CustomCheckBox(QCheckBox):
     """Custom checkbox with a more modern look"""
@@ -74,10 +77,130 @@ class CustomCheckBox(QCheckBox):
         painter.setPen(QPen(self.palette().text().color()))
         painter.drawText(text_rect, Qt.AlignVCenter | Qt.AlignLeft, self.text())
 
+SECTION_LABEL_STYLE = """
+    color: #033860; 
+    font-size: 13px; 
+    font-weight: bold;
+    padding-bottom: 5px;
+    border-bottom: 1px solid #7C8483;
+"""
+
+class FilterSection(QWidget):
+    """One multi-select filter group with live per-option counts."""
+    selectionChanged = Signal()
+
+    MAX_VISIBLE_OPTIONS = 40  # long lists (developers, publishers) show the top options plus a search box
+
+    def __init__(self, title, column, selected=None, match_all=False, allow_match_all=True,
+                 display_name=None, parent=None):
+        super().__init__(parent)
+        self.setObjectName("filterSection")
+        self.column = column
+        self.selected: Set[str] = set(selected or ())
+        self.display_name = display_name or (lambda value: value)
+        self.checkboxes: Dict[str, CustomCheckBox] = {}
+        self.counts: Dict[str, int] = {}
+        self.search_text = ""
+
+        self.section_layout = QVBoxLayout(self)
+        self.section_layout.setSpacing(8)
+
+        header = QHBoxLayout()
+        label = QLabel(title)
+        label.setStyleSheet(SECTION_LABEL_STYLE)
+        header.addWidget(label)
+        header.addStretch()
+        self.match_all_box = None
+        if allow_match_all:
+            # Off: a game needs any selected value; on: it needs all of them
+            self.match_all_box = CustomCheckBox("Match all")
+            self.match_all_box.setChecked(match_all)
+            self.match_all_box.stateChanged.connect(lambda state: self.selectionChanged.emit())
+            header.addWidget(self.match_all_box)
+        self.section_layout.addLayout(header)
+
+        self.search_input = None
+        self.options_layout = QVBoxLayout()
+        self.options_layout.setSpacing(0)
+        self.section_layout.addLayout(self.options_layout)
+
+    def is_match_all(self) -> bool:
+        return bool(self.match_all_box and self.match_all_box.isChecked())
+
+    def set_counts(self, counts: Dict[str, int]):
+        """Show the options with their counts given the other sections' selections."""
+        self.counts = counts
+        if self.search_input is None and len(counts) > self.MAX_VISIBLE_OPTIONS:
+            self.search_input = QLineEdit()
+            self.search_input.setPlaceholderText("Search...")
+            self.search_input.textChanged.connect(self.handle_search)
+            self.section_layout.insertWidget(1, self.search_input)
+        self.refresh_options()
+
+    def handle_search(self, text):
+        self.search_text = text.strip().lower()
+        self.refresh_options()
+
+    def visible_values(self) -> List[str]:
+        """Selected values first, then the most common matching values."""
+        values = [v for v in self.counts if v not in self.selected]
+        if self.search_text:
+            values = [v for v in values if self.search_text in self.display_name(v).lower()]
+        values.sort(key=lambda v: (-self.counts[v], self.display_name(v).lower()))
+        return sorted(self.selected, key=str.lower) + values[:self.MAX_VISIBLE_OPTIONS]
+
+    def refresh_options(self):
+        """Create, update or hide checkboxes for the values to show."""
+        visible = self.visible_values()
+        for value, checkbox in self.checkboxes.items():
+            checkbox.setVisible(False)
+        for index, value in enumerate(visible):
+            checkbox = self.checkboxes.get(value)
+            if checkbox is None:
+                checkbox = CustomCheckBox("")
+                checkbox.setChecked(value in self.selected)
+                checkbox.stateChanged.connect(lambda state, v=value: self.handle_check(state, v))
+                self.checkboxes[value] = checkbox
+            # Keep the widget order in step with the ranking
+            self.options_layout.insertWidget(index, checkbox)
+            count = self.counts.get(value, 0)
+            checkbox.setText(f"{self.display_name(value)}  ({count})")
+            checkbox.setEnabled(count > 0 or value in self.selected)
+            checkbox.setVisible(True)
+            checkbox.update()
+
+    def handle_check(self, state, value):
+        if self.checkboxes[value].isChecked():
+            self.selected.add(value)
+        else:
+            self.selected.discard(value)
+        self.selectionChanged.emit()
+
+    def clear(self):
+        """Deselect every option."""
+        self.selected.clear()
+        for checkbox in self.checkboxes.values():
+            checkbox.blockSignals(True)
+            checkbox.setChecked(False)
+            checkbox.blockSignals(False)
+        if self.match_all_box:
+            self.match_all_box.blockSignals(True)
+            self.match_all_box.setChecked(False)
+            self.match_all_box.blockSignals(False)
+
 class FilterDialog(QDialog):
+    """Multi-select filters with live counts computed from the library's LibraryStore."""
     filtersApplied = Signal(dict)  # Signal emitted when filters are applied
+
+    SECTIONS = [
+        # title, store column, allow "match all" (single-valued columns cannot match several values)
+        ("GENRE", 'genre', True),
+        ("PLATFORM", 'type', False),
+        ("DEVELOPER", 'developer', True),
+        ("PUBLISHER", 'publisher', True),
+    ]
     
-    def __init__(self, parent=None, current_filters=None, available_genres=None, available_platforms=None):
+    def __init__(self, parent=None, current_filters=None, library_store=None):
         super().__init__(parent)
         self.setWindowTitle("Filter Games")
         self.setMinimumWidth(450)
@@ -160,16 +283,9 @@ class FilterDialog(QDialog):
             }
         """)
         
-        # Store current filters
-        self.current_filters = current_filters or {
-            'genre': 'All Genres',
-            'platform': 'All Platforms',
-            'install_status': 'All Games'
-        }
-        
-        # Store available options
-        self.available_genres = available_genres or []
-        self.available_platforms = available_platforms or []
+        # Store current filters and the index the counts come from
+        self.current_filters = current_filters or empty_filters()
+        self.library_store = library_store
         
         # Create layout
         layout = QVBoxLayout(self)
@@ -199,83 +315,20 @@ class FilterDialog(QDialog):
         filter_layout = QVBoxLayout(filter_container)
         filter_layout.setSpacing(15)
         
-        # Genre filter
-        genre_section = QWidget()
-        genre_section.setObjectName("filterSection")
-        genre_layout = QVBoxLayout(genre_section)
-        genre_layout.setSpacing(8)
-        
-        genre_label = QLabel("GENRE")
-        genre_label.setStyleSheet("""
-            color: #033860; 
-            font-size: 13px; 
-            font-weight: bold;
-            padding-bottom: 5px;
-            border-bottom: 1px solid #7C8483;
-        """)
-        genre_layout.addWidget(genre_label)
-        
-        # Add "All Genres" checkbox
-        self.genre_all = CustomCheckBox("All Genres")
-        self.genre_all.setChecked(self.current_filters['genre'] == 'All Genres')
-        self.genre_all.stateChanged.connect(lambda state: self.handle_genre_all(state))
-        genre_layout.addWidget(self.genre_all)
-        
-        # Add genre checkboxes
-        self.genre_checkboxes = {}
-        for genre in self.available_genres:
-            checkbox = CustomCheckBox(genre)
-            checkbox.setChecked(self.current_filters['genre'] == genre)
-            checkbox.stateChanged.connect(lambda state, g=genre: self.handle_genre_check(state, g))
-            self.genre_checkboxes[genre] = checkbox
-            genre_layout.addWidget(checkbox)
-        
-        filter_layout.addWidget(genre_section)
-        
-        # Platform filter
-        platform_section = QWidget()
-        platform_section.setObjectName("filterSection")
-        platform_layout = QVBoxLayout(platform_section)
-        platform_layout.setSpacing(8)
-        
-        platform_label = QLabel("PLATFORM")
-        platform_label.setStyleSheet("""
-            color: #033860; 
-            font-size: 13px; 
-            font-weight: bold;
-            padding-bottom: 5px;
-            border-bottom: 1px solid #7C8483;
-        """)
-        platform_layout.addWidget(platform_label)
-        
-        # Add "All Platforms" checkbox
-        self.platform_all = CustomCheckBox("All Platforms")
-        self.platform_all.setChecked(self.current_filters['platform'] == 'All Platforms')
-        self.platform_all.stateChanged.connect(lambda state: self.handle_platform_all(state))
-        platform_layout.addWidget(self.platform_all)
-        
-        # Add platform checkboxes
-        self.platform_checkboxes = {}
-        # Add common platforms first
-        common_platforms = ['steam', 'epic']
-        for platform in common_platforms:
-            if platform in self.available_platforms:
-                checkbox = CustomCheckBox(platform.capitalize())
-                checkbox.setChecked(self.current_filters['platform'] == platform.capitalize())
-                checkbox.stateChanged.connect(lambda state, p=platform: self.handle_platform_check(state, p))
-                self.platform_checkboxes[platform] = checkbox
-                platform_layout.addWidget(checkbox)
-        
-        # Add remaining platforms
-        for platform in self.available_platforms:
-            if platform.lower() not in common_platforms:
-                checkbox = CustomCheckBox(platform.capitalize())
-                checkbox.setChecked(self.current_filters['platform'] == platform.capitalize())
-                checkbox.stateChanged.connect(lambda state, p=platform: self.handle_platform_check(state, p))
-                self.platform_checkboxes[platform] = checkbox
-                platform_layout.addWidget(checkbox)
-        
-        filter_layout.addWidget(platform_section)
+        # Category sections
+        match_all = self.current_filters.get('match_all', set())
+        self.sections: Dict[str, FilterSection] = {}
+        for title, column, allow_match_all in self.SECTIONS:
+            section = FilterSection(
+                title, column,
+                selected=self.current_filters.get(column),
+                match_all=column in match_all,
+                allow_match_all=allow_match_all,
+                display_name=(lambda value: value.capitalize() or "Unknown") if column == 'type' else None
+            )
+            section.selectionChanged.connect(self.update_counts)
+            self.sections[column] = section
+            filter_layout.addWidget(section)
         
         # Installation status filter
         install_section = QWidget()
@@ -284,33 +337,44 @@ class FilterDialog(QDialog):
         install_layout.setSpacing(8)
         
         install_label = QLabel("INSTALLATION STATUS")
-        install_label.setStyleSheet("""
-            color: #033860; 
-            font-size: 13px; 
-            font-weight: bold;
-            padding-bottom: 5px;
-            border-bottom: 1px solid #7C8483;
-        """)
+        install_label.setStyleSheet(SECTION_LABEL_STYLE)
         install_layout.addWidget(install_label)
         
-        # Add installation status checkboxes
-        self.install_all = CustomCheckBox("All Games")
-        self.install_all.setChecked(self.current_filters['install_status'] == 'All Games')
-        self.install_all.stateChanged.connect(lambda state: self.handle_install_all(state))
-        install_layout.addWidget(self.install_all)
-        
+        # Checking both (or neither) shows every game
+        installed = self.current_filters.get('installed')
         self.install_installed = CustomCheckBox("Installed")
-        self.install_installed.setChecked(self.current_filters['install_status'] == 'Installed')
-        self.install_installed.stateChanged.connect(lambda state: self.handle_install_check(state, 'Installed'))
+        self.install_installed.setChecked(installed is True)
+        self.install_installed.stateChanged.connect(lambda state: self.update_counts())
         install_layout.addWidget(self.install_installed)
         
         self.install_not_installed = CustomCheckBox("Not Installed")
-        self.install_not_installed.setChecked(self.current_filters['install_status'] == 'Not Installed')
-        self.install_not_installed.stateChanged.connect(lambda state: self.handle_install_check(state, 'Not Installed'))
+        self.install_not_installed.setChecked(installed is False)
+        self.install_not_installed.stateChanged.connect(lambda state: self.update_counts())
         install_layout.addWidget(self.install_not_installed)
         
         filter_layout.addWidget(install_section)
         
+        # Release year range, answered from the store's sorted release index
+        release_section = QWidget()
+        release_section.setObjectName("filterSection")
+        release_layout = QVBoxLayout(release_section)
+        release_layout.setSpacing(8)
+        
+        release_label = QLabel("RELEASE YEAR")
+        release_label.setStyleSheet(SECTION_LABEL_STYLE)
+        release_layout.addWidget(release_label)
+        
+        range_layout = QHBoxLayout()
+        self.release_from = self.create_year_box(self.current_filters.get('release_from'))
+        self.release_to = self.create_year_box(self.current_filters.get('release_to'))
+        range_layout.addWidget(QLabel("From"))
+        range_layout.addWidget(self.release_from)
+        range_layout.addWidget(QLabel("To"))
+        range_layout.addWidget(self.release_to)
+        release_layout.addLayout(range_layout)
+        
+        filter_layout.addWidget(release_section)
+        
         # Add spacer at the end
         filter_layout.addStretch()
         
@@ -318,6 +382,10 @@ class FilterDialog(QDialog):
         scroll_area.setWidget(filter_container)
         layout.addWidget(scroll_area)
         
+        # Live result count
+        self.result_label = QLabel()
+        layout.addWidget(self.result_label)
+        
         # Buttons
         button_layout = QHBoxLayout()
         button_layout.setSpacing(15)
@@ -332,127 +400,73 @@ class FilterDialog(QDialog):
         button_layout.addWidget(reset_button)
         button_layout.addWidget(apply_button)
         layout.addLayout(button_layout)
+        
+        self.update_counts()
     
-    def handle_genre_all(self, state):
-        """Handle the 'All Genres' checkbox state change."""
-        if state == Qt.Checked:
-            # Uncheck all other genre checkboxes
-            for checkbox in self.genre_checkboxes.values():
-                checkbox.setChecked(False)
-                checkbox.setEnabled(False)
-        else:
-            # Enable all genre checkboxes
-            for checkbox in self.genre_checkboxes.values():
-                checkbox.setEnabled(True)
+    ANY_YEAR = 1969  # spin box minimum, shown as "Any"
     
-    def handle_genre_check(self, state, genre):
-        """Handle a genre checkbox state change."""
-        if state == Qt.Checked:
-            # Uncheck 'All Genres'
-            self.genre_all.setChecked(False)
-            # Uncheck other genre checkboxes
-            for g, checkbox in self.genre_checkboxes.items():
-                if g != genre:
-                    checkbox.setChecked(False)
+    def create_year_box(self, year: Optional[int]) -> QSpinBox:
+        box = QSpinBox()
+        box.setRange(self.ANY_YEAR, date.today().year + 5)
+        box.setSpecialValueText("Any")
+        box.setValue(year if year is not None else self.ANY_YEAR)
+        # Connected after the initial value so building the dialog does not recount
+        box.valueChanged.connect(lambda value: self.update_counts())
+        return box
     
-    def handle_platform_all(self, state):
-        """Handle the 'All Platforms' checkbox state change."""
-        if state == Qt.Checked:
-            # Uncheck all other platform checkboxes
-            for checkbox in self.platform_checkboxes.values():
-                checkbox.setChecked(False)
-                checkbox.setEnabled(False)
-        else:
-            # Enable all platform checkboxes
-            for checkbox in self.platform_checkboxes.values():
-                checkbox.setEnabled(True)
+    def year_value(self, box: QSpinBox) -> Optional[int]:
+        return box.value() if box.value() != self.ANY_YEAR else None
     
-    def handle_platform_check(self, state, platform):
-        """Handle a platform checkbox state change."""
-        if state == Qt.Checked:
-            # Uncheck 'All Platforms'
-            self.platform_all.setChecked(False)
-            # Uncheck other platform checkboxes
-            for p, checkbox in self.platform_checkboxes.items():
-                if p != platform:
-                    checkbox.setChecked(False)
+    def collect_filters(self, skip_column: Optional[str] = None) -> Dict:
+        """Build the filter dict from the current selections, optionally leaving one column out."""
+        filters = empty_filters()
+        for column, section in self.sections.items():
+            if column != skip_column:
+                filters[column] = set(section.selected)
+            if section.is_match_all():
+                filters['match_all'].add(column)
+        if self.install_installed.isChecked() != self.install_not_installed.isChecked():
+            filters['installed'] = self.install_installed.isChecked()
+        filters['release_from'] = self.year_value(self.release_from)
+        filters['release_to'] = self.year_value(self.release_to)
+        return filters
     
-    def handle_install_all(self, state):
-        """Handle the 'All Games' checkbox state change."""
-        if state == Qt.Checked:
-            # Uncheck other installation status checkboxes
-            self.install_installed.setChecked(False)
-            self.install_not_installed.setChecked(False)
-            self.install_installed.setEnabled(False)
-            self.install_not_installed.setEnabled(False)
-        else:
-            # Enable other installation status checkboxes
-            self.install_installed.setEnabled(True)
-            self.install_not_installed.setEnabled(True)
-    
-    def handle_install_check(self, state, status):
-        """Handle an installation status checkbox state change."""
-        if state == Qt.Checked:
-            # Uncheck 'All Games'
-            self.install_all.setChecked(False)
-            # Uncheck other installation status checkboxes
-            if status == 'Installed':
-                self.install_not_installed.setChecked(False)
-            else:
-                self.install_installed.setChecked(False)
+    def update_counts(self):
+        """Recount every option against the selections in the other sections."""
+        if self.library_store is None:
+            return
+        store = self.library_store
+        for column, section in self.sections.items():
+            # Each section counts within the other sections' selections, so its own
+            # options stay selectable (standard faceted search behaviour)
+            within = store.select(self.collect_filters(skip_column=column))
+            section.set_counts(store.facet_counts(column, within))
+        
+        filters = self.collect_filters()
+        without_install = dict(filters, installed=None)
+        within = store.select(without_install)
+        installed = store.flag_count('installed', within)
+        self.install_installed.setText(f"Installed  ({installed})")
+        self.install_not_installed.setText(f"Not Installed  ({within.bit_count() - installed})")
+        
+        matches = store.select(filters).bit_count()
+        self.result_label.setText(f"{matches} games match")
     
     def reset_filters(self):
         """Reset all filters to their default values."""
-        # Reset genre filters
-        self.genre_all.setChecked(True)
-        for checkbox in self.genre_checkboxes.values():
-            checkbox.setChecked(False)
-            checkbox.setEnabled(False)
-        
-        # Reset platform filters
-        self.platform_all.setChecked(True)
-        for checkbox in self.platform_checkboxes.values():
+        for section in self.sections.values():
+            section.clear()
+        for checkbox in (self.install_installed, self.install_not_installed):
+            checkbox.blockSignals(True)
             checkbox.setChecked(False)
-            checkbox.setEnabled(False)
-        
-        # Reset installation status filters
-        self.install_all.setChecked(True)
-        self.install_installed.setChecked(False)
-        self.install_not_installed.setChecked(False)
-        self.install_installed.setEnabled(False)
-        self.install_not_installed.setEnabled(False)
+            checkbox.blockSignals(False)
+        for box in (self.release_from, self.release_to):
+            box.blockSignals(True)
+            box.setValue(self.ANY_YEAR)
+            box.blockSignals(False)
+        self.update_counts()
     
     def apply_filters(self):
         """Collect and emit the current filter values."""
-        # Get selected genre
-        genre = 'All Genres'
-        if not self.genre_all.isChecked():
-            for g, checkbox in self.genre_checkboxes.items():
-                if checkbox.isChecked():
-                    genre = g
-                    break
-        
-        # Get selected platform
-        platform = 'All Platforms'
-        if not self.platform_all.isChecked():
-            for p, checkbox in self.platform_checkboxes.items():
-                if checkbox.isChecked():
-                    platform = p.capitalize()
-                    break
-        
-        # Get selected installation status
-        install_status = 'All Games'
-        if not self.install_all.isChecked():
-            if self.install_installed.isChecked():
-                install_status = 'Installed'
-            elif self.install_not_installed.isChecked():
-                install_status = 'Not Installed'
-        
-        # Emit the filters
-        filters = {
-            'genre': genre,
-            'platform': platform,
-            'install_status': install_status
-        }
-        self.filtersApplied.emit(filters)
+        self.filtersApplied.emit(self.collect_filters())
         self.accept()
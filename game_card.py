@@ -1,149 +1,361 @@
 from PySide6.QtWidgets import (
-    QFrame, QLabel, QVBoxLayout, QDialog, QMessageBox, 
-    QHBoxLayout, QGraphicsDropShadowEffect, QWidget, QPushButton
+    QFrame, QVBoxLayout, QMessageBox, QHBoxLayout, QPushButton
+)
+from PySide6.QtCore import Qt, QObject, QRect, QRectF, QTimer, QElapsedTimer, QUrl, Signal
+from PySide6.QtGui import (
+    QPixmap, QColor, QDesktopServices, QImage, QPainter, QPainterPath, QFont,
+    QFontMetrics, QLinearGradient, QPixmapCache
 )
-from PySide6.QtCore import Qt, QPropertyAnimation, QEasingCurve, QRect, QUrl, Signal
-from PySide6.QtGui import QPixmap, QColor, QDesktopServices, QImage, QIcon
-from game_details_dialog import GameDetailsDialog
 from models import Game
-import requests
+import app_style
 import subprocess
 import os
-import webbrowser
-from urllib.parse import quote
-from io import BytesIO
+from typing import Dict, List, Tuple
+
+def mix(a: QColor, b: QColor, t: float) -> QColor:
+    """The color t of the way from a to b"""
+    return QColor(int(a.red() + (b.red() - a.red()) * t),
+                  int(a.green() + (b.green() - a.green()) * t),
+                  int(a.blue() + (b.blue() - a.blue()) * t),
+                  int(a.alpha() + (b.alpha() - a.alpha()) * t))
+
+class HoverClock(QObject):
+    """One timer that fades the hover highlight of every card.
+
+    A card entering or leaving only records its target and joins the set of
+    animating cards; each tick moves those cards' hover levels towards their
+    targets and repaints just them. The timer runs only while a fade is in
+    progress, so a mouse sweep over many cards costs one repaint per card per
+    frame for the few cards still fading, and never touches geometry or layout.
+    """
+    INTERVAL = 16  # ms, about 60 frames per second
+    DURATION = 150  # ms for a full fade
+
+    _instance = None
+
+    @classmethod
+    def instance(cls) -> 'HoverClock':
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(self):
+        super().__init__()
+        self.cards = set()
+        self.elapsed = QElapsedTimer()
+        self.timer = QTimer(self)
+        self.timer.setInterval(self.INTERVAL)
+        self.timer.timeout.connect(self.tick)
+
+    def animate(self, card: 'GameCard'):
+        self.cards.add(card)
+        if not self.timer.isActive():
+            self.elapsed.start()
+            self.timer.start()
+
+    def tick(self):
+        step = self.elapsed.restart() / self.DURATION
+        for card in list(self.cards):
+            try:
+                target = 1.0 if card.hovered else 0.0
+                if card.hover_level < target:
+                    card.hover_level = min(target, card.hover_level + step)
+                else:
+                    card.hover_level = max(target, card.hover_level - step)
+                if card.hover_level == target:
+                    self.cards.discard(card)
+                card.update()
+            except RuntimeError:  # deleted with the grid while fading
+                self.cards.discard(card)
+        if not self.cards:
+            self.timer.stop()
 
 class GameCard(QFrame):
+    """A library card drawn in paintEvent.
+
+    The poster, title, separator and info chips are painted from cached pixmaps
+    and pre-elided text; only the buttons are child widgets, and they take their
+    look from the application stylesheet (app_style) through their object names.
+    """
     clicked = Signal(object)  # Emits Game object when clicked
-    
-    def __init__(self, game: Game, parent=None):
+
+    WIDTH = 300
+    SHADOW = 8  # room around the card for its shadow
+    RADIUS = 15
+    BORDER = 3
+    IMAGE_HEIGHT = 170
+    TEXT_LEFT = 30  # title and chips are indented past the accent line
+    TITLE_LINES = 2
+    TITLE_HEIGHT = 50
+    CHIP_HEIGHT = 30
+    SPACING = 12
+    BUTTON_HEIGHT = 36
+
+    _fonts = None
+    _colors = None
+    _shadows: Dict[Tuple[int, int], QPixmap] = {}  # card size -> shadow, shared by all cards
+
+    def __init__(self, game: Game, parent=None, image: QImage = None):
         super().__init__(parent)
         self.game = game
         self.parent = parent
-        self.setup_ui()
-        
-    def setup_ui(self):
-        """Set up the game card UI"""
-        # Set frame style
-        self.setFrameStyle(QFrame.Box | QFrame.Raised)
-        self.setLineWidth(1)
-        self.setMinimumSize(200, 300)
-        self.setMaximumSize(200, 300)
-        self.setStyleSheet("""
-            QFrame {
-                background-color: #2b2b2b;
-                border-radius: 10px;
-                border: 1px solid #3d3d3d;
-            }
-            QFrame:hover {
-                border: 1px solid #4d4d4d;
-                background-color: #323232;
-            }
-            QLabel {
-                color: white;
-            }
-        """)
-        
-        # Create layout
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(10, 10, 10, 10)
-        layout.setSpacing(5)
-        
-        # Add poster image
-        self.poster_label = QLabel()
-        self.poster_label.setFixedSize(180, 100)
-        self.poster_label.setAlignment(Qt.AlignCenter)
-        self.poster_label.setStyleSheet("background-color: #1a1a1a; border-radius: 5px;")
-        self.load_poster()
-        layout.addWidget(self.poster_label)
-        
-        # Add game name
-        self.title_label = QLabel(self.game.name or 'Unknown Game')
-        self.title_label.setAlignment(Qt.AlignCenter)
-        self.title_label.setWordWrap(True)
-        self.title_label.setStyleSheet("font-weight: bold; font-size: 14px; margin-top: 5px;")
-        layout.addWidget(self.title_label)
-        
-        # Add genre if available
+        self.hovered = False
+        self.hover_level = 0.0  # 0 at rest, 1 fully highlighted; driven by HoverClock
+        self.setup_ui(image)
+
+    @classmethod
+    def fonts(cls) -> Dict[str, QFont]:
+        if cls._fonts is None:
+            title = QFont()
+            title.setPixelSize(18)
+            title.setBold(True)
+            chip = QFont()
+            chip.setPixelSize(14)
+            chip.setBold(True)
+            placeholder = QFont()
+            placeholder.setPixelSize(13)
+            placeholder.setItalic(True)
+            cls._fonts = {'title': title, 'chip': chip, 'placeholder': placeholder}
+        return cls._fonts
+
+    @classmethod
+    def colors(cls) -> Dict[str, QColor]:
+        if cls._colors is None:
+            cls._colors = {name: QColor(getattr(app_style, f"CARD_{name.upper()}")) for name in (
+                'background', 'background_hover', 'border', 'border_hover',
+                'image_background', 'placeholder_text', 'chip_background')}
+        return cls._colors
+
+    def setup_ui(self, image: QImage = None):
+        """Lay out the card once: elide its text, place its buttons and fix its size"""
+        fonts = self.fonts()
+        body_width = self.WIDTH - 2 * self.SHADOW
+        text_width = body_width - self.TEXT_LEFT - 15
+
+        self.title_lines = self.elide_lines(self.game.name or 'Unknown Game',
+                                            QFontMetrics(fonts['title']), text_width, self.TITLE_LINES)
+        if len(self.title_lines) > 1 or self.title_lines[0] != self.game.name:
+            self.setToolTip(self.game.name)
+
+        chips = []
+        if self.game.type:
+            chips.append(("🖥️", self.game.type.capitalize()))
+        chips.append(("💾", "Installed") if self.game.is_installed else ("❌", "Not Installed"))
         if self.game.genre:
-            self.genre_label = QLabel(self.game.genre)
-            self.genre_label.setAlignment(Qt.AlignCenter)
-            self.genre_label.setWordWrap(True)
-            self.genre_label.setStyleSheet("font-size: 12px; color: #aaaaaa;")
-            layout.addWidget(self.genre_label)
-            
-        # Add metadata status
-        if not self.game.metadata_fetched:
-            status_label = QLabel("Metadata not fetched")
-            status_label.setAlignment(Qt.AlignCenter)
-            status_label.setStyleSheet("color: #ff4444; font-size: 12px;")
-            layout.addWidget(status_label)
-        else:
-            # Add rating if available
-            if self.game.rating and self.game.rating > 0:
-                rating_label = QLabel(f"★ {self.game.rating:.1f}/5.0")
-                rating_label.setAlignment(Qt.AlignCenter)
-                rating_label.setStyleSheet("color: #ffd700;")  # Gold color for stars
-                layout.addWidget(rating_label)
-        
-        # Make the card clickable
+            chips.append(("🏷️", self.game.genre))
+        chip_metrics = QFontMetrics(fonts['chip'])
+        self.chips: List[Tuple[str, int]] = []  # (label, width)
+        for icon, text in chips:
+            icon = f"{icon}  "
+            text = chip_metrics.elidedText(text, Qt.ElideRight, text_width - chip_metrics.horizontalAdvance(icon) - 20)
+            label = icon + text
+            self.chips.append((label, 8 + chip_metrics.horizontalAdvance(label) + 12))
+
+        self.poster_key = None
+        self.placeholder = "[No Image]"
+        if self.game.poster_url or self.game.poster_path:
+            self.poster_key = self.prepare_poster(image, body_width - 2 * self.BORDER)
+            if self.poster_key is None:
+                self.placeholder = "[No Image Available]"
+
+        self.separator_y = self.SHADOW + self.IMAGE_HEIGHT + 10 + self.TITLE_HEIGHT
+        self.chips_y = self.separator_y + 2 + self.SPACING
+        buttons_y = self.chips_y + len(self.chips) * (self.CHIP_HEIGHT + self.SPACING) - self.SPACING + 10
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(self.SHADOW + 15, buttons_y, self.SHADOW + 15, self.SHADOW + 15)
+        layout.setSpacing(8)
+        rows = [[("PLAY", "cardPlayButton", self.launch_game),
+                 ("DETAILS", "cardDetailsButton", lambda: self.show_details(None))]]
+        if self.game.type == 'manual':
+            rows.append([("EDIT", "cardEditButton", self.edit_game),
+                         ("REMOVE", "cardRemoveButton", self.remove_game)])
+        for row in rows:
+            row_layout = QHBoxLayout()
+            row_layout.setSpacing(8)
+            for text, name, slot in row:
+                button = QPushButton(text)
+                button.setObjectName(name)
+                button.clicked.connect(slot)
+                row_layout.addWidget(button)
+            layout.addLayout(row_layout)
+
+        height = buttons_y + len(rows) * (self.BUTTON_HEIGHT + 8) - 8 + 15 + self.SHADOW
+        self.setFixedSize(self.WIDTH, height)
         self.setCursor(Qt.PointingHandCursor)
-        
-        # Add shadow effect
-        shadow = QGraphicsDropShadowEffect(self)
-        shadow.setBlurRadius(15)
-        shadow.setColor(QColor(0, 0, 0, 80))
-        shadow.setOffset(0, 2)
-        self.setGraphicsEffect(shadow)
-        
-    def load_poster(self):
-        """Load the game's poster image"""
+
+    @staticmethod
+    def elide_lines(text: str, metrics: QFontMetrics, width: int, max_lines: int) -> List[str]:
+        """Word-wrap text to at most max_lines lines, eliding the last one"""
+        lines = []
+        words = text.split()
+        while words and len(lines) < max_lines - 1:
+            line = words.pop(0)
+            while words and metrics.horizontalAdvance(f"{line} {words[0]}") <= width:
+                line = f"{line} {words.pop(0)}"
+            if metrics.horizontalAdvance(line) > width:
+                words.insert(0, line)  # a single word too long for a line; elide it below
+                break
+            lines.append(line)
+        if words:
+            lines.append(metrics.elidedText(" ".join(words), Qt.ElideRight, width))
+        return lines or [""]
+
+    def prepare_poster(self, image: QImage, width: int):
+        """Scale, crop and round the poster once; returns its QPixmapCache key"""
+        url = self.game.poster_url or self.game.poster_path
+        key = f"card-poster:{width}x{self.IMAGE_HEIGHT}:{url}"
+        if QPixmapCache.find(key) is not None:
+            return key
         try:
-            # Try loading from local path first
-            if self.game.poster_path and os.path.exists(self.game.poster_path):
-                pixmap = QPixmap(self.game.poster_path)
-                scaled_pixmap = pixmap.scaled(180, 100, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                self.poster_label.setPixmap(scaled_pixmap)
-                return
-                
-            # If no local path or file doesn't exist, try URL
-            if self.game.poster_url:
-                response = requests.get(self.game.poster_url)
-                if response.status_code == 200:
-                    image = QImage.fromData(response.content)
-                    pixmap = QPixmap.fromImage(image)
-                    scaled_pixmap = pixmap.scaled(180, 100, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                    self.poster_label.setPixmap(scaled_pixmap)
-                    return
-            
-            # Load default image if no poster or loading fails
-            self.poster_label.setText("No Image")
-            self.poster_label.setStyleSheet("""
-                QLabel {
-                    background-color: #3d3d3d;
-                    border-radius: 5px;
-                    color: #888;
-                    font-size: 12px;
-                }
-            """)
+            if image is None:
+                if self.game.poster_path and os.path.exists(self.game.poster_path):
+                    image = QImage(self.game.poster_path)
+                elif self.game.poster_url and hasattr(self.parent, 'load_image'):
+                    image = self.parent.load_image(self.game.poster_url)
+            if image is None or image.isNull():
+                return None
+
+            scaled = image.scaled(width, self.IMAGE_HEIGHT, Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation)
+            pixmap = QPixmap(width, self.IMAGE_HEIGHT)
+            pixmap.fill(Qt.transparent)
+            painter = QPainter(pixmap)
+            painter.setRenderHint(QPainter.Antialiasing)
+            path = QPainterPath()
+            radius = self.RADIUS - self.BORDER
+            path.addRoundedRect(QRectF(0, 0, width, self.IMAGE_HEIGHT + radius), radius, radius)
+            painter.setClipPath(path)
+            painter.drawImage((width - scaled.width()) // 2, (self.IMAGE_HEIGHT - scaled.height()) // 2, scaled)
+            painter.end()
+            QPixmapCache.insert(key, pixmap)
+            return key
         except Exception as e:
-            print(f"Error loading poster: {str(e)}")
-            self.poster_label.setText("Error")
-            self.poster_label.setStyleSheet("""
-                QLabel {
-                    background-color: #3d3d3d;
-                    border-radius: 5px;
-                    color: #ff4444;
-                    font-size: 12px;
-                }
-            """)
-        
+            print(f"Error loading poster for {self.game.name}: {str(e)}")
+            return None
+
+    @classmethod
+    def shadow_pixmap(cls, width: int, height: int) -> QPixmap:
+        """A soft shadow for a card of the given size, rendered once per size"""
+        key = (width, height)
+        if key not in cls._shadows:
+            pixmap = QPixmap(width, height)
+            pixmap.fill(Qt.transparent)
+            painter = QPainter(pixmap)
+            painter.setRenderHint(QPainter.Antialiasing)
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(QColor(0, 0, 0, 20))
+            # Stacked translucent rounded rects shrinking towards the card make a cheap blur
+            for step in range(cls.SHADOW):
+                rect = QRectF(step, step + 3, width - 2 * step, height - 2 * step - 3)
+                radius = cls.RADIUS + cls.SHADOW - step
+                painter.drawRoundedRect(rect, radius, radius)
+            painter.end()
+            cls._shadows[key] = pixmap
+        return cls._shadows[key]
+
+    def paintEvent(self, event):
+        fonts = self.fonts()
+        colors = self.colors()
+        level = self.hover_level
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        # The hover highlight deepens the shared shadow and blends the card colors
+        painter.setOpacity(0.7 + 0.3 * level)
+        painter.drawPixmap(0, 0, self.shadow_pixmap(self.width(), self.height()))
+        painter.setOpacity(1.0)
+
+        body = QRectF(self.rect()).adjusted(self.SHADOW, self.SHADOW, -self.SHADOW, -self.SHADOW)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(mix(colors['border'], colors['border_hover'], level) if level else colors['border'])
+        painter.drawRoundedRect(body, self.RADIUS, self.RADIUS)
+        inner = body.adjusted(self.BORDER, self.BORDER, -self.BORDER, -self.BORDER)
+        inner_radius = self.RADIUS - self.BORDER
+        painter.setBrush(mix(colors['background'], colors['background_hover'], level) if level
+                         else colors['background'])
+        painter.drawRoundedRect(inner, inner_radius, inner_radius)
+
+        # Poster, or a placeholder with the same rounded top
+        image_rect = QRect(int(inner.x()), int(inner.y()), int(inner.width()), self.IMAGE_HEIGHT)
+        poster = QPixmapCache.find(self.poster_key) if self.poster_key else None
+        if poster is None and self.poster_key:
+            # Evicted from the pixmap cache; rebuild it from the image cache
+            self.poster_key = self.prepare_poster(None, image_rect.width())
+            poster = QPixmapCache.find(self.poster_key) if self.poster_key else None
+        if poster is not None:
+            painter.drawPixmap(image_rect.topLeft(), poster)
+        else:
+            path = QPainterPath()
+            path.addRoundedRect(QRectF(image_rect).adjusted(0, 0, 0, inner_radius), inner_radius, inner_radius)
+            painter.save()
+            painter.setClipRect(image_rect)
+            painter.setBrush(colors['image_background'])
+            painter.drawPath(path)
+            painter.restore()
+            painter.setPen(colors['placeholder_text'])
+            painter.setFont(fonts['placeholder'])
+            painter.drawText(image_rect, Qt.AlignCenter, self.placeholder)
+
+        left = int(body.x()) + self.TEXT_LEFT
+        text_width = int(body.width()) - self.TEXT_LEFT - 15
+        title_top = int(inner.y()) + self.IMAGE_HEIGHT + 10
+
+        # Accent line down the left of the title and chips
+        chips_bottom = self.chips_y + len(self.chips) * (self.CHIP_HEIGHT + self.SPACING) - self.SPACING
+        painter.fillRect(QRect(int(body.x()) + 15, title_top, 2, chips_bottom - title_top), colors['border'])
+
+        painter.setPen(Qt.white)
+        painter.setFont(fonts['title'])
+        line_height = QFontMetrics(fonts['title']).height()
+        for index, line in enumerate(self.title_lines):
+            painter.drawText(QRect(left, title_top + index * line_height, text_width, line_height),
+                             Qt.AlignLeft | Qt.AlignVCenter, line)
+
+        gradient = QLinearGradient(left, 0, left + text_width, 0)
+        gradient.setColorAt(0, colors['border'])
+        gradient.setColorAt(1, Qt.transparent)
+        painter.fillRect(QRect(left, self.separator_y, text_width, 2), gradient)
+
+        painter.setFont(fonts['chip'])
+        y = self.chips_y
+        for label, width in self.chips:
+            chip = QRectF(left, y, width, self.CHIP_HEIGHT)
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(colors['chip_background'])
+            painter.drawRoundedRect(chip, 8, 8)
+            painter.setPen(Qt.white)
+            painter.drawText(chip.adjusted(8, 0, 0, 0), Qt.AlignLeft | Qt.AlignVCenter, label)
+            y += self.CHIP_HEIGHT + self.SPACING
+        painter.end()
+
+    def enterEvent(self, event):
+        """Fade the highlight in; HoverClock repaints the card, nothing is relaid out."""
+        self.hovered = True
+        HoverClock.instance().animate(self)
+        super().enterEvent(event)
+
+    def leaveEvent(self, event):
+        self.hovered = False
+        HoverClock.instance().animate(self)
+        super().leaveEvent(event)
+
+    def edit_game(self):
+        if hasattr(self.parent, 'edit_game'):
+            self.parent.edit_game(self.game)
+
+    def remove_game(self):
+        if hasattr(self.parent, 'remove_game'):
+            self.parent.remove_game(self.game)
+
     def launch_game(self):
         """Launch the game"""
         if hasattr(self.parent, 'launch_game'):
             self.parent.launch_game(self.game)
 
     def show_details(self, event):
+        if hasattr(self.parent, 'show_game_details'):
+            self.parent.show_game_details(self.game)
+            return
+        from game_details_dialog import GameDetailsDialog
         dialog = GameDetailsDialog(self.game, self)
         dialog.exec_()
                 
@@ -167,58 +379,6 @@ class GameCard(QFrame):
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to launch game: {str(e)}")
 
-    def enterEvent(self, event):
-        """Handle mouse enter event for hover effect."""
-        # Create animation for scaling up
-        self.animation = QPropertyAnimation(self, b"geometry")
-        self.animation.setDuration(150)
-        self.animation.setEasingCurve(QEasingCurve.OutCubic)
-        
-        # Calculate new size (5% larger)
-        new_width = int(self.width() * 1.05)
-        new_height = int(self.height() * 1.05)
-        
-        # Calculate new position to keep card centered
-        new_x = self.x() - (new_width - self.width()) // 2
-        new_y = self.y() - (new_height - self.height()) // 2
-        
-        self.animation.setStartValue(self.geometry())
-        self.animation.setEndValue(QRect(new_x, new_y, new_width, new_height))
-        self.animation.start()
-        
-        # Increase shadow effect
-        shadow = self.graphicsEffect()
-        if isinstance(shadow, QGraphicsDropShadowEffect):
-            shadow.setBlurRadius(25)
-            shadow.setColor(QColor(0, 0, 0, 100))
-            shadow.setOffset(0, 4)
-        
-    def leaveEvent(self, event):
-        """Handle mouse leave event to restore original size."""
-        # Create animation for scaling down
-        self.animation = QPropertyAnimation(self, b"geometry")
-        self.animation.setDuration(150)
-        self.animation.setEasingCurve(QEasingCurve.OutCubic)
-        
-        # Calculate original size
-        original_width = int(self.width() / 1.05)
-        original_height = int(self.height() / 1.05)
-        
-        # Calculate original position
-        original_x = self.x() + (self.width() - original_width) // 2
-        original_y = self.y() + (self.height() - original_height) // 2
-        
-        self.animation.setStartValue(self.geometry())
-        self.animation.setEndValue(QRect(original_x, original_y, original_width, original_height))
-        self.animation.start()
-        
-        # Restore original shadow effect
-        shadow = self.graphicsEffect()
-        if isinstance(shadow, QGraphicsDropShadowEffect):
-            shadow.setBlurRadius(15)
-            shadow.setColor(QColor(0, 0, 0, 80))
-            shadow.setOffset(0, 2)
-
     def mousePressEvent(self, event):
         """Handle mouse click events"""
         if event.button() == Qt.LeftButton:
@@ -0,0 +1,356 @@
+#!/usr/bin/env python
+"""
+Game Crawler
+Finds the executables of games no store launcher knows about, under folders the
+user picks (C:\\Games, other drives, ...), so they can be added in bulk instead of
+one at a time through the manual add dialog.
+
+    python game_crawler.py D:\\Games E:\\ [--depth 6] [--workers 8] [--resume]
+"""
+
+import os
+import re
+import sys
+import json
+import time
+import threading
+import signal
+import argparse
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+from store_search import GENERIC_FOLDERS, normalize_title, title_score
+
+CRAWL_STATE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "cache", "crawl_state.json")
+STATE_VERSION = 1
+
+EXECUTABLE_EXTENSIONS = ('.exe',)
+MIN_EXE_SIZE = 1 << 20  # smaller executables only count next to engine files
+MIN_ENGINE_EXE_SIZE = 64 << 10
+
+# Folders never worth entering: system folders, store libraries imported elsewhere,
+# redistributables and the asset folders of games already found
+PRUNED_FOLDERS = {
+    'windows', '$recycle.bin', 'system volume information', 'programdata', 'appdata',
+    'recovery', 'perflogs', '$windows.~bt', '$windows.~ws', 'msocache', 'node_modules',
+    'steamapps', 'steamlibrary', 'epic games', 'windowsapps', 'xboxgames',
+    'redist', '_redist', 'redistributables', '_commonredist', 'commonredist', 'directx',
+    'dotnet', 'vcredist', 'prereqs', 'prerequisites', '__installer', 'installers', 'support',
+    'content', 'paks', 'movies', 'videos', 'music', 'sound', 'sounds', 'audio', 'textures',
+    'shaders', 'shadercache', 'localization', 'logs', 'saves', 'screenshots', 'mono', 'jre',
+}
+PRUNED_SUFFIXES = ('_data',)  # Unity asset folders
+
+# Executables that are part of a game's install but not the game (matched on lowercase file
+# names). Plain words only count on their own, so "Observer.exe", "Dispatch.exe" and
+# "CrashBandicoot.exe" stay while "crash_reporter.exe" and "Game-Server.exe" go.
+EXCLUDED_EXE = re.compile(
+    # installers and redistributables, named by how they start
+    r"^(?:unins|setup|install|vc_?redist|dxweb|dxsetup|dotnet|netfx|oalinst|physx|dxdiag)"
+    # helpers shipped inside game folders, whatever they are glued to
+    r"|crash(?:handler|reporter|reportclient|pad)|prereqsetup|webhelper|anticheat|battleye|beservice|"
+    r"cefprocess|touchup|dedicatedserver"
+    # words separated from the rest of the name
+    r"|(?:^|[_\-. ])(?:setup|install|installer|redist|crash|report|reporter|prereq|update|updater|patch|"
+    r"patcher|helper|uploader|config|settings|server|editor|cleanup|repair|diagnostics?)(?=[_\-. \d]|$)"
+)
+
+# Files next to an executable that mark it as a game (lowercase)
+ENGINE_FILES = {
+    'unityplayer.dll', 'gameassembly.dll', 'steam_api.dll', 'steam_api64.dll', 'galaxy.dll',
+    'galaxy64.dll', 'eossdk-win64-shipping.dll', 'fmod.dll', 'fmodex.dll', 'fmodex64.dll',
+    'fmodstudio.dll', 'bink2w64.dll', 'binkw32.dll', 'binkw64.dll', 'openal32.dll',
+    'xinput1_3.dll', 'physx3_x64.dll', 'sdl2.dll', 'love.dll', 'data.win', 'game.rgss3a',
+    'nw.pak', 'd3dx9_43.dll', 'discord_game_sdk.dll', 'gog.ico', 'goggame.dll',
+}
+ENGINE_FOLDERS = {'renpy', 'engine', 'www'}  # Ren'Py, Unreal, RPG Maker MV
+
+CandidateCallback = Callable[[Dict], None]
+
+def scan_directory(path: str) -> Tuple[List[str], int, List[Dict]]:
+    """One directory: its subfolders, its file count and the executables in it that look like games."""
+    subdirs = []
+    files = 0
+    executables = []
+    names = set()
+    with os.scandir(path) as entries:
+        for entry in entries:
+            name = entry.name.lower()
+            names.add(name)
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+                    continue
+                files += 1
+                if name.endswith(EXECUTABLE_EXTENSIONS) and not EXCLUDED_EXE.search(name):
+                    executables.append((entry.path, entry.stat(follow_symlinks=False).st_size))
+            except OSError:
+                continue
+
+    candidates = []
+    markers = len(names & ENGINE_FILES) + len(names & ENGINE_FOLDERS)
+    for exe_path, size in executables:
+        stem = os.path.splitext(os.path.basename(exe_path))[0]
+        engine = markers + (f"{stem.lower()}_data" in names)  # Unity: Game.exe next to Game_Data
+        if size < MIN_EXE_SIZE and not (engine and size >= MIN_ENGINE_EXE_SIZE):
+            continue
+        candidates.append({'path': exe_path, 'size': size, 'engine': engine})
+    return subdirs, files, candidates
+
+def is_pruned(path: str) -> bool:
+    name = os.path.basename(path).lower()
+    return name in PRUNED_FOLDERS or name.startswith('.') or name.endswith(PRUNED_SUFFIXES)
+
+def game_folder(exe_path: str, roots: Iterable[str]) -> str:
+    """The folder of the game an executable belongs to: its nearest non-generic folder."""
+    folder = os.path.dirname(exe_path)
+    roots = {os.path.normcase(root) for root in roots}
+    while os.path.normcase(folder) not in roots:
+        if os.path.basename(folder).lower() not in GENERIC_FOLDERS:
+            return folder
+        parent = os.path.dirname(folder)
+        if parent == folder:
+            break
+        folder = parent
+    return os.path.dirname(exe_path)
+
+def candidate_score(candidate: Dict, folder: str) -> float:
+    """How likely an executable is the one that starts its game."""
+    stem = os.path.splitext(os.path.basename(candidate['path']))[0]
+    score = min(candidate['engine'], 3) + (candidate['size'] >= MIN_EXE_SIZE)
+    score += 2 * title_score(normalize_title(stem), normalize_title(os.path.basename(folder)))
+    if stem.lower().endswith('-shipping'):
+        score += 1  # Unreal's game binary, next to a small bootstrap executable
+    return score
+
+def group_candidates(candidates: List[Dict], roots: Iterable[str], merge_depth: int = 2) -> List[Dict]:
+    """One game per game folder, with its most likely executable.
+
+    Folders nested at most merge_depth below another game's folder (Unreal's
+    Project/Binaries/Win64 under the install folder) are the same game.
+    """
+    roots = list(roots)
+    root_keys = {os.path.normcase(root) for root in roots}
+    folders: Dict[str, List[Dict]] = {}
+    for candidate in candidates:
+        folders.setdefault(game_folder(candidate['path'], roots), []).append(candidate)
+
+    games: Dict[str, List[Dict]] = {}
+    for folder in sorted(folders, key=len):
+        owner = folder
+        parent = os.path.dirname(folder)
+        for _ in range(merge_depth):
+            if parent in games and os.path.normcase(parent) not in root_keys:
+                owner = parent
+                break
+            if parent == os.path.dirname(parent):
+                break
+            parent = os.path.dirname(parent)
+        games.setdefault(owner, []).extend(folders[folder])
+
+    result = []
+    for folder, executables in games.items():
+        best = max(executables, key=lambda c: (candidate_score(c, folder), c['size']))
+        result.append({
+            'name': os.path.basename(folder).replace('_', ' ').strip() or folder,
+            'folder': folder,
+            'path': best['path'],
+            'size': best['size'],
+            'alternatives': len(executables) - 1,
+        })
+    result.sort(key=lambda game: game['name'].casefold())
+    return result
+
+class GameCrawler:
+    """Crawls folders for game executables with a bounded number of parallel scans.
+
+    Directories are scanned on a thread pool with at most workers * 2 scans in
+    flight, depth first so the queue stays small. Pruned folders and folders
+    deeper than max_depth are skipped. The queue and the executables found are
+    saved to state_path every SAVE_INTERVAL seconds and when the crawl is
+    stopped, so an interrupted crawl resumes where it left off; a finished crawl
+    removes its state.
+    """
+    SAVE_INTERVAL = 5.0
+    REPORT_INTERVAL = 0.5
+
+    def __init__(self, roots: List[str], max_depth: int = 6, workers: int = 8,
+                 state_path: Optional[str] = CRAWL_STATE_PATH):
+        self.roots = [os.path.abspath(root) for root in roots]
+        self.max_depth = max_depth
+        self.workers = max(1, workers)
+        self.state_path = state_path
+        self.stop_event = threading.Event()
+        self.pending: List[Tuple[str, int]] = [(root, 0) for root in self.roots]
+        self.candidates: List[Dict] = []
+        self.stats = {'directories': 0, 'files': 0, 'candidates': 0, 'errors': 0,
+                      'pruned': 0, 'elapsed': 0.0, 'per_second': 0.0}
+
+    def resume(self) -> bool:
+        """Continue the saved crawl of the same roots, if there is one."""
+        if not self.state_path or not os.path.exists(self.state_path):
+            return False
+        try:
+            with open(self.state_path, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"Error reading crawl state: {e}")
+            return False
+        if state.get('version') != STATE_VERSION or state.get('roots') != self.roots:
+            return False
+        self.pending = [(path, depth) for path, depth in state['pending']]
+        self.candidates = state['candidates']
+        self.stats.update(state['stats'])
+        print(f"[DEBUG] Resuming crawl: {len(self.pending)} folders left, "
+              f"{len(self.candidates)} executables found so far")
+        return True
+
+    def save_state(self):
+        if not self.state_path:
+            return
+        os.makedirs(os.path.dirname(self.state_path), exist_ok=True)
+        temp_path = f"{self.state_path}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': STATE_VERSION, 'roots': self.roots, 'pending': self.pending,
+                       'candidates': self.candidates, 'stats': self.stats}, f)
+        os.replace(temp_path, self.state_path)
+
+    def clear_state(self):
+        if self.state_path and os.path.exists(self.state_path):
+            os.remove(self.state_path)
+
+    def stop(self):
+        """Stop soon (from any thread); the crawl can be resumed later."""
+        self.stop_event.set()
+
+    @property
+    def finished(self) -> bool:
+        return not self.pending
+
+    def run(self, progress: Optional[Callable[[Dict], None]] = None,
+            on_candidate: Optional[CandidateCallback] = None) -> List[Dict]:
+        """Crawl until done or stopped and return every executable found so far."""
+        started = time.monotonic() - self.stats['elapsed']
+        last_save = last_report = time.monotonic()
+        running = {}
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="crawler") as pool:
+            while (self.pending or running) and not self.stop_event.is_set():
+                while self.pending and len(running) < self.workers * 2:
+                    path, depth = self.pending.pop()
+                    running[pool.submit(scan_directory, path)] = (path, depth)
+
+                done, _ = wait(running, timeout=self.REPORT_INTERVAL, return_when=FIRST_COMPLETED)
+                for future in done:
+                    path, depth = running.pop(future)
+                    try:
+                        subdirs, files, found = future.result()
+                    except OSError:
+                        self.stats['errors'] += 1  # unreadable folder
+                        continue
+                    self.stats['directories'] += 1
+                    self.stats['files'] += files
+                    for candidate in found:
+                        self.candidates.append(candidate)
+                        if on_candidate:
+                            on_candidate(candidate)
+                    for subdir in subdirs:
+                        if depth + 1 > self.max_depth or is_pruned(subdir):
+                            self.stats['pruned'] += 1
+                        else:
+                            self.pending.append((subdir, depth + 1))
+
+                now = time.monotonic()
+                self.stats['candidates'] = len(self.candidates)
+                self.stats['elapsed'] = now - started
+                self.stats['per_second'] = self.stats['directories'] / max(self.stats['elapsed'], 1e-6)
+                if progress and now - last_report >= self.REPORT_INTERVAL:
+                    last_report = now
+                    progress(dict(self.stats, pending=len(self.pending) + len(running)))
+                if now - last_save >= self.SAVE_INTERVAL:
+                    last_save = now
+                    self.save_state_with(running)
+
+            # Stopped: scans still in flight are redone on resume
+            for path, depth in running.values():
+                self.pending.append((path, depth))
+            for future in running:
+                future.cancel()
+
+        if self.pending:
+            self.save_state()
+        else:
+            self.clear_state()
+        if progress:
+            progress(dict(self.stats, pending=len(self.pending)))
+        return self.candidates
+
+    def save_state_with(self, running: Dict):
+        """Save the queue including the folders being scanned right now."""
+        pending = self.pending
+        self.pending = pending + list(running.values())
+        try:
+            self.save_state()
+        except OSError as e:
+            print(f"Error saving crawl state: {e}")
+        finally:
+            self.pending = pending
+
+    def games(self) -> List[Dict]:
+        return group_candidates(self.candidates, self.roots)
+
+def new_games(games: List[Dict], known_paths: Set[str]) -> List[Dict]:
+    """The crawled games whose executable is not in the library yet."""
+    return [game for game in games if os.path.normcase(os.path.normpath(game['path'])) not in known_paths]
+
+def match_catalog(games: List[Dict], store_search) -> Dict[str, str]:
+    """Steam app ids for crawled games, from the local catalog (exe path -> app id)."""
+    matches = {}
+    for game in games:
+        app_id = store_search.resolve_path(game['path']) or store_search.lookup(game['name'])
+        if app_id:
+            matches[game['path']] = app_id
+    return matches
+
+def import_record(game: Dict, app_id: Optional[str] = None, metadata: Optional[Dict] = None) -> Dict:
+    """A manual game record for DatabaseManager.bulk_write_metadata inserts."""
+    record = dict(metadata or {})
+    record.update({
+        'name': record.get('name') or game['name'],
+        'type': 'manual',
+        'app_id': app_id,
+        'install_path': game['path'],
+        'launch_command': game['path'],
+    })
+    return record
+
+def format_stats(stats: Dict) -> str:
+    return (f"{stats['directories']} folders, {stats['candidates']} executables, "
+            f"{stats['per_second']:.0f} folders/s, {stats.get('pending', 0)} queued")
+
+def main():
+    parser = argparse.ArgumentParser(description="Find game executables under folders")
+    parser.add_argument('roots', nargs='+', help="folders to crawl")
+    parser.add_argument('--depth', type=int, default=6, help="deepest folder level to enter")
+    parser.add_argument('--workers', type=int, default=8, help="parallel folder scans")
+    parser.add_argument('--resume', action='store_true', help="continue an interrupted crawl")
+    args = parser.parse_args()
+
+    crawler = GameCrawler(args.roots, max_depth=args.depth, workers=args.workers)
+    if args.resume:
+        crawler.resume()
+    signal.signal(signal.SIGINT, lambda *_: crawler.stop())
+    crawler.run(progress=lambda stats: print(f"\r{format_stats(stats)}", end='', flush=True))
+    print()
+    if not crawler.finished:
+        print("Stopped; continue with --resume")
+        return
+    for game in crawler.games():
+        print(f"{game['name']}: {game['path']} ({game['size'] // 1024} KB)")
+
+if __name__ == "__main__":
+    try:
+        main()
+    except Exception as e:
+        print(f"Error: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
@@ -2,16 +2,32 @@ from PySide6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel,
                              QPushButton, QFrame, QScrollArea, QWidget, QSizePolicy, QMessageBox,
                              QGraphicsDropShadowEffect)
 from PySide6.QtCore import Qt, QSize
-from PySide6.QtGui import QPixmap, QImage, QColor
+from PySide6.QtGui import QPixmap, QImage, QColor, QPainter
 from models import Game
-import requests
-from io import BytesIO
+import asyncio
+from typing import Dict, Optional, Tuple
 
 class GameDetailsDialog(QDialog):
-    def __init__(self, game, parent=None):
+    """Details of one game, shown without blocking the library.
+
+    MainWindow keeps a single instance and points it at another game with
+    show_game, so the widgets are built once. Text and images already in the
+    image cache appear immediately; the background, the full-size portrait poster
+    and metadata the game is still missing arrive afterwards.
+    """
+    # Steam's portrait library art, sized for the poster slot (not every game has one)
+    PORTRAIT_URL = "https://cdn.akamai.steamstatic.com/steam/apps/{app_id}/library_600x900.jpg"
+    POSTER_SIZE = QSize(280, 400)
+
+    def __init__(self, game: Optional[Game] = None, parent=None):
         super().__init__(parent)
-        self.game = game
-        self.setWindowTitle(f"{game.name}")
+        self.game = None
+        self.generation = 0  # bumped on every show_game; stale image loads are dropped
+        self.poster_url = None
+        self.background_url = None
+        self.background = None
+        self.scaled_background = None
+        self.tasks = set()
         self.setMinimumWidth(900)
         self.setMinimumHeight(600)
         self.setStyleSheet("""
@@ -106,8 +122,11 @@ class GameDetailsDialog(QDialog):
             }
         """)
         self.setup_ui()
+        if game is not None:
+            self.set_game(game)
 
     def setup_ui(self):
+        """Build the widgets once; set_game fills them in"""
         layout = QVBoxLayout(self)
         layout.setSpacing(15)
         layout.setContentsMargins(25, 20, 25, 25)
@@ -118,9 +137,9 @@ class GameDetailsDialog(QDialog):
         header_layout.setSpacing(0)
         header_layout.setContentsMargins(0, 0, 0, 0)
 
-        title_label = QLabel(self.game.name)
-        title_label.setObjectName("title-label")
-        header_layout.addWidget(title_label)
+        self.title_label = QLabel()
+        self.title_label.setObjectName("title-label")
+        header_layout.addWidget(self.title_label)
 
         separator = QFrame()
         separator.setObjectName("separator")
@@ -156,39 +175,22 @@ class GameDetailsDialog(QDialog):
         poster_layout.setContentsMargins(0, 0, 0, 0)
         
         # Game poster
-        poster_label = QLabel()
-        poster_label.setMinimumSize(280, 400)
-        poster_label.setMaximumSize(280, 400)
-        poster_label.setAlignment(Qt.AlignCenter)
-        poster_label.setStyleSheet("""
+        self.poster_label = QLabel()
+        self.poster_label.setFixedSize(self.POSTER_SIZE)
+        self.poster_label.setAlignment(Qt.AlignCenter)
+        self.poster_label.setStyleSheet("""
             background-color: rgba(2, 45, 74, 0.7);
             border-radius: 10px;
             padding: 0;
         """)
-        
-        if self.game.poster_url:
-            try:
-                response = requests.get(self.game.poster_url)
-                if response.status_code == 200:
-                    image_data = response.content
-                    pixmap = QPixmap()
-                    pixmap.loadFromData(image_data)
-                    scaled_pixmap = pixmap.scaled(280, 400, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                    poster_label.setPixmap(scaled_pixmap)
-            except Exception as e:
-                print(f"Error loading poster: {e}")
-                poster_label.setText("No Image Available")
-        else:
-            poster_label.setText("No Image Available")
-        
-        poster_layout.addWidget(poster_label)
+        poster_layout.addWidget(self.poster_label)
         
         # Add shadow effect to poster
         poster_shadow = QGraphicsDropShadowEffect()
         poster_shadow.setColor(QColor(0, 0, 0, 120))
         poster_shadow.setBlurRadius(20)
         poster_shadow.setOffset(0, 4)
-        poster_label.setGraphicsEffect(poster_shadow)
+        self.poster_label.setGraphicsEffect(poster_shadow)
         
         left_panel.addWidget(poster_container)
         
@@ -256,179 +258,231 @@ class GameDetailsDialog(QDialog):
         content_layout.addLayout(left_panel)
         
         # Right side - Game details
-        right_panel = QScrollArea()
-        right_panel.setWidgetResizable(True)
-        right_panel.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.right_panel = QScrollArea()
+        self.right_panel.setWidgetResizable(True)
+        self.right_panel.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
         
         details_widget = QWidget()
         details_layout = QVBoxLayout(details_widget)
         details_layout.setSpacing(20)
         details_layout.setContentsMargins(0, 0, 10, 0)
         
+        self.rows: Dict[str, Tuple[QWidget, QLabel]] = {}  # detail name -> (container, text label)
+
         # Game type and installation status
         status_panel = QWidget()
         status_panel.setObjectName("info-panel")
         status_layout = QVBoxLayout(status_panel)
-        
-        # Platform info with icon
-        platform_container = QWidget()
-        platform_container.setObjectName("detail-item")
-        platform_layout = QHBoxLayout(platform_container)
-        platform_layout.setContentsMargins(12, 8, 12, 8)
-        
-        platform_icon = QLabel("🖥️")
-        platform_icon.setStyleSheet("color: #00b0f4; font-size: 16px;")
-        platform_text = QLabel(f"Platform: {self.game.type.capitalize() if self.game.type else 'Unknown'}")
-        platform_text.setObjectName("info-label")
-        
-        platform_layout.addWidget(platform_icon)
-        platform_layout.addWidget(platform_text)
-        platform_layout.addStretch()
-        
-        status_layout.addWidget(platform_container)
-        
-        # Installation status with icon
-        install_container = QWidget()
-        install_container.setObjectName("detail-item")
-        install_layout = QHBoxLayout(install_container)
-        install_layout.setContentsMargins(12, 8, 12, 8)
-        
-        install_icon = QLabel("💾" if self.game.is_installed else "❌")
-        install_icon.setStyleSheet("color: #00b0f4; font-size: 16px;")
-        install_text = QLabel(f"Status: {'Installed' if self.game.is_installed else 'Not Installed'}")
-        install_text.setObjectName("info-label")
-        
-        install_layout.addWidget(install_icon)
-        install_layout.addWidget(install_text)
-        install_layout.addStretch()
-        
-        status_layout.addWidget(install_container)
+        self.add_detail_row(status_layout, 'platform', "🖥️")
+        self.install_icon = self.add_detail_row(status_layout, 'install', "💾")
         details_layout.addWidget(status_panel)
         
         # Game details panel
-        if self.game.description or self.game.genre:
-            details_panel = QWidget()
-            details_panel.setObjectName("info-panel")
-            details_inner_layout = QVBoxLayout(details_panel)
-            
-            if self.game.genre:
-                genre_container = QWidget()
-                genre_container.setObjectName("detail-item")
-                genre_layout = QHBoxLayout(genre_container)
-                genre_layout.setContentsMargins(12, 8, 12, 8)
-                
-                genre_icon = QLabel("🏷️")
-                genre_icon.setStyleSheet("color: #00b0f4; font-size: 16px;")
-                genre_text = QLabel(f"Genre: {self.game.genre}")
-                genre_text.setObjectName("info-label")
-                
-                genre_layout.addWidget(genre_icon)
-                genre_layout.addWidget(genre_text)
-                genre_layout.addStretch()
-                
-                details_inner_layout.addWidget(genre_container)
-            
-            if self.game.description:
-                desc_title = QLabel("Description")
-                desc_title.setObjectName("section-title")
-                details_inner_layout.addWidget(desc_title)
-                
-                desc_label = QLabel(self.game.description)
-                desc_label.setObjectName("info-label")
-                desc_label.setWordWrap(True)
-                details_inner_layout.addWidget(desc_label)
-            
-            details_layout.addWidget(details_panel)
+        self.details_panel = QWidget()
+        self.details_panel.setObjectName("info-panel")
+        details_inner_layout = QVBoxLayout(self.details_panel)
+        self.add_detail_row(details_inner_layout, 'genre', "🏷️")
+        self.description_title = QLabel("Description")
+        self.description_title.setObjectName("section-title")
+        details_inner_layout.addWidget(self.description_title)
+        self.description_label = QLabel()
+        self.description_label.setObjectName("info-label")
+        self.description_label.setWordWrap(True)
+        details_inner_layout.addWidget(self.description_label)
+        details_layout.addWidget(self.details_panel)
         
         # Additional metadata panel
-        if any([self.game.release_date, self.game.developers, self.game.publishers, self.game.playtime]):
-            metadata_panel = QWidget()
-            metadata_panel.setObjectName("info-panel")
-            metadata_layout = QVBoxLayout(metadata_panel)
-            
-            if self.game.playtime is not None:
-                playtime_container = QWidget()
-                playtime_container.setObjectName("detail-item")
-                playtime_layout = QHBoxLayout(playtime_container)
-                playtime_layout.setContentsMargins(12, 8, 12, 8)
-                
-                playtime_icon = QLabel("⏱️")
-                playtime_icon.setStyleSheet("color: #00b0f4; font-size: 16px;")
-                
-                # Format playtime to show hours if >= 60 minutes, otherwise show minutes
-                if self.game.playtime < 60:
-                    playtime_text = QLabel(f"Playtime: {self.game.playtime} minutes")
-                else:
-                    hours = self.game.playtime / 60
-                    playtime_text = QLabel(f"Playtime: {hours:.1f} hours")
-                
-                playtime_text.setObjectName("info-label")
-                
-                playtime_layout.addWidget(playtime_icon)
-                playtime_layout.addWidget(playtime_text)
-                playtime_layout.addStretch()
-                
-                metadata_layout.addWidget(playtime_container)
-            
-            if self.game.release_date:
-                release_container = QWidget()
-                release_container.setObjectName("detail-item")
-                release_layout = QHBoxLayout(release_container)
-                release_layout.setContentsMargins(12, 8, 12, 8)
-                
-                release_icon = QLabel("📅")
-                release_icon.setStyleSheet("color: #00b0f4; font-size: 16px;")
-                release_text = QLabel(f"Release Date: {self.game.release_date}")
-                release_text.setObjectName("info-label")
-                
-                release_layout.addWidget(release_icon)
-                release_layout.addWidget(release_text)
-                release_layout.addStretch()
-                
-                metadata_layout.addWidget(release_container)
-            
-            if self.game.developers:
-                dev_container = QWidget()
-                dev_container.setObjectName("detail-item")
-                dev_layout = QHBoxLayout(dev_container)
-                dev_layout.setContentsMargins(12, 8, 12, 8)
-                
-                dev_icon = QLabel("👨‍💻")
-                dev_icon.setStyleSheet("color: #00b0f4; font-size: 16px;")
-                dev_text = QLabel(f"Developer: {self.game.developers}")
-                dev_text.setObjectName("info-label")
-                
-                dev_layout.addWidget(dev_icon)
-                dev_layout.addWidget(dev_text)
-                dev_layout.addStretch()
-                
-                metadata_layout.addWidget(dev_container)
-            
-            if self.game.publishers:
-                pub_container = QWidget()
-                pub_container.setObjectName("detail-item")
-                pub_layout = QHBoxLayout(pub_container)
-                pub_layout.setContentsMargins(12, 8, 12, 8)
-                
-                pub_icon = QLabel("🏢")
-                pub_icon.setStyleSheet("color: #00b0f4; font-size: 16px;")
-                pub_text = QLabel(f"Publisher: {self.game.publishers}")
-                pub_text.setObjectName("info-label")
-                
-                pub_layout.addWidget(pub_icon)
-                pub_layout.addWidget(pub_text)
-                pub_layout.addStretch()
-                
-                metadata_layout.addWidget(pub_container)
-            
-            details_layout.addWidget(metadata_panel)
+        self.metadata_panel = QWidget()
+        self.metadata_panel.setObjectName("info-panel")
+        metadata_layout = QVBoxLayout(self.metadata_panel)
+        self.add_detail_row(metadata_layout, 'playtime', "⏱️")
+        self.add_detail_row(metadata_layout, 'release', "📅")
+        self.add_detail_row(metadata_layout, 'developer', "👨‍💻")
+        self.add_detail_row(metadata_layout, 'publisher', "🏢")
+        details_layout.addWidget(self.metadata_panel)
         
         details_layout.addStretch()
-        right_panel.setWidget(details_widget)
-        content_layout.addWidget(right_panel, stretch=1)
+        self.right_panel.setWidget(details_widget)
+        content_layout.addWidget(self.right_panel, stretch=1)
         
         layout.addWidget(content_widget)
 
+    def add_detail_row(self, layout: QVBoxLayout, name: str, icon: str) -> QLabel:
+        """Add an icon + text detail item; returns its icon label"""
+        container = QWidget()
+        container.setObjectName("detail-item")
+        row_layout = QHBoxLayout(container)
+        row_layout.setContentsMargins(12, 8, 12, 8)
+        
+        icon_label = QLabel(icon)
+        icon_label.setStyleSheet("color: #00b0f4; font-size: 16px;")
+        text_label = QLabel()
+        text_label.setObjectName("info-label")
+        
+        row_layout.addWidget(icon_label)
+        row_layout.addWidget(text_label)
+        row_layout.addStretch()
+        layout.addWidget(container)
+        self.rows[name] = (container, text_label)
+        return icon_label
+
+    def set_row(self, name: str, text: Optional[str]):
+        container, label = self.rows[name]
+        container.setVisible(bool(text))
+        if text:
+            label.setText(text)
+
+    def show_game(self, game: Game):
+        """Point the dialog at a game and bring it up without waiting for anything"""
+        self.set_game(game)
+        self.show()
+        self.raise_()
+        self.activateWindow()
+
+    def set_game(self, game: Game):
+        """Fill in the text of a game and start loading its images"""
+        if game is not self.game:
+            self.game = game
+            self.generation += 1
+            self.right_panel.verticalScrollBar().setValue(0)
+        game = self.game
+        self.setWindowTitle(f"{game.name}")
+        self.title_label.setText(game.name)
+
+        self.set_row('platform', f"Platform: {game.type.capitalize() if game.type else 'Unknown'}")
+        self.install_icon.setText("💾" if game.is_installed else "❌")
+        self.set_row('install', f"Status: {'Installed' if game.is_installed else 'Not Installed'}")
+
+        description = game.description
+        self.set_row('genre', f"Genre: {game.genre}" if game.genre else None)
+        self.description_title.setVisible(bool(description))
+        self.description_label.setVisible(bool(description))
+        self.description_label.setText(description or "")
+        self.details_panel.setVisible(bool(description or game.genre))
+
+        # Format playtime to show hours if >= 60 minutes, otherwise show minutes
+        if game.playtime is None:
+            playtime = None
+        elif game.playtime < 60:
+            playtime = f"Playtime: {game.playtime} minutes"
+        else:
+            playtime = f"Playtime: {game.playtime / 60:.1f} hours"
+        self.set_row('playtime', playtime)
+        self.set_row('release', f"Release Date: {game.release_date}" if game.release_date else None)
+        self.set_row('developer', f"Developer: {self.join(game.developers)}" if game.developers else None)
+        self.set_row('publisher', f"Publisher: {self.join(game.publishers)}" if game.publishers else None)
+        self.metadata_panel.setVisible(any([game.release_date, game.developers, game.publishers,
+                                            game.playtime is not None]))
+        self.load_images()
+
+    @staticmethod
+    def join(values) -> str:
+        return ", ".join(values) if isinstance(values, (list, tuple)) else str(values)
+
+    def on_game_updated(self, game: Game):
+        """Metadata for a game arrived; refresh if it is the one shown"""
+        if self.game is not None and game.id == self.game.id and self.isVisible():
+            if game is not self.game:
+                self.game.update_from_dict(game.to_dict())
+            self.set_game(self.game)
+
+    def load_images(self):
+        """Show cached images now and fetch the rest in the background"""
+        game = self.game
+        portrait_url = self.PORTRAIT_URL.format(app_id=game.app_id) if game.type == 'steam' and game.app_id else None
+        poster_url = game.poster_url
+        if poster_url != self.poster_url:
+            self.poster_url = poster_url
+            thumbnail = self.cached_image(portrait_url) or self.cached_image(poster_url)
+            self.set_poster(thumbnail)
+            if poster_url and thumbnail is None:
+                self.fetch(poster_url, self.set_thumbnail)
+            if portrait_url and self.cached_image(portrait_url) is None:
+                self.fetch(portrait_url, self.set_poster, quiet=True)
+
+        if game.background_url != self.background_url:
+            self.background_url = game.background_url
+            self.background = None
+            self.scaled_background = None
+            image = self.cached_image(game.background_url)
+            if image is not None:
+                self.set_background(image)
+            elif game.background_url:
+                self.fetch(game.background_url, self.set_background)
+            self.update()
+
+    def cached_image(self, url: Optional[str]) -> Optional[QImage]:
+        owner = self.parent()
+        if url and hasattr(owner, 'cached_image'):
+            return owner.cached_image(url)
+        return None
+
+    def fetch(self, url: str, apply, quiet: bool = False):
+        """Download an image without blocking and hand it to apply if this game is still shown"""
+        owner = self.parent()
+        if not hasattr(owner, 'fetch_image'):
+            return
+        try:
+            loop = asyncio.get_event_loop()
+        except RuntimeError:
+            return
+        generation = self.generation
+
+        async def run():
+            image = await owner.fetch_image(url, quiet=quiet)
+            if image is not None and generation == self.generation:
+                apply(image)
+
+        task = loop.create_task(run())
+        self.tasks.add(task)
+        task.add_done_callback(self.tasks.discard)
+
+    def set_thumbnail(self, image: QImage):
+        # Only while the portrait poster has not arrived
+        if self.poster_label.property("portrait") is not True:
+            self.set_poster(image)
+
+    def set_poster(self, image: Optional[QImage]):
+        if image is None or image.isNull():
+            self.poster_label.setPixmap(QPixmap())
+            self.poster_label.setText("No Image Available")
+            self.poster_label.setProperty("portrait", False)
+            return
+        pixmap = QPixmap.fromImage(image).scaled(self.POSTER_SIZE, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        self.poster_label.setPixmap(pixmap)
+        self.poster_label.setProperty("portrait", image.height() > image.width())
+
+    def set_background(self, image: QImage):
+        self.background = QPixmap.fromImage(image)
+        self.scaled_background = None
+        self.update()
+
+    def resizeEvent(self, event):
+        self.scaled_background = None
+        super().resizeEvent(event)
+
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if self.background is None or self.background.isNull():
+            return
+        # The store background, covering the dialog and faded into its color
+        if self.scaled_background is None:
+            self.scaled_background = self.background.scaled(self.size(), Qt.KeepAspectRatioByExpanding,
+                                                            Qt.SmoothTransformation)
+        scaled = self.scaled_background
+        painter = QPainter(self)
+        painter.setOpacity(0.25)
+        painter.drawPixmap((self.width() - scaled.width()) // 2, (self.height() - scaled.height()) // 2, scaled)
+        painter.end()
+
+    def hideEvent(self, event):
+        """Stop waiting for images; the next show_game looks at the cache again"""
+        for task in list(self.tasks):
+            task.cancel()
+        self.poster_url = None
+        self.background_url = None
+        super().hideEvent(event)
+
     def launch_game(self):
         """Launch the game using the parent window's launch_game method."""
         try:
@@ -1,5 +1,4 @@
 import os
-import subprocess
 import psutil
 from typing import Optional
 from models import Game
@@ -12,18 +11,25 @@ class GameManager:
         self.epic_manager = EpicGamesManager()
         
     def launch_game(self, game_id: int) -> Optional[psutil.Process]:
-        """Launch a game and return its process."""
+        """Launch a game and return its process.
+
+        Returns None when the game was handed to its store client (Steam/Epic),
+        whose game process is found later; raises when the game cannot be launched.
+        """
         try:
             # Get game data from database
             game = self.db_manager.get_game_by_id(game_id)
             if not game:
-                print(f"Game with ID {game_id} not found")
-                return None
+                raise Exception(f"Game with ID {game_id} not found")
                 
             # Check if game is installed
             if not game.is_installed:
-                print(f"Game {game.name} is not installed")
-                return None
+                # A merged entry (library_dedupe) may still start from its other store or executable
+                if game.type != 'epic' and game.epic_launch_command and self.epic_manager.launch_game(game):
+                    return None
+                if game.type not in ('steam', 'epic') or not game.install_path or not os.path.isfile(game.install_path):
+                    raise Exception(f"{game.name} is not installed")
+                return self.start_executable(game.install_path)
                 
             # Launch based on game type
             if game.type == 'steam':
@@ -39,18 +45,21 @@ class GameManager:
             else:
                 # For regular executables
                 if game.install_path and os.path.exists(game.install_path):
-                    process = subprocess.Popen(
-                        game.launch_command,
-                        cwd=os.path.dirname(game.install_path),
-                        shell=True
-                    )
-                    return psutil.Process(process.pid)
+                    executable = (game.launch_command or '').strip().strip('"')
+                    if not os.path.isfile(executable):
+                        executable = game.install_path
+                    return self.start_executable(executable)
                 else:
                     raise Exception(f"Installation path not found: {game.install_path}")
                     
         except Exception as e:
             print(f"Error launching game: {e}")
             raise
+
+    @staticmethod
+    def start_executable(path: str) -> psutil.Process:
+        """Start a game executable directly (no shell), so its liveness and exit code are the game's own."""
+        return psutil.Popen([path], cwd=os.path.dirname(path))
             
     def check_game_running(self, process: Optional[psutil.Process]) -> bool:
         """Check if a game process is still running."""
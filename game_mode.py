@@ -0,0 +1,142 @@
+import gc
+import sys
+import psutil
+from PySide6.QtCore import QObject, QTimer, Signal
+from PySide6.QtGui import QPixmapCache
+
+class GameModeGovernor(QObject):
+    """Scales the launcher down while a game session is active and restores it afterwards."""
+    report_ready = Signal(dict)  # resources released by entering game mode
+
+    IMAGE_CACHE_BUDGET = 24  # decoded images kept in memory during game mode
+    PIXMAP_CACHE_LIMIT_KB = 2048
+    REPORT_DELAY = 5000  # ms to let the launcher settle before measuring
+
+    def __init__(self, main_window):
+        super().__init__(main_window)
+        self.main_window = main_window
+        self.active = False
+        self.process = psutil.Process()
+        self.original_priority = None
+        self.original_pixmap_limit = None
+        self.baseline = {}
+
+        # Prime the CPU counter so the first reading covers the time since startup
+        self.process.cpu_percent(interval=None)
+
+    def enter(self):
+        """Suspend nonessential work and release resources."""
+        if self.active:
+            return
+        self.active = True
+        print("[DEBUG] Entering game mode")
+
+        self.baseline = {
+            'rss': self.process.memory_info().rss,
+            'cpu': self.process.cpu_percent(interval=None),
+        }
+
+        # Scheduler jobs that opted in pause while a game is running
+        self.main_window.scheduler.set_game_running(True)
+        self.freeze_store_tabs()
+        self.trim_image_caches()
+        self.lower_priority()
+        gc.collect()
+
+        QTimer.singleShot(self.REPORT_DELAY, self.report)
+
+    def exit(self):
+        """Restore normal operation."""
+        if not self.active:
+            return
+        self.active = False
+        print("[DEBUG] Leaving game mode")
+
+        self.restore_priority()
+        if self.original_pixmap_limit is not None:
+            QPixmapCache.setCacheLimit(self.original_pixmap_limit)
+            self.original_pixmap_limit = None
+        self.thaw_store_tabs()
+        self.main_window.scheduler.set_game_running(False)
+
+        # Restart the CPU measurement window
+        self.process.cpu_percent(interval=None)
+
+    def freeze_store_tabs(self):
+        """Discard the store web views, which keep running scripts in the background."""
+        store_view = getattr(self.main_window, 'store_view', None)
+        if store_view is None:
+            return  # never opened, nothing to freeze
+        from store_tab import StoreTab
+        for tab in store_view.findChildren(StoreTab):
+            try:
+                tab.freeze()
+            except Exception as e:
+                print(f"Error freezing store tab {tab.title}: {e}")
+
+    def thaw_store_tabs(self):
+        """Restore the store web views."""
+        store_view = getattr(self.main_window, 'store_view', None)
+        if store_view is None:
+            return
+        from store_tab import StoreTab
+        for tab in store_view.findChildren(StoreTab):
+            try:
+                tab.thaw()
+            except Exception as e:
+                print(f"Error restoring store tab {tab.title}: {e}")
+
+    def trim_image_caches(self):
+        """Shrink the decoded image caches to a minimal budget."""
+        image_cache = getattr(self.main_window, 'image_cache', None)
+        if image_cache:
+            # Keep the most recently added images, the rest reload from the disk cache
+            for url in list(image_cache)[:-self.IMAGE_CACHE_BUDGET]:
+                del image_cache[url]
+
+        self.original_pixmap_limit = QPixmapCache.cacheLimit()
+        QPixmapCache.clear()
+        QPixmapCache.setCacheLimit(self.PIXMAP_CACHE_LIMIT_KB)
+
+    def lower_priority(self):
+        """Drop the launcher's scheduling priority below the game's."""
+        try:
+            self.original_priority = self.process.nice()
+            if sys.platform == 'win32':
+                self.process.nice(psutil.BELOW_NORMAL_PRIORITY_CLASS)
+            else:
+                self.process.nice(min(19, self.original_priority + 10))
+        except (psutil.AccessDenied, OSError) as e:
+            print(f"Could not lower launcher priority: {e}")
+            self.original_priority = None
+
+    def restore_priority(self):
+        """Restore the launcher's original priority."""
+        if self.original_priority is None:
+            return
+        try:
+            self.process.nice(self.original_priority)
+        except (psutil.AccessDenied, OSError) as e:
+            # Unprivileged POSIX processes cannot raise their priority back
+            print(f"Could not restore launcher priority: {e}")
+        self.original_priority = None
+
+    def report(self):
+        """Measure how much CPU and memory the launcher released."""
+        if not self.active:
+            return
+        try:
+            rss_after = self.process.memory_info().rss
+            cpu_after = self.process.cpu_percent(interval=None)
+            report = {
+                'ram_before_mb': self.baseline['rss'] / (1024 * 1024),
+                'ram_after_mb': rss_after / (1024 * 1024),
+                'ram_released_mb': (self.baseline['rss'] - rss_after) / (1024 * 1024),
+                'cpu_before': self.baseline['cpu'],
+                'cpu_after': cpu_after,
+            }
+            print(f"[DEBUG] Game mode released {report['ram_released_mb']:.1f} MB RAM, "
+                  f"CPU {report['cpu_before']:.1f}% -> {report['cpu_after']:.1f}%")
+            self.report_ready.emit(report)
+        except Exception as e:
+            print(f"Error measuring game mode savings: {e}")
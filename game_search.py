@@ -1,15 +1,11 @@
 import os
 import sys
 import subprocess
-import requests
 import winreg
 from PySide6.QtWidgets import QApplication, QPushButton, QFileDialog, QVBoxLayout, QWidget, QMessageBox, QDialog, QLabel, QLineEdit, QHBoxLayout
 from PySide6.QtCore import Qt, Signal, QUrl
-from PySide6.QtWebEngineWidgets import QWebEngineView
-from PySide6.QtWebEngineCore import QWebEnginePage, QWebEngineProfile
 from urllib.parse import urlencode
 import json
-import vdf  # for reading Steam config files
 from pathlib import Path
 import re
 from models import Game
@@ -31,8 +27,32 @@ def read_steam_api_key():
         print(f"Error reading Steam API key: {e}")
         return None
 
-# Get Steam API key from file
-STEAM_API_KEY = read_steam_api_key()
+# Credentials are read on first use rather than at import time
+_steam_credentials = {}
+
+def get_cached_steam_api_key():
+    """Get the Steam API key, reading the key file only once."""
+    if 'api_key' not in _steam_credentials:
+        _steam_credentials['api_key'] = read_steam_api_key()
+    return _steam_credentials['api_key']
+
+def get_cached_steam_id():
+    """Get the Steam64 ID, querying the registry only once."""
+    if 'steam_id' not in _steam_credentials:
+        _steam_credentials['steam_id'] = get_steam_id()
+    return _steam_credentials['steam_id']
+
+def __getattr__(name):
+    """Resolve the old module-level constants lazily."""
+    if name == 'STEAM_API_KEY':
+        return get_cached_steam_api_key()
+    if name == 'STEAM_ID':
+        return get_cached_steam_id()
+    if name == 'SteamAuthWebPage':
+        # Keeps QtWebEngine out of startup for callers that never sign in
+        from steam_auth import SteamAuthWebPage
+        return SteamAuthWebPage
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 def get_steam_path():
     """Get Steam installation path from Windows registry."""
@@ -70,25 +90,26 @@ def get_steam_id():
         print(f"Error getting Steam ID: {e}")
         return None
 
-# Get Steam ID at startup
-STEAM_ID = get_steam_id()
-
 def get_steam_games():
     """Get list of games from Steam library"""
     try:
-        if not STEAM_API_KEY:
+        import requests
+
+        api_key = get_cached_steam_api_key()
+        steam_id = get_cached_steam_id()
+        if not api_key:
             print("Error: Steam API key not found")
             return []
             
-        if not STEAM_ID:
+        if not steam_id:
             print("Error: Steam ID not found")
             return []
             
-        print(f"Using Steam ID: {STEAM_ID}")
-        print(f"Using API Key: {STEAM_API_KEY[:5]}...")  # Only show first 5 chars for security
+        print(f"Using Steam ID: {steam_id}")
+        print(f"Using API Key: {api_key[:5]}...")  # Only show first 5 chars for security
             
         # Get owned games from Steam API
-        url = f"https://api.steampowered.com/IPlayerService/GetOwnedGames/v0001/?key={STEAM_API_KEY}&steamid={STEAM_ID}&include_appinfo=true&include_played_free_games=true"
+        url = f"https://api.steampowered.com/IPlayerService/GetOwnedGames/v0001/?key={api_key}&steamid={steam_id}&include_appinfo=true&include_played_free_games=true"
         print(f"Fetching games from URL: {url}")
         response = requests.get(url)
         
@@ -243,32 +264,3 @@ class ManualAddGame(QDialog):
             is_installed=True,
             metadata_fetched=False
         )
-
-class SteamAuthWebPage(QWebEnginePage):
-    def __init__(self, profile, parent=None):
-        super().__init__(profile, parent)
-        self.parent = parent
-        
-        # Accept all certificates (only for Steam's domain)
-        self.certificateError.connect(self.handleCertificateError)
-
-    def handleCertificateError(self, error):
-        if "steamcommunity.com" in error.url().toString():
-            error.acceptCertificate()
-            return True
-        return False
-
-    def acceptNavigationRequest(self, url, _type, isMainFrame):
-        url_string = url.toString()
-        print(f"Navigation request to: {url_string}")  # Debug print
-        
-        # Handle the Steam login response
-        if "/openid/login" in url_string and "openid.claimed_id" in url_string:
-            self.parent.handle_auth_callback(url)
-            return False
-            
-        # Allow navigation to Steam domains
-        if "steamcommunity.com" in url_string:
-            return True
-            
-        return True 
\ No newline at end of file
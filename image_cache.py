@@ -0,0 +1,9 @@
+import os
+import hashlib
+
+# Downloaded posters and backgrounds, one file per image URL
+IMAGE_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "cache", "images")
+
+def image_cache_path(url: str, cache_dir: str = IMAGE_CACHE_DIR) -> str:
+    """Where MainWindow.load_image caches the image for a URL."""
+    return os.path.join(cache_dir, f"{hashlib.md5(url.encode()).hexdigest()}.jpg")
@@ -0,0 +1,235 @@
+#!/usr/bin/env python
+"""
+Library Deduplication
+Finds the same game imported from several stores or added by hand, and merges
+each set into one library entry that keeps every store's launch options.
+
+    python library_dedupe.py [--merge]
+"""
+
+import os
+import re
+import sys
+import argparse
+from datetime import datetime, timezone
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from models import Game
+from store_search import normalize_title
+from game_crawler import game_folder
+
+# Words that only name an edition of a game, stripped from the end of a title
+EDITION_WORDS = (r"game of the year|goty|definitive|complete|deluxe|ultimate|gold|enhanced|special|"
+                 r"collector s|anniversary|standard|digital|premium|legendary|royal|classic")
+EDITION_SUFFIX = re.compile(rf"(?:\s+(?:{EDITION_WORDS}))+\s+(?:edition|version)$"
+                            r"|\s+(?:game of the year|goty|director s cut)$")
+EDITION_ENDINGS = ('edition', 'version', 'goty', 'game of the year', 'director s cut')
+YEAR = re.compile(r"\(\s*(?:19|20)\d\d\s*\)")  # "DOOM (2016)"; "Cyberpunk 2077" keeps its number
+ROMAN_NUMERALS = {'ii': '2', 'iii': '3', 'iv': '4', 'v': '5', 'vi': '6', 'vii': '7',
+                  'viii': '8', 'ix': '9', 'x': '10', 'xi': '11', 'xii': '12', 'xiii': '13'}
+STORE_RANK = {'steam': 0, 'epic': 1}  # the primary entry of a merged set, then every other type
+
+def canonical_title(name: str) -> str:
+    """A title reduced to what stays the same across stores and editions.
+
+    "The Witcher® 3: Wild Hunt - Game of the Year Edition" and "Witcher III
+    Wild Hunt" both become "witcher 3 wild hunt".
+    """
+    name = (name or '').replace('&', ' and ').replace("'", ' ')
+    title = normalize_title(YEAR.sub(' ', name) if '(' in name else name)
+    previous = None
+    while title != previous and title.endswith(EDITION_ENDINGS):  # skip the regex for most titles
+        previous = title
+        title = EDITION_SUFFIX.sub('', title)
+    words = title.split()
+    if len(words) > 1 and words[0] == 'the':
+        words = words[1:]
+    return ' '.join([words[0]] + [ROMAN_NUMERALS.get(word, word) for word in words[1:]]) if words else ''
+
+def release_year(game: Game) -> Optional[int]:
+    """The year in the title ("DOOM (1993)"), else the year of the known release date."""
+    match = YEAR.search(game.name or '') if '(' in (game.name or '') else None
+    if match:
+        return int(match.group(0).strip('() '))
+    epoch = game.release_epoch
+    return datetime.fromtimestamp(epoch, timezone.utc).year if epoch is not None else None
+
+def install_folder(game: Game) -> Optional[str]:
+    """The normalized game folder of an install path (an executable's game folder, or the folder itself)."""
+    path = game.install_path
+    if not path:
+        return None
+    path = os.path.normcase(os.path.normpath(path))
+    if path.lower().endswith('.exe'):
+        path = game_folder(path, ())
+    return path
+
+def store_identity(game: Game, folder: Optional[str]) -> Dict[str, str]:
+    """What a game's entry is on its own store: an entry never merges with another of a different identity."""
+    identity = {}
+    if game.app_id and game.type != 'epic':
+        identity['steam'] = str(game.app_id)  # manual games keep the Steam app id they were matched to
+    if game.epic_app_id:
+        identity['epic'] = game.epic_app_id
+    if folder and game.type not in STORE_RANK:
+        identity[game.type] = folder
+    return identity
+
+def blocking_keys(game: Game, identity: Dict[str, str], folder: Optional[str]) -> List[Tuple[str, str]]:
+    """The keys two entries of the same game share, strongest first."""
+    keys = list(identity.items())
+    if folder:
+        keys.append(('folder', folder))
+    title = canonical_title(game.name)
+    if title:
+        keys.append(('title', title))
+    return keys
+
+class DuplicateIndex:
+    """Clusters library entries that are the same game, in near-linear time.
+
+    Every entry is indexed under its blocking keys (Steam/Epic app ids, install
+    folder, canonical title); entries sharing a key are joined with union-find.
+    A join is refused when both sides already have a different identity on the
+    same store (two Steam app ids, two manual installs), and a join by title
+    alone is refused when the release years differ, so a Steam "DOOM" (2016)
+    and an Epic "DOOM (1993)" stay apart.
+    """
+
+    def __init__(self, games: Iterable[Game]):
+        self.games: Dict[int, Game] = {game.id: game for game in games if game.id is not None}
+        self.parent: Dict[int, int] = {game_id: game_id for game_id in self.games}
+        self.size: Dict[int, int] = {game_id: 1 for game_id in self.games}
+        self.identity: Dict[int, Dict[str, str]] = {}
+        self.years: Dict[int, Set[int]] = {}
+        keyed = []
+        for game_id, game in self.games.items():
+            folder = install_folder(game)
+            self.identity[game_id] = store_identity(game, folder)
+            year = release_year(game)
+            self.years[game_id] = {year} if year else set()
+            keyed.extend((key, game_id) for key in blocking_keys(game, self.identity[game_id], folder))
+        # Strong keys first, so titles only join what ids and folders did not tell apart
+        keyed.sort(key=lambda item: item[0][0] == 'title')
+        # Each key keeps one entry per cluster that refused to join the others
+        seen: Dict[Tuple[str, str], List[int]] = {}
+        for key, game_id in keyed:
+            earlier = seen.setdefault(key, [])
+            by_title = key[0] == 'title'
+            if not any(self.union(other, game_id, by_title) for other in earlier):
+                earlier.append(game_id)
+
+    def find(self, game_id: int) -> int:
+        root = game_id
+        while self.parent[root] != root:
+            root = self.parent[root]
+        while self.parent[game_id] != root:
+            self.parent[game_id], game_id = root, self.parent[game_id]
+        return root
+
+    def union(self, a: int, b: int, by_title: bool = False) -> bool:
+        a, b = self.find(a), self.find(b)
+        if a == b:
+            return True
+        identity_a, identity_b = self.identity[a], self.identity[b]
+        if any(identity_b.get(store, value) != value for store, value in identity_a.items()):
+            return False
+        if by_title and self.years[a] and self.years[b] and not self.years[a] & self.years[b]:
+            return False
+        if self.size[a] < self.size[b]:
+            a, b = b, a
+            identity_a, identity_b = identity_b, identity_a
+        self.parent[b] = a
+        self.size[a] += self.size[b]
+        identity_a.update(identity_b)
+        self.years[a] |= self.years.pop(b)
+        del self.identity[b]
+        return True
+
+    def clusters(self) -> List[List[Game]]:
+        """Every set of two or more entries of the same game, primary entry first."""
+        groups: Dict[int, List[Game]] = {}
+        for game_id, game in self.games.items():
+            groups.setdefault(self.find(game_id), []).append(game)
+        return [sorted(group, key=primary_rank) for group in groups.values() if len(group) > 1]
+
+def primary_rank(game: Game) -> Tuple:
+    """Steam first, then Epic, then entries with metadata, then the oldest."""
+    return (STORE_RANK.get(game.type, len(STORE_RANK)), not game.metadata_fetched, game.id)
+
+def merge_update(primary: Game, duplicates: List[Game]) -> Dict:
+    """The update that gives the primary entry every store's launch options and missing metadata."""
+    update = {}
+    everyone = [primary] + duplicates
+    # Per-store launch options: the Steam app id, the Epic app and launch URL, the executable
+    if primary.type == 'epic':
+        fields = ('epic_app_id', 'epic_launch_command', 'install_path')
+    else:
+        fields = ('app_id', 'epic_app_id', 'epic_launch_command', 'install_path')
+    # An executable beats an Epic install folder as the path to start the game from directly
+    by_path = sorted(duplicates, key=lambda game: not (game.install_path or '').lower().endswith('.exe'))
+    for field in fields:
+        if not getattr(primary, field):
+            value = next((getattr(game, field) for game in by_path
+                          if getattr(game, field) and (field != 'app_id' or game.type != 'epic')), None)
+            if value:
+                update[field] = value
+
+    for field in ('genre', 'poster_url', 'background_url', 'description', 'release_date', 'rating',
+                  'metacritic', 'esrb_rating', 'platforms', 'developers', 'publishers'):
+        if not getattr(primary, field):
+            value = next((getattr(game, field) for game in duplicates if getattr(game, field)), None)
+            if value:
+                update[field] = value
+    if not primary.metadata_fetched and any(game.metadata_fetched for game in duplicates):
+        update['metadata_fetched'] = True
+    if any(game.is_installed for game in everyone) and not primary.is_installed:
+        update['is_installed'] = True
+
+    # Steam playtime comes from the Steam API; every other store's was counted locally
+    if primary.type != 'steam':
+        update['playtime'] = sum(game.playtime or 0 for game in everyone)
+    played = [game.last_launched for game in everyone if game.last_launched]
+    if played and max(played) != primary.last_launched:
+        update['last_played'] = max(played).strftime('%Y-%m-%d %H:%M:%S')  # as CURRENT_TIMESTAMP
+    return update
+
+def find_duplicates(games: Iterable[Game]) -> List[List[Game]]:
+    return DuplicateIndex(games).clusters()
+
+def merge_duplicates(db_manager, games: Optional[Iterable[Game]] = None) -> int:
+    """Merge every set of duplicate entries in the library; returns the number of entries removed."""
+    return merge_clusters(db_manager, find_duplicates(db_manager.get_all_games() if games is None else games))
+
+def merge_clusters(db_manager, clusters: Iterable[List[Game]]) -> int:
+    """Merge each cluster (primary entry first, as find_duplicates returns them); returns the entries removed."""
+    removed = 0
+    for cluster in clusters:
+        primary, duplicates = cluster[0], cluster[1:]
+        if db_manager.merge_games(primary.id, [game.id for game in duplicates],
+                                  merge_update(primary, duplicates)):
+            print(f"[DEBUG] Merged {', '.join(f'{g.name} ({g.type})' for g in duplicates)} "
+                  f"into {primary.name} ({primary.type})")
+            removed += len(duplicates)
+    return removed
+
+def main():
+    from database import DatabaseManager
+    parser = argparse.ArgumentParser(description="Find games that are in the library more than once")
+    parser.add_argument('--merge', action='store_true', help="merge them instead of only listing them")
+    args = parser.parse_args()
+
+    db = DatabaseManager()
+    if args.merge:
+        print(f"Removed {merge_duplicates(db)} duplicate entries")
+        return
+    for cluster in find_duplicates(db.get_all_games()):
+        print(" = ".join(f"{game.name} ({game.type}, #{game.id})" for game in cluster))
+
+if __name__ == "__main__":
+    try:
+        main()
+    except Exception as e:
+        print(f"Error: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
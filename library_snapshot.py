@@ -0,0 +1,109 @@
+import os
+import struct
+from typing import List, Optional, Tuple
+from models import Game
+
+SNAPSHOT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "cache", "library_snapshot.bin")
+
+# File layout (little endian):
+#   header   magic, version, string count, record count
+#   strings  u16 length + UTF-8 bytes, each distinct string stored once
+#   records  id, flags, then string table indices for name, type, genre and poster URL
+# Records are stored in grid order.
+MAGIC = b"CWLS"
+VERSION = 1
+HEADER = struct.Struct("<4sBII")
+STRING_LENGTH = struct.Struct("<H")
+RECORD = struct.Struct("<iBIIII")
+NO_STRING = 0xFFFFFFFF
+FLAG_INSTALLED = 0x01
+
+def visible_state(games: List[Game]) -> List[Tuple]:
+    """The parts of each game the library grid shows, in grid order."""
+    return [(game.id, game.name, game.type, game.genre, game.poster_url, bool(game.is_installed))
+            for game in games]
+
+def save_snapshot(games: List[Game], path: str = SNAPSHOT_PATH) -> bool:
+    """Write the grid state for the given games. The file is replaced atomically."""
+    try:
+        strings = {}
+        records = []
+
+        def string_index(value: Optional[str]) -> int:
+            if value is None:
+                return NO_STRING
+            if value not in strings:
+                strings[value] = len(strings)
+            return strings[value]
+
+        for game in games:
+            if game.id is None:
+                continue
+            records.append(RECORD.pack(
+                game.id,
+                FLAG_INSTALLED if game.is_installed else 0,
+                string_index(game.name),
+                string_index(game.type),
+                string_index(game.genre),
+                string_index(game.poster_url),
+            ))
+
+        chunks = [HEADER.pack(MAGIC, VERSION, len(strings), len(records))]
+        for value in strings:  # dicts keep insertion order, which matches the indices
+            data = value.encode("utf-8")[:0xFFFF]
+            chunks.append(STRING_LENGTH.pack(len(data)))
+            chunks.append(data)
+        chunks.extend(records)
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temp_path = path + ".tmp"
+        with open(temp_path, "wb") as f:
+            f.write(b"".join(chunks))
+        os.replace(temp_path, path)
+        print(f"[DEBUG] Saved library snapshot with {len(records)} games")
+        return True
+    except Exception as e:
+        print(f"Error saving library snapshot: {e}")
+        return False
+
+def load_snapshot(path: str = SNAPSHOT_PATH) -> Optional[List[Game]]:
+    """Read a snapshot as lightweight Game placeholders. Returns None if there is no usable snapshot."""
+    try:
+        if not os.path.exists(path):
+            return None
+        with open(path, "rb") as f:
+            data = f.read()
+
+        magic, version, string_count, record_count = HEADER.unpack_from(data, 0)
+        if magic != MAGIC or version != VERSION:
+            print("[DEBUG] Ignoring library snapshot with unknown format")
+            return None
+
+        offset = HEADER.size
+        strings = []
+        for _ in range(string_count):
+            (length,) = STRING_LENGTH.unpack_from(data, offset)
+            offset += STRING_LENGTH.size
+            strings.append(data[offset:offset + length].decode("utf-8", errors="replace"))
+            offset += length
+
+        def lookup(index: int) -> Optional[str]:
+            return None if index == NO_STRING else strings[index]
+
+        games = []
+        for game_id, flags, name, game_type, genre, poster_url in RECORD.iter_unpack(
+                data[offset:offset + record_count * RECORD.size]):
+            # Installation status comes from the snapshot, the real check runs during reconciliation
+            games.append(Game(
+                id=game_id,
+                name=lookup(name) or "",
+                type=lookup(game_type) or "",
+                genre=lookup(genre),
+                poster_url=lookup(poster_url),
+                is_installed=bool(flags & FLAG_INSTALLED),
+                check_install=False
+            ))
+        return games
+    except Exception as e:
+        print(f"Error loading library snapshot: {e}")
+        return None
@@ -0,0 +1,159 @@
+import re
+import locale
+from bisect import bisect_left, bisect_right
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Tuple
+from models import Game
+
+_DIGITS = re.compile(r'(\d+)')
+
+def _collate(text: str) -> str:
+    """Locale-aware collation key, falling back to case folding."""
+    try:
+        return locale.strxfrm(text)
+    except Exception:
+        return text
+
+def name_key(name: Optional[str]) -> Tuple:
+    """Natural sort key: case-insensitive, locale-aware, and 'Game 2' before 'Game 10'."""
+    parts = _DIGITS.split((name or "").casefold().strip())
+    # Split keeps text at even positions and digit runs at odd ones, so types line up between keys
+    return tuple(int(part) if i % 2 else _collate(part) for i, part in enumerate(parts))
+
+def _timestamp(value: Optional[datetime]) -> float:
+    return value.timestamp() if value else float('-inf')
+
+def _release_key(game: Game) -> float:
+    """Normalized release timestamp; unknown dates ("Coming soon") sort as oldest."""
+    epoch = game.release_epoch
+    return epoch if epoch is not None else float('-inf')
+
+class SortOption:
+    """A way to order the library by a numeric value, ties broken by name."""
+
+    def __init__(self, label: str, key: Callable[[Game], float], descending: bool):
+        self.label = label
+        self.key = key
+        self.descending = descending
+
+SORT_OPTIONS: Dict[str, SortOption] = {
+    'name': SortOption("Name", lambda g: 0, False),  # the name tiebreak does the work
+    'playtime': SortOption("Most played", lambda g: g.playtime or 0, True),
+    'last_played': SortOption("Recently played", lambda g: _timestamp(g.last_launched), True),
+    'release_date': SortOption("Release date", _release_key, True),
+    'metacritic': SortOption("Metacritic score", lambda g: g.metacritic or 0, True),
+    'date_added': SortOption("Recently added", lambda g: _timestamp(g.created_at), True),
+}
+
+class LibrarySorter:
+    """Orders games by a SortOption using precomputed, cached sort keys.
+
+    Keys are kept per game until invalidate() is called after a write. Values
+    of descending options are negated, so every key sorts ascending and ends
+    with the name and id, which makes keys unique and bisect-friendly.
+    """
+
+    def __init__(self, sort_by: str = 'name'):
+        self.sort_by = sort_by
+        self.cache: Dict[str, Dict[int, Tuple]] = {}  # option -> id(game) -> key
+        self.names: Dict[int, Tuple] = {}  # id(game) -> natural name key
+        self.sorted_keys: List[Tuple] = []  # ascending keys of the last sorted list
+        self.sorted_list: Optional[List[Game]] = None
+        self.source: Optional[List[Game]] = None  # library the cached keys belong to
+
+    @property
+    def option(self) -> SortOption:
+        return SORT_OPTIONS[self.sort_by]
+
+    def set_sort(self, sort_by: str):
+        if sort_by not in SORT_OPTIONS:
+            raise ValueError(f"Unknown sort option '{sort_by}'")
+        if sort_by != self.sort_by:
+            self.sort_by = sort_by
+            self.sorted_list = None
+
+    def clear(self):
+        """Forget every cached key."""
+        self.cache.clear()
+        self.names.clear()
+        self.sorted_list = None
+
+    def sync(self, games: List[Game]):
+        """Drop the cache when the main window replaced its game list (ids of old games get reused)."""
+        if games is not self.source:
+            self.clear()
+            self.source = games
+
+    def invalidate(self, game: Game):
+        """Drop a game's cached keys after it was written.
+
+        The last sorted list may now be out of order, so the next is_sorted() is
+        False; use reposition() instead to move the game and keep the list sorted.
+        """
+        self._drop_keys(game)
+        self.sorted_list = None
+
+    def _drop_keys(self, game: Game):
+        for keys in self.cache.values():
+            keys.pop(id(game), None)
+        self.names.pop(id(game), None)
+
+    def key(self, game: Game) -> Tuple:
+        """Cached ascending sort key for the current option."""
+        keys = self.cache.setdefault(self.sort_by, {})
+        key = keys.get(id(game))
+        if key is None:
+            name = self.names.get(id(game))
+            if name is None:
+                name = self.names[id(game)] = name_key(game.name)
+            value = self.option.key(game)
+            key = (-value if self.option.descending else value, name, game.id or 0)
+            keys[id(game)] = key
+        return key
+
+    def sort(self, games: List[Game]) -> List[Game]:
+        """Sort a list of games in place and remember it for incremental updates."""
+        keys = [self.key(game) for game in games]
+        order = sorted(range(len(games)), key=keys.__getitem__)
+        self.sorted_keys = [keys[i] for i in order]
+        games[:] = [games[i] for i in order]
+        self.sorted_list = games
+        return games
+
+    def is_sorted(self, games: List[Game]) -> bool:
+        """True if the list is the last one sorted (or repositioned) with the current option."""
+        return games is self.sorted_list and len(games) == len(self.sorted_keys)
+
+    def index_of(self, games: List[Game], game: Game) -> int:
+        """Position of this very game object in a list (never compared by value).
+
+        In the last sorted list a game whose key is still cached is found by
+        binary search; otherwise the list is scanned.
+        """
+        key = self.cache.get(self.sort_by, {}).get(id(game))
+        if key is not None and self.is_sorted(games):
+            index = bisect_left(self.sorted_keys, key)
+            if index < len(games) and games[index] is game:
+                return index
+        return next(i for i, g in enumerate(games) if g is game)
+
+    def reposition(self, games: List[Game], game: Game) -> int:
+        """Move one changed game to its new place with binary search instead of a full re-sort.
+
+        Returns the game's new index in the list.
+        """
+        if not self.is_sorted(games):
+            self._drop_keys(game)
+            self.sort(games)
+            return self.index_of(games, game)
+
+        index = self.index_of(games, game)
+        del self.sorted_keys[index]
+        del games[index]
+
+        self._drop_keys(game)
+        new_key = self.key(game)
+        index = bisect_right(self.sorted_keys, new_key)
+        self.sorted_keys.insert(index, new_key)
+        games.insert(index, game)
+        return index
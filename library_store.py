@@ -0,0 +1,338 @@
+from array import array
+from bisect import bisect_left, insort
+from datetime import datetime, timezone
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from models import Game
+
+def empty_filters() -> Dict:
+    """Filter criteria that match every game (see LibraryStore.select)."""
+    return {
+        'genre': set(),
+        'type': set(),
+        'developer': set(),
+        'publisher': set(),
+        'installed': None,  # True, False or None for both
+        'release_from': None,  # first release year to include, or None
+        'release_to': None,  # last release year to include, or None
+        'match_all': set(),  # columns whose selected values must all match
+    }
+
+def split_genres(genre: Optional[str]) -> List[str]:
+    """Split a stored genre string such as 'Action, Adventure' into its genres."""
+    if not genre:
+        return []
+    return [g.strip() for g in genre.split(',') if g.strip()]
+
+def iter_bits(bits: int) -> Iterable[int]:
+    """Yield the row indices set in a bitset, lowest first."""
+    # Scanning the binary string is linear, peeling bits off the int would be quadratic
+    digits = bin(bits)[:1:-1]
+    row = digits.find('1')
+    while row != -1:
+        yield row
+        row = digits.find('1', row + 1)
+
+def bitset_from_rows(rows: List[int]) -> int:
+    """Build a bitset from row indices in one pass."""
+    if len(rows) < 64:
+        bits = 0
+        for row in rows:
+            bits |= 1 << row
+        return bits
+    # Setting bits one at a time copies the whole int for each row
+    buffer = bytearray(max(rows) // 8 + 1)
+    for row in rows:
+        buffer[row >> 3] |= 1 << (row & 7)
+    return int.from_bytes(buffer, 'little')
+
+def year_start(year: int) -> int:
+    """UTC timestamp of January 1st of a year."""
+    return int(datetime(year, 1, 1, tzinfo=timezone.utc).timestamp())
+
+class CategoryColumn:
+    """Dictionary-encoded column: each distinct value gets a code and the set of rows holding it.
+
+    Common values keep their rows as a bitset. Rare values (most developers and
+    publishers) keep a sorted row list, which is far smaller than a bitset the
+    size of the library.
+    """
+    DENSE_FRACTION = 256  # a value is dense once it holds at least 1/256 of the rows
+
+    def __init__(self):
+        self.values: List[str] = []  # code -> value
+        self.codes: Dict[str, int] = {}  # value -> code
+        self.bitsets: List[Optional[int]] = []  # code -> rows as a bitset (dense values)
+        self.row_lists: List[Optional[List[int]]] = []  # code -> sorted rows (sparse values)
+        self.row_codes: Dict[int, Tuple[int, ...]] = {}  # row -> codes it holds
+
+    def code(self, value: str) -> int:
+        """Get the code for a value, adding it if new."""
+        code = self.codes.get(value)
+        if code is None:
+            code = len(self.values)
+            self.codes[value] = code
+            self.values.append(value)
+            self.bitsets.append(None)
+            self.row_lists.append([])
+        return code
+
+    def add(self, row: int, values: Iterable[str]):
+        codes = tuple(self.code(value) for value in values)
+        self.row_codes[row] = codes
+        for code in codes:
+            if self.bitsets[code] is not None:
+                self.bitsets[code] |= 1 << row
+            else:
+                insort(self.row_lists[code], row)
+
+    def load(self, rows_by_value: Dict[str, List[int]], row_count: int):
+        """Bulk-build a whole library's column from ascending row lists."""
+        dense_rows = max(64, row_count // self.DENSE_FRACTION)
+        row_codes: Dict[int, List[int]] = {}
+        for value, rows in rows_by_value.items():
+            code = self.code(value)
+            if len(rows) >= dense_rows:
+                self.bitsets[code] = bitset_from_rows(rows)
+                self.row_lists[code] = None
+            else:
+                self.row_lists[code] = rows
+            for row in rows:
+                row_codes.setdefault(row, []).append(code)
+        self.row_codes = {row: tuple(codes) for row, codes in row_codes.items()}
+
+    def remove(self, row: int):
+        for code in self.row_codes.pop(row, ()):
+            if self.bitsets[code] is not None:
+                self.bitsets[code] &= ~(1 << row)
+            else:
+                rows = self.row_lists[code]
+                index = bisect_left(rows, row)
+                if index < len(rows) and rows[index] == row:
+                    del rows[index]
+
+    def rows_bitset(self, code: int) -> int:
+        bits = self.bitsets[code]
+        return bits if bits is not None else bitset_from_rows(self.row_lists[code])
+
+    def select(self, values: Iterable[str], match_all: bool = False) -> int:
+        """Rows holding any (or all) of the values."""
+        result = None
+        for value in values:
+            code = self.codes.get(value)
+            bits = self.rows_bitset(code) if code is not None else 0
+            if result is None:
+                result = bits
+            else:
+                result = result & bits if match_all else result | bits
+        return result or 0
+
+    def counts(self, within: int) -> Dict[str, int]:
+        """Number of rows in `within` holding each value (values with no rows are left out)."""
+        digits = None
+        counts = {}
+        for code, bits in enumerate(self.bitsets):
+            if bits is not None:
+                count = (bits & within).bit_count()
+            else:
+                rows = self.row_lists[code]
+                if not rows:
+                    continue
+                if digits is None:
+                    digits = bin(within)[:1:-1]
+                count = sum(1 for row in rows if row < len(digits) and digits[row] == '1')
+            if count:
+                counts[self.values[code]] = count
+        return counts
+
+class LibraryStore:
+    """Columnar view of the library used for filtering, facet counts and sorting.
+
+    Category columns are dictionary encoded with one bitset per value, flags are
+    bitsets and numbers live in typed arrays, so filters and counts are a handful
+    of big-integer operations instead of a scan over Game objects. Rows keep
+    their index until the next rebuild; removed rows are only cleared from the
+    `alive` bitset.
+    """
+    CATEGORY_COLUMNS = ('type', 'genre', 'platform', 'developer', 'publisher')
+
+    def __init__(self, games: Optional[List[Game]] = None):
+        self.rebuild(games or [])
+
+    def rebuild(self, games: List[Game]):
+        """Re-encode the whole library."""
+        self.source = games
+        self.games: List[Game] = []
+        self.rows: Dict[int, int] = {}  # id(game) -> row
+        self.columns = {name: CategoryColumn() for name in self.CATEGORY_COLUMNS}
+        self.type_codes = array('H')
+        self.playtime = array('q')
+        self.rating = array('d')
+        self.metacritic = array('q')
+        self.release_epochs: Dict[int, int] = {}  # row -> normalized release timestamp (known dates only)
+        self.release_index: List[Tuple[int, int]] = []  # sorted (timestamp, row) for range queries
+        self.installed = 0
+        self.metadata_fetched = 0
+        self.alive = 0
+
+        # Collect rows per value first and build every bitset once
+        rows_by_value = {name: {} for name in self.CATEGORY_COLUMNS}
+        installed, fetched = [], []
+        for row, game in enumerate(games):
+            self.games.append(game)
+            self.rows[id(game)] = row
+            values = self._category_values(game)
+            for name in self.CATEGORY_COLUMNS:
+                column_rows = rows_by_value[name]
+                for value in values[name]:
+                    column_rows.setdefault(value, []).append(row)
+            self.type_codes.append(self.columns['type'].code(game.type or ''))
+            self.playtime.append(game.playtime or 0)
+            self.rating.append(game.rating or 0.0)
+            self.metacritic.append(game.metacritic or 0)
+            epoch = game.release_epoch
+            if epoch is not None:
+                self.release_epochs[row] = epoch
+            if game.is_installed:
+                installed.append(row)
+            if game.metadata_fetched:
+                fetched.append(row)
+
+        for name, column in self.columns.items():
+            column.load(rows_by_value[name], len(games))
+        self.installed = bitset_from_rows(installed) if installed else 0
+        self.metadata_fetched = bitset_from_rows(fetched) if fetched else 0
+        self.release_index = sorted((epoch, row) for row, epoch in self.release_epochs.items())
+        self.alive = (1 << len(games)) - 1
+
+    def sync(self, games: List[Game]):
+        """Rebuild when the main window replaced its game list."""
+        if games is not self.source or len(games) != len(self.rows):
+            self.rebuild(games)
+
+    def add_game(self, game: Game) -> int:
+        """Append a row for a game."""
+        row = len(self.games)
+        self.games.append(game)
+        self.rows[id(game)] = row
+        self.type_codes.append(0)
+        self.playtime.append(0)
+        self.rating.append(0.0)
+        self.metacritic.append(0)
+        self.alive |= 1 << row
+        self._encode(row, game)
+        return row
+
+    def update_game(self, game: Game):
+        """Re-encode a single game after it changed."""
+        row = self.rows.get(id(game))
+        if row is None:
+            self.add_game(game)
+            return
+        self._clear(row)
+        self._encode(row, game)
+
+    def remove_game(self, game: Game):
+        """Drop a game from every result."""
+        row = self.rows.pop(id(game), None)
+        if row is not None:
+            self._clear(row)
+            self.alive &= ~(1 << row)
+
+    @staticmethod
+    def _category_values(game: Game) -> Dict[str, Iterable[str]]:
+        return {
+            'type': (game.type or '',),
+            'genre': split_genres(game.genre),
+            'platform': game.platforms or (),
+            'developer': game.developers or (),
+            'publisher': game.publishers or (),
+        }
+
+    def _encode(self, row: int, game: Game):
+        bit = 1 << row
+        for name, values in self._category_values(game).items():
+            self.columns[name].add(row, values)
+        self.type_codes[row] = self.columns['type'].code(game.type or '')
+        self.playtime[row] = game.playtime or 0
+        self.rating[row] = game.rating or 0.0
+        self.metacritic[row] = game.metacritic or 0
+        epoch = game.release_epoch
+        if epoch is not None:
+            self.release_epochs[row] = epoch
+            insort(self.release_index, (epoch, row))
+        if game.is_installed:
+            self.installed |= bit
+        if game.metadata_fetched:
+            self.metadata_fetched |= bit
+
+    def _clear(self, row: int):
+        mask = ~(1 << row)
+        for column in self.columns.values():
+            column.remove(row)
+        epoch = self.release_epochs.pop(row, None)
+        if epoch is not None:
+            index = bisect_left(self.release_index, (epoch, row))
+            if index < len(self.release_index) and self.release_index[index] == (epoch, row):
+                del self.release_index[index]
+        self.installed &= mask
+        self.metadata_fetched &= mask
+
+    def select(self, criteria: Dict) -> int:
+        """Bitset of rows matching every criterion.
+
+        Category criteria map a column name to a set of values, matched with OR
+        unless the column is listed in criteria['match_all']. 'installed' and
+        'metadata_fetched' take True/False. 'release_from' and 'release_to' take
+        inclusive years and leave out games without a known release date.
+        Missing or empty criteria match all.
+        """
+        bits = self.alive
+        match_all: Set[str] = criteria.get('match_all', set())
+        for name in self.CATEGORY_COLUMNS:
+            values = criteria.get(name)
+            if values:
+                bits &= self.columns[name].select(values, name in match_all)
+        for flag in ('installed', 'metadata_fetched'):
+            wanted = criteria.get(flag)
+            if wanted is not None:
+                flag_bits = getattr(self, flag)
+                bits &= flag_bits if wanted else ~flag_bits
+        first, last = criteria.get('release_from'), criteria.get('release_to')
+        if first is not None or last is not None:
+            bits &= self.released_between(
+                year_start(first) if first is not None else None,
+                year_start(last + 1) if last is not None else None,
+            )
+        return bits
+
+    def released_between(self, start: Optional[int] = None, end: Optional[int] = None) -> int:
+        """Bitset of rows released in [start, end), found by binary search on the release index."""
+        low = bisect_left(self.release_index, (start, -1)) if start is not None else 0
+        high = bisect_left(self.release_index, (end, -1)) if end is not None else len(self.release_index)
+        rows = [row for _, row in self.release_index[low:high]]
+        return bitset_from_rows(rows) if rows else 0
+
+    def facet_counts(self, column: str, within: Optional[int] = None) -> Dict[str, int]:
+        """Per-value row counts for a category column, limited to a bitset."""
+        return self.columns[column].counts(self.alive if within is None else within)
+
+    def flag_count(self, flag: str, within: Optional[int] = None) -> int:
+        """Number of rows with a flag set, limited to a bitset."""
+        within = self.alive if within is None else within
+        return (getattr(self, flag) & within).bit_count()
+
+    def games_for(self, bits: int, order: Optional[List[int]] = None) -> List[Game]:
+        """Games for the rows in a bitset, in row order or the given row order."""
+        if order is None:
+            return [self.games[row] for row in iter_bits(bits)]
+        digits = bin(bits)[:1:-1]
+        return [self.games[row] for row in order if row < len(digits) and digits[row] == '1']
+
+    def sorted_rows(self, column: str, reverse: bool = False) -> List[int]:
+        """Live rows ordered by a numeric column ('playtime', 'rating' or 'metacritic')."""
+        values = getattr(self, column)
+        return sorted(iter_bits(self.alive), key=values.__getitem__, reverse=reverse)
+
+    def filter(self, criteria: Dict) -> List[Game]:
+        """Games matching the criteria, in library order."""
+        return self.games_for(self.select(criteria))
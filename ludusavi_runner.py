@@ -0,0 +1,205 @@
+"""
+Ludusavi Runner
+Runs Ludusavi save backups through QProcess, off the GUI thread, reading its
+machine-readable (--api) JSON output to report real per-game progress.
+"""
+
+import json
+import time
+from typing import Dict, List, Optional
+from PySide6.QtCore import QObject, QProcess, Signal
+
+class LudusaviRunner(QObject):
+    """Backs up game saves with Ludusavi in two stages.
+
+    A preview run (backup --preview --api) lists every game with saves, its
+    size and whether it changed since the last backup. The games to back up
+    (only the changed ones when changed_only is set) then go through real
+    backup runs in batches of up to BATCH_GAMES games or BATCH_BYTES bytes,
+    so progress, throughput and cancellation have per-batch granularity
+    without paying Ludusavi's startup for every small game.
+    """
+    progress = Signal(dict)  # {'stage', 'games_done', 'games_total', 'bytes_done', 'bytes_total', 'rate', 'current'}
+    game_finished = Signal(str, dict)  # game name, its entry from Ludusavi's --api output
+    finished = Signal(dict)  # summary: games, bytes, skipped, failed, cancelled, elapsed
+    failed = Signal(str)  # error message
+
+    BATCH_GAMES = 8
+    BATCH_BYTES = 256 * 1024 * 1024
+
+    def __init__(self, ludusavi_path: str, parent=None):
+        super().__init__(parent)
+        self.ludusavi_path = ludusavi_path
+        self.process = QProcess(self)
+        self.process.readyReadStandardOutput.connect(self.read_output)
+        self.process.readyReadStandardError.connect(self.read_errors)
+        self.process.finished.connect(self.on_process_finished)
+        self.process.errorOccurred.connect(self.on_process_error)
+        self.reset()
+
+    def reset(self):
+        self.backup_folder = None
+        self.stage = None  # 'preview', 'backup' or None when idle
+        self.output = bytearray()
+        self.errors = bytearray()
+        self.queue: List[List[str]] = []
+        self.batch: List[str] = []
+        self.sizes: Dict[str, int] = {}
+        self.summary = {'games': 0, 'bytes': 0, 'skipped': 0, 'failed': 0, 'cancelled': False, 'elapsed': 0.0}
+        self.games_total = 0
+        self.bytes_total = 0
+        self.bytes_done = 0  # backed up or failed
+        self.started = 0.0
+        self.cancelled = False
+        self.changed_only = True
+
+    @property
+    def running(self) -> bool:
+        return self.stage is not None
+
+    def start(self, backup_folder: str, changed_only: bool = True):
+        """Start a backup; the outcome arrives through finished or failed."""
+        if self.running:
+            return
+        self.reset()
+        self.backup_folder = backup_folder
+        self.changed_only = changed_only
+        self.started = time.monotonic()
+        self.stage = 'preview'
+        self.emit_progress(current=None)
+        self.run(["backup", "--preview", "--api", "--path", backup_folder])
+
+    def cancel(self):
+        """Stop after killing the running Ludusavi; games already backed up stay backed up."""
+        if not self.running:
+            return
+        self.cancelled = True
+        self.queue.clear()
+        if self.process.state() != QProcess.NotRunning:
+            self.process.kill()
+
+    def run(self, arguments: List[str]):
+        self.output.clear()
+        self.errors.clear()
+        self.process.start(self.ludusavi_path, arguments)
+
+    def read_output(self):
+        # --api prints one JSON document; collect it as it streams in
+        self.output += bytes(self.process.readAllStandardOutput())
+
+    def read_errors(self):
+        self.errors += bytes(self.process.readAllStandardError())
+
+    def on_process_error(self, error):
+        if error == QProcess.FailedToStart:
+            self.fail(f"Could not start Ludusavi at {self.ludusavi_path}")
+
+    def on_process_finished(self, exit_code, exit_status):
+        if not self.running:
+            return
+        self.read_output()
+        if self.cancelled:
+            self.finish()
+            return
+        report = self.parse_output()
+        if report is None:
+            message = bytes(self.errors).decode('utf-8', 'replace').strip() or f"Ludusavi exited with code {exit_code}"
+            self.fail(message)
+            return
+        # A non-zero exit with a report only means some games failed; the report says which
+        if self.stage == 'preview':
+            self.plan(report)
+        else:
+            self.record(report)
+        self.next_batch()
+
+    def parse_output(self) -> Optional[Dict]:
+        text = bytes(self.output).decode('utf-8', 'replace')
+        start = text.find('{')  # anything Ludusavi logs before the document
+        if start < 0:
+            return None
+        try:
+            return json.loads(text[start:])
+        except ValueError:
+            return None
+
+    @staticmethod
+    def game_bytes(entry: Dict) -> int:
+        return sum((info or {}).get('bytes', 0) for info in (entry.get('files') or {}).values())
+
+    def plan(self, report: Dict):
+        """Pick the games to back up from the preview and split them into batches."""
+        games = []
+        for name, entry in (report.get('games') or {}).items():
+            if entry.get('decision', 'Processed') != 'Processed':
+                continue
+            if self.changed_only and entry.get('change') == 'Same':
+                self.summary['skipped'] += 1
+                continue
+            self.sizes[name] = self.game_bytes(entry)
+            games.append(name)
+        self.games_total = len(games)
+        self.bytes_total = sum(self.sizes.values())
+
+        # Large games alone, small ones together
+        batch, batch_bytes = [], 0
+        for name in sorted(games, key=lambda game: self.sizes[game]):
+            if batch and (len(batch) >= self.BATCH_GAMES or batch_bytes + self.sizes[name] > self.BATCH_BYTES):
+                self.queue.append(batch)
+                batch, batch_bytes = [], 0
+            batch.append(name)
+            batch_bytes += self.sizes[name]
+        if batch:
+            self.queue.append(batch)
+        self.queue.reverse()  # popped from the end: smallest first
+        self.stage = 'backup'
+
+    def record(self, report: Dict):
+        """Count a finished batch from its --api report."""
+        games = report.get('games') or {}
+        for name in self.batch:
+            entry = games.get(name)
+            if entry is None or any((info or {}).get('failed') for info in (entry.get('files') or {}).values()):
+                self.summary['failed'] += 1
+            else:
+                self.summary['games'] += 1
+                self.summary['bytes'] += self.sizes.get(name, 0)
+            self.bytes_done += self.sizes.get(name, 0)
+            self.game_finished.emit(name, entry or {})
+
+    def next_batch(self):
+        if not self.queue:
+            self.finish()
+            return
+        self.batch = self.queue.pop()
+        self.emit_progress(current=self.batch[0] if len(self.batch) == 1 else f"{self.batch[0]} and {len(self.batch) - 1} more")
+        self.run(["backup", "--force", "--api", "--no-manifest-update", "--path", self.backup_folder, "--"]
+                 + self.batch)
+
+    def emit_progress(self, current: Optional[str]):
+        elapsed = time.monotonic() - self.started
+        done = self.bytes_done
+        self.progress.emit({
+            'stage': self.stage,
+            'games_done': self.summary['games'] + self.summary['failed'],
+            'games_total': self.games_total,
+            'bytes_done': done,
+            'bytes_total': self.bytes_total,
+            'rate': done / elapsed if elapsed > 0 else 0.0,
+            'current': current,
+        })
+
+    def finish(self):
+        self.summary['cancelled'] = self.cancelled
+        self.summary['elapsed'] = time.monotonic() - self.started
+        if not self.cancelled:
+            self.emit_progress(current=None)
+        self.stage = None
+        self.finished.emit(dict(self.summary))
+
+    def fail(self, message: str):
+        if not self.running:
+            return
+        self.stage = None
+        self.queue.clear()
+        self.failed.emit(message)
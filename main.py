@@ -1,42 +1,40 @@
+from startup_timeline import StartupTimeline  # first, so module imports are timed
 import sys
 import os
-import requests
 import asyncio
-import psutil
 import qasync
-import sqlite3
-import subprocess
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QMessageBox, QPushButton, QStackedWidget, 
     QWidget, QLabel, QGridLayout, QVBoxLayout, 
-    QSizePolicy, QScrollArea, QSpacerItem, QFileDialog, QHBoxLayout,
-    QFrame, QProgressDialog, QDialog, QTextEdit, QStatusBar, QGraphicsDropShadowEffect,
-    QColorDialog, QInputDialog
+    QSizePolicy, QScrollArea, QSpacerItem, QFileDialog,
+    QProgressDialog, QDialog, QTextEdit, QStatusBar,
+    QColorDialog, QComboBox
 )
-from PySide6.QtCore import QTimer, QUrl, Qt
+from PySide6.QtCore import QTimer, QUrl, Qt, QEvent, QRect
 from PySide6.QtGui import QAction, QIcon, QDesktopServices, QImage, QPixmap, QColor
 from datetime import datetime
 
-from game_search import search_local_games, STEAM_API_KEY, get_steam_id, get_steam_games
-from system_optimizer import SystemOptimizer
+from game_search import get_cached_steam_api_key, get_cached_steam_id
 from overlay import OverlayWindow
 from save_file import SaveFileManager
-from store_tab import create_store_tabs
 from interface_ui import Ui_MainWindow
 from database import DatabaseManager
 from game_card import GameCard
-from game_details_dialog import GameDetailsDialog
+from app_style import apply_app_style
 from metadata_fetcher import MetadataFetcher
 from game_manager import GameManager
 from timer_manager import TimerManager
+from scheduler import JobScheduler
+from game_mode import GameModeGovernor
+from session_tracker import SessionTracker
+from steam_api_client import SteamAPIClient
 from ui_manager import UIManager
 from models import Game
-from filter_dialog import FilterDialog
+import library_snapshot
+from library_store import LibraryStore, empty_filters
+from library_sort import LibrarySorter, SORT_OPTIONS
+from image_cache import IMAGE_CACHE_DIR, image_cache_path
 from splash_screen import CustomSplashScreen
-from manual_add_dialog import ManualAddGameDialog
-
-# Get Steam ID at startup
-STEAM_ID = get_steam_id()
 
 class MainWindow(QMainWindow):
     # Common styles for progress dialogs
@@ -76,7 +74,10 @@ class MainWindow(QMainWindow):
         self.setWindowTitle("Clockwork")
         self.setMinimumSize(1200, 800)
         
+        self.startup_timeline = StartupTimeline()
+        
         # Create and show splash screen
+        self.startup_timeline.mark("Showing splash screen")
         self.splash = CustomSplashScreen()
         self.splash.show()
         self.process_events()
@@ -92,50 +93,23 @@ class MainWindow(QMainWindow):
         """Process pending events to update the splash screen."""
         QApplication.processEvents()
 
+    def set_startup_progress(self, value, message):
+        """Start a new timed startup phase and show it on the splash screen."""
+        self.startup_timeline.mark(message)
+        self.splash.set_progress(value, message)
+
     def init_ui_with_loading(self):
         """Initialize the UI with loading indicators."""
         total_steps = 10
         current_step = 0
         
         # Set window properties
-        self.splash.set_progress(current_step, "Setting up window properties...")
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: #1e1e1e;
-            }
-            QLabel {
-                color: white;
-            }
-            QPushButton {
-                background-color: #5865f2;
-                color: white;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 6px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #4752c4;
-            }
-            QPushButton:pressed {
-                background-color: #3b45b5;
-            }
-            QLineEdit {
-                background-color: #40444b;
-                color: white;
-                border: none;
-                border-radius: 6px;
-                padding: 8px 12px;
-                selection-background-color: #5865f2;
-            }
-            QLineEdit:focus {
-                border: 1px solid #5865f2;
-            }
-        """)
+        self.set_startup_progress(current_step, "Setting up window properties...")
+        # Window-wide rules live in the application stylesheet (app_style)
         current_step += 1
         
         # Create central widget and UI
-        self.splash.set_progress(current_step * 10, "Creating user interface...")
+        self.set_startup_progress(current_step * 10, "Creating user interface...")
         central_widget = QWidget()
         self.setCentralWidget(central_widget)
         self.ui = Ui_MainWindow()
@@ -144,41 +118,53 @@ class MainWindow(QMainWindow):
         current_step += 1
         
         # Initialize managers
-        self.splash.set_progress(current_step * 10, "Initializing database...")
+        self.set_startup_progress(current_step * 10, "Initializing database...")
         self.db_manager = DatabaseManager()
         current_step += 1
         
-        self.splash.set_progress(current_step * 10, "Setting up game management...")
+        self.set_startup_progress(current_step * 10, "Setting up game management...")
         self.game_manager = GameManager(self.db_manager)
+        self.session_tracker = SessionTracker(self.db_manager, self)
+        self.session_tracker.session_started.connect(self.on_session_started)
+        self.session_tracker.session_ended.connect(self.on_session_ended)
+        self.session_tracker.session_discarded.connect(self.on_session_discarded)
         self.save_file_manager = SaveFileManager(self.ui, self)
         current_step += 1
         
-        self.splash.set_progress(current_step * 10, "Configuring metadata fetcher...")
+        self.set_startup_progress(current_step * 10, "Configuring metadata fetcher...")
         self.metadata_fetcher = MetadataFetcher()
-        self.metadata_fetcher.api_key = STEAM_API_KEY
-        self.metadata_fetcher.steam_id = STEAM_ID
+        self.metadata_fetcher.api_key = get_cached_steam_api_key()
+        self.metadata_fetcher.steam_id = get_cached_steam_id()
         self.metadata_fetcher.db_manager = self.db_manager
+        self.refresh_job = None  # running MetadataRefreshJob, if any
+        self.details_dialog = None  # GameDetailsDialog, created on first use and reused
+        self.temp_cleaner = None  # TempCleaner while a cleanup runs
+        self.declined_duplicates = set()  # ids of duplicate sets the user chose not to merge
+        self.temp_cleanup_dialog = None
         current_step += 1
         
         # Setup image cache
-        self.splash.set_progress(current_step * 10, "Setting up image cache...")
-        self.image_cache_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "cache", "images")
+        self.set_startup_progress(current_step * 10, "Setting up image cache...")
+        self.image_cache_dir = IMAGE_CACHE_DIR
         os.makedirs(self.image_cache_dir, exist_ok=True)
         self.image_cache = {}
         current_step += 1
         
         # Initialize timer manager
-        self.splash.set_progress(current_step * 10, "Initializing timer manager...")
+        self.set_startup_progress(current_step * 10, "Initializing timer manager...")
+        self.scheduler = JobScheduler(self)
         self.timer_manager = TimerManager(self)
+        self.game_mode = GameModeGovernor(self)
+        self.game_mode.report_ready.connect(self.on_game_mode_report)
         current_step += 1
         
         # Setup scroll area and grid
-        self.splash.set_progress(current_step * 10, "Creating game library interface...")
+        self.set_startup_progress(current_step * 10, "Creating game library interface...")
         self.setup_scroll_area()
         current_step += 1
         
         # Setup status bar
-        self.splash.set_progress(current_step * 10, "Setting up status bar...")
+        self.set_startup_progress(current_step * 10, "Setting up status bar...")
         self.setup_status_bar()
         current_step += 1
         
@@ -205,6 +191,31 @@ class MainWindow(QMainWindow):
                 }
             """)
         
+        # Sort order selector next to the filter button
+        self.sort_combo = QComboBox()
+        for sort_by, option in SORT_OPTIONS.items():
+            self.sort_combo.addItem(option.label, sort_by)
+        self.sort_combo.setStyleSheet("""
+            QComboBox {
+                color: #FFFFFF;
+                font-size: 14px;
+                font-weight: 700;
+                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+                                          stop:0 #033860, stop:1 #044a7a);
+                border-radius: 8px;
+                padding: 8px 16px;
+                border: 2px solid #055a9a;
+                min-height: 20px;
+            }
+            QComboBox QAbstractItemView {
+                background-color: #033860;
+                color: white;
+                selection-background-color: #055a9a;
+            }
+        """)
+        self.sort_combo.currentIndexChanged.connect(self.handle_sort_change)
+        self.ui.headerLayout.insertWidget(self.ui.headerLayout.indexOf(self.ui.filterBtn) + 1, self.sort_combo)
+        
         # Style toolbar buttons (filter, refresh, etc.)
         toolbar_buttons = [
             self.ui.filterBtn, 
@@ -325,17 +336,12 @@ class MainWindow(QMainWindow):
             self.ui.savefileBtn
         ]
 
-        # Initialize store view
-        self.store_view = create_store_tabs()
-        self.store_view.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
-        self.ui.storeLayout.addWidget(self.store_view)
+        # The store view pulls in QtWebEngine, so it is created on first visit
+        self.store_view = None
         
-        # Initialize filters
-        self.current_filters = {
-            'genre': 'All Genres',
-            'platform': 'All Platforms',
-            'install_status': 'All Games'
-        }
+        # Initialize filters and the library search text
+        self.current_filters = empty_filters()
+        self.library_query = ''
         
         # Style game count label
         self.ui.gameCountLabel.setStyleSheet("""
@@ -358,7 +364,7 @@ class MainWindow(QMainWindow):
         """)
         
         # Connect signals and initialize game lists
-        self.splash.set_progress(current_step * 10, "Connecting signals...")
+        self.set_startup_progress(current_step * 10, "Connecting signals...")
         self.connect_signals()
         self.initialize_game_lists()
         self.setup_connections()
@@ -371,49 +377,40 @@ class MainWindow(QMainWindow):
         self.loop = asyncio.get_event_loop()
         
         # Final setup
-        self.splash.set_progress(100, "Loading complete!")
-        QTimer.singleShot(1000, self.finish_loading)  # Show 100% for 1 second
+        self.set_startup_progress(100, "Loading complete!")
+        QTimer.singleShot(0, self.finish_loading)
 
     def setup_scroll_area(self):
         """Setup scroll area for game cards."""
         self.scroll_area = QScrollArea(self.ui.homePage)
         self.scroll_area.setWidgetResizable(True)
-        self.scroll_area.setStyleSheet("""
-            QScrollArea { 
-                border: none; 
-                background-color: #1e1e1e; 
-            }
-            QScrollBar:vertical {
-                border: none;
-                background: #2d2d2d;
-                width: 10px;
-                margin: 0px;
-            }
-            QScrollBar::handle:vertical {
-                background: #4f545c;
-                min-height: 20px;
-                border-radius: 5px;
-            }
-            QScrollBar::handle:vertical:hover {
-                background: #5865f2;
-            }
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
-                height: 0px;
-            }
-            QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical {
-                background: none;
-            }
-        """)
+        self.scroll_area.setObjectName("libraryScrollArea")
         self.ui.homeLayout.addWidget(self.scroll_area)
         
         self.grid_widget = QWidget()
-        self.grid_widget.setStyleSheet("background-color: #1e1e1e;")
+        self.grid_widget.setObjectName("libraryGrid")
         self.scroll_area.setWidget(self.grid_widget)
         
         self.grid_layout = QGridLayout(self.grid_widget)
         self.grid_layout.setSpacing(20)
         self.grid_layout.setContentsMargins(30, 30, 30, 30)
         self.grid_layout.setAlignment(Qt.AlignTop | Qt.AlignLeft)
+        self.grid_cards = []  # (card, game) in grid order
+        
+        # Tell the metadata fetcher which cards are on screen once scrolling settles
+        self.visible_cards_timer = QTimer(self)
+        self.visible_cards_timer.setSingleShot(True)
+        self.visible_cards_timer.setInterval(100)
+        self.visible_cards_timer.timeout.connect(self.update_visible_games)
+        self.scroll_area.verticalScrollBar().valueChanged.connect(lambda value: self.visible_cards_timer.start())
+        
+        # Rebuild changed cards at most once a second while metadata of on-screen games comes in
+        self.metadata_changed = {}  # id(game) -> game whose card shows old metadata
+        self.refreshing_cards = False
+        self.metadata_redraw_timer = QTimer(self)
+        self.metadata_redraw_timer.setSingleShot(True)
+        self.metadata_redraw_timer.setInterval(1000)
+        self.metadata_redraw_timer.timeout.connect(lambda: asyncio.ensure_future(self.refresh_metadata_cards()))
 
     def setup_status_bar(self):
         """Setup the status bar."""
@@ -432,6 +429,7 @@ class MainWindow(QMainWindow):
         """Connect metadata fetcher signals."""
         self.metadata_fetcher.progress.connect(self.update_metadata_progress)
         self.metadata_fetcher.finished.connect(self.on_metadata_fetch_complete)
+        self.metadata_fetcher.game_updated.connect(self.on_game_metadata_updated)
         self.metadata_fetcher.error.connect(self.on_metadata_fetch_error)
 
     def initialize_game_lists(self):
@@ -439,11 +437,16 @@ class MainWindow(QMainWindow):
         self.games = []
         self.session_games = []
         self.filtered_games = []
+        self.library_store = LibraryStore()
+        self.sorter = LibrarySorter()
+        self.available_genres = []
+        self.available_platforms = []
 
     def finish_loading(self):
         """Complete the loading process and show the main window."""
         self.splash.finish(self)
         self.show()
+        self.startup_timeline.mark("Loading library")
         
         # Start loading games after the window is shown
         asyncio.create_task(self.load_initial_games())
@@ -455,8 +458,8 @@ class MainWindow(QMainWindow):
             self.games = self.db_manager.get_all_games()
             print(f"[DEBUG] load_games: Retrieved {len(self.games)} games from database")
             
-            # Initialize filtered_games with all games
-            self.filtered_games = self.games.copy()
+            # Show the games the current filters and search let through
+            self.filtered_games = self.current_view()
             
             # Use our new force refresh method to ensure UI is updated correctly
             self.force_ui_refresh()
@@ -473,422 +476,13 @@ class MainWindow(QMainWindow):
 
     def create_game_card(self, game):
         try:
-            print(f"[DEBUG] Creating game card for {game.name} with type: {game.type}")
-            
-            # Create the card widget with fixed dimensions for consistent layout
-            card = QWidget()
-            card.setObjectName("game-card")
-            card.setFixedWidth(300)
-            card.setMinimumHeight(360)  # Increase height for better spacing
-            card.setStyleSheet("""
-                QWidget#game-card { 
-                    background-color: #033860; 
-                    border-radius: 15px; 
-                    padding: 0px; 
-                    margin: 8px;
-                    border: 3px solid #044a7a;
-                }
-                QWidget#game-card:hover { 
-                    background-color: #044a7a;
-                    border: 3px solid #055a9a;
-                }
-                QLabel { 
-                    color: white; 
-                }
-                QPushButton { 
-                    background-color: #7C8483; 
-                    color: white; 
-                    border: none; 
-                    padding: 8px 15px; 
-                    border-radius: 8px;
-                    font-weight: bold;
-                    font-size: 13px;
-                }
-                QPushButton:hover { 
-                    background-color: #8a9291; 
-                }
-                QPushButton:pressed {
-                    background-color: #6e7675;
-                }
-            """)
-            
-            # Create main layout
-            layout = QVBoxLayout()
-            layout.setSpacing(10)
-            layout.setContentsMargins(0, 0, 0, 15)
-            
-            # Create image container with rounded top corners
-            image_container = QWidget()
-            image_container.setFixedSize(300, 170)
-            image_container.setStyleSheet("""
-                background-color: #022d4a; 
-                border-top-left-radius: 12px; 
-                border-top-right-radius: 12px;
-            """)
-            image_layout = QVBoxLayout(image_container)
-            image_layout.setContentsMargins(0, 0, 0, 0)
-            
-            # Add game poster/image
+            image = None
             if game.poster_url:
                 try:
-                    img = self.load_image(game.poster_url)
-                    if img:
-                        poster_label = QLabel()
-                        poster_label.setFixedSize(300, 170)
-                        poster_label.setScaledContents(True)
-                        poster_label.setPixmap(QPixmap.fromImage(img))
-                        poster_label.setStyleSheet("""
-                            border-top-left-radius: 12px; 
-                            border-top-right-radius: 12px;
-                        """)
-                        poster_label.setAlignment(Qt.AlignCenter)
-                        image_layout.addWidget(poster_label)
-                    else:
-                        placeholder = QLabel(f"[No Image Available]")
-                        placeholder.setFixedSize(300, 170)
-                        placeholder.setStyleSheet("""
-                            background-color: #022d4a; 
-                            color: #7C8483; 
-                            font-style: italic;
-                            border-top-left-radius: 12px; 
-                            border-top-right-radius: 12px;
-                        """)
-                        placeholder.setAlignment(Qt.AlignCenter)
-                        image_layout.addWidget(placeholder)
+                    image = self.load_image(game.poster_url)
                 except Exception as e:
                     print(f"Error loading poster for {game.name}: {str(e)}")
-                    placeholder = QLabel(f"[Image Error]")
-                    placeholder.setFixedSize(300, 170)
-                    placeholder.setStyleSheet("""
-                        background-color: #022d4a; 
-                        color: #7C8483; 
-                        font-style: italic;
-                        border-top-left-radius: 12px; 
-                        border-top-right-radius: 12px;
-                    """)
-                    placeholder.setAlignment(Qt.AlignCenter)
-                    image_layout.addWidget(placeholder)
-            else:
-                placeholder = QLabel(f"[No Image]")
-                placeholder.setFixedSize(300, 170)
-                placeholder.setStyleSheet("""
-                    background-color: #022d4a; 
-                    color: #7C8483; 
-                    font-style: italic;
-                    border-top-left-radius: 12px; 
-                    border-top-right-radius: 12px;
-                """)
-                placeholder.setAlignment(Qt.AlignCenter)
-                image_layout.addWidget(placeholder)
-                
-            layout.addWidget(image_container)
-            
-            # Create info container for text
-            info_container = QWidget()
-            info_container.setStyleSheet("""
-                QWidget {
-                    background: transparent;
-                    border-left: 2px solid #044a7a;
-                    margin-left: 15px;
-                }
-            """)
-            info_layout = QVBoxLayout(info_container)
-            info_layout.setContentsMargins(15, 0, 15, 0)
-            info_layout.setSpacing(12)
-            
-            # Add game name with enhanced styling
-            title_container = QWidget()
-            title_container.setStyleSheet("""
-                QWidget {
-                    background: transparent;
-                    border: none;
-                }
-            """)
-            title_layout = QVBoxLayout(title_container)
-            title_layout.setContentsMargins(0, 0, 0, 8)
-            title_layout.setSpacing(0)
-            
-            title_label = QLabel(game.name)
-            title_label.setStyleSheet("""
-                font-weight: bold; 
-                font-size: 18px; 
-                color: #ffffff;
-                padding-bottom: 4px;
-            """)
-            title_label.setWordWrap(True)
-            title_label.setAlignment(Qt.AlignLeft)
-            title_label.setFixedHeight(50)
-            title_layout.addWidget(title_label)
-            
-            # Add separator line
-            separator = QFrame()
-            separator.setFrameShape(QFrame.HLine)
-            separator.setStyleSheet("""
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 #044a7a, stop:1 transparent);
-                border: none;
-                height: 2px;
-                margin: 0;
-            """)
-            title_layout.addWidget(separator)
-            
-            info_layout.addWidget(title_container)
-            
-            # Add info layout for platform and status
-            details_layout = QVBoxLayout()
-            details_layout.setSpacing(12)
-            
-            # Add game type/platform with icon
-            if game.type:
-                platform_layout = QHBoxLayout()
-                platform_layout.setSpacing(10)
-                
-                platform_container = QWidget()
-                platform_container.setStyleSheet("""
-                    QWidget {
-                        background: rgba(2, 45, 74, 0.5);
-                        border-radius: 8px;
-                        padding: 4px;
-                    }
-                """)
-                platform_inner_layout = QHBoxLayout(platform_container)
-                platform_inner_layout.setContentsMargins(8, 4, 12, 4)
-                platform_inner_layout.setSpacing(8)
-                
-                platform_icon = QLabel("🖥️")
-                platform_icon.setStyleSheet("color: #00b0f4; font-size: 14px;")
-                platform_inner_layout.addWidget(platform_icon)
-                
-                type_label = QLabel(f"{game.type.capitalize()}")
-                type_label.setStyleSheet("color: #ffffff; font-size: 14px; font-weight: bold;")
-                platform_inner_layout.addWidget(type_label)
-                
-                platform_layout.addWidget(platform_container)
-                platform_layout.addStretch()
-                details_layout.addLayout(platform_layout)
-            
-            # Add installation status with icon
-            status_layout = QHBoxLayout()
-            status_layout.setSpacing(10)
-            
-            status_container = QWidget()
-            status_container.setStyleSheet("""
-                QWidget {
-                    background: rgba(2, 45, 74, 0.5);
-                    border-radius: 8px;
-                    padding: 4px;
-                }
-            """)
-            status_inner_layout = QHBoxLayout(status_container)
-            status_inner_layout.setContentsMargins(8, 4, 12, 4)
-            status_inner_layout.setSpacing(8)
-            
-            status_icon = QLabel("💾" if game.is_installed else "❌")
-            status_icon.setStyleSheet("color: #00b0f4; font-size: 14px;")
-            status_inner_layout.addWidget(status_icon)
-            
-            status_text = "Installed" if game.is_installed else "Not Installed"
-            status_label = QLabel(status_text)
-            status_label.setStyleSheet("color: #ffffff; font-size: 14px; font-weight: bold;")
-            status_inner_layout.addWidget(status_label)
-            
-            status_layout.addWidget(status_container)
-            status_layout.addStretch()
-            details_layout.addLayout(status_layout)
-            
-            # Add genre if available
-            if game.genre:
-                genre_layout = QHBoxLayout()
-                genre_layout.setSpacing(10)
-                
-                genre_container = QWidget()
-                genre_container.setStyleSheet("""
-                    QWidget {
-                        background: rgba(2, 45, 74, 0.5);
-                        border-radius: 8px;
-                        padding: 4px;
-                    }
-                """)
-                genre_inner_layout = QHBoxLayout(genre_container)
-                genre_inner_layout.setContentsMargins(8, 4, 12, 4)
-                genre_inner_layout.setSpacing(8)
-                
-                genre_icon = QLabel("🏷️")
-                genre_icon.setStyleSheet("color: #00b0f4; font-size: 14px;")
-                genre_inner_layout.addWidget(genre_icon)
-                
-                genre_label = QLabel(game.genre)
-                genre_label.setStyleSheet("color: #ffffff; font-size: 14px; font-weight: bold;")
-                genre_label.setWordWrap(True)
-                genre_inner_layout.addWidget(genre_label)
-                
-                genre_layout.addWidget(genre_container)
-                genre_layout.addStretch()
-                details_layout.addLayout(genre_layout)
-            
-            info_layout.addLayout(details_layout)
-            layout.addWidget(info_container)
-            
-            # Add buttons with updated styling
-            button_layout = QHBoxLayout()
-            button_layout.setContentsMargins(15, 0, 15, 0)
-            button_layout.setSpacing(8)  # Reduced spacing between buttons
-            
-            # Create a container for all buttons
-            button_container = QWidget()
-            button_container.setStyleSheet("""
-                QWidget {
-                    background: transparent;
-                }
-            """)
-            button_container_layout = QVBoxLayout(button_container)
-            button_container_layout.setSpacing(8)
-            button_container_layout.setContentsMargins(0, 0, 0, 0)
-            
-            # Top row of buttons (Play and Details)
-            top_row = QHBoxLayout()
-            top_row.setSpacing(8)
-            
-            # Play button
-            play_button = QPushButton("PLAY")
-            play_button.setFixedHeight(36)
-            play_button.setMinimumWidth(100)
-            play_button.setStyleSheet("""
-                QPushButton {
-                    background-color: #723D46;
-                    color: white;
-                    border: none;
-                    padding: 8px 15px;
-                    border-radius: 8px;
-                    font-weight: bold;
-                    font-size: 13px;
-                }
-                QPushButton:hover {
-                    background-color: #8B4B55;
-                }
-                QPushButton:pressed {
-                    background-color: #5E323A;
-                }
-            """)
-            play_button.clicked.connect(lambda: self.launch_game(game))
-            top_row.addWidget(play_button)
-            
-            # Details button
-            details_button = QPushButton("DETAILS")
-            details_button.setFixedHeight(36)
-            details_button.setMinimumWidth(100)
-            details_button.setStyleSheet("""
-                QPushButton {
-                    background-color: #022d4a;
-                    color: white;
-                    border: none;
-                    padding: 8px 15px;
-                    border-radius: 8px;
-                    font-weight: bold;
-                    font-size: 13px;
-                }
-                QPushButton:hover {
-                    background-color: #033860;
-                }
-                QPushButton:pressed {
-                    background-color: #022d4a;
-                }
-            """)
-            details_button.clicked.connect(lambda: self.show_game_details(game))
-            top_row.addWidget(details_button)
-            
-            button_container_layout.addLayout(top_row)
-            
-            # Bottom row of buttons (Edit and Remove) - Always show for manual games
-            if game.type == 'manual':
-                print(f"[DEBUG] Adding edit/remove buttons for manual game: {game.name}")
-                bottom_row = QHBoxLayout()
-                bottom_row.setSpacing(8)
-                
-                # Edit button
-                edit_button = QPushButton("EDIT")
-                edit_button.setFixedHeight(36)
-                edit_button.setMinimumWidth(100)
-                edit_button.setStyleSheet("""
-                    QPushButton {
-                        background-color: #3182ce;
-                        color: white;
-                        border: none;
-                        padding: 8px 15px;
-                        border-radius: 8px;
-                        font-weight: bold;
-                        font-size: 13px;
-                    }
-                    QPushButton:hover {
-                        background-color: #4299e1;
-                    }
-                    QPushButton:pressed {
-                        background-color: #2b6cb0;
-                    }
-                """)
-                edit_button.clicked.connect(lambda: self.edit_game(game))
-                bottom_row.addWidget(edit_button)
-                
-                # Remove button
-                remove_button = QPushButton("REMOVE")
-                remove_button.setFixedHeight(36)
-                remove_button.setMinimumWidth(100)
-                remove_button.setStyleSheet("""
-                    QPushButton {
-                        background-color: #dc2626;
-                        color: white;
-                        border: none;
-                        padding: 8px 15px;
-                        border-radius: 8px;
-                        font-weight: bold;
-                        font-size: 13px;
-                    }
-                    QPushButton:hover {
-                        background-color: #ef4444;
-                    }
-                    QPushButton:pressed {
-                        background-color: #b91c1c;
-                    }
-                """)
-                remove_button.clicked.connect(lambda: self.remove_game(game))
-                bottom_row.addWidget(remove_button)
-                
-                button_container_layout.addLayout(bottom_row)
-            
-            # Add the button container to the main layout
-            layout.addWidget(button_container)
-            
-            card.setLayout(layout)
-            
-            # Set up hover effects with graphical effects
-            shadow = QGraphicsDropShadowEffect()
-            shadow.setColor(QColor(0, 0, 0, 150))
-            shadow.setBlurRadius(20)
-            shadow.setOffset(0, 5)
-            card.setGraphicsEffect(shadow)
-            
-            # Store shadow as an attribute of the card for reference in event handlers
-            card.shadow = shadow
-            
-            # Connect mouse events to change shadow on hover
-            def enter_event(e):
-                card.shadow.setColor(QColor(0, 0, 0, 200))
-                card.shadow.setBlurRadius(25)
-                card.shadow.setOffset(0, 8)
-                # Move card up slightly on hover for "pop out" effect
-                card.setContentsMargins(0, -5, 0, 5)
-                
-            def leave_event(e):
-                card.shadow.setColor(QColor(0, 0, 0, 150))
-                card.shadow.setBlurRadius(20)
-                card.shadow.setOffset(0, 5)
-                # Reset to normal position
-                card.setContentsMargins(0, 0, 0, 0)
-                
-            card.enterEvent = enter_event
-            card.leaveEvent = leave_event
-            
-            return card
-            
+            return GameCard(game, self, image)
         except Exception as e:
             print(f"Error creating game card: {str(e)}")
             import traceback
@@ -930,9 +524,8 @@ class MainWindow(QMainWindow):
             self.ui.backupButton.clicked.connect(self.save_file_manager.backup_save_files)
             
             # Set up periodic installation status check
-            self.install_status_timer = QTimer()
-            self.install_status_timer.timeout.connect(self.update_game_statuses)
-            self.install_status_timer.start(30000)  # Check every 30 seconds
+            self.timer_manager.start_install_status_timer()
+            self.timer_manager.start_steam_playtime_timer()
             
             # Initialize available filter options
             self.available_genres = []
@@ -1030,7 +623,7 @@ class MainWindow(QMainWindow):
                 # Create new widget for the layout
                 new_widget = QWidget()
                 new_widget.setLayout(new_layout)
-                new_widget.setStyleSheet("background-color: #1e1e1e;")
+                new_widget.setObjectName("libraryGrid")
                 
                 # Replace old layout with new one
                 print("[DEBUG] Resize: Replacing old layout with new layout")
@@ -1075,31 +668,62 @@ class MainWindow(QMainWindow):
         reply = QMessageBox.question(
             self, 
             "Force Refresh Metadata",
-            "This will clear all existing metadata and fetch it again from Steam.\n"
-            "This process may take several minutes.\n\n"
+            "This will fetch all metadata again from Steam.\n"
+            "Existing metadata is kept until new data for a game arrives, and an\n"
+            "interrupted refresh continues the next time Clockwork starts.\n\n"
             "Do you want to continue?",
             QMessageBox.Yes | QMessageBox.No,
             QMessageBox.No
         )
         
         if reply == QMessageBox.Yes:
-            # Clear all metadata from database
-            self.db_manager.clear_all_metadata()
-            
-            # Set force refresh flag
-            self.metadata_fetcher.force_refresh = True
-            
-            # Show loading indicator
+            from metadata_jobs import MetadataRefreshJob
+            if self.refresh_job is None:
+                self.refresh_job = MetadataRefreshJob.start(self.db_manager, self.metadata_fetcher, self.games)
+            if self.refresh_job:
+                await self.run_metadata_refresh()
+
+    async def resume_metadata_refresh(self):
+        """Continue a metadata refresh the previous run left unfinished."""
+        from metadata_jobs import MetadataRefreshJob
+        if self.refresh_job is None:
+            self.refresh_job = MetadataRefreshJob.resume(self.db_manager, self.metadata_fetcher)
+            if self.refresh_job:
+                await self.run_metadata_refresh()
+
+    async def run_metadata_refresh(self):
+        """Run the current refresh job, applying each game's new metadata as it arrives."""
+        games_by_id = {game.id: game for game in self.games}
+        
+        def on_game_updated(game_id, update_data):
+            game = games_by_id.get(game_id)
+            if game is not None:
+                game.update_from_dict(update_data)
+                self.library_store.update_game(game)
+                self.resort_game(game, redraw=False)  # the grid is redrawn when the job ends
+        
+        def on_progress(progress):
+            finished = progress.get('done', 0) + progress.get('failed', 0)
+            total = finished + progress.get('pending', 0) + progress.get('in_flight', 0)
+            self.ui.statusbar.showMessage(f"Refreshing game metadata... ({finished}/{total})")
+        
+        job = self.refresh_job
+        try:
             self.ui.statusbar.showMessage("Refreshing all game metadata...")
-            
-            # Refresh games with fresh metadata
-            self.loop.create_task(self.refresh_games())
-            
-            # Reset force refresh flag
-            self.metadata_fetcher.force_refresh = False
-            
-            # Update status
-            self.ui.statusbar.showMessage("Metadata refresh complete!", 5000)
+            progress = await job.run(on_progress=on_progress, on_game_updated=on_game_updated)
+            if not job.cancelled:
+                self.force_ui_refresh()
+                message = f"Metadata refresh complete! ({progress.get('done', 0)} updated"
+                if progress.get('failed'):
+                    message += f", {progress['failed']} kept their previous metadata"
+                self.ui.statusbar.showMessage(message + ")", 5000)
+        except Exception as e:
+            print(f"Error refreshing metadata: {e}")
+            import traceback
+            traceback.print_exc()
+        finally:
+            if self.refresh_job is job:
+                self.refresh_job = None
 
     def update_fps(self):
         """Update FPS display for the currently running game."""
@@ -1132,18 +756,20 @@ class MainWindow(QMainWindow):
         self.ui.gameCountLabel.setText(f"{len(self.games)} Games")
         self.populate_filter_dropdowns()
 
-    def force_ui_refresh(self):
+    def force_ui_refresh(self, reload=True):
         """Force a complete refresh of the UI to ensure games are displayed correctly."""
         try:
             print("[DEBUG] Starting force_ui_refresh")
             
             # Make sure we have the latest data
-            self.games = self.db_manager.get_all_games()
-            self.filtered_games = self.games.copy()
+            if reload:
+                self.games = self.db_manager.get_all_games()
+            self.filtered_games = self.current_view()
             
             print(f"[DEBUG] Force refresh: retrieved {len(self.games)} games from database")
             
             # Remove all existing widgets from the grid layout
+            self.grid_cards = []
             if hasattr(self, 'grid_layout') and self.grid_layout:
                 while self.grid_layout.count():
                     item = self.grid_layout.takeAt(0)
@@ -1199,6 +825,8 @@ class MainWindow(QMainWindow):
                 
                 self.grid_layout.addWidget(empty_widget, 0, 0, 1, max_cols)
             else:
+                self.sort_filtered_games()
+                
                 # Add game cards to the layout
                 row = 0
                 col = 0
@@ -1207,6 +835,7 @@ class MainWindow(QMainWindow):
                 for game in self.filtered_games:
                     card = self.create_game_card(game)
                     if card:
+                        self.grid_cards.append((card, game))
                         self.grid_layout.addWidget(card, row, col)
                         cards_added += 1
                         col += 1
@@ -1314,6 +943,9 @@ class MainWindow(QMainWindow):
                         print(f"[DEBUG] Added game to database: {game.name}, ID: {game_id}")
                 
                 print(f"[DEBUG] Added total of {total_new_games} new games to database")
+                self.progress_dialog.setValue(100)
+                self.progress_dialog.close()
+                self.merge_duplicate_games()  # asks first, now that the progress dialog is gone
                 
                 # Force a complete UI refresh to update the game list display
                 self.force_ui_refresh()
@@ -1321,9 +953,6 @@ class MainWindow(QMainWindow):
                 # Also populate filter dropdowns
                 self.populate_filter_dropdowns()
                 
-                self.progress_dialog.setValue(100)
-                self.progress_dialog.close()
-                
                 QMessageBox.information(
                     self, 
                     "Success", 
@@ -1361,10 +990,13 @@ class MainWindow(QMainWindow):
             print(f"Error updating game count: {str(e)}")
 
     def update_system_usage(self):
+        """Request a fresh system usage sample (taken on a scheduler worker thread)."""
+        self.scheduler.run_now('system_usage')
+
+    def display_system_usage(self, usage):
         """Update the system usage displays."""
         try:
-            # Get system usage values
-            cpu_usage, ram_usage, disk_usage = SystemOptimizer.get_system_usage()
+            cpu_usage, ram_usage, disk_usage = usage
             
             # Format the values
             cpu_text = f"{cpu_usage:.1f}%"
@@ -1381,120 +1013,83 @@ class MainWindow(QMainWindow):
             self.timer_manager.stop_system_timer()
 
     def clean_temp_files(self):
-        """Clean temporary files from the system."""
+        """Preview the reclaimable temporary files, then delete them in the background."""
+        if self.temp_cleaner is not None:
+            return  # a cleanup is already running
+        self.loop.create_task(self.run_temp_cleanup())
+
+    async def run_temp_cleanup(self):
+        from temp_cleaner import TempCleaner, format_size
+        self.temp_cleaner = TempCleaner(parent=self)
+        self.temp_cleanup_dialog = self.create_progress_dialog(
+            "Temporary Files", "Looking for temporary files...", 0, 0)
+        self.temp_cleanup_dialog.canceled.connect(self.temp_cleaner.cancel)
+        self.temp_cleaner.progress.connect(self.on_temp_cleanup_progress)
+        self.temp_cleanup_dialog.show()
         try:
-            # Delete temporary files
-            deleted_files = SystemOptimizer.optimize_pc()
-            
-            # Show success message
-            QMessageBox.information(
-                self, 
-                'Cleanup Complete', 
-                f"Successfully deleted {deleted_files} temporary files."
+            preview = await self.loop.run_in_executor(None, self.temp_cleaner.run, True)
+            self.temp_cleanup_dialog.hide()
+            if preview['cancelled']:
+                return
+            if not preview['files']:
+                QMessageBox.information(self, 'Cleanup Complete', "No old temporary files to delete.")
+                return
+            reply = QMessageBox.question(
+                self,
+                'Clean Temporary Files',
+                f"{preview['files']} temporary files ({format_size(preview['bytes'])}) older than a day "
+                f"can be deleted. Files still in use are kept.\n\nDelete them now?",
+                QMessageBox.Yes | QMessageBox.No,
+                QMessageBox.Yes
             )
-            
+            if reply != QMessageBox.Yes:
+                return
+
+            self.temp_cleanup_dialog.setLabelText("Deleting temporary files...")
+            self.temp_cleanup_dialog.show()
+            report = await self.loop.run_in_executor(None, self.temp_cleaner.run, False)
+            self.temp_cleanup_dialog.hide()
+            message = f"Deleted {report['files']} temporary files ({format_size(report['bytes'])})."
+            if report['in_use']:
+                message += f"\n{report['in_use']} files in use were kept."
+            if report['cancelled']:
+                message = "Cleanup cancelled. " + message
+            QMessageBox.information(self, 'Cleanup Complete', message)
+
             # Update the system usage display
             self.update_system_usage()
-            
+
         except Exception as e:
             QMessageBox.warning(
                 self, 
                 'Cleanup Error',
                 f"An error occurred while cleaning temporary files: {str(e)}"
             )
+        finally:
+            self.temp_cleanup_dialog.canceled.disconnect(self.temp_cleaner.cancel)
+            self.temp_cleanup_dialog.close()
+            self.temp_cleanup_dialog = None
+            self.temp_cleaner = None
+
+    def on_temp_cleanup_progress(self, report):
+        """Show the running totals of the temp cleanup (queued from its worker thread)."""
+        from temp_cleaner import format_size
+        if self.temp_cleanup_dialog is not None:
+            verb = "Found" if report['dry_run'] else "Deleted"
+            self.temp_cleanup_dialog.setLabelText(
+                f"{verb} {report['files']} files ({format_size(report['bytes'])})\n"
+                f"{report['scanned']} files in {report['directories']} folders checked"
+            )
 
     def manage_processes(self):
-        """Show dialog to manage high-demand processes."""
+        """Show the live process table to find and end high-demand processes."""
         try:
-            # Get list of high-demand processes
-            processes = SystemOptimizer.get_unnecessary_processes()
-            
-            if not processes:
-                QMessageBox.information(
-                    self, 
-                    "System Processes", 
-                    "No high-demand processes found.\nAll system processes are running normally."
-                )
-                return
-            
-            # Create process list text with better formatting
-            process_list = "\n".join([
-                f"{idx}. {name} (PID: {pid})\n   • CPU Usage: {cpu:.1f}%\n   • Memory Usage: {mem:.1f}%" 
-                for idx, (pid, name, cpu, mem) in enumerate(processes, start=1)
-            ])
-            
-            # Show dialog with process list and options
-            input_dialog = QInputDialog(self)
-            input_dialog.setWindowTitle("High-Demand Processes Found")
-            input_dialog.setLabelText(
-                "The following processes are using high system resources:\n\n"
-                f"{process_list}\n\n"
-                "To end processes, enter their numbers (comma-separated)\n"
-                "Example: 1,3 (to end processes 1 and 3)\n"
-                "Or type 'all' to end all listed processes:"
-            )
-            input_dialog.setTextValue("")
+            from process_manager_dialog import ProcessManagerDialog
+            dialog = ProcessManagerDialog(self)
+            dialog.exec_()
             
-            ok = input_dialog.exec_()
-            if ok:
-                input_text = input_dialog.textValue().strip()
-                
-                if not input_text:
-                    return
-                
-                if input_text.lower() == 'all':
-                    to_kill_indices = range(1, len(processes) + 1)
-                else:
-                    try:
-                        to_kill_indices = [
-                            int(i.strip()) for i in input_text.split(',') 
-                            if i.strip().isdigit()
-                        ]
-                    except ValueError:
-                        QMessageBox.warning(
-                            self, 
-                            "Invalid Input", 
-                            "Invalid input format. Please enter numbers separated by commas."
-                        )
-                        return
-                
-                if not to_kill_indices:
-                    QMessageBox.warning(
-                        self,
-                        "Invalid Input",
-                        "No valid process numbers entered."
-                    )
-                    return
-                
-                # End selected processes
-                terminated_count = 0
-                failed_count = 0
-                for idx in to_kill_indices:
-                    if 1 <= idx <= len(processes):
-                        pid = processes[idx - 1][0]
-                        name = processes[idx - 1][1]
-                        try:
-                            psutil.Process(pid).terminate()
-                            terminated_count += 1
-                        except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
-                            failed_count += 1
-                
-                # Show summary message
-                summary = []
-                if terminated_count > 0:
-                    summary.append(f"Successfully terminated {terminated_count} process(es)")
-                if failed_count > 0:
-                    summary.append(f"Failed to terminate {failed_count} process(es)")
-                
-                if summary:
-                    QMessageBox.information(
-                        self,
-                        "Process Management Complete",
-                        "\n".join(summary)
-                    )
-                
-                # Update system usage display after terminating processes
-                self.update_system_usage()
+            # Update system usage display after terminating processes
+            self.update_system_usage()
             
         except Exception as e:
             QMessageBox.warning(
@@ -1520,6 +1115,7 @@ class MainWindow(QMainWindow):
             # Clear search when switching to library tab
             self.clear_search()
         elif clicked_button == self.ui.storeBtn:
+            self.ensure_store_view()
             self.ui.stackedWidget.setCurrentIndex(4)
             self.store_view.updateGeometry()
         elif clicked_button == self.ui.optimizationBtn:
@@ -1531,6 +1127,15 @@ class MainWindow(QMainWindow):
         elif clicked_button == self.ui.savefileBtn:
             self.ui.stackedWidget.setCurrentIndex(1)
 
+    def ensure_store_view(self):
+        """Create the store tabs the first time the store page is opened."""
+        if self.store_view is None:
+            from store_tab import create_store_tabs
+            self.store_view = create_store_tabs()
+            self.store_view.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+            self.ui.storeLayout.addWidget(self.store_view)
+        return self.store_view
+
     def handle_search(self, query: str):
         """Handle search input and update clear button visibility"""
         # Only perform search if we're in the library tab
@@ -1551,45 +1156,40 @@ class MainWindow(QMainWindow):
             
         self.ui.lineEdit.clear()
         self.ui.clearSearchBtn.setVisible(False)
-        self.filtered_games = self.games.copy()
-        self.display_games_in_grid()
-        self.ui.gameCountLabel.setText(f"{len(self.games)} Games")
+        self.library_query = ''
+        self.apply_current_filters()
 
     def search_for_games(self, query: str):
         """Search for games in the library."""
         # Only search if we're in the library tab
         if self.ui.stackedWidget.currentIndex() != 0:
             return
-            
-        if not query:
-            self.filtered_games = self.games.copy()
-            self.display_games_in_grid()
-            return
 
-        query = query.lower()
-        self.filtered_games = [
-            game for game in self.games 
-            if (
-                # Search in game name
-                query in game.name.lower() or
-                # Search in genre
-                (game.genre and query in game.genre.lower()) or
-                # Search in platform/type
-                (game.type and query in game.type.lower()) or
-                # Search in installation status
-                (game.is_installed and "installed" in query) or
-                (not game.is_installed and "not installed" in query)
-            )
-        ]
-        
-        # Update display
-        self.display_games_in_grid()
-        
-        # Update game count with search results
-        if query:
-            self.ui.gameCountLabel.setText(f"{len(self.filtered_games)} Games Found")
-        else:
-            self.ui.gameCountLabel.setText(f"{len(self.games)} Games")
+        self.library_query = query.strip().lower()
+        self.apply_current_filters()
+
+    @staticmethod
+    def matches_search(game, query: str) -> bool:
+        """Whether a game matches the library search text (lowercase)."""
+        return bool(
+            # Search in game name
+            query in game.name.lower() or
+            # Search in genre
+            (game.genre and query in game.genre.lower()) or
+            # Search in platform/type
+            (game.type and query in game.type.lower()) or
+            # Search in installation status
+            (game.is_installed and "installed" in query) or
+            (not game.is_installed and "not installed" in query)
+        )
+
+    def current_view(self):
+        """The games the grid shows: the library with the current filters and search applied."""
+        self.library_store.sync(self.games)
+        games = self.library_store.filter(self.current_filters)
+        if self.library_query:
+            games = [game for game in games if self.matches_search(game, self.library_query)]
+        return games
 
     def toggle_overlay(self):
         """Toggle the overlay window visibility"""
@@ -1614,6 +1214,7 @@ class MainWindow(QMainWindow):
         msg_box.setIcon(QMessageBox.Question)
         msg_box.setStandardButtons(QMessageBox.Yes | QMessageBox.No)
         msg_box.setDefaultButton(QMessageBox.No)
+        scan_button = msg_box.addButton("Scan Folders...", QMessageBox.ActionRole)
         
         # Set the Steam icon for both window and message box
         icon = QIcon("./icons/steam.png")
@@ -1627,10 +1228,100 @@ class MainWindow(QMainWindow):
             msg_box.setIconPixmap(steam_pixmap)
         
         reply = msg_box.exec_()
-        if reply == QMessageBox.Yes:
+        if msg_box.clickedButton() is scan_button:
+            self.scan_game_folders()
+        elif reply == QMessageBox.Yes:
             # Call fetch_steam_games instead of search_for_games since this is for finding new games
             self.loop.create_task(self.fetch_steam_games())
 
+    def merge_duplicate_games(self):
+        """Offer to fold games owned on several stores (or also added by hand) into one entry each."""
+        from library_dedupe import find_duplicates, merge_clusters
+        from duplicates_dialog import DuplicatesDialog
+        try:
+            clusters = [cluster for cluster in find_duplicates(self.db_manager.get_all_games())
+                        if frozenset(game.id for game in cluster) not in self.declined_duplicates]
+            if not clusters:
+                return 0
+            dialog = DuplicatesDialog(clusters, self)
+            selected = dialog.selected_clusters() if dialog.exec() == QDialog.Accepted else []
+            # Don't ask again this session about the sets left unchecked
+            self.declined_duplicates.update(frozenset(game.id for game in cluster)
+                                            for cluster in clusters if not any(cluster is c for c in selected))
+            removed = merge_clusters(self.db_manager, selected)
+            if removed:
+                print(f"[DEBUG] Merged away {removed} duplicate library entries")
+            return removed
+        except Exception as e:
+            print(f"Error merging duplicate games: {e}")
+            return 0
+
+    def scan_game_folders(self):
+        """Ask for a folder and add the games found under it (see game_crawler)."""
+        folder = QFileDialog.getExistingDirectory(self, "Select a Folder with Games")
+        if folder:
+            self.loop.create_task(self.import_crawled_games([folder]))
+
+    async def import_crawled_games(self, roots):
+        """Crawl folders for game executables and add the new ones in one bulk insert.
+
+        Games the local Steam catalog recognizes get their store metadata; the
+        crawl runs on worker threads and an interrupted one resumes next time.
+        """
+        from game_crawler import GameCrawler, new_games, match_catalog, import_record, format_stats
+        from manual_add_dialog import ManualAddGameDialog
+        crawler = GameCrawler(roots)
+        progress_dialog = self.create_progress_dialog("Scanning Folders", "Looking for games...", 0, 0)
+        progress_dialog.canceled.connect(crawler.stop)
+        progress_dialog.show()
+        try:
+            if crawler.resume():
+                progress_dialog.setLabelText("Resuming the last scan...")
+            crawl = self.loop.run_in_executor(None, crawler.run)
+            while not crawl.done():
+                await asyncio.sleep(0.25)
+                progress_dialog.setLabelText(f"Looking for games...\n{format_stats(crawler.stats)}")
+            await crawl
+            if not crawler.finished:
+                print(f"[DEBUG] Folder scan stopped after {format_stats(crawler.stats)}")
+                return
+
+            games = new_games(crawler.games(), self.db_manager.get_install_paths())
+            progress_dialog.setLabelText(f"Matching {len(games)} games with the Steam catalog...")
+            matches = match_catalog(games, self.metadata_fetcher.store_search)
+            details = await self.metadata_fetcher.fetch_appdetails(sorted(set(matches.values()))) if matches else {}
+
+            known = self.db_manager.get_metadata_index()
+            records = []
+            for game in games:
+                app_id = matches.get(game['path'])
+                key = self.db_manager.metadata_key('manual', app_id, game['name'])
+                if key in known:
+                    continue  # the same game was added by hand
+                known[key] = (None, True)
+                metadata = ManualAddGameDialog.store_metadata(app_id, details[app_id]) if details.get(app_id) else None
+                records.append(import_record(game, app_id, metadata))
+            if records and not self.db_manager.bulk_write_metadata([], records):
+                raise RuntimeError("the games could not be saved")
+            print(f"[DEBUG] Folder scan: {format_stats(crawler.stats)}, {len(records)} games added, "
+                  f"{len(matches)} matched in the Steam catalog")
+        except Exception as e:
+            print(f"Error scanning folders: {e}")
+            import traceback
+            traceback.print_exc()
+            progress_dialog.close()
+            QMessageBox.critical(self, "Error", f"Failed to scan folders: {str(e)}")
+            return
+        finally:
+            progress_dialog.canceled.disconnect(crawler.stop)
+            progress_dialog.close()
+
+        if records:
+            self.merge_duplicate_games()  # asks first, now that the progress dialog is gone
+            self.force_ui_refresh()
+            self.populate_filter_dropdowns()
+        QMessageBox.information(self, "Scan Complete", f"Added {len(records)} new games to your library.")
+
     def browse_and_launch_game(self, game=None):
         """Open dialog to browse for game executable and add/edit game."""
         try:
@@ -1638,6 +1329,7 @@ class MainWindow(QMainWindow):
             if game:
                 print(f"[DEBUG] Editing game with type: {game.type}")
                 
+            from manual_add_dialog import ManualAddGameDialog
             dialog = ManualAddGameDialog(self, game)
             if dialog.exec_() == QDialog.Accepted:
                 game_data = dialog.get_game_data()
@@ -1669,7 +1361,7 @@ class MainWindow(QMainWindow):
                         print(f"[DEBUG] Successfully updated game in database with ID: {game.id}")
                         # Refresh the games list
                         self.games = self.db_manager.get_all_games()
-                        self.filtered_games = self.games.copy()
+                        self.filtered_games = self.current_view()
                         
                         # Clear and rebuild the grid layout
                         while self.grid_layout.count():
@@ -1692,7 +1384,7 @@ class MainWindow(QMainWindow):
                         print(f"[DEBUG] Successfully added new game to database with ID: {game_id}")
                         # Refresh the games list
                         self.games = self.db_manager.get_all_games()
-                        self.filtered_games = self.games.copy()
+                        self.filtered_games = self.current_view()
                         
                         # Clear and rebuild the grid layout
                         while self.grid_layout.count():
@@ -1714,6 +1406,65 @@ class MainWindow(QMainWindow):
             traceback.print_exc()
             QMessageBox.critical(self, "Error", f"Failed to {'edit' if game else 'add'} game: {str(e)}")
 
+    def launch_game(self, game):
+        """Launch a game and start tracking its play session."""
+        try:
+            if not game.is_installed:
+                QMessageBox.warning(self, "Not Installed", f"{game.name} is not installed.")
+                return
+
+            process = self.game_manager.launch_game(game.id)
+            game.process = process
+            if game not in self.session_games:
+                self.session_games.append(game)
+
+            self.session_tracker.start_session(game, process)
+            self.timer_manager.start_fps_timer()
+            self.status_bar.showMessage(f"Launched {game.name}", 5000)
+        except Exception as e:
+            print(f"Error launching game {game.name}: {e}")
+            QMessageBox.critical(self, "Error", f"Failed to launch game: {str(e)}")
+
+    def on_session_started(self, game):
+        """Switch the launcher into game mode while a game is running."""
+        self.game_mode.enter()
+        self.resort_game(game)  # last played changed
+
+    def on_game_mode_report(self, report):
+        """Show how many resources game mode released."""
+        self.status_bar.showMessage(
+            f"Game mode: released {report['ram_released_mb']:.0f} MB RAM, "
+            f"launcher CPU {report['cpu_before']:.1f}% -> {report['cpu_after']:.1f}%",
+            10000
+        )
+
+    def leave_session(self, game):
+        """Stop treating a game as running, and leave game mode when it was the last one."""
+        if not self.session_tracker.has_active_sessions():
+            self.game_mode.exit()
+        if game in self.session_games:
+            self.session_games.remove(game)
+        if not self.session_games:
+            self.timer_manager.stop_fps_timer()
+            self.overlay_window.hide_overlay()
+
+    def on_session_discarded(self, game):
+        """Handle a store-launched game whose process never showed up."""
+        self.leave_session(game)
+        self.status_bar.showMessage(f"Stopped tracking {game.name}: its process was not found", 5000)
+
+    def on_session_ended(self, game, duration):
+        """Handle a tracked game exiting."""
+        self.leave_session(game)
+
+        minutes = round(duration / 60)
+        self.status_bar.showMessage(f"{game.name} closed after {minutes} minute(s)", 5000)
+
+        # Locally tracked playtime changed for non-Steam games
+        if game.type != 'steam':
+            game.playtime = self.db_manager.get_game_playtime(game.id) or game.playtime
+            self.resort_game(game)
+
     def edit_game(self, game):
         """Open the edit dialog for an existing game."""
         self.browse_and_launch_game(game)
@@ -1758,7 +1509,7 @@ class MainWindow(QMainWindow):
             
             # Update UI
             self.games = self.db_manager.get_all_games()
-            self.filtered_games = self.games.copy()
+            self.filtered_games = self.current_view()
             self.display_games_in_grid()
             
             # Close progress dialog if it exists
@@ -1793,7 +1544,7 @@ class MainWindow(QMainWindow):
                 if self.db_manager.remove_game(game.id):
                     # Update games list
                     self.games = self.db_manager.get_all_games()
-                    self.filtered_games = self.games.copy()
+                    self.filtered_games = self.current_view()
                     
                     # Update UI
                     self.force_ui_refresh()
@@ -1818,8 +1569,24 @@ class MainWindow(QMainWindow):
         except Exception as e:
             print(f"Error updating overlay metrics: {e}")
 
+    def changeEvent(self, event):
+        """Pause background jobs while the window is minimized."""
+        if event.type() == QEvent.WindowStateChange and hasattr(self, 'scheduler'):
+            self.scheduler.set_window_minimized(self.isMinimized())
+        super().changeEvent(event)
+
     def closeEvent(self, event):
         """Cleanup when closing the application"""
+        if hasattr(self, 'session_tracker'):
+            self.session_tracker.stop_all()
+        if getattr(self, 'refresh_job', None):
+            # The job's progress is in the database, it resumes on the next start
+            self.refresh_job.cancel()
+        if getattr(self, 'library_reconciled', False):
+            # Only a reconciled library is worth painting on the next start
+            library_snapshot.save_snapshot(self.games)
+        if hasattr(self, 'scheduler'):
+            self.scheduler.shutdown()
         if hasattr(self, 'overlay_window'):
             self.overlay_window.close()
         event.accept()
@@ -1845,30 +1612,55 @@ class MainWindow(QMainWindow):
         # Update overlay position
         self.overlay_window.set_position(position)
 
-    def update_game_statuses(self):
-        """Update the status of running games and installation status"""
-        try:
-            # Update running games
-            for game in self.session_games[:]:  # Create a copy of the list to modify it
-                if hasattr(game, 'process') and game.process:
-                    # Check if the game process is still running
-                    if not game.process.is_running():
-                        # Game has closed
-                        self.session_games.remove(game)
-                        # Stop FPS monitoring if no games are running
-                        if not self.session_games:
-                            self.timer_manager.stop_fps_timer()
-                            self.overlay_window.hide_overlay()
-            
-            # Update installation status for all games
-            for game in self.games:
-                game.check_installation_status()
-            
-            # Update the display to reflect any changes
+    def check_install_statuses(self):
+        """Re-check installation status for every game (runs on a scheduler worker thread).
+
+        Only reads the games; the new statuses are applied on the GUI thread.
+        """
+        changed = []
+        for game in list(self.games):
+            installed = game.installation_status()
+            if installed != game.is_installed:
+                changed.append((game, installed))
+        return changed
+
+    def apply_install_statuses(self, changed):
+        """Apply the statuses found by check_install_statuses; redraw only when one changed."""
+        changed = [(game, installed) for game, installed in changed if game.is_installed != installed]
+        if changed:
+            print(f"[DEBUG] Installation status changed for {len(changed)} games")
+            for game, installed in changed:
+                game.is_installed = installed
+                self.library_store.update_game(game)
             self.display_games_in_grid()
-        except Exception as e:
-            print(f"Error updating game statuses: {e}")
-            self.timer_manager.stop_system_timer()
+
+    async def sync_steam_playtime(self):
+        """Background Steam playtime sync (scheduled async job); returns whether it succeeded."""
+        api_key = get_cached_steam_api_key()
+        steam_id = get_cached_steam_id()
+        if not api_key or not steam_id:
+            return False
+        client = SteamAPIClient(api_key, steam_id)
+        try:
+            return await client.update_database_playtime(self.db_manager)
+        finally:
+            await client.close()
+
+    def apply_steam_playtimes(self, synced):
+        """Copy playtimes written by sync_steam_playtime onto the loaded games."""
+        if not synced:
+            return
+        stored = self.db_manager.get_steam_playtimes()
+        changed = 0
+        for game in self.games:
+            row = stored.get(str(game.app_id)) if game.type == 'steam' else None
+            if row and row[1] != game.playtime:
+                game.playtime = row[1]
+                self.library_store.update_game(game)
+                self.resort_game(game)
+                changed += 1
+        if changed:
+            print(f"[DEBUG] Steam playtime changed for {changed} games")
 
     def display_games_in_grid(self):
         """Display games in a grid layout."""
@@ -1888,13 +1680,17 @@ class MainWindow(QMainWindow):
             
             print(f"[DEBUG] Grid width: {grid_width}, Columns: {columns}")
             
+            self.sort_filtered_games()
+            
             # Add games to grid
             row = 0
             col = 0
+            self.grid_cards = []
             for game in self.filtered_games:
                 try:
                     card = self.create_game_card(game)
                     if card:
+                        self.grid_cards.append((card, game))
                         self.grid_layout.addWidget(card, row, col)
                         col += 1
                         if col >= columns:
@@ -1912,6 +1708,7 @@ class MainWindow(QMainWindow):
             self.grid_widget.updateGeometry()
             self.grid_layout.update()
             self.scroll_area.viewport().update()
+            self.visible_cards_timer.start()
             
             print("[DEBUG] Finished display_games_in_grid")
             
@@ -1920,36 +1717,170 @@ class MainWindow(QMainWindow):
             import traceback
             traceback.print_exc()
 
+    def visible_games(self):
+        """Games whose card intersects the scroll area's viewport."""
+        viewport = self.scroll_area.viewport()
+        top = self.scroll_area.verticalScrollBar().value()
+        visible_rect = QRect(0, top, viewport.width(), viewport.height())
+        return [game for card, game in self.grid_cards if card.geometry().intersects(visible_rect)]
+
+    def update_visible_games(self):
+        """Let on-screen games jump the metadata queue."""
+        self.metadata_fetcher.set_visible_games(self.visible_games())
+
+    def on_game_metadata_updated(self, game):
+        """Apply metadata that just arrived for one game, redrawing soon if it is on screen."""
+        self.library_store.update_game(game)
+        self.metadata_changed[id(game)] = game
+        moved = self.resort_game(game, redraw=False)
+        if moved or game.id in self.metadata_fetcher.queue.visible:
+            self.metadata_redraw_timer.start()
+
+    async def refresh_metadata_cards(self):
+        """Show streamed metadata without redrawing the whole grid.
+
+        Only the cards of changed games are rebuilt, with their posters downloaded
+        off the GUI thread; the current filters, search and sort order are kept,
+        and the other cards are only moved when the order or the shown games changed.
+        """
+        if self.refreshing_cards:
+            self.metadata_redraw_timer.start()  # try again once the running refresh is done
+            return
+        self.refreshing_cards = True
+        try:
+            changed = self.metadata_changed
+            self.metadata_changed = {}
+            shown = {id(game) for card, game in self.grid_cards}
+            fetch = [game for key, game in changed.items() if key in shown and game.poster_url]
+            images = await asyncio.gather(*(self.fetch_image(game.poster_url, quiet=True) for game in fetch))
+            posters = {id(game): image for game, image in zip(fetch, images)}
+
+            old_order = [game for card, game in self.grid_cards]
+            cards = {id(game): card for card, game in self.grid_cards}
+            self.filtered_games = self.current_view()
+            self.sort_filtered_games()
+
+            grid_cards = []
+            replaced = []
+            for game in self.filtered_games:
+                card = cards.pop(id(game), None)
+                if card is None or id(game) in changed:
+                    image = posters.get(id(game))
+                    if image is None and game.poster_url:
+                        # A failed download shows the placeholder instead of retrying on this thread
+                        image = self.cached_image(game.poster_url) or QImage()
+                    new_card = GameCard(game, self, image)
+                    if card is not None:
+                        replaced.append((card, new_card))
+                    card = new_card
+                grid_cards.append((card, game))
+
+            if len(old_order) == len(self.filtered_games) and all(
+                    a is b for a, b in zip(old_order, self.filtered_games)):
+                for card, new_card in replaced:
+                    self.grid_layout.replaceWidget(card, new_card)
+                    card.deleteLater()
+                self.grid_cards = grid_cards
+            else:
+                for card, new_card in replaced:
+                    card.deleteLater()
+                for card in cards.values():  # games no longer shown
+                    card.deleteLater()
+                self.grid_cards = grid_cards
+                self.lay_out_cards()
+                self.show_view_count()
+            self.visible_cards_timer.start()
+        except Exception as e:
+            print(f"Error refreshing game cards: {e}")
+        finally:
+            self.refreshing_cards = False
+
+    def lay_out_cards(self):
+        """Place the cards of self.grid_cards in grid order, keeping the card widgets."""
+        while self.grid_layout.count():
+            self.grid_layout.takeAt(0)
+        columns = max(1, self.scroll_area.viewport().width() // 220)  # as display_games_in_grid
+        for i, (card, game) in enumerate(self.grid_cards):
+            self.grid_layout.addWidget(card, i // columns, i % columns)
+        rows = (len(self.grid_cards) + columns - 1) // columns
+        spacer = QSpacerItem(20, 20, QSizePolicy.Minimum, QSizePolicy.Expanding)
+        self.grid_layout.addItem(spacer, rows + 1, 0, 1, columns)
+
+    def show_game_details(self, game):
+        """Show the details dialog (one instance, reused); a game still waiting for metadata is fetched next."""
+        from game_details_dialog import GameDetailsDialog
+        if self.details_dialog is None:
+            self.details_dialog = GameDetailsDialog(parent=self)
+            self.details_dialog.finished.connect(lambda result: self.metadata_fetcher.set_focused_game(None))
+            self.metadata_fetcher.game_updated.connect(self.details_dialog.on_game_updated)
+        self.metadata_fetcher.set_focused_game(game)
+        if game.type == 'steam' and not game.metadata_fetched and not self.metadata_fetcher.queue:
+            # No fetch is running to pick the focused game up, so fetch just this one
+            asyncio.ensure_future(self.metadata_fetcher.fetch_metadata_for_games([game]))
+        self.details_dialog.show_game(game)
+
+    def cached_image(self, url):
+        """An image from the memory or file cache, without touching the network."""
+        if url in self.image_cache:
+            return self.image_cache[url]
+        cache_path = image_cache_path(url, self.image_cache_dir)
+        if os.path.exists(cache_path):
+            img = QImage(cache_path)
+            if not img.isNull():
+                self.image_cache[url] = img
+                return img
+        return None
+
+    def download_image_data(self, url, quiet=False):
+        """Download an image into the file cache (safe to run off the GUI thread); returns its bytes."""
+        import requests
+        try:
+            response = requests.get(url, timeout=10)
+            if response.status_code != 200:
+                if not quiet:
+                    print(f"[DEBUG] Failed to download image - status code: {response.status_code}")
+                return None
+            cache_path = image_cache_path(url, self.image_cache_dir)
+            with open(f"{cache_path}.part", 'wb') as f:
+                f.write(response.content)
+            os.replace(f"{cache_path}.part", cache_path)
+            return response.content
+        except Exception as e:
+            if not quiet:
+                print(f"Error downloading image: {str(e)}")
+            return None
+
+    async def fetch_image(self, url, quiet=False):
+        """Like load_image, but downloads on a worker thread instead of blocking the UI."""
+        img = self.cached_image(url)
+        if img is not None or not url.startswith(('http://', 'https://')):
+            return img
+        data = await asyncio.get_event_loop().run_in_executor(None, self.download_image_data, url, quiet)
+        if not data:
+            return None
+        img = QImage()
+        if img.loadFromData(data) and not img.isNull():
+            self.image_cache[url] = img
+            return img
+        return None
+
     def load_image(self, url):
         """Load an image from a URL or local path, with caching support."""
         try:
             print(f"[DEBUG] Attempting to load image from URL: {url}")
             
-            # Check if image is in memory cache
-            if url in self.image_cache:
-                print(f"[DEBUG] Image loaded from memory cache: {url}")
-                return self.image_cache[url]
+            img = self.cached_image(url)
+            if img is not None:
+                print(f"[DEBUG] Image loaded from cache: {url}")
+                return img
             
-            # Generate a unique filename for the image
-            import hashlib
-            url_hash = hashlib.md5(url.encode()).hexdigest()
-            cache_path = os.path.join(self.image_cache_dir, f"{url_hash}.jpg")
-            
-            # Check if image exists in file cache
-            if os.path.exists(cache_path):
-                print(f"[DEBUG] Loading image from file cache: {cache_path}")
-                img = QImage(cache_path)
-                if not img.isNull():
-                    print("[DEBUG] Successfully loaded image from file cache")
-                    # Add to memory cache
-                    self.image_cache[url] = img
-                    return img
-                else:
-                    print("[DEBUG] Failed to load image from file cache - image is null")
+            # Generate a unique filename for the image (metadata bundles restore images under the same name)
+            cache_path = image_cache_path(url, self.image_cache_dir)
             
             # Image not in cache, need to download it
             if url.startswith(('http://', 'https://')):
                 print(f"[DEBUG] Downloading image from URL: {url}")
+                import requests
                 response = requests.get(url, stream=True, timeout=5)
                 if response.status_code == 200:
                     print("[DEBUG] Successfully downloaded image")
@@ -1994,11 +1925,11 @@ class MainWindow(QMainWindow):
             self.populate_filter_dropdowns()
             
             # Create and show dialog with current filters and available options
+            from filter_dialog import FilterDialog
             dialog = FilterDialog(
                 parent=self,
                 current_filters=self.current_filters,
-                available_genres=self.available_genres,
-                available_platforms=self.available_platforms
+                library_store=self.library_store
             )
             
             # Connect the dialog's signal
@@ -2011,19 +1942,114 @@ class MainWindow(QMainWindow):
             print(f"Error showing filter dialog: {e}")
             QMessageBox.critical(self, "Error", f"Failed to show filter dialog: {str(e)}")
 
+    def handle_sort_change(self, index):
+        """Re-sort the grid with the selected sort order."""
+        self.sorter.set_sort(self.sort_combo.itemData(index))
+        self.display_games_in_grid()
+
+    def sort_filtered_games(self):
+        """Order the displayed games, reusing cached sort keys."""
+        self.sorter.sync(self.games)
+        if not self.sorter.is_sorted(self.filtered_games):
+            self.sorter.sort(self.filtered_games)
+
+    def resort_game(self, game, redraw=True):
+        """Move a single changed game to its new grid position; returns True if it moved."""
+        shown = any(g is game for g in self.filtered_games)
+        if not (shown and self.sorter.is_sorted(self.filtered_games)):
+            self.sorter.invalidate(game)
+            return False
+        old_index = self.sorter.index_of(self.filtered_games, game)
+        moved = self.sorter.reposition(self.filtered_games, game) != old_index
+        if moved and redraw:
+            self.display_games_in_grid()
+        return moved
+
+    def populate_filter_dropdowns(self):
+        """Refresh the genre and platform options offered by the filter dialog."""
+        self.library_store.sync(self.games)
+        self.available_genres = sorted(self.library_store.facet_counts('genre'), key=str.lower)
+        self.available_platforms = sorted(t for t in self.library_store.facet_counts('type') if t)
+
+    def apply_filter_dialog_results(self, filters):
+        """Store the filters chosen in the filter dialog and apply them."""
+        self.current_filters = filters
+        self.apply_current_filters()
+
+    def apply_current_filters(self):
+        """Show only the games matching the current filters and search."""
+        self.filtered_games = self.current_view()
+        self.display_games_in_grid()
+        self.show_view_count()
+
+    def show_view_count(self):
+        """Show how many games the grid shows."""
+        if self.library_query:
+            self.ui.gameCountLabel.setText(f"{len(self.filtered_games)} Games Found")
+        else:
+            self.ui.gameCountLabel.setText(f"{len(self.filtered_games)} Games")
+
+    def read_library(self):
+        """Read every game with a fresh installation check (runs on a worker thread)."""
+        # sqlite connections are bound to the thread that created them
+        db = DatabaseManager(self.db_manager.db_path, initialize=False)
+        try:
+            return db.get_all_games()
+        finally:
+            db.conn.close()
+
+    def reconcile_library(self, games):
+        """Replace snapshot placeholders with the database games, redrawing only if the grid changed."""
+        grid_changed = library_snapshot.visible_state(self.games) != library_snapshot.visible_state(games)
+
+        # Cards built from the snapshot hold on to their game objects, so upgrade those in place
+        shown = {game.id: game for game in self.games}
+        library = []
+        for game in games:
+            placeholder = shown.get(game.id)
+            if placeholder is not None:
+                placeholder.copy_from(game)
+                game = placeholder
+            library.append(game)
+
+        self.games = library
+        self.filtered_games = self.current_view()
+        self.library_reconciled = True
+        if grid_changed or not self.games:
+            print("[DEBUG] Library changed since the snapshot, redrawing grid")
+            self.force_ui_refresh(reload=False)
+        self.update_game_count()
+
     async def load_initial_games(self):
-        """Load games from database ONLY - NEVER fetch metadata on normal startup."""
+        """Load games from database ONLY - NEVER fetch metadata on normal startup
+        (an unfinished refresh the user started is resumed).
+
+        The grid saved at the last shutdown is painted first, then the library is
+        read and install states are checked on a worker thread and reconciled.
+        """
         try:
             print("[DEBUG] Starting load_initial_games")
-            # Get all games from database
-            self.games = self.db_manager.get_all_games()
-            self.filtered_games = self.games.copy()
-            print(f"[DEBUG] load_initial_games: Retrieved {len(self.games)} games from database")
-            
-            # Update display with games from database - NO API calls
-            self.force_ui_refresh()
+            self.library_reconciled = False
+            snapshot = library_snapshot.load_snapshot()
+            if snapshot:
+                self.games = snapshot
+                self.filtered_games = self.current_view()
+                self.display_games_in_grid()
+                self.ui.gameCountLabel.setText(f"{len(self.games)} Games")
+                self.startup_timeline.finish()
+                print(f"[DEBUG] load_initial_games: Painted {len(snapshot)} games from snapshot")
+            
+            # Get all games from database - NO API calls
+            games = await self.loop.run_in_executor(None, self.read_library)
+            print(f"[DEBUG] load_initial_games: Retrieved {len(games)} games from database")
+            self.reconcile_library(games)
+            if not snapshot:
+                self.startup_timeline.finish()
             print("[DEBUG] load_initial_games complete")
             
+            # A metadata refresh the user started earlier is the one fetch that continues on startup
+            self.loop.create_task(self.resume_metadata_refresh())
+            
         except Exception as e:
             print(f"Error loading initial games: {e}")
             import traceback
@@ -2032,7 +2058,13 @@ class MainWindow(QMainWindow):
 
 if __name__ == '__main__':
     try:
+        # QtWebEngine is imported lazily, after the application exists
+        QApplication.setAttribute(Qt.AA_ShareOpenGLContexts)
+        # Library names are sorted with the user's collation rules
+        import locale
+        locale.setlocale(locale.LC_COLLATE, '')
         app = QApplication(sys.argv)
+        apply_app_style(app)
         
         # Create and show the main window
         loop = qasync.QEventLoop(app)
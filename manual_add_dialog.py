@@ -1,99 +1,41 @@
 from PySide6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, 
                             QPushButton, QFileDialog, QFrame, QScrollArea, QWidget,
-                            QGraphicsDropShadowEffect, QProgressBar, QMessageBox)
-from PySide6.QtCore import Qt, QThread, Signal
+                            QGraphicsDropShadowEffect, QProgressBar, QMessageBox, QListWidget,
+                            QListWidgetItem)
+from PySide6.QtCore import Qt, QTimer
 from PySide6.QtGui import QColor, QPixmap
 from models import Game
-import requests
-import json
+from store_search import rank_candidates
+import asyncio
 import os
+from typing import Dict, List, Optional
 from urllib.request import urlopen
-from io import BytesIO
-
-class MetadataFetcherThread(QThread):
-    """Thread for fetching game metadata without blocking the UI"""
-    metadata_fetched = Signal(dict)
-    error = Signal(str)
-    progress = Signal(int, int)  # current, total
-
-    def __init__(self, game_name):
-        super().__init__()
-        self.game_name = game_name
-        self.base_url = "https://store.steampowered.com/api"
-
-    def run(self):
-        try:
-            self.progress.emit(1, 3)
-            
-            # Search for the game using Steam Store search
-            search_url = f"{self.base_url}/storesearch/"
-            params = {
-                "term": self.game_name,
-                "l": "english",
-                "cc": "US"
-            }
-            
-            response = requests.get(search_url, params=params)
-            if response.status_code != 200:
-                raise Exception(f"Steam API request failed: {response.status_code}")
-
-            data = response.json()
-            items = data.get("items", [])
-            
-            if not items:
-                raise Exception("No matching game found on Steam")
-                
-            # Get the first match
-            game = items[0]
-            app_id = game.get("id")
-            
-            self.progress.emit(2, 3)
-            
-            # Get detailed game info from store API
-            details_url = f"{self.base_url}/appdetails/"
-            params = {
-                "appids": app_id,
-                "l": "english"
-            }
-            
-            response = requests.get(details_url, params=params)
-            if response.status_code != 200:
-                raise Exception(f"Steam API request failed: {response.status_code}")
-
-            detailed_data = response.json()
-            app_data = detailed_data.get(str(app_id), {}).get("data", {})
-            
-            if not app_data:
-                raise Exception("Failed to fetch game details")
-                
-            self.progress.emit(3, 3)
-
-            # Extract relevant metadata
-            metadata = {
-                "name": app_data.get("name", ""),
-                "app_id": app_id,
-                "genre": ", ".join(g.get("description", "") for g in app_data.get("genres", [])),
-                "release_date": app_data.get("release_date", {}).get("date", ""),
-                "description": app_data.get("short_description", ""),
-                "developers": app_data.get("developers", []),
-                "publishers": app_data.get("publishers", []),
-                "poster_url": app_data.get("header_image", ""),
-                "background_url": app_data.get("background", ""),
-                "type": "steam"
-            }
-
-            self.metadata_fetched.emit(metadata)
-
-        except Exception as e:
-            self.error.emit(str(e))
 
 class ManualAddGameDialog(QDialog):
+    SEARCH_DELAY = 350  # ms of typing pause before the store is searched
+    MAX_CANDIDATES = 8
+
     def __init__(self, parent=None, game=None):
         super().__init__(parent)
         self.game = game  # Store the game being edited
         self.setWindowTitle("Edit Game" if game else "Add Game Manually")
         self.setMinimumWidth(600)
         self.poster_path = None  # Store local poster path
+        self.poster_url = None
+        # The library's fetcher, so searches and store details share its caches
+        self.fetcher = getattr(parent, 'metadata_fetcher', None)
+        if self.fetcher is None:
+            from metadata_fetcher import MetadataFetcher
+            self.fetcher = MetadataFetcher()
+        self.search_task = None
+        self.details_task = None
+        self.poster_task = None
+        self.candidates: List[Dict] = []
+        self.candidates_term = ""
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(self.SEARCH_DELAY)
+        self.search_timer.timeout.connect(lambda: self.start_search(self.name_input.text()))
         self.setup_ui()
         if game:
             self.load_game_data(game)
@@ -130,6 +72,7 @@ class ManualAddGameDialog(QDialog):
         name_label.setStyleSheet("font-weight: bold; color: #ffffff;")
         self.name_input = QLineEdit()
         self.name_input.setPlaceholderText("Enter game name")
+        self.name_input.textEdited.connect(self.on_name_edited)
         self.name_input.setStyleSheet("""
             QLineEdit {
                 padding: 8px;
@@ -178,6 +121,25 @@ class ManualAddGameDialog(QDialog):
         self.progress_bar.hide()
         required_layout.addWidget(self.progress_bar)
         
+        # Store matches for the typed name, best first
+        self.candidate_list = QListWidget()
+        self.candidate_list.setMaximumHeight(150)
+        self.candidate_list.setStyleSheet("""
+            QListWidget {
+                border: 1px solid #2d3748;
+                border-radius: 4px;
+                background-color: #1a202c;
+                color: #ffffff;
+            }
+            QListWidget::item:selected {
+                background-color: #3182ce;
+            }
+        """)
+        self.candidate_list.itemActivated.connect(self.on_candidate_chosen)
+        self.candidate_list.itemClicked.connect(self.on_candidate_chosen)
+        self.candidate_list.hide()
+        required_layout.addWidget(self.candidate_list)
+        
         # Game executable
         exe_container = QWidget()
         exe_layout = QHBoxLayout(exe_container)
@@ -187,6 +149,7 @@ class ManualAddGameDialog(QDialog):
         exe_label.setStyleSheet("font-weight: bold; color: #ffffff;")
         self.exe_input = QLineEdit()
         self.exe_input.setPlaceholderText("Select game executable")
+        self.exe_input.textChanged.connect(lambda text: self.show_candidates(self.candidates))
         self.exe_input.setStyleSheet("""
             QLineEdit {
                 padding: 8px;
@@ -466,34 +429,143 @@ class ManualAddGameDialog(QDialog):
         """)
         
     def fetch_metadata(self):
-        """Fetch game metadata from Steam API"""
+        """Fill the form from the best store match for the name"""
         game_name = self.name_input.text().strip()
         if not game_name:
             QMessageBox.warning(self, "Error", "Please enter a game name first")
             return
-            
-        # Show progress bar
-        self.progress_bar.setRange(0, 3)
-        self.progress_bar.setValue(0)
+        self.search_timer.stop()
+        self.start_search(game_name, choose_best=True)
+
+    def on_name_edited(self, text):
+        """Search as the user types, once typing pauses"""
+        self.search_timer.start()
+
+    def start_search(self, term: str, choose_best: bool = False):
+        """Search the store for term, replacing any search still running"""
+        term = term.strip()
+        if self.search_task and not self.search_task.done():
+            self.search_task.cancel()  # the results would be for an older name
+        if len(term) < 2:
+            self.show_candidates([])
+            return
+
+        search = self.fetcher.store_search
+        cached = search.cached(term)
+        if cached is not None:
+            self.show_candidates(cached, term)
+            if choose_best:
+                self.choose_best()
+            return
+
+        # Titles seen before or in the local catalog are offered right away, before the store answers
+        offline = search.offline_candidates(term, self.MAX_CANDIDATES)
+        app_id = search.lookup(term)
+        if app_id and all(candidate['app_id'] != app_id for candidate in offline):
+            offline.insert(0, {'app_id': app_id, 'name': term, 'image': None})
+        if offline:
+            self.show_candidates(offline, term)
+
+        self.progress_bar.setRange(0, 0)
         self.progress_bar.show()
-        
-        # Create and start the metadata fetcher thread
-        self.fetcher = MetadataFetcherThread(game_name)
-        self.fetcher.metadata_fetched.connect(self.on_metadata_fetched)
-        self.fetcher.error.connect(self.on_metadata_error)
-        self.fetcher.progress.connect(self.on_metadata_progress)
-        self.fetcher.start()
+        self.search_task = asyncio.ensure_future(self.run_search(term, choose_best))
+
+    async def run_search(self, term: str, choose_best: bool):
+        try:
+            candidates = await self.fetcher.store_search.search(term)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            print(f"Error searching the store: {e}")
+            self.progress_bar.hide()
+            if choose_best:
+                QMessageBox.warning(self, "Error", f"Failed to fetch metadata: {e}")
+            return
+        self.progress_bar.hide()
+        self.show_candidates(candidates, term)
+        if choose_best:
+            if candidates:
+                self.choose_best()
+            else:
+                QMessageBox.warning(self, "Error", "Failed to fetch metadata: No matching game found on Steam")
+
+    def show_candidates(self, candidates: List[Dict], term: Optional[str] = None):
+        """List candidates ranked against the name and the executable"""
+        self.candidates = candidates
+        if term is not None:
+            self.candidates_term = term
+        self.candidate_list.clear()
+        ranked = rank_candidates(candidates, self.candidates_term, self.exe_input.text())
+        for score, candidate in ranked[:self.MAX_CANDIDATES]:
+            item = QListWidgetItem(f"{candidate['name']}   ({score:.0%} match, app {candidate['app_id']})")
+            item.setData(Qt.UserRole, candidate)
+            self.candidate_list.addItem(item)
+        self.candidate_list.setVisible(bool(ranked))
+
+    def choose_best(self):
+        if self.candidate_list.count():
+            self.on_candidate_chosen(self.candidate_list.item(0))
+
+    def on_candidate_chosen(self, item):
+        """Fetch store details for a candidate and fill in the form"""
+        candidate = item.data(Qt.UserRole)
+        if self.details_task and not self.details_task.done():
+            self.details_task.cancel()
+        self.progress_bar.setRange(0, 0)
+        self.progress_bar.show()
+        self.details_task = asyncio.ensure_future(self.fetch_details(candidate['app_id']))
+
+    async def fetch_details(self, app_id: str):
+        # Through the fetcher, so details already fetched for the library are reused
+        try:
+            results = await self.fetcher.fetch_appdetails([app_id])
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            results = {}
+            print(f"Error fetching store details: {e}")
+        self.progress_bar.hide()
+        app_data = results.get(app_id)
+        if not app_data:
+            self.on_metadata_error("Failed to fetch game details")
+            return
+        self.on_metadata_fetched(self.store_metadata(app_id, app_data))
+
+    @staticmethod
+    def store_metadata(app_id: str, app_data: Dict) -> Dict:
+        """The form fields from an appdetails payload"""
+        return {
+            "name": app_data.get("name", ""),
+            "app_id": app_id,
+            "genre": ", ".join(g.get("description", "") for g in app_data.get("genres", [])),
+            "release_date": (app_data.get("release_date") or {}).get("date", ""),
+            "description": app_data.get("short_description", ""),
+            "developers": app_data.get("developers", []),
+            "publishers": app_data.get("publishers", []),
+            "poster_url": app_data.get("header_image", ""),
+            "background_url": app_data.get("background", ""),
+            "type": "steam"
+        }
+
+    def reject(self):
+        self.cancel_tasks()
+        super().reject()
+
+    def accept(self):
+        self.cancel_tasks()
+        super().accept()
+
+    def cancel_tasks(self):
+        self.search_timer.stop()
+        for task in (self.search_task, self.details_task, self.poster_task):
+            if task and not task.done():
+                task.cancel()
         
     def on_metadata_error(self, error_msg):
         """Handle metadata fetch error"""
         self.progress_bar.hide()
         QMessageBox.warning(self, "Error", f"Failed to fetch metadata: {error_msg}")
         
-    def on_metadata_progress(self, current, total):
-        """Update progress bar"""
-        self.progress_bar.setValue(current)
-        self.progress_bar.setMaximum(total)
-        
     def load_game_data(self, game):
         """Load existing game data into the form."""
         self.name_input.setText(game.name)
@@ -510,6 +582,13 @@ class ManualAddGameDialog(QDialog):
         )
         if file_path:
             self.exe_input.setText(file_path)
+            if not self.name_input.text().strip():
+                # The local catalog may know the game from its folder; fill the form from the store
+                app_id = self.fetcher.store_search.resolve_path(file_path)
+                if app_id:
+                    self.progress_bar.setRange(0, 0)
+                    self.progress_bar.show()
+                    self.details_task = asyncio.ensure_future(self.fetch_details(app_id))
             
     def browse_poster(self):
         """Open file dialog to select a poster image"""
@@ -537,12 +616,16 @@ class ManualAddGameDialog(QDialog):
                 self.poster_path = path_or_url
                 self.poster_url = None
             else:
-                # Load from URL
-                response = urlopen(path_or_url)
-                data = response.read()
-                pixmap.loadFromData(data)
                 self.poster_url = path_or_url
                 self.poster_path = None
+                owner = self.parent()
+                if hasattr(owner, 'fetch_image'):
+                    # Through the library's image cache, without blocking the dialog
+                    self.poster_preview.setText("Loading image...")
+                    self.poster_task = asyncio.ensure_future(self.load_poster(owner, path_or_url))
+                    return
+                response = urlopen(path_or_url, timeout=10)
+                pixmap.loadFromData(response.read())
 
             # Scale the pixmap to fit the preview label while maintaining aspect ratio
             scaled_pixmap = pixmap.scaled(
@@ -556,6 +639,16 @@ class ManualAddGameDialog(QDialog):
             print(f"Error loading poster: {str(e)}")
             self.poster_preview.setText("Error loading image")
 
+    async def load_poster(self, owner, url: str):
+        image = await owner.fetch_image(url)
+        if url != self.poster_url:
+            return  # cleared or replaced meanwhile
+        if image is None:
+            self.poster_preview.setText("Error loading image")
+            return
+        self.poster_preview.setPixmap(QPixmap.fromImage(image).scaled(
+            self.poster_preview.size(), Qt.KeepAspectRatio, Qt.SmoothTransformation))
+
     def get_game_data(self):
         """Get the game data from the dialog."""
         try:
@@ -604,6 +697,8 @@ class ManualAddGameDialog(QDialog):
             
             # Store the Steam app ID and URLs for later use
             self.steam_app_id = metadata.get("app_id")
+            self.background_url = metadata.get("background_url") or None
+            self.fetcher.store_search.remember(self.steam_app_id, metadata.get("name"))
             
             # Load the poster image if available
             poster_url = metadata.get("poster_url")
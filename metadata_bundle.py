@@ -0,0 +1,194 @@
+#!/usr/bin/env python
+"""
+Metadata Bundle
+Exports fetched metadata and cached images into one file, and imports such a file
+into another library without any store requests.
+
+    python metadata_bundle.py export clockwork-metadata.cwb
+    python metadata_bundle.py import clockwork-metadata.cwb [--overwrite] [--no-add]
+"""
+
+import io
+import os
+import sys
+import json
+import shutil
+import hashlib
+import zipfile
+import argparse
+from datetime import datetime
+from typing import Dict, Iterator, List, Set, Tuple
+from image_cache import IMAGE_CACHE_DIR, image_cache_path
+
+# Bundle layout (a zip file):
+#   manifest.json   format version, creation time and counts
+#   games.jsonl     one deflated JSON object per game: identity, metadata and
+#                   images ({url: sha256}) for its cached poster/background
+#   blobs/<sha256>  each distinct image once, stored uncompressed (already JPEG/PNG)
+BUNDLE_VERSION = 1
+IMPORT_CHUNK = 500
+IMAGE_FIELDS = ('poster_url', 'background_url')
+
+def file_sha256(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 16), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def export_bundle(db_manager, path: str, cache_dir: str = IMAGE_CACHE_DIR) -> Dict[str, int]:
+    """Write every game with fetched metadata and its cached images to a bundle.
+
+    Games are streamed from the database; the file is replaced atomically.
+    """
+    blobs: Dict[str, str] = {}  # sha256 -> cached file
+    hashes: Dict[str, str] = {}  # cached file -> sha256
+    games = 0
+    temp_path = f"{path}.tmp"
+    with zipfile.ZipFile(temp_path, 'w', compression=zipfile.ZIP_DEFLATED) as bundle:
+        with bundle.open('games.jsonl', 'w') as raw, io.TextIOWrapper(raw, encoding='utf-8') as out:
+            for record in db_manager.iter_fetched_metadata():
+                images = {}
+                for field in IMAGE_FIELDS:
+                    url = record.get(field)
+                    cached = image_cache_path(url, cache_dir) if url else None
+                    if cached and os.path.exists(cached):
+                        if cached not in hashes:
+                            hashes[cached] = file_sha256(cached)
+                            blobs.setdefault(hashes[cached], cached)
+                        images[url] = hashes[cached]
+                record['images'] = images
+                out.write(json.dumps(record, ensure_ascii=False, separators=(',', ':')) + '\n')
+                games += 1
+
+        # Entries can only be written one at a time, so images follow the game list
+        for digest, cached in blobs.items():
+            bundle.write(cached, f"blobs/{digest}", compress_type=zipfile.ZIP_STORED)
+
+        bundle.writestr('manifest.json', json.dumps({
+            'version': BUNDLE_VERSION,
+            'created_at': datetime.now().isoformat(timespec='seconds'),
+            'games': games,
+            'images': len(blobs),
+        }))
+    os.replace(temp_path, path)
+    return {'games': games, 'images': len(blobs)}
+
+def read_records(bundle: zipfile.ZipFile) -> Iterator[Dict]:
+    """Stream the game records of an open bundle."""
+    with bundle.open('games.jsonl') as raw:
+        for line in io.TextIOWrapper(raw, encoding='utf-8'):
+            if line.strip():
+                yield json.loads(line)
+
+def import_bundle(db_manager, path: str, cache_dir: str = IMAGE_CACHE_DIR,
+                  overwrite: bool = False, add_missing: bool = True) -> Dict[str, int]:
+    """Load a bundle into the database and image cache.
+
+    Games are matched by app id (or name for games without one). Games that
+    already have metadata keep it unless overwrite is set; games missing from
+    the library are added when add_missing is set. Records are written in
+    chunks, each in one transaction, while the bundle is read.
+    """
+    stats = {'updated': 0, 'added': 0, 'skipped': 0, 'images': 0}
+    with zipfile.ZipFile(path) as bundle:
+        manifest = json.loads(bundle.read('manifest.json'))
+        if manifest.get('version') != BUNDLE_VERSION:
+            raise ValueError(f"Unsupported metadata bundle version {manifest.get('version')}")
+
+        index = db_manager.get_metadata_index()
+        wanted_images: Dict[str, Set[str]] = {}  # sha256 -> cache files to create
+        updates: List[Tuple[int, Dict]] = []
+        inserts: List[Dict] = []
+
+        def flush():
+            if db_manager.bulk_write_metadata(updates, inserts):
+                stats['updated'] += len(updates)
+                stats['added'] += len(inserts)
+            else:
+                stats['skipped'] += len(updates) + len(inserts)
+            updates.clear()
+            inserts.clear()
+
+        for record in read_records(bundle):
+            key = db_manager.metadata_key(record.get('type'), record.get('app_id'), record.get('name'))
+            existing = index.get(key)
+            if existing is None:
+                if not add_missing or not record.get('name') or not record.get('type'):
+                    stats['skipped'] += 1
+                    continue
+                index[key] = (None, True)  # later duplicates in the bundle are skipped
+                inserts.append(record)
+            else:
+                game_id, has_metadata = existing
+                if game_id is None or (has_metadata and not overwrite):
+                    stats['skipped'] += 1
+                    continue
+                index[key] = (game_id, True)
+                updates.append((game_id, record))
+
+            for url, digest in (record.get('images') or {}).items():
+                target = image_cache_path(url, cache_dir)
+                if not os.path.exists(target):
+                    wanted_images.setdefault(digest, set()).add(target)
+
+            if len(updates) + len(inserts) >= IMPORT_CHUNK:
+                flush()
+        flush()
+
+        os.makedirs(cache_dir, exist_ok=True)
+        for digest, targets in wanted_images.items():
+            if copy_blob(bundle, digest, sorted(targets)):
+                stats['images'] += len(targets)
+    return stats
+
+def copy_blob(bundle: zipfile.ZipFile, digest: str, targets: List[str]) -> bool:
+    """Extract one image to its cache files, checking it against its content hash."""
+    first = targets[0]
+    temp_path = f"{first}.tmp"
+    try:
+        sha = hashlib.sha256()
+        with bundle.open(f"blobs/{digest}") as source, open(temp_path, 'wb') as target:
+            for chunk in iter(lambda: source.read(1 << 16), b''):
+                sha.update(chunk)
+                target.write(chunk)
+        if sha.hexdigest() != digest:
+            print(f"[DEBUG] Skipping corrupt image {digest} in metadata bundle")
+            os.remove(temp_path)
+            return False
+        os.replace(temp_path, first)
+        for other in targets[1:]:
+            shutil.copyfile(first, other)
+        return True
+    except (KeyError, OSError) as e:
+        print(f"Error extracting image {digest}: {e}")
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        return False
+
+def main():
+    from database import DatabaseManager
+    parser = argparse.ArgumentParser(description="Export or import Clockwork metadata bundles")
+    parser.add_argument('action', choices=('export', 'import'))
+    parser.add_argument('path', help="bundle file")
+    parser.add_argument('--overwrite', action='store_true', help="replace metadata games already have")
+    parser.add_argument('--no-add', action='store_true', help="only update games already in the library")
+    args = parser.parse_args()
+
+    db = DatabaseManager()
+    if args.action == 'export':
+        stats = export_bundle(db, args.path)
+        print(f"Exported {stats['games']} games and {stats['images']} images to {args.path}")
+    else:
+        stats = import_bundle(db, args.path, overwrite=args.overwrite, add_missing=not args.no_add)
+        print(f"Imported {args.path}: {stats['updated']} games updated, {stats['added']} added, "
+              f"{stats['skipped']} skipped, {stats['images']} images restored")
+
+if __name__ == "__main__":
+    try:
+        main()
+    except Exception as e:
+        print(f"Error: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
@@ -1,23 +1,141 @@
 import os
 import json
+import heapq
 import asyncio
-import aiohttp
-from datetime import datetime
-from functools import lru_cache
-from typing import List, Dict, Optional
+import itertools
+from datetime import datetime, timedelta
+from typing import List, Dict, Iterable, Optional, Sequence, Set, Tuple
 from PySide6.QtCore import QObject, Signal
 from models import Game
+from store_search import StoreSearch
+
+class FetchStats:
+    """Request and byte counters for the Steam store API."""
+    
+    def __init__(self):
+        self.reset()
+        
+    def reset(self):
+        self.requests = 0
+        self.bytes = 0  # response body bytes after decompression
+        self.apps = 0  # apps requested over the network
+        self.cache_hits = 0
+        
+    def record(self, body_size: int, app_count: int):
+        self.requests += 1
+        self.bytes += body_size
+        self.apps += app_count
+        
+    def summary(self) -> str:
+        apps = max(self.apps, 1)
+        return (f"{self.requests} requests for {self.apps} apps "
+                f"({self.requests / apps:.2f} requests/game, {self.bytes / apps / 1024:.1f} KB/game, "
+                f"{self.cache_hits} cache hits)")
+
+class MetadataQueue:
+    """Games waiting for metadata, ordered by how soon the user will look at them.
+
+    The game in the open details dialog comes first, then games with a card on
+    screen, then recently played games, then everything else in the order it was
+    queued. Priorities change as the user scrolls; stale heap entries are skipped
+    when popped instead of being removed.
+    """
+    FOCUSED = 0  # shown in the open GameDetailsDialog
+    VISIBLE = 1  # card on screen
+    RECENT = 2  # played in the last RECENT_DAYS
+    BACKGROUND = 3
+    RECENT_DAYS = 14
+    
+    def __init__(self):
+        self.heap: List[Tuple[int, int, int]] = []  # (priority, order, game id)
+        self.games: Dict[int, Game] = {}  # game id -> queued game
+        self.order: Dict[int, int] = {}  # game id -> position it was queued at
+        self.base: Dict[int, int] = {}  # game id -> priority without on-screen boosts
+        self.visible: Set[int] = set()
+        self.focused: Optional[int] = None
+        self.counter = itertools.count()
+        
+    def __len__(self) -> int:
+        return len(self.games)
+        
+    def priority(self, game_id: int) -> int:
+        if game_id == self.focused:
+            return self.FOCUSED
+        if game_id in self.visible:
+            return self.VISIBLE
+        return self.base.get(game_id, self.BACKGROUND)
+        
+    def push(self, game: Game):
+        recent = game.last_launched and datetime.now() - game.last_launched < timedelta(days=self.RECENT_DAYS)
+        self.games[game.id] = game
+        self.order.setdefault(game.id, next(self.counter))
+        self.base[game.id] = self.RECENT if recent else self.BACKGROUND
+        self._reprioritize(game.id)
+        
+    def pop(self) -> Optional[Game]:
+        """The most urgent queued game, or None when empty."""
+        while self.heap:
+            priority, _, game_id = heapq.heappop(self.heap)
+            if game_id in self.games and priority == self.priority(game_id):
+                self.base.pop(game_id, None)
+                return self.games.pop(game_id)
+        return None
+        
+    def pop_batch(self, size: int) -> List[Game]:
+        batch = []
+        while len(batch) < size:
+            game = self.pop()
+            if game is None:
+                break
+            batch.append(game)
+        return batch
+        
+    def set_visible(self, game_ids: Iterable[int]):
+        """Replace the set of games with a card on screen."""
+        visible = set(game_ids)
+        changed = visible ^ self.visible
+        self.visible = visible
+        for game_id in changed:
+            self._reprioritize(game_id)
+            
+    def set_focused(self, game_id: Optional[int]):
+        """Set (or clear) the game shown in the details dialog."""
+        previous, self.focused = self.focused, game_id
+        for changed in (previous, game_id):
+            if changed is not None:
+                self._reprioritize(changed)
+                
+    def clear(self):
+        self.heap.clear()
+        self.games.clear()
+        self.base.clear()
+        
+    def _reprioritize(self, game_id: int):
+        if game_id in self.games:
+            heapq.heappush(self.heap, (self.priority(game_id), self.order[game_id], game_id))
 
 class MetadataFetcher(QObject):
     progress = Signal(int, int)  # current, total
     finished = Signal(list)  # list of games with metadata
     error = Signal(str)  # error message
+    game_updated = Signal(object)  # Game whose metadata was just written
     
     # Steam API rate limits
     MAX_REQUESTS_PER_MINUTE = 30
     REQUEST_DELAY = 2.0  # seconds between requests
     
-    def __init__(self):
+    STORE_API_URL = "https://store.steampowered.com/api/appdetails"
+    # appdetails sections apply_store_metadata reads. Everything else (the detailed
+    # description HTML, screenshots, movies, system requirements) is left out.
+    METADATA_FILTERS = ('name', 'short_description', 'header_image', 'background', 'genres',
+                        'platforms', 'release_date', 'metacritic', 'content_descriptors',
+                        'developers', 'publishers')
+    # The store only answers several appids in one request when every filter is one of these
+    BATCHABLE_FILTERS = frozenset({'price_overview'})
+    MAX_APPIDS_PER_REQUEST = 100
+    STORE_CACHE_SIZE = 1000
+    
+    def __init__(self, store_api_url: Optional[str] = None):
         super().__init__()
         self.api_key = None
         self.steam_id = None
@@ -25,10 +143,16 @@ class MetadataFetcher(QObject):
         self.db_manager = None
         self.force_refresh = False
         self.last_request_time = datetime.now()
+        self.store_api_url = store_api_url or os.environ.get('CLOCKWORK_STORE_API_URL', self.STORE_API_URL)
+        self.store_cache: Dict[Tuple[str, Tuple[str, ...]], Optional[Dict]] = {}  # (appid, filters) -> data
+        self.stats = FetchStats()
+        self.queue = MetadataQueue()
+        self.store_search = StoreSearch(self)
         
     async def ensure_session(self):
         """Ensure we have a valid aiohttp session."""
         if not self.session or self.session.closed:
+            import aiohttp  # deferred so the network stack is not loaded at startup
             self.session = aiohttp.ClientSession()
         return self.session
         
@@ -45,27 +169,77 @@ class MetadataFetcher(QObject):
             await asyncio.sleep(self.REQUEST_DELAY - elapsed)
         self.last_request_time = datetime.now()
         
-    @lru_cache(maxsize=1000)
+    def appdetails_params(self, appids: Sequence[str], filters: Sequence[str]) -> Dict[str, str]:
+        params = {'appids': ','.join(appids)}
+        if filters:
+            params['filters'] = ','.join(filters)
+        return params
+        
+    @staticmethod
+    def parse_appdetails(payload, appids: Iterable[str]) -> Dict[str, Optional[Dict]]:
+        """Map each appid to its data, or None when the store has none for it."""
+        results = {}
+        for appid in appids:
+            entry = payload.get(appid) if isinstance(payload, dict) else None
+            data = entry.get('data') if isinstance(entry, dict) and entry.get('success') else None
+            # Filtered responses use an empty list when none of the sections exist
+            results[appid] = data if isinstance(data, dict) else None
+        return results
+        
+    async def _request_appdetails(self, appids: Sequence[str], filters: Sequence[str]) -> Dict[str, Optional[Dict]]:
+        """One appdetails request. Raises on transport errors and bad responses."""
+        await self._rate_limit()
+        session = await self.ensure_session()
+        async with session.get(self.store_api_url, params=self.appdetails_params(appids, filters)) as response:
+            body = await response.read()
+            self.stats.record(len(body), len(appids))
+            if response.status != 200:
+                raise RuntimeError(f"store API returned status {response.status}")
+        return self.parse_appdetails(json.loads(body), appids)
+        
+    async def fetch_appdetails(self, appids: Sequence[str],
+                               filters: Optional[Sequence[str]] = None) -> Dict[str, Optional[Dict]]:
+        """Store data for several apps, limited to the given sections (METADATA_FILTERS by default).
+        
+        Results are cached per app and filter set. Apps share a request only when the
+        filters allow it. Apps whose request failed are left out of the result (and
+        not cached), unlike apps the store has no data for, which map to None.
+        """
+        filters = tuple(self.METADATA_FILTERS if filters is None else filters)
+        results = {}
+        missing = []
+        for appid in appids:
+            key = (appid, filters)
+            if key in self.store_cache:
+                results[appid] = self.store_cache[key]
+                self.stats.cache_hits += 1
+            else:
+                missing.append(appid)
+                
+        batchable = filters and self.BATCHABLE_FILTERS.issuperset(filters)
+        batch_size = self.MAX_APPIDS_PER_REQUEST if batchable else 1
+        for i in range(0, len(missing), batch_size):
+            chunk = missing[i:i + batch_size]
+            try:
+                fetched = await self._request_appdetails(chunk, filters)
+            except Exception as e:
+                print(f"Error fetching Steam store metadata for app {','.join(chunk)}: {e}")
+                fetched = {}
+            for appid, data in fetched.items():
+                results[appid] = data
+                self.store_cache[(appid, filters)] = data
+                if data and data.get('name'):
+                    self.store_search.remember(appid, data['name'])
+                    
+        # Keep the cache bounded, dropping the oldest entries first
+        while len(self.store_cache) > self.STORE_CACHE_SIZE:
+            del self.store_cache[next(iter(self.store_cache))]
+        return results
+        
     async def _fetch_steam_store_metadata(self, appid: str) -> Optional[Dict]:
         """Fetch metadata for a single game from Steam Store API."""
-        try:
-            await self._rate_limit()
-            session = await self.ensure_session()
-            url = f"https://store.steampowered.com/api/appdetails?appids={appid}"
-            
-            async with session.get(url) as response:
-                if response.status == 200:
-                    try:
-                        data = await response.json()
-                        if data and appid in data and data[appid]['success']:
-                            return data[appid]['data']
-                    except json.JSONDecodeError:
-                        pass
-                        
-            return None
-        except Exception as e:
-            print(f"Error fetching Steam store metadata for app {appid}: {e}")
-            return None
+        results = await self.fetch_appdetails([appid])
+        return results.get(appid)
             
     async def _fetch_metadata_batch(self, games: List[Game]) -> List[Optional[Dict]]:
         """Fetch metadata for a batch of games in parallel."""
@@ -96,8 +270,20 @@ class MetadataFetcher(QObject):
 
         return results
 
+    def set_visible_games(self, games: Iterable[Game]):
+        """Fetch these games (cards on screen) before the rest of the queue."""
+        self.queue.set_visible(game.id for game in games)
+        
+    def set_focused_game(self, game: Optional[Game]):
+        """Fetch the game in the open details dialog next."""
+        self.queue.set_focused(game.id if game is not None else None)
+        
     async def fetch_metadata_for_games(self, games: List[Game]) -> List[Game]:
-        """Fetch metadata for a list of games from the Steam Store API."""
+        """Fetch metadata for a list of games from the Steam Store API.
+        
+        Games are taken from the priority queue one batch at a time, so priority
+        changes made while fetching (scrolling, opening a game) apply to the next batch.
+        """
         if not games:
             return []
         
@@ -127,6 +313,15 @@ class MetadataFetcher(QObject):
                             self.db_manager.update_game(game.id, {'app_id': app_id})
                 except Exception as e:
                     continue
+            if not game.app_id:
+                # Offline, from the install folder or the name, via the local catalog (steam_catalog)
+                try:
+                    app_id = self.store_search.resolve_path(game.install_path) or self.store_search.lookup(game.name)
+                    if app_id:
+                        game.app_id = app_id
+                        self.db_manager.update_game(game.id, {'app_id': app_id})
+                except Exception as e:
+                    print(f"[DEBUG] Local catalog lookup failed for {game.name}: {e}")
 
         # Filter games with valid app IDs
         games_with_app_ids = [game for game in steam_games if game.app_id]
@@ -143,11 +338,15 @@ class MetadataFetcher(QObject):
         batch_size = 10
 
         try:
+            import aiohttp
             async with aiohttp.ClientSession() as session:
                 self.session = session
                 
-                for i in range(0, total_games, batch_size):
-                    batch = games_with_app_ids[i:i + batch_size]
+                for game in games_with_app_ids:
+                    self.queue.push(game)
+                
+                while self.queue:
+                    batch = self.queue.pop_batch(batch_size)
                     results = await self._fetch_metadata_batch(batch)
                     
                     for game, metadata in zip(batch, results):
@@ -155,33 +354,23 @@ class MetadataFetcher(QObject):
                             # Extract metadata fields
                             if self._update_game_metadata(game, metadata):
                                 # Update the database with the extracted metadata
-                                update_data = {
-                                    'genre': game.genre,
-                                    'poster_url': game.poster_url,
-                                    'description': game.description,
-                                    'release_date': game.release_date,
-                                    'rating': game.rating,
-                                    'metacritic': game.metacritic,
-                                    'esrb_rating': game.esrb_rating,
-                                    'platforms': game.platforms,
-                                    'developers': game.developers,
-                                    'publishers': game.publishers,
-                                    'metadata_fetched': True
-                                }
-                                self.db_manager.update_game(game.id, update_data)
+                                self.db_manager.update_game(game.id, self.metadata_update_data(game))
+                                self.game_updated.emit(game)
                     
                     processed_games += len(batch)
                     self.progress.emit(processed_games, total_games)
                     
                     # Add delay between batches
-                    if i + batch_size < total_games:
+                    if self.queue:
                         await asyncio.sleep(self.REQUEST_DELAY)
             
         except Exception as e:
+            self.queue.clear()
             error_msg = f"Error fetching metadata: {str(e)}"
             self.error.emit(error_msg)
             return games
 
+        print(f"[DEBUG] Store API: {self.stats.summary()}")
         self.finished.emit(games)
         return games
 
@@ -213,20 +402,38 @@ class MetadataFetcher(QObject):
                                 for game in data['response']['games']
                             }
                             
-                            # Update playtime for each game
+                            # Update playtime only for games whose value changed
+                            changes = []
                             for app_id, game in steam_games.items():
-                                if app_id in playtime_data:
-                                    # Convert minutes to hours and round to 1 decimal place
-                                    playtime_minutes = playtime_data[app_id]
-                                    game.playtime = playtime_minutes
-                                    
-                                    # Update the database
-                                    self.db_manager.update_game(game.id, {'playtime': playtime_minutes})
+                                if app_id in playtime_data and playtime_data[app_id] != game.playtime:
+                                    game.playtime = playtime_data[app_id]
+                                    changes.append((game.id, game.playtime))
+                            
+                            # Write all changes in one transaction
+                            self.db_manager.update_playtimes(changes)
                     except json.JSONDecodeError:
                         pass
         except Exception as e:
             pass
 
+    @staticmethod
+    def metadata_update_data(game: Game) -> Dict:
+        """The database update for the store metadata apply_store_metadata sets on a game."""
+        return {
+            'genre': game.genre,
+            'poster_url': game.poster_url,
+            'background_url': game.background_url,
+            'description': game.description,
+            'release_date': game.release_date,
+            'rating': game.rating,
+            'metacritic': game.metacritic,
+            'esrb_rating': game.esrb_rating,
+            'platforms': game.platforms,
+            'developers': game.developers,
+            'publishers': game.publishers,
+            'metadata_fetched': True
+        }
+
     def _update_game_metadata(self, game: Game, steam_data: Dict) -> bool:
         """Update a Game object with metadata from Steam store data."""
         if not steam_data:
@@ -234,96 +441,8 @@ class MetadataFetcher(QObject):
 
         try:
             print(f"[DEBUG] Updating metadata for {game.name} (App ID: {game.app_id})")
-            
-            # Only update fields with valid data
-            if 'name' in steam_data and steam_data['name']:
-                game.name = steam_data['name']
-                print(f"[DEBUG] Updated name: {game.name}")
-            
-            # Get header image - primary source
-            if 'header_image' in steam_data and steam_data['header_image']:
-                game.poster_url = steam_data['header_image']
-                print(f"[DEBUG] Set poster_url from header_image: {game.poster_url}")
-            # Fallback to screenshots if available
-            elif 'screenshots' in steam_data and steam_data['screenshots'] and len(steam_data['screenshots']) > 0:
-                game.poster_url = steam_data['screenshots'][0]['path_full']
-                print(f"[DEBUG] Set poster_url from screenshots: {game.poster_url}")
-            # Fallback to background image if available
-            elif 'background' in steam_data and steam_data['background']:
-                game.poster_url = steam_data['background']
-                print(f"[DEBUG] Set poster_url from background: {game.poster_url}")
-            else:
-                print(f"[DEBUG] No poster image found for {game.name}")
-                
-            # Get background image for details page
-            if 'background' in steam_data and steam_data['background']:
-                game.background_url = steam_data['background']
-            
-            # Get description - prefer short_description as it's more concise
-            if 'short_description' in steam_data and steam_data['short_description']:
-                game.description = steam_data['short_description']
-            elif 'detailed_description' in steam_data and steam_data['detailed_description']:
-                # Truncate detailed description to a reasonable length
-                desc = steam_data['detailed_description']
-                if len(desc) > 500:
-                    desc = desc[:500] + "..."
-                game.description = desc
-            else:
-                game.description = 'No description available'
-            
-            # Get genres
-            if 'genres' in steam_data and steam_data['genres']:
-                game.genre = ', '.join(genre['description'] for genre in steam_data['genres'])
-            else:
-                game.genre = 'Uncategorized'
-            
-            # Get platforms
-            if 'platforms' in steam_data and steam_data['platforms']:
-                game.platforms = [
-                    platform for platform, supported in steam_data['platforms'].items()
-                    if supported
-                ]
-            else:
-                game.platforms = []
-            
-            # Get release date
-            if 'release_date' in steam_data and steam_data['release_date']:
-                if 'date' in steam_data['release_date']:
-                    game.release_date = steam_data['release_date']['date']
-                else:
-                    game.release_date = 'Unknown'
-            else:
-                game.release_date = 'Unknown'
-            
-            # Get metacritic score
-            if 'metacritic' in steam_data and isinstance(steam_data['metacritic'], dict) and 'score' in steam_data['metacritic']:
-                game.rating = steam_data['metacritic']['score'] / 20  # Convert to 5-point scale
-                game.metacritic = steam_data['metacritic']['score']
-            else:
-                game.rating = 0
-                game.metacritic = 0
-            
-            # Get ESRB rating
-            if 'content_descriptors' in steam_data and 'notes' in steam_data['content_descriptors']:
-                game.esrb_rating = steam_data['content_descriptors']['notes']
-            else:
-                game.esrb_rating = 'Not Rated'
-            
-            # Get developers and publishers
-            if 'developers' in steam_data:
-                game.developers = steam_data['developers']
-            else:
-                game.developers = []
-                
-            if 'publishers' in steam_data:
-                game.publishers = steam_data['publishers']
-            else:
-                game.publishers = []
-            
-            # Mark as having metadata
-            game.metadata_fetched = True
-            
-            print(f"[DEBUG] Metadata update complete for {game.name}")
+            self.apply_store_metadata(game, steam_data)
+            print(f"[DEBUG] Metadata update complete for {game.name} (poster: {game.poster_url or 'none'})")
             return True
             
         except Exception as e:
@@ -332,6 +451,96 @@ class MetadataFetcher(QObject):
             traceback.print_exc()
             return False
 
+    @staticmethod
+    def apply_store_metadata(game: Game, steam_data: Dict) -> bool:
+        """Set a game's metadata from Steam store data without logging.
+
+        Returns False when there is no store data; malformed data raises.
+        """
+        if not steam_data:
+            return False
+
+        # Only update fields with valid data
+        if 'name' in steam_data and steam_data['name']:
+            game.name = steam_data['name']
+        
+        # Header image first, then the first screenshot, then the background
+        if 'header_image' in steam_data and steam_data['header_image']:
+            game.poster_url = steam_data['header_image']
+        elif 'screenshots' in steam_data and steam_data['screenshots'] and len(steam_data['screenshots']) > 0:
+            game.poster_url = steam_data['screenshots'][0]['path_full']
+        elif 'background' in steam_data and steam_data['background']:
+            game.poster_url = steam_data['background']
+            
+        # Get background image for details page
+        if 'background' in steam_data and steam_data['background']:
+            game.background_url = steam_data['background']
+        
+        # Get description - prefer short_description as it's more concise
+        if 'short_description' in steam_data and steam_data['short_description']:
+            game.description = steam_data['short_description']
+        elif 'detailed_description' in steam_data and steam_data['detailed_description']:
+            # Truncate detailed description to a reasonable length
+            desc = steam_data['detailed_description']
+            if len(desc) > 500:
+                desc = desc[:500] + "..."
+            game.description = desc
+        else:
+            game.description = 'No description available'
+        
+        # Get genres
+        if 'genres' in steam_data and steam_data['genres']:
+            game.genre = ', '.join(genre['description'] for genre in steam_data['genres'])
+        else:
+            game.genre = 'Uncategorized'
+        
+        # Get platforms
+        if 'platforms' in steam_data and steam_data['platforms']:
+            game.platforms = [
+                platform for platform, supported in steam_data['platforms'].items()
+                if supported
+            ]
+        else:
+            game.platforms = []
+        
+        # Get release date
+        if 'release_date' in steam_data and steam_data['release_date']:
+            if 'date' in steam_data['release_date']:
+                game.release_date = steam_data['release_date']['date']
+            else:
+                game.release_date = 'Unknown'
+        else:
+            game.release_date = 'Unknown'
+        
+        # Get metacritic score
+        if 'metacritic' in steam_data and isinstance(steam_data['metacritic'], dict) and 'score' in steam_data['metacritic']:
+            game.rating = steam_data['metacritic']['score'] / 20  # Convert to 5-point scale
+            game.metacritic = steam_data['metacritic']['score']
+        else:
+            game.rating = 0
+            game.metacritic = 0
+        
+        # Get ESRB rating
+        if 'content_descriptors' in steam_data and 'notes' in steam_data['content_descriptors']:
+            game.esrb_rating = steam_data['content_descriptors']['notes']
+        else:
+            game.esrb_rating = 'Not Rated'
+        
+        # Get developers and publishers
+        if 'developers' in steam_data:
+            game.developers = steam_data['developers']
+        else:
+            game.developers = []
+            
+        if 'publishers' in steam_data:
+            game.publishers = steam_data['publishers']
+        else:
+            game.publishers = []
+        
+        # Mark as having metadata
+        game.metadata_fetched = True
+        return True
+
     async def fetch_owned_games(self) -> List[Game]:
         """Fetch owned games from Steam API."""
         if not self.api_key or not self.steam_id:
@@ -407,13 +616,16 @@ class MetadataFetcher(QObject):
             if not game.app_id:
                 return None
                 
-            url = f"https://store.steampowered.com/api/appdetails?appids={game.app_id}"
-            response = requests.get(url)
+            import requests
+            response = requests.get(
+                self.store_api_url,
+                params=self.appdetails_params([game.app_id], self.METADATA_FILTERS),
+                timeout=10
+            )
+            self.stats.record(len(response.content), 1)
             
             if response.status_code == 200:
-                data = response.json()
-                if data and game.app_id in data and data[game.app_id]['success']:
-                    return data[game.app_id]['data']
+                return self.parse_appdetails(response.json(), [game.app_id])[game.app_id]
                     
             return None
         except Exception as e:
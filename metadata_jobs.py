@@ -0,0 +1,120 @@
+import asyncio
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Iterable, Optional
+from models import Game
+
+class MetadataRefreshJob:
+    """Refreshes store metadata for a set of games as a persisted, resumable job.
+
+    Every game is an item in refresh_job_items with a state (pending, in_flight,
+    done or failed), an attempt count and a next retry time. A game's current
+    metadata is only overwritten once replacement data for it has arrived, so
+    stopping halfway never leaves blank games, and the next run picks up the
+    remaining items.
+    """
+    BATCH_SIZE = 10
+    MAX_ATTEMPTS = 5
+    RETRY_DELAY = 60  # seconds before the first retry, doubled after every failed attempt
+    MAX_RETRY_DELAY = 3600
+    MAX_IDLE_WAIT = 30  # longest sleep while only retries are left
+
+    def __init__(self, db_manager, fetcher, job_id: int):
+        self.db_manager = db_manager
+        self.fetcher = fetcher
+        self.job_id = job_id
+        self.cancelled = False
+
+    @classmethod
+    def start(cls, db_manager, fetcher, games: Iterable[Game]) -> Optional['MetadataRefreshJob']:
+        """Create a job for every Steam game with an app id (or resume the unfinished one)."""
+        game_ids = [game.id for game in games if game.id and game.type == 'steam' and game.app_id]
+        job_id = db_manager.create_refresh_job(game_ids)
+        if job_id is None:
+            return None
+        db_manager.requeue_in_flight_items(job_id)
+        return cls(db_manager, fetcher, job_id)
+
+    @classmethod
+    def resume(cls, db_manager, fetcher) -> Optional['MetadataRefreshJob']:
+        """The job a previous run left unfinished, if any."""
+        job_id = db_manager.get_active_refresh_job()
+        if job_id is None:
+            return None
+        requeued = db_manager.requeue_in_flight_items(job_id)
+        print(f"[DEBUG] Resuming metadata refresh job {job_id} ({requeued} interrupted games requeued)")
+        return cls(db_manager, fetcher, job_id)
+
+    def cancel(self):
+        """Stop after the current batch. The job stays active and resumes on the next start."""
+        self.cancelled = True
+
+    def progress(self) -> Dict[str, int]:
+        return self.db_manager.get_refresh_job_progress(self.job_id)
+
+    def retry_at(self, attempts: int) -> Optional[datetime]:
+        """When to retry after the given number of failed attempts, or None to give up."""
+        if attempts >= self.MAX_ATTEMPTS:
+            return None
+        delay = min(self.RETRY_DELAY * (2 ** (attempts - 1)), self.MAX_RETRY_DELAY)
+        return datetime.now() + timedelta(seconds=delay)
+
+    async def run(self, on_progress: Optional[Callable[[Dict[str, int]], None]] = None,
+                  on_game_updated: Optional[Callable[[int, Dict], None]] = None) -> Dict[str, int]:
+        """Work through the job until every item is done or failed, or it is cancelled.
+
+        on_progress gets the state counts after each batch, on_game_updated the game
+        id and the metadata written for it.
+        """
+        # A refresh wants the store's current data, not what an earlier fetch cached
+        self.fetcher.store_cache.clear()
+        while not self.cancelled:
+            items = self.db_manager.claim_refresh_items(self.job_id, datetime.now(), self.BATCH_SIZE)
+            if not items:
+                next_attempt = self.db_manager.get_next_refresh_attempt(self.job_id)
+                if next_attempt is None:
+                    self.db_manager.finish_refresh_job(self.job_id)
+                    print(f"[DEBUG] Metadata refresh job {self.job_id} finished: {self.progress()}")
+                    break
+                wait = (next_attempt - datetime.now()).total_seconds()
+                await asyncio.sleep(min(max(wait, 1), self.MAX_IDLE_WAIT))
+                continue
+
+            await self.process(items, on_game_updated)
+            if on_progress:
+                on_progress(self.progress())
+        return self.progress()
+
+    async def process(self, items: Dict[int, int],
+                      on_game_updated: Optional[Callable[[int, Dict], None]] = None):
+        """Fetch one claimed batch (game id -> earlier attempts) and record each game's outcome."""
+        app_ids = self.db_manager.get_app_ids(list(items))
+        try:
+            results = await self.fetcher.fetch_appdetails(list(set(app_ids.values())))
+        except Exception as e:
+            print(f"Error refreshing metadata: {e}")
+            results = {}
+
+        for game_id, attempts in items.items():
+            app_id = app_ids.get(game_id)
+            if app_id is None:
+                self.db_manager.fail_refresh_item(self.job_id, game_id, "no Steam app id", None)
+                continue
+            if app_id not in results:
+                # The request failed; the old metadata stays until a retry succeeds
+                self.db_manager.fail_refresh_item(self.job_id, game_id, "store request failed",
+                                                  self.retry_at(attempts + 1))
+                continue
+
+            # Parse into a scratch game so nothing is replaced unless parsing succeeds
+            game = Game(id=game_id, name="", type='steam', app_id=app_id, check_install=False)
+            try:
+                parsed = self.fetcher.apply_store_metadata(game, results[app_id])
+            except Exception as e:
+                self.db_manager.fail_refresh_item(self.job_id, game_id, f"unreadable store data: {e}", None)
+                continue
+            if not parsed:
+                self.db_manager.fail_refresh_item(self.job_id, game_id, "no store data", None)
+                continue
+            update_data = self.fetcher.metadata_update_data(game)
+            if self.db_manager.complete_refresh_item(self.job_id, game_id, update_data) and on_game_updated:
+                on_game_updated(game_id, update_data)
@@ -1,56 +1,213 @@
-from typing import Dict, List, Optional
-from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple
 from datetime import datetime
 import os
+import sys
 import json
 import re
 import winreg
+from release_dates import normalize_release_date
+
+# Marks a description that is still in the database and will be read on first access
+NOT_LOADED = object()
+
+def _intern(value):
+    """Share one copy of frequently repeated strings such as store types and genres."""
+    return sys.intern(value) if type(value) is str else value
+
+# One shared tuple per distinct platform/developer/publisher combination
+_tuple_cache: Dict[Tuple[str, ...], Tuple[str, ...]] = {}
+
+def _to_tuple(value) -> Tuple[str, ...]:
+    """Store list fields as shared tuples of interned strings (smaller than lists and safe to share)."""
+    if not value:
+        return ()
+    if isinstance(value, str):
+        value = [v.strip() for v in value.split(',') if v.strip()]
+    value = tuple(_intern(str(v)) for v in value)
+    return _tuple_cache.setdefault(value, value)
 
-@dataclass
 class Game:
-    """Represents a game in the library."""
-    id: Optional[int] = None
-    name: str = ""
-    type: str = ""  # steam, epic, etc.
-    app_id: Optional[str] = None
-    install_path: Optional[str] = None
-    launch_command: Optional[str] = None
-    genre: Optional[str] = None
-    is_installed: bool = False
-    playtime: int = 0
-    metadata_fetched: bool = False
-    poster_url: Optional[str] = None
-    poster_path: Optional[str] = None
-    background_url: Optional[str] = None
-    release_date: Optional[str] = None
-    description: Optional[str] = None
-    rating: float = 0.0
-    platforms: List[str] = None
-    developers: List[str] = None
-    publishers: List[str] = None
-    metacritic: int = 0
-    esrb_rating: str = "Not Rated"
-    epic_app_id: Optional[str] = None  # For Epic Games Store
-    epic_launch_command: Optional[str] = None  # For Epic Games Store
-    last_launched: Optional[datetime] = None  # For tracking when the game was last launched
-
-    def __post_init__(self):
-        """Initialize lists if they are None and extract app_id if possible."""
-        if self.platforms is None:
-            self.platforms = []
-        if self.developers is None:
-            self.developers = []
-        if self.publishers is None:
-            self.publishers = []
-        
+    """Represents a game in the library.
+
+    Slotted to keep large libraries small in memory. Repeated strings are
+    interned, list fields are tuples and the description can be loaded on demand.
+    """
+    FIELDS = (
+        'id', 'name', 'type', 'app_id', 'install_path', 'launch_command', 'genre',
+        'is_installed', 'playtime', 'metadata_fetched', 'poster_url', 'poster_path',
+        'background_url', 'release_date', 'description', 'rating', 'platforms',
+        'developers', 'publishers', 'metacritic', 'esrb_rating', 'epic_app_id',
+        'epic_launch_command', 'last_launched', 'created_at'
+    )
+
+    __slots__ = (
+        'id', 'name', '_type', 'app_id', 'install_path', 'launch_command', '_genre',
+        'is_installed', 'playtime', 'metadata_fetched', 'poster_url', 'poster_path',
+        'background_url', '_release_date', '_description', 'rating', '_platforms',
+        '_developers', '_publishers', 'metacritic', '_esrb_rating', 'epic_app_id',
+        'epic_launch_command', 'last_launched', 'created_at',
+        '_release_epoch',  # normalized release timestamp, NOT_LOADED until known
+        'process'  # running game process while a session is tracked
+    )
+
+    # Reads a description by game id; registered by the primary DatabaseManager
+    description_loader: Optional[Callable[[int], Optional[str]]] = None
+
+    def __init__(self, id: Optional[int] = None, name: str = "", type: str = "",
+                 app_id: Optional[str] = None, install_path: Optional[str] = None,
+                 launch_command: Optional[str] = None, genre: Optional[str] = None,
+                 is_installed: bool = False, playtime: int = 0, metadata_fetched: bool = False,
+                 poster_url: Optional[str] = None, poster_path: Optional[str] = None,
+                 background_url: Optional[str] = None, release_date: Optional[str] = None,
+                 description: Optional[str] = None, rating: float = 0.0,
+                 platforms: Optional[List[str]] = None, developers: Optional[List[str]] = None,
+                 publishers: Optional[List[str]] = None, metacritic: int = 0,
+                 esrb_rating: str = "Not Rated",
+                 epic_app_id: Optional[str] = None,  # For Epic Games Store
+                 epic_launch_command: Optional[str] = None,  # For Epic Games Store
+                 last_launched: Optional[datetime] = None,  # For tracking when the game was last launched
+                 created_at: Optional[datetime] = None,  # When the game was added to the library
+                 release_epoch=NOT_LOADED,  # Stored normalized release timestamp (None when unknown)
+                 check_install: bool = True):  # False keeps the given is_installed (e.g. from the startup snapshot)
+        self.id = id
+        self.name = name
+        self.type = type
+        self.app_id = app_id
+        self.install_path = install_path
+        self.launch_command = launch_command
+        self.genre = genre
+        self.is_installed = is_installed
+        self.playtime = playtime
+        self.metadata_fetched = metadata_fetched
+        self.poster_url = poster_url
+        self.poster_path = poster_path
+        self.background_url = background_url
+        self.release_date = release_date
+        self._release_epoch = release_epoch
+        self._description = description
+        self.rating = rating
+        self.platforms = platforms
+        self.developers = developers
+        self.publishers = publishers
+        self.metacritic = metacritic
+        self.esrb_rating = esrb_rating
+        self.epic_app_id = epic_app_id
+        self.epic_launch_command = epic_launch_command
+        self.last_launched = last_launched
+        self.created_at = created_at
+        self.process = None
+
         # Try to extract app_id from launch command if not set
         self.extract_app_id_from_launch_command()
             
         # Check if game is installed
-        self.check_installation_status()
+        if check_install:
+            self.check_installation_status()
+
+    # Interned string fields
+    @property
+    def type(self) -> str:
+        return self._type
+
+    @type.setter
+    def type(self, value):
+        self._type = _intern(value)
+
+    @property
+    def genre(self) -> Optional[str]:
+        return self._genre
+
+    @genre.setter
+    def genre(self, value):
+        self._genre = _intern(value)
+
+    @property
+    def release_date(self) -> Optional[str]:
+        return self._release_date
+
+    @release_date.setter
+    def release_date(self, value):
+        self._release_date = _intern(value)
+        self._release_epoch = NOT_LOADED
+
+    @property
+    def release_epoch(self) -> Optional[int]:
+        """Release date as a UTC timestamp, None when unknown.
+
+        Games loaded from the database carry the stored release_date_epoch;
+        others parse the date once per distinct string.
+        """
+        if self._release_epoch is NOT_LOADED:
+            self._release_epoch = normalize_release_date(self._release_date).epoch
+        return self._release_epoch
+
+    @property
+    def esrb_rating(self) -> str:
+        return self._esrb_rating
+
+    @esrb_rating.setter
+    def esrb_rating(self, value):
+        self._esrb_rating = _intern(value)
+
+    # List fields, stored as tuples
+    @property
+    def platforms(self) -> Tuple[str, ...]:
+        return self._platforms
+
+    @platforms.setter
+    def platforms(self, value):
+        self._platforms = _to_tuple(value)
+
+    @property
+    def developers(self) -> Tuple[str, ...]:
+        return self._developers
+
+    @developers.setter
+    def developers(self, value):
+        self._developers = _to_tuple(value)
+
+    @property
+    def publishers(self) -> Tuple[str, ...]:
+        return self._publishers
+
+    @publishers.setter
+    def publishers(self, value):
+        self._publishers = _to_tuple(value)
+
+    @property
+    def description(self) -> Optional[str]:
+        """The description, read from the database on first access when loaded lazily."""
+        if self._description is NOT_LOADED:
+            loader = Game.description_loader
+            if not loader or self.id is None:
+                self._description = None
+            else:
+                try:
+                    self._description = loader(self.id)
+                except Exception as e:
+                    print(f"Error loading description of {self.name}: {e}")
+                    return None  # not cached, so the next access tries again
+        return self._description
+
+    @description.setter
+    def description(self, value):
+        self._description = value
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        if self.id is not None and other.id is not None:
+            return self.id == other.id  # the same library entry; never loads a lazy description
+        return all(getattr(self, name) == getattr(other, name) for name in self.FIELDS)
+
+    __hash__ = None  # mutable
 
     def check_installation_status(self):
         """Check if the game is installed."""
+        self.is_installed = self.installation_status()
+
+    def installation_status(self) -> bool:
+        """Whether the game is installed, read without changing the game (safe off the GUI thread)."""
         try:
             if self.type == 'steam':
                 # Get Steam installation path from registry
@@ -62,14 +219,12 @@ class Game:
                         key = winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, r"Software\Valve\Steam")
                         steam_path = winreg.QueryValueEx(key, "SteamPath")[0]
                     except:
-                        self.is_installed = False
-                        return
+                        return False
                 
                 # Read libraryfolders.vdf to get all library paths
                 vdf_path = os.path.join(steam_path, "steamapps", "libraryfolders.vdf")
                 if not os.path.exists(vdf_path):
-                    self.is_installed = False
-                    return
+                    return False
                 
                 with open(vdf_path, 'r', encoding='utf-8') as f:
                     vdf_content = f.read()
@@ -89,10 +244,9 @@ class Game:
                         # Check StateFlags (4 = fully installed)
                         state_flags = re.search(r'"StateFlags"\s+"(\d+)"', manifest_data)
                         if state_flags and state_flags.group(1) == "4":
-                            self.is_installed = True
-                            return
+                            return True
                 
-                self.is_installed = False
+                return False
                 
             elif self.type == 'epic':
                 try:
@@ -103,8 +257,7 @@ class Game:
                         key = winreg.OpenKey(winreg.HKEY_CURRENT_USER, r"Software\Epic Games\EpicGamesLauncher")
                         epic_path = winreg.QueryValueEx(key, "AppDataPath")[0]
                     except:
-                        self.is_installed = False
-                        return
+                        return False
                 
                 # Check for game manifest
                 manifest_path = os.path.join(epic_path, "Data", "Manifests", f"{self.app_id}.item")
@@ -115,13 +268,13 @@ class Game:
                     # Check if installation location exists
                     install_location = manifest_data.get('InstallLocation', '')
                     if install_location and os.path.exists(install_location):
-                        self.is_installed = True
-                        return
+                        return True
                 
-                self.is_installed = False
+                return False
                 
         except Exception as e:
-            self.is_installed = False
+            return False
+        return self.is_installed  # other stores have no manifest to read
 
     def extract_app_id_from_launch_command(self) -> Optional[str]:
         """Extract app_id from launch command if possible."""
@@ -157,7 +310,7 @@ class Game:
                     value = metadata[field]
                     if isinstance(value, str):
                         value = [v.strip() for v in value.split(',') if v.strip()]
-                    elif isinstance(value, list):
+                    elif isinstance(value, (list, tuple)):
                         value = [str(v).strip() for v in value if str(v).strip()]
                     setattr(self, field, value)
 
@@ -186,9 +339,9 @@ class Game:
             'release_date': self.release_date,
             'description': self.description,
             'rating': self.rating,
-            'platforms': self.platforms,
-            'developers': self.developers,
-            'publishers': self.publishers,
+            'platforms': list(self.platforms),
+            'developers': list(self.developers),
+            'publishers': list(self.publishers),
             'metacritic': self.metacritic,
             'esrb_rating': self.esrb_rating
         }
@@ -220,13 +373,24 @@ class Game:
             esrb_rating=data.get('esrb_rating', 'Not Rated'),
             epic_app_id=data.get('epic_app_id'),
             epic_launch_command=data.get('epic_launch_command'),
-            last_launched=data.get('last_launched')
+            last_launched=data.get('last_launched'),
+            created_at=data.get('created_at')
         )
 
+    def copy_from(self, other: 'Game') -> None:
+        """Copy every field from another game, keeping this object's identity."""
+        for name in self.FIELDS:
+            if name == 'description':
+                # Keep a lazy description lazy
+                self._description = other._description
+            else:
+                setattr(self, name, getattr(other, name))
+        self._release_epoch = other._release_epoch
+
     def update_from_dict(self, data: dict) -> None:
         """Update the game's attributes from a dictionary."""
         for key, value in data.items():
-            if hasattr(self, key):
+            if key in self.FIELDS:
                 if key in ['platforms', 'developers', 'publishers'] and isinstance(value, str):
                     value = [v.strip() for v in value.split(',') if v.strip()]
                 setattr(self, key, value)
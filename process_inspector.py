@@ -0,0 +1,295 @@
+"""
+Process Inspector
+Samples every running process in the background with real CPU deltas and
+process-tree totals, and exposes the samples as a live, sortable table model.
+"""
+
+import os
+import time
+import threading
+from typing import Dict, List, Optional
+import psutil
+from PySide6.QtCore import QObject, Signal, Qt, QAbstractTableModel, QModelIndex
+from PySide6.QtGui import QColor
+
+# Processes that must never be ended from the launcher (lowercase names)
+PROTECTED_PROCESSES = {
+    "explorer.exe", "csrss.exe", "winlogon.exe", "system", "taskmgr.exe", "system idle process",
+    "idle", "smss.exe", "wininit.exe", "services.exe", "lsass.exe", "svchost.exe", "dwm.exe",
+    "registry", "memory compression", "fontdrvhost.exe", "systemd", "init", "kthreadd",
+}
+
+class ProcessEntry:
+    """One process kept across samples, so its CPU time can be compared with the last one."""
+    __slots__ = ('process', 'pid', 'name', 'ppid', 'cpu_time', 'cpu', 'memory', 'denied',
+                 'tree_cpu', 'tree_memory', 'children')
+
+    def __init__(self, process: psutil.Process):
+        self.process = process
+        self.pid = process.pid
+        self.name = ''
+        self.ppid = 0
+        self.cpu_time: Optional[float] = None
+        self.cpu = 0.0  # percent of the whole machine since the last sample
+        self.memory = 0  # resident bytes
+        self.denied = False
+        self.tree_cpu = 0.0
+        self.tree_memory = 0
+        self.children = 0
+
+    def row(self) -> Dict:
+        return {'pid': self.pid, 'name': self.name, 'ppid': self.ppid, 'cpu': self.cpu,
+                'memory': self.memory, 'tree_cpu': self.tree_cpu, 'tree_memory': self.tree_memory,
+                'children': self.children, 'denied': self.denied}
+
+class ProcessSampler(QObject):
+    """Samples processes on a background thread and emits the rows.
+
+    psutil.Process handles live across samples (psutil.pids() only finds new
+    and ended processes), so a process's CPU share is the change of its CPU
+    time over the wall time between two samples, divided by the core count
+    like Task Manager shows it; the first sample of a process reads 0.
+    Processes that deny access are read once for their name and then skipped.
+    The interval stretches so sampling never takes more than MAX_DUTY of the
+    time, however many processes are running.
+    """
+    sampled = Signal(object)  # list of row dicts, emitted from the sampling thread
+
+    INTERVAL = 1.0
+    MAX_DUTY = 0.05  # largest share of the time spent sampling
+
+    def __init__(self, interval: float = INTERVAL, parent=None):
+        super().__init__(parent)
+        self.interval = interval
+        self.entries: Dict[int, ProcessEntry] = {}
+        self.cpu_count = psutil.cpu_count() or 1
+        self.last_sample: Optional[float] = None
+        self.sample_time = 0.0  # seconds the last sample took
+        self.stop_event = threading.Event()
+        self.thread: Optional[threading.Thread] = None
+        self.lock = threading.Lock()
+
+    def start(self):
+        if self.thread and self.thread.is_alive():
+            return
+        self.stop_event.clear()
+        self.thread = threading.Thread(target=self.run, name="process-sampler", daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        self.stop_event.set()
+
+    def run(self):
+        while not self.stop_event.is_set():
+            rows = self.sample()
+            if self.stop_event.is_set():
+                break
+            self.sampled.emit(rows)
+            self.stop_event.wait(self.next_interval())
+
+    def next_interval(self) -> float:
+        return max(self.interval, self.sample_time / self.MAX_DUTY - self.sample_time)
+
+    def sample(self) -> List[Dict]:
+        """Read every process once and return the rows, with tree totals."""
+        with self.lock:
+            started = time.perf_counter()
+            now = time.monotonic()
+            elapsed = (now - self.last_sample) if self.last_sample else None
+            self.last_sample = now
+
+            pids = set(psutil.pids())
+            for pid in list(self.entries):
+                if pid not in pids:
+                    del self.entries[pid]
+            for pid in pids:
+                entry = self.entries.get(pid)
+                if entry is None:
+                    entry = self.add(pid)
+                    if entry is None:
+                        continue
+                elif entry.denied:
+                    continue
+                self.read(entry, elapsed)
+
+            self.tree_totals()
+            rows = [entry.row() for entry in self.entries.values()]
+            self.sample_time = time.perf_counter() - started
+            return rows
+
+    def add(self, pid: int) -> Optional[ProcessEntry]:
+        try:
+            entry = ProcessEntry(psutil.Process(pid))
+            entry.name = entry.process.name()
+            entry.ppid = entry.process.ppid()
+        except psutil.NoSuchProcess:
+            return None
+        except psutil.AccessDenied:
+            entry.denied = True
+        self.entries[pid] = entry
+        return entry
+
+    def read(self, entry: ProcessEntry, elapsed: Optional[float]):
+        try:
+            with entry.process.oneshot():
+                times = entry.process.cpu_times()
+                entry.memory = entry.process.memory_info().rss
+        except psutil.NoSuchProcess:
+            self.entries.pop(entry.pid, None)
+            return
+        except psutil.AccessDenied:
+            entry.denied = True
+            entry.cpu = 0.0
+            return
+        cpu_time = times.user + times.system
+        if entry.cpu_time is not None and elapsed:
+            entry.cpu = max(0.0, (cpu_time - entry.cpu_time) / elapsed / self.cpu_count * 100)
+        entry.cpu_time = cpu_time
+
+    def tree_totals(self):
+        """Add every process's CPU and memory to its own and all its ancestors' tree totals."""
+        for entry in self.entries.values():
+            entry.tree_cpu = 0.0
+            entry.tree_memory = 0
+            entry.children = 0
+        for entry in self.entries.values():
+            node = entry
+            seen = 0
+            while node is not None and seen <= len(self.entries):  # parent links can loop on pid reuse
+                node.tree_cpu += entry.cpu
+                node.tree_memory += entry.memory
+                if node is not entry:
+                    node.children += 1
+                parent = self.entries.get(node.ppid)
+                node = parent if parent is not node else None
+                seen += 1
+
+    def descendants(self, pid: int) -> List[int]:
+        """The pids of a process's children, grandchildren and so on, deepest first."""
+        with self.lock:
+            children: Dict[int, List[int]] = {}
+            for entry in self.entries.values():
+                if entry.ppid != entry.pid:
+                    children.setdefault(entry.ppid, []).append(entry.pid)
+        result = []
+        seen = {pid}
+        stack = list(children.get(pid, []))
+        while stack:
+            child = stack.pop()
+            if child in seen:
+                continue
+            seen.add(child)
+            result.append(child)
+            stack.extend(children.get(child, []))
+        return result[::-1]
+
+def format_bytes(size: int) -> str:
+    return f"{size / (1024 * 1024):,.0f} MB"
+
+class ProcessTableModel(QAbstractTableModel):
+    """Live rows from a ProcessSampler, updated in place and keyed by pid.
+
+    Existing rows are changed without resetting the model, so selection and
+    scroll position survive every sample. Sort through a QSortFilterProxyModel
+    with SORT_ROLE, which holds the raw numbers.
+    """
+    COLUMNS = [
+        # header, row key
+        ("Name", 'name'),
+        ("PID", 'pid'),
+        ("CPU", 'cpu'),
+        ("Memory", 'memory'),
+        ("Tree CPU", 'tree_cpu'),
+        ("Tree Memory", 'tree_memory'),
+    ]
+    SORT_ROLE = Qt.UserRole
+    HIGHLIGHT = QColor("#5c1f24")
+
+    def __init__(self, cpu_threshold: float = 50, memory_threshold: float = 70, parent=None):
+        super().__init__(parent)
+        self.rows: List[Dict] = []
+        self.index_of: Dict[int, int] = {}  # pid -> row
+        self.cpu_threshold = cpu_threshold
+        self.memory_threshold = memory_threshold * psutil.virtual_memory().total / 100  # bytes
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.COLUMNS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.COLUMNS[section][0]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row = self.rows[index.row()]
+        key = self.COLUMNS[index.column()][1]
+        value = row[key]
+        if role == Qt.DisplayRole:
+            if key in ('cpu', 'tree_cpu'):
+                return "-" if row['denied'] else f"{value:.1f}%"
+            if key in ('memory', 'tree_memory'):
+                return "-" if row['denied'] else format_bytes(value)
+            if key == 'name' and row['children']:
+                return f"{value} (+{row['children']})"
+            return str(value)
+        if role == self.SORT_ROLE:
+            return value.casefold() if key == 'name' else value
+        if role == Qt.TextAlignmentRole and key != 'name':
+            return int(Qt.AlignRight | Qt.AlignVCenter)
+        if role == Qt.BackgroundRole and self.is_heavy(row):
+            return self.HIGHLIGHT
+        if role == Qt.ToolTipRole and row['denied']:
+            return "Access denied: usage of this process cannot be read"
+        return None
+
+    def is_heavy(self, row: Dict) -> bool:
+        return row['cpu'] > self.cpu_threshold or row['memory'] > self.memory_threshold
+
+    def row_for(self, source_row: int) -> Dict:
+        return self.rows[source_row]
+
+    def update_rows(self, rows: List[Dict]):
+        """Apply a sample: ended processes are removed, new ones appended, the rest updated."""
+        fresh = {row['pid']: row for row in rows}
+        ended = [i for i, row in enumerate(self.rows) if row['pid'] not in fresh]
+        for i in reversed(ended):  # contiguous runs would be fewer signals; ends are rare
+            self.beginRemoveRows(QModelIndex(), i, i)
+            del self.rows[i]
+            self.endRemoveRows()
+        if ended:
+            self.index_of = {row['pid']: i for i, row in enumerate(self.rows)}
+
+        for i, row in enumerate(self.rows):
+            self.rows[i] = fresh[row['pid']]
+        if self.rows:
+            self.dataChanged.emit(self.index(0, 0), self.index(len(self.rows) - 1, len(self.COLUMNS) - 1))
+
+        started = [row for pid, row in fresh.items() if pid not in self.index_of]
+        if started:
+            first = len(self.rows)
+            self.beginInsertRows(QModelIndex(), first, first + len(started) - 1)
+            for row in started:
+                self.index_of[row['pid']] = len(self.rows)
+                self.rows.append(row)
+            self.endInsertRows()
+
+def terminate_processes(pids: List[int]) -> Dict[str, int]:
+    """Ask processes to end, skipping protected and launcher processes."""
+    own = os.getpid()
+    result = {'terminated': 0, 'failed': 0, 'protected': 0}
+    for pid in pids:
+        try:
+            process = psutil.Process(pid)
+            if pid in (0, own) or process.name().lower() in PROTECTED_PROCESSES:
+                result['protected'] += 1
+                continue
+            process.terminate()
+            result['terminated'] += 1
+        except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+            result['failed'] += 1
+    return result
@@ -0,0 +1,190 @@
+from typing import List
+from PySide6.QtWidgets import (
+    QDialog, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QPushButton, QTableView,
+    QHeaderView, QAbstractItemView, QMessageBox
+)
+from PySide6.QtCore import Qt, QSortFilterProxyModel
+from process_inspector import ProcessSampler, ProcessTableModel, terminate_processes
+
+class ProcessManagerDialog(QDialog):
+    """Live process table: sort by any column, filter by name, end processes or whole trees.
+
+    Sampling runs on the ProcessSampler's thread only while the dialog is open.
+    """
+
+    def __init__(self, parent=None, cpu_threshold: float = 50, memory_threshold: float = 70):
+        super().__init__(parent)
+        self.setWindowTitle("Manage Processes")
+        self.setMinimumSize(760, 520)
+        self.setStyleSheet("""
+            QDialog {
+                background-color: #121416;
+                color: white;
+            }
+            QLabel {
+                color: #f2f3f5;
+                font-size: 13px;
+            }
+            QLineEdit {
+                background-color: #1a1c1e;
+                color: white;
+                border: 1px solid #2a2c2e;
+                border-radius: 6px;
+                padding: 6px 10px;
+            }
+            QTableView {
+                background-color: #1a1c1e;
+                alternate-background-color: #16181a;
+                color: #f2f3f5;
+                gridline-color: #2a2c2e;
+                border: none;
+                selection-background-color: #044a7a;
+            }
+            QHeaderView::section {
+                background-color: #033860;
+                color: white;
+                padding: 6px;
+                border: none;
+                font-weight: bold;
+            }
+            QPushButton {
+                background-color: #033860;
+                color: white;
+                border: none;
+                padding: 10px 20px;
+                border-radius: 6px;
+                font-weight: bold;
+            }
+            QPushButton:hover {
+                background-color: #044a7a;
+            }
+            QPushButton:disabled {
+                background-color: #2a2c2e;
+                color: #7C8483;
+            }
+            QPushButton#endButton, QPushButton#endTreeButton {
+                background-color: #dc2626;
+            }
+            QPushButton#endButton:hover, QPushButton#endTreeButton:hover {
+                background-color: #ef4444;
+            }
+        """)
+
+        self.sampler = ProcessSampler(parent=self)
+        self.model = ProcessTableModel(cpu_threshold, memory_threshold, self)
+        self.proxy = QSortFilterProxyModel(self)
+        self.proxy.setSourceModel(self.model)
+        self.proxy.setSortRole(ProcessTableModel.SORT_ROLE)
+        self.proxy.setFilterKeyColumn(0)
+        self.proxy.setFilterCaseSensitivity(Qt.CaseInsensitive)
+        self.proxy.setDynamicSortFilter(True)
+        self.sampler.sampled.connect(self.on_sampled)
+
+        self.setup_ui()
+
+    def setup_ui(self):
+        layout = QVBoxLayout(self)
+
+        self.filter_input = QLineEdit()
+        self.filter_input.setPlaceholderText("Filter by name...")
+        self.filter_input.textChanged.connect(self.proxy.setFilterFixedString)
+        layout.addWidget(self.filter_input)
+
+        self.table = QTableView()
+        self.table.setModel(self.proxy)
+        self.table.setSortingEnabled(True)
+        self.table.sortByColumn(2, Qt.DescendingOrder)  # CPU
+        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.table.setSelectionMode(QAbstractItemView.ExtendedSelection)
+        self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.table.setAlternatingRowColors(True)
+        self.table.verticalHeader().hide()
+        self.table.verticalHeader().setDefaultSectionSize(26)
+        header = self.table.horizontalHeader()
+        header.setSectionResizeMode(0, QHeaderView.Stretch)
+        for column in range(1, self.model.columnCount()):
+            header.setSectionResizeMode(column, QHeaderView.ResizeToContents)
+        self.table.selectionModel().selectionChanged.connect(self.update_buttons)
+        layout.addWidget(self.table)
+
+        footer = QHBoxLayout()
+        self.status_label = QLabel("Reading processes...")
+        footer.addWidget(self.status_label)
+        footer.addStretch()
+        self.end_button = QPushButton("End Process")
+        self.end_button.setObjectName("endButton")
+        self.end_button.clicked.connect(lambda: self.end_selected(tree=False))
+        footer.addWidget(self.end_button)
+        self.end_tree_button = QPushButton("End Process Tree")
+        self.end_tree_button.setObjectName("endTreeButton")
+        self.end_tree_button.clicked.connect(lambda: self.end_selected(tree=True))
+        footer.addWidget(self.end_tree_button)
+        close_button = QPushButton("Close")
+        close_button.clicked.connect(self.accept)
+        footer.addWidget(close_button)
+        layout.addLayout(footer)
+        self.update_buttons()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.sampler.start()
+
+    def done(self, result):
+        self.sampler.stop()
+        super().done(result)
+
+    def on_sampled(self, rows):
+        """Apply a sample (queued from the sampler thread)."""
+        if not self.isVisible():
+            return
+        self.model.update_rows(rows)
+        heavy = sum(1 for row in rows if self.model.is_heavy(row))
+        status = f"{len(rows)} processes"
+        if heavy:
+            status += f", {heavy} using high CPU or memory (highlighted)"
+        status += f" · sampled in {self.sampler.sample_time * 1000:.0f} ms"
+        self.status_label.setText(status)
+
+    def selected_pids(self) -> List[int]:
+        rows = self.table.selectionModel().selectedRows()
+        return [self.model.row_for(self.proxy.mapToSource(index).row())['pid'] for index in rows]
+
+    def update_buttons(self, *args):
+        selected = bool(self.table.selectionModel().selectedRows())
+        self.end_button.setEnabled(selected)
+        self.end_tree_button.setEnabled(selected)
+
+    def end_selected(self, tree: bool):
+        pids = self.selected_pids()
+        if not pids:
+            return
+        if tree:
+            targets = []
+            for pid in pids:
+                targets.extend(child for child in self.sampler.descendants(pid) if child not in targets)
+            targets.extend(pid for pid in pids if pid not in targets)
+        else:
+            targets = pids
+        names = [self.model.row_for(self.model.index_of[pid])['name'] for pid in pids if pid in self.model.index_of]
+        reply = QMessageBox.question(
+            self,
+            "End Processes",
+            f"End {', '.join(names[:5])}{' and more' if len(names) > 5 else ''}"
+            f"{f' with {len(targets) - len(pids)} child processes' if len(targets) > len(pids) else ''}?\n"
+            "Unsaved work in them will be lost.",
+            QMessageBox.Yes | QMessageBox.No,
+            QMessageBox.No
+        )
+        if reply != QMessageBox.Yes:
+            return
+
+        result = terminate_processes(targets)
+        summary = []
+        if result['terminated']:
+            summary.append(f"Ended {result['terminated']} process(es)")
+        if result['failed']:
+            summary.append(f"Failed to end {result['failed']} process(es)")
+        if result['protected']:
+            summary.append(f"Skipped {result['protected']} system process(es)")
+        if summary:
+            QMessageBox.information(self, "Process Management Complete", "\n".join(summary))
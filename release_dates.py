@@ -0,0 +1,114 @@
+import re
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import NamedTuple, Optional
+
+# Precision of a normalized release date
+DAY = 'day'
+MONTH = 'month'
+QUARTER = 'quarter'
+YEAR = 'year'
+UNKNOWN = 'unknown'  # "Coming soon", "To be announced", ...
+
+class ReleaseDate(NamedTuple):
+    iso: Optional[str]  # YYYY-MM-DD, the first day of the period for coarser precisions
+    epoch: Optional[int]  # seconds since 1970 (UTC midnight of `iso`)
+    precision: str
+
+UNKNOWN_DATE = ReleaseDate(None, None, UNKNOWN)
+
+# Month names and abbreviations (English, German, French, Spanish, Italian, Portuguese,
+# Russian) as store pages show them. Words are matched whole, then on their first four
+# and three letters.
+_MONTHS = {
+    1: ('jan', 'janv', 'januar', 'janeiro', 'enero', 'gennaio', 'ene', 'gen', 'янв'),
+    2: ('feb', 'fev', 'fév', 'févr', 'februar', 'fevereiro', 'febrero', 'febbraio', 'фев'),
+    3: ('mar', 'mär', 'märz', 'mars', 'março', 'marzo', 'мар'),
+    4: ('apr', 'avr', 'avril', 'abr', 'abril', 'aprile', 'апр'),
+    5: ('may', 'mai', 'maio', 'mayo', 'mag', 'maggio', 'мая', 'май'),
+    6: ('jun', 'juin', 'juni', 'junho', 'junio', 'giu', 'giugno', 'июн'),
+    7: ('jul', 'juil', 'juli', 'julho', 'julio', 'lug', 'luglio', 'июл'),
+    8: ('aug', 'août', 'aoû', 'ago', 'agosto', 'авг'),
+    9: ('sep', 'sept', 'set', 'septembre', 'setembro', 'septiembre', 'settembre', 'сен'),
+    10: ('oct', 'okt', 'octobre', 'out', 'outubro', 'octubre', 'ott', 'ottobre', 'окт'),
+    11: ('nov', 'novembre', 'novembro', 'noviembre', 'ноя'),
+    12: ('dec', 'déc', 'dez', 'dezember', 'dezembro', 'dic', 'diciembre', 'dicembre', 'дек'),
+}
+_MONTH_LOOKUP = {name: month for month, names in _MONTHS.items() for name in names}
+
+_ISO = re.compile(r'^(\d{4})-(\d{1,2})(?:-(\d{1,2}))?')
+_CJK = re.compile(r'(\d{4})\s*年\s*(\d{1,2})\s*月(?:\s*(\d{1,2})\s*日)?')
+_NUMERIC = re.compile(r'^(\d{1,2})[./-](\d{1,2})[./-](\d{4})$')
+_QUARTER = re.compile(r'\bq([1-4])\b')
+_YEAR = re.compile(r'\b(1[89]\d\d|2\d\d\d)\b')
+_DAY = re.compile(r'^(\d{1,2})(?:st|nd|rd|th|er|º|\.)?$')
+_WORD = re.compile(r'[^\W\d_]+')
+
+def _month_from_word(word: str) -> Optional[int]:
+    word = word.lower()
+    return _MONTH_LOOKUP.get(word) or _MONTH_LOOKUP.get(word[:4]) or _MONTH_LOOKUP.get(word[:3])
+
+def _make(year: int, month: int = 1, day: int = 1, precision: str = DAY) -> ReleaseDate:
+    try:
+        date = datetime(year, month, day, tzinfo=timezone.utc)
+    except ValueError:
+        return UNKNOWN_DATE
+    return ReleaseDate(date.strftime('%Y-%m-%d'), int(date.timestamp()), precision)
+
+@lru_cache(maxsize=8192)
+def normalize_release_date(text: Optional[str]) -> ReleaseDate:
+    """Turn a store's display release date into a sortable date and its precision.
+
+    Handles Steam's English formats ("14 Oct, 2019", "Oct 14, 2019"), localized
+    month names ("14. Okt. 2019", "14 oct. 2019"), ISO and CJK dates, numeric
+    day-first dates, quarters ("Q1 2025") and bare years. Anything else, such as
+    "Coming soon", is UNKNOWN.
+    """
+    if not text:
+        return UNKNOWN_DATE
+    text = text.strip()
+    lowered = text.lower()
+
+    match = _ISO.match(lowered)
+    if match:
+        year, month, day = match.groups()
+        return _make(int(year), int(month), int(day or 1), DAY if day else MONTH)
+
+    match = _CJK.search(lowered)
+    if match:
+        year, month, day = match.groups()
+        return _make(int(year), int(month), int(day or 1), DAY if day else MONTH)
+
+    match = _NUMERIC.match(lowered)
+    if match:
+        first, second, year = (int(part) for part in match.groups())
+        # Store pages use day-first numeric dates outside the US; flip when that cannot be right
+        day, month = (second, first) if second > 12 else (first, second)
+        return _make(year, month, day)
+
+    year_match = _YEAR.search(lowered)
+    if not year_match:
+        return UNKNOWN_DATE
+    year = int(year_match.group(1))
+
+    quarter = _QUARTER.search(lowered)
+    if quarter:
+        return _make(year, (int(quarter.group(1)) - 1) * 3 + 1, 1, QUARTER)
+
+    month = None
+    for word in _WORD.findall(lowered):
+        month = _month_from_word(word)
+        if month:
+            break
+    if month is None:
+        return _make(year, precision=YEAR)
+
+    day = None
+    for token in re.split(r'[\s,]+', lowered.replace(year_match.group(1), ' ')):
+        day_match = _DAY.match(token)
+        if day_match and 1 <= int(day_match.group(1)) <= 31:
+            day = int(day_match.group(1))
+            break
+    if day is None:
+        return _make(year, month, 1, MONTH)
+    return _make(year, month, day)
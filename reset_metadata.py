@@ -1,43 +1,57 @@
 #!/usr/bin/env python
 """
 Reset Metadata Script
-This script completely clears all metadata from the database and allows you to re-fetch it.
+This script re-fetches all metadata from Steam. Existing metadata is only replaced
+once new data for a game has arrived, and an interrupted run continues where it stopped.
 """
 
 import asyncio
 import sys
 from database import DatabaseManager
 from metadata_fetcher import MetadataFetcher
+from metadata_jobs import MetadataRefreshJob
 
 async def reset_and_fetch_metadata():
-    """Reset all metadata and fetch fresh data"""
+    """Refresh all metadata as a resumable job"""
     print("Starting metadata reset process...")
     
     # Initialize database and metadata fetcher
     db = DatabaseManager()
     metadata_fetcher = MetadataFetcher()
     
-    # Clear all existing metadata
-    print("Clearing all existing metadata...")
-    db.clear_all_metadata()
+    # Continue an interrupted refresh, or start one for every game
+    job = MetadataRefreshJob.resume(db, metadata_fetcher)
+    if job is None:
+        games = db.get_all_games()
+        print(f"Found {len(games)} games in database")
+        job = MetadataRefreshJob.start(db, metadata_fetcher, games)
+    if job is None:
+        print("Could not create the refresh job")
+        return
     
-    # Get all games from database
-    games = db.get_all_games()
-    print(f"Found {len(games)} games in database")
+    def on_progress(progress):
+        finished = progress.get('done', 0) + progress.get('failed', 0)
+        total = finished + progress.get('pending', 0) + progress.get('in_flight', 0)
+        print(f"Refreshed {finished}/{total} games ({progress.get('failed', 0)} failed)")
     
-    # Fetch fresh metadata
     print("Fetching fresh metadata for all games...")
-    await metadata_fetcher.fetch_metadata_for_games(games)
+    try:
+        await job.run(on_progress=on_progress)
+    finally:
+        await metadata_fetcher.close()
     
     print("Metadata reset and refresh complete!")
 
 if __name__ == "__main__":
     print("=== Metadata Reset Tool ===")
-    print("WARNING: This will clear ALL existing metadata and fetch it again.")
+    print("This will fetch ALL metadata again. Existing metadata is kept for games that fail.")
     print("This process may take several minutes depending on the number of games.")
     
     response = input("Do you want to proceed? (y/n): ")
     if response.lower() == 'y':
-        asyncio.run(reset_and_fetch_metadata())
+        try:
+            asyncio.run(reset_and_fetch_metadata())
+        except KeyboardInterrupt:
+            print("Stopped. Run the script again to continue the refresh.")
     else:
         print("Operation cancelled.")
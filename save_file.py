@@ -1,8 +1,8 @@
 # save_file.py
 import os
-import subprocess
 from PySide6.QtWidgets import QFileDialog, QMessageBox
-from PySide6.QtCore import QTimer
+from ludusavi_runner import LudusaviRunner
+from temp_cleaner import format_size
 
 class SaveFileManager:
     def __init__(self, ui, parent_widget):
@@ -10,8 +10,14 @@ class SaveFileManager:
         self.parent_widget = parent_widget  # Store the parent widget
         self.backup_folder = None
         self.ludusavi_path = os.path.join("tools", "ludusavi.exe")  # Path to Ludusavi
-        self.timer = QTimer()  # Timer for simulating progress
-        self.progress_value = 0  # Current progress value
+        self.changed_only = True  # Skip games whose saves match the last backup
+        self.button_text = None
+
+        # Connected once here; the runner is reused for every backup
+        self.runner = LudusaviRunner(self.ludusavi_path, parent_widget)
+        self.runner.progress.connect(self.update_progress)
+        self.runner.finished.connect(self.on_backup_finished)
+        self.runner.failed.connect(self.on_backup_failed)
 
     def browse_backup_folder(self):
         """Open dialog to select backup folder."""
@@ -26,46 +32,65 @@ class SaveFileManager:
             self.backup_folder = backup_folder
 
     def backup_save_files(self):
-        """Backup save files using Ludusavi."""
+        """Backup save files using Ludusavi, or cancel the running backup."""
+        if self.runner.running:
+            self.ui.statusLabel.setText("Cancelling backup...")
+            self.runner.cancel()
+            return
         if not self.backup_folder:
             QMessageBox.warning(self.parent_widget, "Error", "No backup folder selected.")
             return
 
-        # Reset progress bar
         self.ui.progressBar.setValue(0)
-        self.progress_value = 0
+        self.button_text = self.ui.backupButton.text()
+        self.ui.backupButton.setText("Cancel Backup")
+        self.ui.browseBackupButton.setEnabled(False)
+        self.runner.ludusavi_path = self.ludusavi_path
+        self.runner.start(self.backup_folder, self.changed_only)
 
-        # Start the backup process
-        self.timer.timeout.connect(self.update_progress)
-        self.timer.start(100)  # Update progress every 100ms
-
-        try:
-            # Call Ludusavi to back up save files (use --force to skip confirmation)
-            result = subprocess.run(
-                [self.ludusavi_path, "backup", "--path", self.backup_folder, "--force"],
-                capture_output=True,
-                text=True,
+    def update_progress(self, progress):
+        """Show Ludusavi's real progress: games and bytes backed up, and the throughput."""
+        if progress['stage'] == 'preview':
+            self.ui.progressBar.setRange(0, 0)  # busy until the preview lists the games
+            self.ui.statusLabel.setText("Looking for changed save files...")
+            return
+        self.ui.progressBar.setRange(0, 100)
+        if progress['bytes_total']:
+            self.ui.progressBar.setValue(int(progress['bytes_done'] * 100 / progress['bytes_total']))
+        elif progress['games_total']:
+            self.ui.progressBar.setValue(int(progress['games_done'] * 100 / progress['games_total']))
+        if progress['current']:
+            self.ui.statusLabel.setText(
+                f"Backing up {progress['current']} ({progress['games_done']}/{progress['games_total']} games, "
+                f"{format_size(progress['bytes_done'])} of {format_size(progress['bytes_total'])}, "
+                f"{format_size(progress['rate'])}/s)"
             )
 
-            # Stop the timer and set progress to 100% when done
-            self.timer.stop()
-            self.ui.progressBar.setValue(100)
+    def reset_buttons(self):
+        self.ui.progressBar.setRange(0, 100)
+        self.ui.backupButton.setText(self.button_text or "Backup")
+        self.ui.browseBackupButton.setEnabled(True)
 
-            if result.returncode == 0:
-                # Backup successful
-                self.ui.statusLabel.setText("Backup successful!")
-                QMessageBox.information(self.parent_widget, "Success", "Save files backed up successfully.")
-            else:
-                # Backup failed
-                self.ui.statusLabel.setText("Backup failed.")
-                QMessageBox.critical(self.parent_widget, "Error", f"Backup failed: {result.stderr}")
-        except Exception as e:
-            self.timer.stop()
-            self.ui.statusLabel.setText("Backup failed.")
-            QMessageBox.critical(self.parent_widget, "Error", f"Backup failed: {str(e)}")
+    def on_backup_finished(self, summary):
+        self.reset_buttons()
+        done = f"{summary['games']} games ({format_size(summary['bytes'])}) in {summary['elapsed']:.1f}s"
+        if summary['cancelled']:
+            self.ui.statusLabel.setText(f"Backup cancelled after {done}.")
+            return
+        self.ui.progressBar.setValue(100)
+        unchanged = f", {summary['skipped']} unchanged" if summary['skipped'] else ""
+        if summary['failed']:
+            print(f"[DEBUG] Ludusavi failed to back up {summary['failed']} games")
+            self.ui.statusLabel.setText(f"Backed up {done}{unchanged}; {summary['failed']} failed.")
+            QMessageBox.warning(self.parent_widget, "Backup Incomplete",
+                                f"Backed up {done}.\n{summary['failed']} games could not be backed up.")
+            return
+        self.ui.statusLabel.setText(f"Backup successful: {done}{unchanged}.")
+        QMessageBox.information(self.parent_widget, "Success", "Save files backed up successfully.")
 
-    def update_progress(self):
-        """Simulate progress by incrementing the progress bar."""
-        if self.progress_value < 100:
-            self.progress_value += 1  # Increment progress
-            self.ui.progressBar.setValue(self.progress_value)
+    def on_backup_failed(self, message):
+        print(f"[DEBUG] Backup failed: {message}")
+        self.reset_buttons()
+        self.ui.progressBar.setValue(0)
+        self.ui.statusLabel.setText("Backup failed.")
+        QMessageBox.critical(self.parent_widget, "Error", f"Backup failed: {message}")
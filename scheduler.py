@@ -0,0 +1,200 @@
+import time
+import random
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Optional
+from PySide6.QtCore import QObject, QTimer, Signal
+
+class Job:
+    """A periodic unit of work managed by the JobScheduler."""
+    EXECUTORS = ('gui', 'thread', 'async')
+
+    def __init__(self, name: str, callback: Callable, interval: float, priority: int = 0,
+                 jitter: float = 0.1, executor: str = 'gui', on_result: Optional[Callable] = None,
+                 pause_when_minimized: bool = True, pause_during_game: bool = True,
+                 max_backoff: float = 300.0):
+        if executor not in self.EXECUTORS:
+            raise ValueError(f"Unknown executor '{executor}' for job {name}")
+        self.name = name
+        self.callback = callback
+        self.interval = interval  # seconds between the end of one run and the start of the next
+        self.priority = priority  # higher runs first when several jobs are due together
+        self.jitter = jitter  # fraction of the interval to randomise by
+        self.executor = executor
+        self.on_result = on_result  # always called on the GUI thread
+        self.pause_when_minimized = pause_when_minimized
+        self.pause_during_game = pause_during_game
+        self.max_backoff = max_backoff
+
+        self.active = False
+        self.running = False
+        self.failures = 0
+        self.next_run = 0.0
+
+    def next_delay(self) -> float:
+        """Delay until the next run, with exponential backoff after failures and jitter."""
+        delay = self.interval
+        if self.failures:
+            delay = min(self.interval * (2 ** self.failures), max(self.max_backoff, self.interval))
+        if self.jitter:
+            delay *= 1 + random.uniform(-self.jitter, self.jitter)
+        return max(0.0, delay)
+
+class JobScheduler(QObject):
+    """Central scheduler for periodic background work.
+
+    A single timer is armed for the earliest due job, so nothing wakes up while
+    every job is idle or paused.
+    """
+    job_failed = Signal(str, str)  # job name, error message
+    _job_finished = Signal(str, object, object)  # job name, result, error (queued back to the GUI thread)
+
+    MAX_THREAD_WORKERS = 2
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.jobs: Dict[str, Job] = {}
+        self.window_minimized = False
+        self.game_running = False
+        self.thread_pool = ThreadPoolExecutor(max_workers=self.MAX_THREAD_WORKERS,
+                                              thread_name_prefix="scheduler")
+
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.timeout.connect(self._run_due_jobs)
+        self._job_finished.connect(self._on_job_finished)
+
+    def add_job(self, name: str, callback: Callable, interval: float, start: bool = False, **options) -> Job:
+        """Register a job. Options are passed through to Job."""
+        job = Job(name, callback, interval, **options)
+        self.jobs[name] = job
+        if start:
+            self.start_job(name)
+        return job
+
+    def remove_job(self, name: str):
+        """Unregister a job (a run already in flight still completes)."""
+        self.jobs.pop(name, None)
+        self._reschedule()
+
+    def start_job(self, name: str, run_immediately: bool = False):
+        """Activate a job, optionally running it on the next dispatch."""
+        job = self.jobs[name]
+        if not job.active:
+            job.active = True
+            job.failures = 0
+            job.next_run = time.monotonic() + (0 if run_immediately else job.next_delay())
+        elif run_immediately:
+            job.next_run = time.monotonic()
+        self._reschedule()
+
+    def stop_job(self, name: str):
+        """Deactivate a job."""
+        job = self.jobs.get(name)
+        if job:
+            job.active = False
+            self._reschedule()
+
+    def is_job_active(self, name: str) -> bool:
+        """Return True if the job is registered and active."""
+        job = self.jobs.get(name)
+        return bool(job and job.active)
+
+    def run_now(self, name: str):
+        """Run a job once right away, even if it is inactive or paused. Overlapping runs are skipped."""
+        job = self.jobs.get(name)
+        if job and not job.running:
+            self._dispatch(job)
+
+    def set_window_minimized(self, minimized: bool):
+        """Pause or resume jobs that only matter while the window is visible."""
+        if minimized != self.window_minimized:
+            self.window_minimized = minimized
+            self._reschedule()
+
+    def set_game_running(self, running: bool):
+        """Pause or resume jobs that should not compete with a running game."""
+        if running != self.game_running:
+            self.game_running = running
+            self._reschedule()
+
+    def is_paused(self, job: Job) -> bool:
+        """Return True if a job is held back by the current window/game state."""
+        return ((self.window_minimized and job.pause_when_minimized) or
+                (self.game_running and job.pause_during_game))
+
+    def shutdown(self):
+        """Stop scheduling and release worker threads."""
+        self.timer.stop()
+        for job in self.jobs.values():
+            job.active = False
+        self.thread_pool.shutdown(wait=False, cancel_futures=True)
+
+    def _runnable_jobs(self):
+        return [job for job in self.jobs.values()
+                if job.active and not job.running and not self.is_paused(job)]
+
+    def _reschedule(self):
+        """Arm the timer for the earliest runnable job."""
+        jobs = self._runnable_jobs()
+        if not jobs:
+            self.timer.stop()
+            return
+        delay = min(job.next_run for job in jobs) - time.monotonic()
+        self.timer.start(max(0, int(delay * 1000)))
+
+    def _run_due_jobs(self):
+        """Dispatch every due job, highest priority first."""
+        now = time.monotonic()
+        due = [job for job in self._runnable_jobs() if job.next_run <= now]
+        for job in sorted(due, key=lambda j: j.priority, reverse=True):
+            self._dispatch(job)
+        self._reschedule()
+
+    def _dispatch(self, job: Job):
+        """Start a run on the job's executor."""
+        job.running = True
+        if job.executor == 'thread':
+            future = self.thread_pool.submit(job.callback)
+            future.add_done_callback(lambda f, name=job.name: self._emit_future_result(name, f))
+        elif job.executor == 'async':
+            try:
+                task = asyncio.ensure_future(job.callback())
+                task.add_done_callback(lambda t, name=job.name: self._emit_future_result(name, t))
+            except Exception as e:
+                self._on_job_finished(job.name, None, e)
+        else:
+            try:
+                result = job.callback()
+            except Exception as e:
+                self._on_job_finished(job.name, None, e)
+            else:
+                self._on_job_finished(job.name, result, None)
+
+    def _emit_future_result(self, name: str, future):
+        """Forward a finished future to the GUI thread."""
+        if future.cancelled():
+            self._job_finished.emit(name, None, asyncio.CancelledError())
+            return
+        error = future.exception()
+        self._job_finished.emit(name, None if error else future.result(), error)
+
+    def _on_job_finished(self, name: str, result, error):
+        """Record the outcome of a run and schedule the next one."""
+        job = self.jobs.get(name)
+        if job is None:
+            return
+        job.running = False
+        if error is not None:
+            job.failures += 1
+            print(f"Error in scheduled job {name}: {error}")
+            self.job_failed.emit(name, str(error))
+        else:
+            job.failures = 0
+            if job.on_result:
+                try:
+                    job.on_result(result)
+                except Exception as e:
+                    print(f"Error handling result of job {name}: {e}")
+        job.next_run = time.monotonic() + job.next_delay()
+        self._reschedule()
@@ -0,0 +1,133 @@
+import os
+import time
+import psutil
+from datetime import datetime
+from typing import Dict, Optional
+from PySide6.QtCore import QObject, QTimer, Signal
+from models import Game
+
+class SessionTracker(QObject):
+    """Tracks running games and records their play sessions in the database."""
+    session_started = Signal(object)  # Game
+    session_ended = Signal(object, int)  # Game, duration in seconds
+    session_discarded = Signal(object)  # Game whose process never appeared
+
+    POLL_INTERVAL = 5000  # ms between process liveness checks
+    HEARTBEAT_INTERVAL = 60  # seconds between session heartbeats written to the database
+    PROCESS_SEARCH_TIMEOUT = 120  # seconds to wait for a store-launched game process to appear
+
+    def __init__(self, db_manager, parent=None):
+        super().__init__(parent)
+        self.db_manager = db_manager
+        self.sessions: Dict[int, dict] = {}  # session_id -> tracking state
+
+        self.poll_timer = QTimer(self)
+        self.poll_timer.timeout.connect(self.poll_sessions)
+        self.poll_timer.setInterval(self.POLL_INTERVAL)
+
+    def has_active_sessions(self) -> bool:
+        """Return True while at least one tracked game is running."""
+        return bool(self.sessions)
+
+    def start_session(self, game: Game, process: Optional[psutil.Process] = None) -> Optional[int]:
+        """Open a session for a launched game and start watching its process."""
+        session_id = self.db_manager.start_session(game.id)
+        if session_id is None:
+            return None
+
+        game.last_launched = datetime.now()
+        now = time.monotonic()
+        self.sessions[session_id] = {
+            'game': game,
+            'process': process,
+            'last_heartbeat': now,
+            'search_deadline': now + self.PROCESS_SEARCH_TIMEOUT,
+        }
+        print(f"[DEBUG] Started session {session_id} for {game.name}")
+
+        if not self.poll_timer.isActive():
+            self.poll_timer.start()
+        self.session_started.emit(game)
+        return session_id
+
+    def poll_sessions(self):
+        """Check tracked processes, write heartbeats and close finished sessions."""
+        now = time.monotonic()
+        for session_id, state in list(self.sessions.items()):
+            try:
+                process = state['process']
+                if process is None:
+                    # Steam/Epic launches go through the store client, so find the game process ourselves
+                    process = self._find_game_process(state['game'])
+                    if process is None:
+                        if now >= state['search_deadline']:
+                            print(f"[DEBUG] No process found for {state['game'].name}, discarding session")
+                            self.db_manager.discard_session(session_id)
+                            self._forget(session_id)
+                            self.session_discarded.emit(state['game'])
+                        continue
+                    state['process'] = process
+                    state['game'].process = process
+
+                if not self._is_alive(process):
+                    self._finish(session_id, self._exit_code(process))
+                elif now - state['last_heartbeat'] >= self.HEARTBEAT_INTERVAL:
+                    self.db_manager.heartbeat_session(session_id)
+                    state['last_heartbeat'] = now
+            except Exception as e:
+                print(f"Error polling session {session_id}: {e}")
+
+    def stop_all(self):
+        """Persist a final heartbeat for every running session (used on shutdown).
+
+        Sessions stay open so the next start can close them at this heartbeat.
+        """
+        self.poll_timer.stop()
+        for session_id in self.sessions:
+            self.db_manager.heartbeat_session(session_id)
+
+    def _finish(self, session_id: int, exit_code: Optional[int]):
+        """Close a session in the database and notify listeners."""
+        game = self.sessions[session_id]['game']
+        duration = self.db_manager.end_session(session_id, exit_code=exit_code)
+        self._forget(session_id)
+        print(f"[DEBUG] Session {session_id} for {game.name} ended after {duration}s (exit code {exit_code})")
+        self.session_ended.emit(game, duration or 0)
+
+    def _forget(self, session_id: int):
+        """Stop tracking a session and idle the poll timer when nothing is left."""
+        self.sessions.pop(session_id, None)
+        if not self.sessions:
+            self.poll_timer.stop()
+
+    @staticmethod
+    def _find_game_process(game: Game) -> Optional[psutil.Process]:
+        """Find a running process whose executable lives under the game's install path."""
+        if not game.install_path:
+            return None
+        install_dir = game.install_path
+        if os.path.isfile(install_dir):
+            install_dir = os.path.dirname(install_dir)
+        install_dir = os.path.normcase(os.path.abspath(install_dir)) + os.sep
+
+        for proc in psutil.process_iter(['exe']):
+            exe = proc.info.get('exe')
+            if exe and os.path.normcase(exe).startswith(install_dir):
+                return proc
+        return None
+
+    @staticmethod
+    def _is_alive(process: psutil.Process) -> bool:
+        """Return True if the process is still running (zombies count as exited)."""
+        try:
+            return process.is_running() and process.status() != psutil.STATUS_ZOMBIE
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            return False
+
+    @staticmethod
+    def _exit_code(process: psutil.Process) -> Optional[int]:
+        """Get the exit code of a finished process when the OS still reports it."""
+        try:
+            return process.wait(timeout=0)
+        except (psutil.TimeoutExpired, psutil.NoSuchProcess, psutil.AccessDenied, ChildProcessError):
+            return None
@@ -0,0 +1,47 @@
+import time
+from typing import List, Optional, Tuple
+
+# Taken when main.py imports this module first, so the import phase is measured too
+PROCESS_START = time.perf_counter()
+
+class StartupTimeline:
+    """Records how long each startup phase takes, in milliseconds."""
+
+    def __init__(self, origin: float = PROCESS_START):
+        self.origin = origin
+        self.phases: List[Tuple[str, float]] = []
+        self.current_phase = "Importing modules"
+        self.phase_start = origin
+        self.finished = False
+
+    def mark(self, phase: str) -> Optional[float]:
+        """End the current phase and start a new one. Returns the ended phase's duration in ms."""
+        if self.finished:
+            return None
+        now = time.perf_counter()
+        elapsed = (now - self.phase_start) * 1000
+        self.phases.append((self.current_phase, elapsed))
+        print(f"[STARTUP] {self.current_phase}: {elapsed:.1f} ms")
+        self.current_phase = phase
+        self.phase_start = now
+        return elapsed
+
+    def finish(self) -> float:
+        """End the last phase and return the total time since process start in ms."""
+        if not self.finished:
+            self.mark("")
+            self.finished = True
+        total = self.total_ms()
+        print(f"[STARTUP] Time to interactive: {total:.1f} ms")
+        return total
+
+    def total_ms(self) -> float:
+        """Total of all recorded phases."""
+        return sum(elapsed for _, elapsed in self.phases)
+
+    def report(self) -> str:
+        """Format the recorded phases, slowest first."""
+        lines = [f"{name}: {elapsed:.1f} ms"
+                 for name, elapsed in sorted(self.phases, key=lambda p: p[1], reverse=True)]
+        lines.append(f"Total: {self.total_ms():.1f} ms")
+        return "\n".join(lines)
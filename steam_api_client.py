@@ -5,11 +5,19 @@ A dedicated module to fetch data directly from Steam API
 
 import os
 import json
+import time
 import asyncio
 import aiohttp
 from typing import Dict, List, Optional, Any
 
 class SteamAPIClient:
+    # Sync watermark stored in the database's sync_state table
+    PLAYTIME_SYNC_KEY = "steam_playtime_last_sync"
+    # Skip syncs requested more often than this unless forced
+    MIN_SYNC_INTERVAL = 300  # seconds
+    # playtime_2weeks only covers the last 14 days, so incremental syncs need a newer watermark
+    RECENT_PLAYTIME_WINDOW = 14 * 24 * 60 * 60  # seconds
+
     def __init__(self, api_key: str, steam_id: str):
         self.api_key = api_key
         self.steam_id = steam_id
@@ -26,7 +34,7 @@ class SteamAPIClient:
         if self.session and not self.session.closed:
             await self.session.close()
             
-    async def get_owned_games(self) -> Dict[str, Any]:
+    async def get_owned_games(self, include_appinfo: bool = True) -> Dict[str, Any]:
         """
         Fetch all owned games with playtime directly from Steam API
         Returns a dictionary mapping app_id to game data
@@ -37,7 +45,7 @@ class SteamAPIClient:
             params = {
                 "key": self.api_key,
                 "steamid": self.steam_id,
-                "include_appinfo": "true",
+                "include_appinfo": "true" if include_appinfo else "false",
                 "include_played_free_games": "true",
                 "format": "json"
             }
@@ -71,38 +79,59 @@ class SteamAPIClient:
             traceback.print_exc()
             return {}
             
-    async def update_database_playtime(self, db_manager) -> bool:
+    async def update_database_playtime(self, db_manager, force: bool = False) -> bool:
         """
         Update the database with accurate playtime data from Steam
+        Only rows whose playtime changed are written, in a single transaction.
         Returns True if successful
         """
         try:
-            # Get all games from the database
-            games = db_manager.get_all_games()
-            if not games:
-                print("No games found in database")
+            now = time.time()
+            last_sync = db_manager.get_sync_state(self.PLAYTIME_SYNC_KEY)
+            last_sync = float(last_sync) if last_sync else None
+
+            if not force and last_sync and now - last_sync < self.MIN_SYNC_INTERVAL:
+                print("Playtime synced recently, skipping")
+                return True
+
+            # Stored playtimes straight from the table (no Game objects or install checks)
+            stored = db_manager.get_steam_playtimes()
+            if not stored:
+                print("No Steam games found in database")
                 return False
                 
-            # Get playtime data from Steam
-            steam_data = await self.get_owned_games()
+            # Get playtime data from Steam (names and icons are not needed here)
+            steam_data = await self.get_owned_games(include_appinfo=False)
             if not steam_data:
                 print("No data received from Steam API")
                 return False
                 
             print(f"Got playtime data for {len(steam_data)} games from Steam API")
+
+            # Titles with no playtime in the last two weeks cannot have changed since a sync inside that window,
+            # but only rows already in the database at that sync have a synced playtime to keep
+            incremental = not force and last_sync is not None and now - last_sync < self.RECENT_PLAYTIME_WINDOW
             
-            # Update each game's playtime in the database
-            updated_count = 0
-            for game in games:
-                if game.type == 'steam' and game.app_id in steam_data:
-                    playtime = steam_data[game.app_id]['playtime_minutes']
-                    
-                    # Force update playtime regardless of current value
-                    db_manager.update_game(game.id, {'playtime': playtime})
-                    print(f"Updated playtime for {game.name}: {playtime} minutes")
-                    updated_count += 1
+            changes = []
+            skipped = 0
+            for app_id, data in steam_data.items():
+                if app_id not in stored:
+                    continue
+                game_id, stored_playtime, added = stored[app_id]
+                if incremental and not data['playtime_2weeks'] and added < last_sync:
+                    skipped += 1
+                    continue
+                if data['playtime_minutes'] != stored_playtime:
+                    changes.append((game_id, data['playtime_minutes']))
+
+            updated_count = db_manager.update_playtimes(changes)
+            if updated_count is None:
+                # Keep the old watermark so the next sync retries these changes
+                return False
+            db_manager.set_sync_state(self.PLAYTIME_SYNC_KEY, str(now))
                         
-            print(f"Successfully updated playtime for {updated_count} games")
+            print(f"Successfully updated playtime for {updated_count} games "
+                  f"({skipped} skipped as not recently played)")
             return True
             
         except Exception as e:
@@ -0,0 +1,30 @@
+from PySide6.QtWebEngineCore import QWebEnginePage
+
+class SteamAuthWebPage(QWebEnginePage):
+    def __init__(self, profile, parent=None):
+        super().__init__(profile, parent)
+        self.parent = parent
+        
+        # Accept all certificates (only for Steam's domain)
+        self.certificateError.connect(self.handleCertificateError)
+
+    def handleCertificateError(self, error):
+        if "steamcommunity.com" in error.url().toString():
+            error.acceptCertificate()
+            return True
+        return False
+
+    def acceptNavigationRequest(self, url, _type, isMainFrame):
+        url_string = url.toString()
+        print(f"Navigation request to: {url_string}")  # Debug print
+        
+        # Handle the Steam login response
+        if "/openid/login" in url_string and "openid.claimed_id" in url_string:
+            self.parent.handle_auth_callback(url)
+            return False
+            
+        # Allow navigation to Steam domains
+        if "steamcommunity.com" in url_string:
+            return True
+            
+        return True 
\ No newline at end of file
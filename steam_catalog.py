@@ -0,0 +1,336 @@
+#!/usr/bin/env python
+"""
+Steam Catalog
+A local index of every Steam app id and name, so titles and executable folders
+resolve to app ids offline. The index is one memory-mapped file; opening it
+reads nothing but the header, and a lookup touches a few pages.
+
+    python steam_catalog.py refresh [--full] [--api-key KEY]
+    python steam_catalog.py import applist.json [--replace]
+    python steam_catalog.py resolve "C:/Games/Hollow Knight/hollow_knight.exe"
+    python steam_catalog.py search "hollow knight"
+"""
+
+import os
+import io
+import sys
+import csv
+import json
+import mmap
+import time
+import zlib
+import struct
+import argparse
+from array import array
+from collections import Counter
+from typing import Dict, Iterator, List, Optional, Tuple
+from store_search import normalize_title, exe_titles, title_score
+
+CATALOG_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "cache", "steam_catalog.idx")
+APP_LIST_URL = "https://api.steampowered.com/ISteamApps/GetAppList/v2/"
+STORE_APP_LIST_URL = "https://api.steampowered.com/IStoreService/GetAppList/v1/"
+
+# File layout (little endian):
+#   header    magic, version, entry count, trigram count, posting count, last_modified
+#   entries   (string offset, normalized length, name length, app id) sorted by normalized name, then app id
+#   trigrams  (crc32 of trigram, first posting, posting count) sorted by key
+#   postings  entry indices, grouped by trigram
+#   strings   each entry's normalized name followed by its display name, UTF-8
+MAGIC = b'CWSC'
+VERSION = 1
+HEADER = struct.Struct('<4sIIIII')
+ENTRY = struct.Struct('<IHHI')
+TRIGRAM = struct.Struct('<III')
+MAX_NAME_BYTES = 0xFFFF
+FUZZY_THRESHOLD = 0.85  # least title_score for resolve_path to accept a fuzzy match
+
+def trigrams(normalized: str) -> List[int]:
+    """Distinct trigram keys of a normalized name, padded so short words count too."""
+    padded = f"  {normalized} "
+    return list({zlib.crc32(padded[i:i + 3].encode('utf-8')) for i in range(len(padded) - 2)})
+
+def build_index(apps: Dict[int, str], path: str = CATALOG_PATH, last_modified: int = 0) -> int:
+    """Write the index for {app id: name} to path (atomically); returns the entry count."""
+    entries = []
+    for app_id, name in apps.items():
+        normalized = normalize_title(name)
+        if normalized and 0 <= int(app_id) <= 0xFFFFFFFF:
+            entries.append((normalized.encode('utf-8')[:MAX_NAME_BYTES],
+                            name.encode('utf-8')[:MAX_NAME_BYTES], int(app_id)))
+    entries.sort(key=lambda entry: (entry[0], entry[2]))  # resolve takes the lowest app id on ties
+
+    strings = io.BytesIO()
+    entry_table = bytearray(ENTRY.size * len(entries))
+    grams: Dict[int, array] = {}
+    for index, (normalized, name, app_id) in enumerate(entries):
+        ENTRY.pack_into(entry_table, index * ENTRY.size, strings.tell(), len(normalized), len(name), app_id)
+        strings.write(normalized)
+        strings.write(name)
+        for key in trigrams(normalized.decode('utf-8', 'ignore')):
+            grams.setdefault(key, array('I')).append(index)
+
+    trigram_table = bytearray(TRIGRAM.size * len(grams))
+    postings = array('I')
+    for index, key in enumerate(sorted(grams)):
+        TRIGRAM.pack_into(trigram_table, index * TRIGRAM.size, key, len(postings), len(grams[key]))
+        postings.extend(grams[key])
+    if sys.byteorder != 'little':
+        postings.byteswap()
+
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    temp_path = f"{path}.tmp"
+    with open(temp_path, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, VERSION, len(entries), len(grams), len(postings), last_modified))
+        f.write(entry_table)
+        f.write(trigram_table)
+        f.write(postings.tobytes())
+        f.write(strings.getvalue())
+    os.replace(temp_path, path)
+    return len(entries)
+
+class SteamCatalog:
+    """Read side of the index: exact, fuzzy and executable-path lookups."""
+
+    def __init__(self, path: str = CATALOG_PATH):
+        self.path = path
+        self.file = open(path, 'rb')
+        try:
+            self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+            magic, version, self.count, self.trigram_count, self.posting_count, self.last_modified = \
+                HEADER.unpack_from(self.map, 0)
+            if magic != MAGIC or version != VERSION:
+                raise ValueError(f"{path} is not a version {VERSION} Steam catalog")
+        except Exception:
+            self.file.close()
+            raise
+        self.entries_at = HEADER.size
+        self.trigrams_at = self.entries_at + self.count * ENTRY.size
+        self.postings_at = self.trigrams_at + self.trigram_count * TRIGRAM.size
+        self.strings_at = self.postings_at + self.posting_count * 4
+
+    def close(self):
+        self.map.close()
+        self.file.close()
+
+    def __len__(self) -> int:
+        return self.count
+
+    def _normalized(self, index: int) -> bytes:
+        offset, normalized_len, _, _ = ENTRY.unpack_from(self.map, self.entries_at + index * ENTRY.size)
+        start = self.strings_at + offset
+        return self.map[start:start + normalized_len]
+
+    def entry(self, index: int) -> Tuple[int, str, str]:
+        """(app id, name, normalized name) of an entry."""
+        offset, normalized_len, name_len, app_id = ENTRY.unpack_from(self.map, self.entries_at + index * ENTRY.size)
+        start = self.strings_at + offset
+        normalized = self.map[start:start + normalized_len].decode('utf-8', 'ignore')
+        name = self.map[start + normalized_len:start + normalized_len + name_len].decode('utf-8', 'ignore')
+        return app_id, name, normalized
+
+    def items(self) -> Iterator[Tuple[int, str]]:
+        for index in range(self.count):
+            app_id, name, _ = self.entry(index)
+            yield app_id, name
+
+    def resolve(self, title: str) -> Optional[str]:
+        """The app id whose normalized name equals the title's (lowest id on ties), by binary search."""
+        target = normalize_title(title).encode('utf-8')
+        if not target:
+            return None
+        low, high = 0, self.count
+        while low < high:
+            middle = (low + high) // 2
+            if self._normalized(middle) < target:
+                low = middle + 1
+            else:
+                high = middle
+        if low < self.count and self._normalized(low) == target:
+            return str(self.entry(low)[0])
+        return None
+
+    def _postings(self, key: int) -> memoryview:
+        low, high = 0, self.trigram_count
+        while low < high:
+            middle = (low + high) // 2
+            if TRIGRAM.unpack_from(self.map, self.trigrams_at + middle * TRIGRAM.size)[0] < key:
+                low = middle + 1
+            else:
+                high = middle
+        if low < self.trigram_count:
+            found, first, count = TRIGRAM.unpack_from(self.map, self.trigrams_at + low * TRIGRAM.size)
+            if found == key:
+                start = self.postings_at + first * 4
+                return memoryview(self.map)[start:start + count * 4].cast('I')
+        return memoryview(b'').cast('I')
+
+    def search(self, title: str, limit: int = 10) -> List[Tuple[float, str, str]]:
+        """Closest names to a title as (score, app id, name), best first.
+
+        Entries sharing the most trigrams with the title are scored with
+        store_search.title_score; exact matches score 1.
+        """
+        normalized = normalize_title(title)
+        if not normalized:
+            return []
+        shared = Counter()
+        for key in trigrams(normalized):
+            shared.update(self._postings(key))
+        results = []
+        for index, _ in shared.most_common(max(limit * 20, 200)):
+            app_id, name, entry_normalized = self.entry(index)
+            results.append((title_score(entry_normalized, normalized), str(app_id), name))
+        results.sort(key=lambda result: result[0], reverse=True)
+        return results[:limit]
+
+    def resolve_path(self, path: str) -> Optional[str]:
+        """The app id an executable path points at, from its file and game folder names."""
+        titles = exe_titles(path)
+        for title in titles:
+            app_id = self.resolve(title)
+            if app_id:
+                return app_id
+        best = None
+        for title in titles:
+            for score, app_id, _ in self.search(title, limit=1):
+                if score >= FUZZY_THRESHOLD and (best is None or score > best[0]):
+                    best = (score, app_id)
+        return best[1] if best else None
+
+def open_catalog(path: str = CATALOG_PATH) -> Optional[SteamCatalog]:
+    """The local catalog, or None when it has not been downloaded or imported."""
+    if not os.path.exists(path):
+        return None
+    try:
+        return SteamCatalog(path)
+    except (OSError, ValueError, struct.error) as e:
+        print(f"Error opening Steam catalog: {e}")
+        return None
+
+def read_app_list(source: str) -> Dict[int, str]:
+    """Apps from a GetAppList JSON response, a JSON list of {appid, name} or an appid,name CSV file."""
+    with open(source, encoding='utf-8') as f:
+        text = f.read()
+    apps = {}
+    if text.lstrip().startswith(('{', '[')):
+        data = json.loads(text)
+        if isinstance(data, dict):
+            data = (data.get('applist') or data.get('response') or {}).get('apps', [])
+        for app in data:
+            if app.get('appid') and app.get('name'):
+                apps[int(app['appid'])] = app['name']
+    else:
+        for row in csv.reader(io.StringIO(text)):
+            if len(row) >= 2 and row[0].strip().isdigit() and row[1].strip():
+                apps[int(row[0])] = row[1].strip()
+    return apps
+
+def download_app_list(api_key: Optional[str] = None, if_modified_since: int = 0) -> Dict[int, str]:
+    """Apps from Steam. With an API key only apps changed since if_modified_since are listed."""
+    import requests
+    if not api_key:
+        response = requests.get(APP_LIST_URL, timeout=60)
+        response.raise_for_status()
+        return {app['appid']: app['name'] for app in response.json()['applist']['apps']
+                if app.get('appid') and app.get('name')}
+
+    apps = {}
+    last_appid = 0
+    while True:
+        response = requests.get(STORE_APP_LIST_URL, timeout=60, params={
+            'key': api_key, 'if_modified_since': if_modified_since, 'last_appid': last_appid,
+            'max_results': 50000, 'include_games': 1, 'include_dlc': 1, 'include_software': 1,
+        })
+        response.raise_for_status()
+        data = response.json().get('response', {})
+        for app in data.get('apps', []):
+            if app.get('appid') and app.get('name'):
+                apps[app['appid']] = app['name']
+        if not data.get('have_more_results'):
+            return apps
+        last_appid = data.get('last_appid', last_appid)
+
+def diff_apps(old: Dict[int, str], new: Dict[int, str]) -> Dict[str, int]:
+    added = sum(1 for app_id in new if app_id not in old)
+    renamed = sum(1 for app_id, name in new.items() if app_id in old and old[app_id] != name)
+    removed = sum(1 for app_id in old if app_id not in new)
+    return {'added': added, 'renamed': renamed, 'removed': removed}
+
+def update_catalog(apps: Dict[int, str], path: str = CATALOG_PATH, complete: bool = True,
+                   last_modified: int = 0) -> Dict[str, int]:
+    """Merge apps into the catalog, rewriting it only when something changed.
+
+    A complete list replaces the catalog (apps missing from it are dropped); a
+    partial one, such as a delta since the last refresh, is applied on top.
+    """
+    catalog = open_catalog(path)
+    old = dict(catalog.items()) if catalog else {}
+    previous_modified = catalog.last_modified if catalog else 0
+    if catalog:
+        catalog.close()  # the file is about to be replaced
+
+    merged = dict(apps) if complete else {**old, **apps}
+    changes = diff_apps(old, merged)
+    changes['total'] = len(merged)
+    if any(changes[kind] for kind in ('added', 'renamed', 'removed')) or not os.path.exists(path):
+        build_index(merged, path, last_modified or previous_modified)
+    elif last_modified and last_modified != previous_modified:
+        with open(path, 'r+b') as f:  # nothing new; only remember when we last asked
+            f.seek(HEADER.size - 4)
+            f.write(struct.pack('<I', last_modified))
+    return changes
+
+def refresh_catalog(path: str = CATALOG_PATH, api_key: Optional[str] = None, full: bool = False) -> Dict[str, int]:
+    """Bring the catalog up to date from Steam, asking only for changes when possible."""
+    catalog = open_catalog(path)
+    since = catalog.last_modified if catalog and not full else 0
+    if catalog:
+        catalog.close()
+    started = int(time.time())
+    if api_key and since:
+        return update_catalog(download_app_list(api_key, since), path, complete=False, last_modified=started)
+    return update_catalog(download_app_list(api_key), path, complete=True, last_modified=started)
+
+def main():
+    parser = argparse.ArgumentParser(description="Build and query the local Steam app catalog")
+    parser.add_argument('action', choices=('refresh', 'import', 'resolve', 'search'))
+    parser.add_argument('value', nargs='?', help="file to import, or the title/path to look up")
+    parser.add_argument('--full', action='store_true', help="download the whole list instead of changes")
+    parser.add_argument('--replace', action='store_true', help="imported list replaces the catalog")
+    parser.add_argument('--catalog', default=CATALOG_PATH, help="index file")
+    parser.add_argument('--api-key', help="Steam Web API key for refresh (default: the cached key)")
+    args = parser.parse_args()
+
+    if args.action == 'refresh':
+        api_key = args.api_key
+        if not api_key:
+            from game_search import get_cached_steam_api_key
+            api_key = get_cached_steam_api_key()
+        changes = refresh_catalog(args.catalog, api_key, args.full)
+    elif args.action == 'import':
+        changes = update_catalog(read_app_list(args.value), args.catalog, complete=args.replace)
+    else:
+        catalog = open_catalog(args.catalog)
+        if catalog is None:
+            print("No Steam catalog yet; run `python steam_catalog.py refresh` or `import` first")
+            sys.exit(1)
+        started = time.perf_counter()
+        if args.action == 'resolve':
+            result = catalog.resolve_path(args.value) or catalog.resolve(args.value)
+            print(f"{args.value} -> {result}")
+        else:
+            for score, app_id, name in catalog.search(args.value):
+                print(f"{score:5.0%}  {app_id:>8}  {name}")
+        print(f"({(time.perf_counter() - started) * 1e6:.0f} us, {len(catalog)} apps)")
+        return
+    print(f"Steam catalog: {changes['total']} apps ({changes['added']} added, "
+          f"{changes['renamed']} renamed, {changes['removed']} removed)")
+
+if __name__ == "__main__":
+    try:
+        main()
+    except Exception as e:
+        print(f"Error: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
@@ -0,0 +1,132 @@
+import os
+import re
+import difflib
+from typing import Dict, List, Optional, Tuple
+
+# Folders between a game's own folder and its executable
+GENERIC_FOLDERS = {'bin', 'bin32', 'bin64', 'x64', 'x86', 'win32', 'win64', 'binaries', 'game',
+                   'games', 'release', 'retail', 'shipping', 'common', 'program files',
+                   'program files (x86)', 'steamapps'}
+
+def normalize_title(title: str) -> str:
+    """Lowercase a title and reduce it to words, dropping trademark signs and punctuation."""
+    title = re.sub(r"[™®©]", "", title or "")
+    title = re.sub(r"([a-z])([A-Z])", r"\1 \2", title)  # HollowKnight -> Hollow Knight
+    return " ".join(re.findall(r"[^\W_]+", title.lower()))
+
+def exe_titles(path: str) -> List[str]:
+    """Titles an executable path suggests: its file name and its game folder."""
+    if not path:
+        return []
+    path = path.replace('\\', '/')
+    titles = [normalize_title(os.path.splitext(os.path.basename(path))[0])]
+    for folder in reversed(path.split('/')[:-1]):
+        if folder and folder.lower() not in GENERIC_FOLDERS and not folder.endswith(':'):
+            titles.append(normalize_title(folder))
+            break
+    return [title for title in titles if title]
+
+def title_score(a: str, b: str) -> float:
+    """Similarity of two normalized titles, 0..1 (1 for equal titles)."""
+    if not a or not b:
+        return 0.0
+    if a == b:
+        return 1.0
+    ratio = difflib.SequenceMatcher(None, a, b, autojunk=False).ratio()
+    short, long = sorted((a, b), key=len)
+    if long.startswith(short + " "):
+        # A leading run of words ("the witcher 3" for "the witcher 3 wild hunt") is nearly a match
+        return max(ratio, 0.9 + 0.1 * len(short) / len(long))
+    return ratio
+
+def rank_candidates(candidates: List[Dict], query: str, exe_path: str = "") -> List[Tuple[float, Dict]]:
+    """Store search candidates as (score, candidate), best first.
+
+    A candidate scores by its best match against the typed title or the titles
+    the executable path suggests; ties keep the store's own order.
+    """
+    references = [normalize_title(query)] + exe_titles(exe_path)
+    scored = []
+    for order, candidate in enumerate(candidates):
+        name = normalize_title(candidate.get('name', ''))
+        score = max(title_score(name, reference) for reference in references)
+        scored.append((score, -order, candidate))
+    scored.sort(key=lambda item: (item[0], item[1]), reverse=True)
+    return [(score, candidate) for score, _, candidate in scored]
+
+class StoreSearch:
+    """Steam store title search with cached results and a local title -> app id index.
+
+    Results are kept per normalized search term, and every app seen in a result
+    is remembered by title, so retyping a title or looking up a known game needs
+    no request. Requests go through the MetadataFetcher's session.
+    """
+    SEARCH_URL = "https://store.steampowered.com/api/storesearch/"
+    CACHE_SIZE = 200  # search terms
+
+    def __init__(self, fetcher):
+        self.fetcher = fetcher
+        self.results: Dict[str, List[Dict]] = {}  # normalized term -> candidates
+        self.titles: Dict[str, str] = {}  # normalized title -> app id
+        self.catalog = None
+        self.catalog_checked = False
+
+    def local_catalog(self):
+        """The offline steam_catalog index, if one has been downloaded or imported."""
+        if not self.catalog_checked:
+            self.catalog_checked = True
+            from steam_catalog import open_catalog
+            self.catalog = open_catalog()
+        return self.catalog
+
+    def lookup(self, title: str) -> Optional[str]:
+        """The app id of a title seen before or in the local catalog, without any request."""
+        app_id = self.titles.get(normalize_title(title))
+        if app_id is None and self.local_catalog():
+            app_id = self.catalog.resolve(title)
+        return app_id
+
+    def resolve_path(self, path: str) -> Optional[str]:
+        """The app id of the game an executable belongs to, from the local catalog."""
+        return self.catalog.resolve_path(path) if path and self.local_catalog() else None
+
+    def offline_candidates(self, term: str, limit: int = 10) -> List[Dict]:
+        """Candidates for a title from the local catalog, best first."""
+        if not self.local_catalog():
+            return []
+        return [{'app_id': app_id, 'name': name, 'image': None}
+                for _, app_id, name in self.catalog.search(term, limit)]
+
+    def remember(self, app_id: str, name: str):
+        if app_id and name:
+            self.titles[normalize_title(name)] = str(app_id)
+
+    def cached(self, term: str) -> Optional[List[Dict]]:
+        return self.results.get(normalize_title(term))
+
+    async def search(self, term: str) -> List[Dict]:
+        """Candidates ({app_id, name, image}) for a title, in the store's order."""
+        key = normalize_title(term)
+        if not key:
+            return []
+        if key in self.results:
+            self.results[key] = self.results.pop(key)  # most recently used last
+            return self.results[key]
+
+        session = await self.fetcher.ensure_session()
+        params = {'term': term, 'l': 'english', 'cc': 'US'}
+        async with session.get(self.SEARCH_URL, params=params) as response:
+            if response.status != 200:
+                raise RuntimeError(f"store search returned status {response.status}")
+            data = await response.json(content_type=None)
+
+        candidates = []
+        for item in (data or {}).get('items', []):
+            if item.get('id') and item.get('name'):
+                candidates.append({'app_id': str(item['id']), 'name': item['name'],
+                                   'image': item.get('tiny_image')})
+                self.remember(str(item['id']), item['name'])
+        self.results[key] = candidates
+        while len(self.results) > self.CACHE_SIZE:
+            del self.results[next(iter(self.results))]
+        return candidates
@@ -1,4 +1,5 @@
 from PySide6.QtWebEngineWidgets import QWebEngineView
+from PySide6.QtWebEngineCore import QWebEnginePage
 from PySide6.QtWidgets import (QVBoxLayout, QToolBar, QWidget, QTabWidget, 
                               QPushButton, QHBoxLayout, QFrame, QLabel, QSizePolicy)
 from PySide6.QtGui import QAction, QIcon, QFont
@@ -140,6 +141,17 @@ class StoreTab(QWidget):
 
         self.setLayout(layout)
 
+    def freeze(self):
+        """Discard the web page to release its memory and CPU (e.g. while a game is running)."""
+        # Qt only discards pages that are not visible
+        self.web_view.hide()
+        self.web_view.page().setLifecycleState(QWebEnginePage.LifecycleState.Discarded)
+
+    def thaw(self):
+        """Bring a frozen page back; a discarded page reloads itself."""
+        self.web_view.page().setLifecycleState(QWebEnginePage.LifecycleState.Active)
+        self.web_view.show()
+
 def create_store_tabs():
     """
     Creates a tabbed widget containing both Steam and Epic Games stores.
@@ -1,6 +1,6 @@
 from PySide6.QtWidgets import QMessageBox, QInputDialog
 import psutil
-import os
+import time
 
 class SystemOptimizer:
     @staticmethod
@@ -37,54 +37,34 @@ class SystemOptimizer:
     @staticmethod
     def optimize_pc():
         """
-        Delete temporary files to optimize the system.
+        Delete old temporary files to optimize the system (blocking; see temp_cleaner.TempCleaner).
         Returns the number of deleted files.
         """
-        temp_dirs = [
-            os.getenv('TEMP'),  # Windows temporary files
-            os.getenv('TMP'),   # Alternative Windows temporary files
-            '/tmp',             # Linux/Mac temporary files
-        ]
-
-        deleted_files = 0
-        for temp_dir in temp_dirs:
-            if temp_dir and os.path.exists(temp_dir):
-                for root, dirs, files in os.walk(temp_dir):
-                    for file in files:
-                        try:
-                            file_path = os.path.join(root, file)
-                            os.remove(file_path)
-                            deleted_files += 1
-                        except Exception as e:
-                            print(f"Failed to delete {file_path}: {e}")
-        return deleted_files
+        from temp_cleaner import TempCleaner
+        return TempCleaner().run(dry_run=False)['files']
 
     @staticmethod
-    def get_unnecessary_processes(cpu_threshold=50, memory_threshold=70):
+    def get_unnecessary_processes(cpu_threshold=50, memory_threshold=70, interval=0.5):
         """
         Identify background processes consuming excessive CPU or memory.
+        CPU is measured over interval seconds (a single reading is always 0),
+        as a share of the whole machine.
         """
-        unnecessary_processes = []
-        system_processes = {
-            "explorer.exe", "csrss.exe", "winlogon.exe", "system", "taskmgr.exe",
-            "system idle process", "idle"
-        }  # Safe list
-
-        for proc in psutil.process_iter(['pid', 'name', 'cpu_percent', 'memory_percent']):
-            try:
-                name = proc.info['name'].lower()
-                pid = proc.info['pid']
-                cpu = proc.info['cpu_percent']
-                memory = proc.info['memory_percent']
-                if (
-                    (cpu > cpu_threshold or memory > memory_threshold)
-                    and name not in system_processes
-                    and pid != 0
-                ):
-                    unnecessary_processes.append((pid, proc.info['name'], cpu, memory))
-            except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
-                continue
+        from process_inspector import ProcessSampler, PROTECTED_PROCESSES
+        sampler = ProcessSampler()
+        sampler.sample()
+        time.sleep(interval)
+        total_memory = psutil.virtual_memory().total
 
+        unnecessary_processes = []
+        for row in sampler.sample():
+            memory = row['memory'] * 100 / total_memory
+            if (
+                (row['cpu'] > cpu_threshold or memory > memory_threshold)
+                and row['name'].lower() not in PROTECTED_PROCESSES
+                and row['pid'] != 0
+            ):
+                unnecessary_processes.append((row['pid'], row['name'], row['cpu'], memory))
         return unnecessary_processes
 
     @staticmethod
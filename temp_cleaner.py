@@ -0,0 +1,179 @@
+"""
+Temp Cleaner
+Finds and deletes old temporary files on a worker pool, off the GUI thread, with
+a dry-run preview of the reclaimable space and cancellation.
+"""
+
+import os
+import time
+import errno
+import fnmatch
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from typing import Dict, List, Optional, Set, Tuple
+import psutil
+from PySide6.QtCore import QObject, Signal
+
+# Entries other programs keep in the temp folders while they run (lowercase patterns)
+SKIP_PATTERNS = (
+    '.x11-unix', '.ice-unix', '.font-unix', '.xim-unix', '.test-unix', 'systemd-private-*',
+    'snap-private-tmp', 'tmux-*', 'ssh-*', 'pulse-*', 'dbus-*', 'lock', 'lockfile', '*.lock',
+    '*.lck', '*.pid', '_mei*',  # _MEI*: unpacked PyInstaller apps that are running
+)
+IN_USE_ERRORS = {errno.EACCES, errno.EPERM, errno.EBUSY, errno.ETXTBSY}
+
+def temp_roots() -> List[str]:
+    """The temp folders to clean, each once: TEMP and TMP are usually the same folder,
+    and a folder inside another one is covered by it."""
+    roots: List[str] = []
+    for path in (os.getenv('TEMP'), os.getenv('TMP'), tempfile.gettempdir(), '/tmp'):
+        if not path or not os.path.isdir(path):
+            continue
+        real = os.path.normcase(os.path.realpath(path))
+        if any(real == root or real.startswith(root.rstrip(os.sep) + os.sep) for root in roots):
+            continue
+        roots = [root for root in roots if not root.startswith(real.rstrip(os.sep) + os.sep)]
+        roots.append(real)
+    return roots
+
+def is_skipped(name: str) -> bool:
+    name = name.lower()
+    return any(fnmatch.fnmatchcase(name, pattern) for pattern in SKIP_PATTERNS)
+
+def empty_report() -> Dict:
+    return {'files': 0, 'bytes': 0, 'scanned': 0, 'directories': 0, 'too_new': 0,
+            'too_small': 0, 'skipped': 0, 'in_use': 0, 'errors': 0}
+
+class TempCleaner(QObject):
+    """Cleans the temp folders on a thread pool.
+
+    Folders are listed with os.scandir, with at most WORKERS * 2 folders in
+    flight, and each worker deletes the matching files of its folder. Files
+    younger than min_age or smaller than min_size are kept, as are entries
+    matching SKIP_PATTERNS and files this process has open; files another
+    program holds open fail to delete and are counted as in use instead of
+    printed one by one. A dry run only adds up what would be deleted.
+    progress is emitted at most every PROGRESS_INTERVAL seconds and finished
+    once with the final report, both from the cleaning thread.
+    """
+    progress = Signal(dict)  # running report
+    finished = Signal(dict)  # final report
+
+    WORKERS = 4
+    PROGRESS_INTERVAL = 0.1
+    MIN_AGE = 24 * 3600  # seconds since the last change
+
+    def __init__(self, roots: Optional[List[str]] = None, min_age: float = MIN_AGE,
+                 min_size: int = 0, parent=None):
+        super().__init__(parent)
+        self.roots = temp_roots() if roots is None else roots
+        self.min_age = min_age
+        self.min_size = min_size
+        self.cancel_event = threading.Event()
+        self.thread: Optional[threading.Thread] = None
+
+    def cancel(self):
+        """Stop soon; files already deleted stay deleted."""
+        self.cancel_event.set()
+
+    def start(self, dry_run: bool = True):
+        """Run in a background thread; the result arrives through finished."""
+        self.cancel_event.clear()
+        self.thread = threading.Thread(target=self.run, args=(dry_run,), name="temp-cleaner", daemon=True)
+        self.thread.start()
+
+    def run(self, dry_run: bool = True) -> Dict:
+        """Clean (or preview) every temp root and return the report."""
+        report = empty_report()
+        report.update({'dry_run': dry_run, 'roots': list(self.roots), 'cancelled': False})
+        started = last_progress = time.monotonic()
+        cutoff = time.time() - self.min_age
+        keep = self.open_files()
+        pending = list(self.roots)
+        running = {}
+        with ThreadPoolExecutor(max_workers=self.WORKERS, thread_name_prefix="temp-cleaner") as pool:
+            while (pending or running) and not self.cancel_event.is_set():
+                while pending and len(running) < self.WORKERS * 2:
+                    path = pending.pop()
+                    running[pool.submit(self.clean_directory, path, cutoff, keep, dry_run)] = path
+                done, _ = wait(running, timeout=self.PROGRESS_INTERVAL, return_when=FIRST_COMPLETED)
+                for future in done:
+                    running.pop(future)
+                    subdirs, counts = future.result()
+                    pending.extend(subdirs)
+                    for key, value in counts.items():
+                        report[key] += value
+                now = time.monotonic()
+                if now - last_progress >= self.PROGRESS_INTERVAL:
+                    last_progress = now
+                    self.progress.emit(dict(report, elapsed=now - started))
+            for future in running:
+                future.cancel()
+
+        report['cancelled'] = self.cancel_event.is_set()
+        report['elapsed'] = time.monotonic() - started
+        if report['in_use'] or report['errors']:
+            print(f"[DEBUG] Temp cleanup kept {report['in_use']} files in use; {report['errors']} other errors")
+        self.finished.emit(report)
+        return report
+
+    @staticmethod
+    def open_files() -> Set[str]:
+        """Files this process has open, which must survive the cleanup."""
+        try:
+            return {os.path.normcase(f.path) for f in psutil.Process().open_files()}
+        except (psutil.Error, OSError):
+            return set()
+
+    def clean_directory(self, path: str, cutoff: float, keep: Set[str], dry_run: bool) -> Tuple[List[str], Dict]:
+        """Delete (or count) the matching files of one folder; returns its subfolders and counts."""
+        counts = empty_report()
+        subdirs = []
+        try:
+            entries = os.scandir(path)
+        except FileNotFoundError:
+            return subdirs, counts
+        except OSError:
+            counts['errors'] += 1
+            return subdirs, counts
+        counts['directories'] += 1
+        with entries:
+            for entry in entries:
+                if self.cancel_event.is_set():
+                    break
+                if is_skipped(entry.name):
+                    counts['skipped'] += 1
+                    continue
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                        continue
+                    if not entry.is_file(follow_symlinks=False):
+                        continue  # sockets, pipes and links are left alone
+                    counts['scanned'] += 1
+                    stat = entry.stat(follow_symlinks=False)
+                    if stat.st_mtime > cutoff:
+                        counts['too_new'] += 1
+                        continue
+                    if stat.st_size < self.min_size:
+                        counts['too_small'] += 1
+                        continue
+                    if os.path.normcase(entry.path) in keep:
+                        counts['in_use'] += 1
+                        continue
+                    if not dry_run:
+                        os.remove(entry.path)
+                    counts['files'] += 1
+                    counts['bytes'] += stat.st_size
+                except FileNotFoundError:
+                    continue  # removed by its owner meanwhile
+                except OSError as e:
+                    counts['in_use' if e.errno in IN_USE_ERRORS else 'errors'] += 1
+        return subdirs, counts
+
+def format_size(size: float) -> str:
+    for unit in ('B', 'KB', 'MB', 'GB'):
+        if size < 1024 or unit == 'GB':
+            return f"{size:.0f} {unit}" if unit == 'B' else f"{size:.1f} {unit}"
+        size /= 1024
@@ -1,50 +1,77 @@
-from PySide6.QtCore import QTimer, QObject
+from PySide6.QtCore import QObject
 from PySide6.QtWidgets import QMainWindow
+from system_optimizer import SystemOptimizer
 
 class TimerManager(QObject):
+    """Registers the main window's periodic work with the shared JobScheduler."""
+
     def __init__(self, main_window: QMainWindow):
         super().__init__()
         self.main_window = main_window
-        
-        # Initialize timers
-        self.system_timer = QTimer(main_window)
-        self.system_timer.timeout.connect(self.main_window.update_system_usage)
-        self.system_timer.setInterval(1000)
+        self.scheduler = main_window.scheduler
+
+        # System usage sampling blocks for a second, so it runs on a worker thread
+        self.scheduler.add_job(
+            'system_usage', SystemOptimizer.get_system_usage, 1.0,
+            priority=1, executor='thread',
+            on_result=self.main_window.display_system_usage
+        )
+
+        # FPS feeds the in-game overlay, so it keeps running while a game is active
+        self.scheduler.add_job(
+            'fps', self.main_window.update_fps, 1.0,
+            priority=2, jitter=0, pause_when_minimized=False, pause_during_game=False
+        )
 
-        self.fps_timer = QTimer(main_window)
-        self.fps_timer.timeout.connect(self.main_window.update_fps)
-        self.fps_timer.setInterval(1000)
+        # Installation checks read the registry and manifests for every game
+        self.scheduler.add_job(
+            'install_status', self.main_window.check_install_statuses, 30.0,  # Check every 30 seconds
+            priority=0, executor='thread',
+            on_result=self.main_window.apply_install_statuses
+        )
 
-        self.game_status_timer = QTimer(main_window)
-        self.game_status_timer.timeout.connect(self.main_window.update_game_statuses)
-        self.game_status_timer.setInterval(5000)  # Check game status every 5 seconds
+        # Steam playtime only changes while playing, so the incremental sync can run rarely
+        self.scheduler.add_job(
+            'steam_playtime', self.main_window.sync_steam_playtime, 900.0,  # Sync every 15 minutes
+            priority=0, executor='async',
+            on_result=self.main_window.apply_steam_playtimes
+        )
 
     def start_system_timer(self):
         """Start the system usage timer"""
-        self.system_timer.start(1000)
+        self.scheduler.start_job('system_usage')
 
     def stop_system_timer(self):
         """Stop the system usage timer"""
-        self.system_timer.stop()
+        self.scheduler.stop_job('system_usage')
 
     def start_fps_timer(self):
         """Start the FPS monitoring timer"""
-        self.fps_timer.start(1000)
+        self.scheduler.start_job('fps')
 
     def stop_fps_timer(self):
         """Stop the FPS monitoring timer"""
-        self.fps_timer.stop()
+        self.scheduler.stop_job('fps')
+
+    def start_install_status_timer(self):
+        """Start the periodic installation status check"""
+        self.scheduler.start_job('install_status')
+
+    def stop_install_status_timer(self):
+        """Stop the periodic installation status check"""
+        self.scheduler.stop_job('install_status')
 
-    def start_game_status_timer(self):
-        """Start the game status monitoring timer"""
-        self.game_status_timer.start(5000)
+    def start_steam_playtime_timer(self):
+        """Start the periodic Steam playtime sync"""
+        self.scheduler.start_job('steam_playtime')
 
-    def stop_game_status_timer(self):
-        """Stop the game status monitoring timer"""
-        self.game_status_timer.stop()
+    def stop_steam_playtime_timer(self):
+        """Stop the periodic Steam playtime sync"""
+        self.scheduler.stop_job('steam_playtime')
 
     def stop_all_timers(self):
         """Stop all timers"""
         self.stop_system_timer()
         self.stop_fps_timer()
-        self.stop_game_status_timer() 
\ No newline at end of file
+        self.stop_install_status_timer()
+        self.stop_steam_playtime_timer()
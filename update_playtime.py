@@ -34,7 +34,7 @@ async def update_playtime():
     try:
         # Update playtime data in database
         print("Fetching playtime data from Steam API...")
-        success = await client.update_database_playtime(db)
+        success = await client.update_database_playtime(db, force=True)
         
         if success:
             print("Playtime data updated successfully!")